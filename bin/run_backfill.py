@@ -0,0 +1,69 @@
+"""
+Run a data backfill in batches, see `lms.backfills`.
+
+The backfill's progress is saved after each batch. If it's stopped, or fails,
+running it again carries on where it left off.
+"""  # noqa: EXE002
+
+import logging
+from argparse import ArgumentParser
+
+from pyramid.paster import bootstrap
+from pyramid.path import DottedNameResolver
+from sqlalchemy.orm import Session
+
+from lms.backfills import BackfillRunner
+
+parser = ArgumentParser(description=__doc__)
+parser.add_argument(
+    "-c",
+    "--config-file",
+    required=True,
+    help="The paster config for this application. (e.g. development.ini)",
+)
+parser.add_argument(
+    "-b",
+    "--backfill",
+    required=True,
+    help="Dotted path of the Backfill class (e.g. lms.backfills.example.Example)",
+)
+parser.add_argument(
+    "--batch-size", type=int, default=1000, help="Rows to process per transaction"
+)
+parser.add_argument(
+    "--max-rows-per-second", type=float, help="Don't process rows faster than this"
+)
+parser.add_argument("--max-batches", type=int, help="Stop after this many batches")
+parser.add_argument(
+    "--restart",
+    action="store_true",
+    help="Start from the first row, ignoring any saved progress",
+)
+
+
+def main():
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    backfill = DottedNameResolver().resolve(args.backfill)()
+
+    with bootstrap(args.config_file) as env:
+        registry = env["registry"]
+
+        # A session of our own, outside of pyramid_tm, to commit every batch
+        with Session(bind=registry["sqlalchemy.engine"]) as db:
+            checkpoint = BackfillRunner(
+                db,
+                batch_size=args.batch_size,
+                max_rows_per_second=args.max_rows_per_second,
+                replica=registry.get("sqlalchemy.replica"),
+            ).run(backfill, restart=args.restart, max_batches=args.max_batches)
+
+            print(  # noqa: T201
+                f"{checkpoint.name}: {checkpoint.rows_done} rows done,"
+                f" {'finished' if checkpoint.finished_at else 'not finished'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
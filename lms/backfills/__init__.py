@@ -0,0 +1,29 @@
+"""
+Data backfills that run online, outside of deploys.
+
+Unlike a data migration, which runs in a single transaction, a backfill runs
+in small batches that are committed one by one, can be rate limited and
+resumes where it stopped if it fails. Use it for data fixes on large or busy
+tables. For example:
+
+    class FillInCourseNames(Backfill):
+        @property
+        def key(self):
+            return Course.id
+
+        def where(self):
+            return Course.lms_name.is_(None)
+
+        def run_batch(self, db, keys):
+            db.execute(
+                update(Course)
+                .where(Course.id.in_(keys))
+                .values(lms_name=Course.lms_id)
+            )
+
+And then run it with `bin/run_backfill.py`.
+"""
+
+from lms.backfills._backfill import Backfill, BackfillRunner
+
+__all__ = ("Backfill", "BackfillRunner")
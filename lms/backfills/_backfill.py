@@ -0,0 +1,157 @@
+import logging
+from datetime import datetime
+from time import monotonic, sleep
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from lms.db import Replica
+from lms.models import BackfillCheckpoint
+
+LOG = logging.getLogger(__name__)
+
+
+class Backfill:
+    """
+    Base class for data backfills that can run online.
+
+    Subclasses say which rows to process and how to process a batch of them.
+    `BackfillRunner` then walks through the rows in batches, in `key` order,
+    committing each batch and its checkpoint together.
+    """
+
+    @property
+    def key(self) -> sa.ColumnElement:
+        """
+        Get the unique, indexed column to walk the rows by, e.g. `Model.id`.
+
+        Its values must be JSON serializable as they are stored in checkpoints.
+        """
+        raise NotImplementedError
+
+    @property
+    def name(self) -> str:
+        """Name the checkpoint is stored under."""
+        return f"{type(self).__module__}.{type(self).__name__}"
+
+    def where(self) -> sa.ColumnElement[bool]:
+        """Get a clause to only process some rows, e.g. those still to fix."""
+        return sa.true()
+
+    def run_batch(self, db: Session, keys: list) -> None:
+        """Process the rows with `keys`."""
+        raise NotImplementedError
+
+
+class BackfillRunner:
+    """Run backfills in small batches, resuming where the last run stopped."""
+
+    REPLICA_WAIT = 10
+    """How long (in seconds) to wait for a lagging replica to catch up."""
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = 1000,
+        max_rows_per_second: float | None = None,
+        replica: Replica | None = None,
+    ):
+        """
+        Initialize the runner.
+
+        :param db: Session to run backfills with, it's committed after each
+            batch
+        :param batch_size: How many rows to process per transaction
+        :param max_rows_per_second: Slow down to this rate
+        :param replica: Wait for this replica to catch up between batches
+        """
+        self._db = db
+        self._batch_size = batch_size
+        self._max_rows_per_second = max_rows_per_second
+        self._replica = replica
+
+    def run(
+        self,
+        backfill: Backfill,
+        *,
+        restart: bool = False,
+        max_batches: int | None = None,
+    ) -> BackfillCheckpoint:
+        """
+        Run `backfill` until it runs out of rows.
+
+        If the backfill fails the batch in progress is rolled back. Running it
+        again picks up after the last batch that succeeded.
+
+        :param restart: Start from the first row again
+        :param max_batches: Stop after this many batches
+        :return: The backfill's checkpoint
+        """
+        checkpoint = self._checkpoint(backfill, restart=restart)
+        batches = 0
+
+        while not checkpoint.finished_at and batches != max_batches:
+            started = monotonic()
+            try:
+                rows = self._run_batch(backfill, checkpoint)
+                self._db.commit()
+            except Exception:
+                LOG.exception(
+                    "%s: failed after key %r", backfill.name, checkpoint.last_key
+                )
+                self._db.rollback()
+                raise
+            batches += 1
+
+            LOG.info(
+                "%s: %d rows done, up to key %r",
+                backfill.name,
+                checkpoint.rows_done,
+                checkpoint.last_key,
+            )
+            self._throttle(started, rows)
+
+        return checkpoint
+
+    def _checkpoint(self, backfill: Backfill, *, restart: bool) -> BackfillCheckpoint:
+        checkpoint = self._db.get(BackfillCheckpoint, backfill.name)
+
+        if not checkpoint:
+            checkpoint = BackfillCheckpoint(name=backfill.name)
+            self._db.add(checkpoint)
+        elif restart:
+            checkpoint.last_key = None
+            checkpoint.rows_done = 0
+            checkpoint.finished_at = None
+
+        self._db.commit()
+        return checkpoint
+
+    def _run_batch(self, backfill: Backfill, checkpoint: BackfillCheckpoint) -> int:
+        query = (
+            sa.select(backfill.key)
+            .where(backfill.where())
+            .order_by(backfill.key)
+            .limit(self._batch_size)
+        )
+        if checkpoint.last_key is not None:
+            query = query.where(backfill.key > checkpoint.last_key)
+
+        keys = self._db.scalars(query).all()
+        if not keys:
+            checkpoint.finished_at = datetime.utcnow()  # noqa: DTZ003
+            return 0
+
+        backfill.run_batch(self._db, list(keys))
+        checkpoint.last_key = keys[-1]
+        checkpoint.rows_done += len(keys)
+        return len(keys)
+
+    def _throttle(self, started: float, rows: int) -> None:
+        if self._max_rows_per_second:
+            # Take at least as long per batch as the rate allows
+            sleep(max(0, rows / self._max_rows_per_second - (monotonic() - started)))
+
+        while self._replica and not self._replica.is_available():
+            LOG.info("Waiting for the replica to catch up")
+            sleep(self.REPLICA_WAIT)
@@ -129,6 +129,54 @@ SETTINGS = (
     _Setting("email_preferences_secret"),
     _Setting("hubspot_api_key"),
     _Setting("hubspot_account_id"),
+    # Size of the process-wide HTTP connection pools used to talk to LMSes
+    # and other upstream APIs (max connections kept per host).
+    _Setting("http_pool_maxsize"),
+    # Per host overrides of `http_pool_maxsize`, one `host=size` per line.
+    _Setting("http_pool_hosts"),
+    # Maximum number of concurrent async requests (e.g. Blackboard folder
+    # traversal) we send to any single host.
+    _Setting("async_http_limit_per_host"),
+    # Queue events in batches of this size instead of one task per event.
+    # LTI events (e.g. launches) are then also queued instead of inserted by
+    # the request.
+    _Setting("event_buffer_size"),
+    # Maximum time (in seconds) an event can wait in the buffer.
+    _Setting("event_buffer_max_age"),
+    # How long (in seconds) dashboard annotation counts from h are cached.
+    # Set to 0 to disable the cache.
+    _Setting("annotation_counts_cache_ttl"),
+    # For how long after that (in seconds) cached counts are still served
+    # while they are refreshed in the background.
+    _Setting("annotation_counts_cache_stale_ttl"),
+    # How long (in seconds) the application instances and LTI registrations
+    # launches are resolved to, and their LTI role overrides, are cached. Set
+    # to 0 to disable the cache.
+    _Setting("tenant_cache_ttl"),
+    # How long (in seconds) launches leave the `updated` timestamps of
+    # unchanged memberships (and application instances' `last_launched`)
+    # alone after touching them. Set to 0 to touch them on every launch. Keep
+    # it well under a day, reports use these to find recently active courses.
+    _Setting("touch_interval"),
+    # Database connection pool of each process. Each of these is either a
+    # single value or per process type values, e.g. "10 celery=2".
+    _Setting("db_pool_size"),
+    _Setting("db_max_overflow"),
+    # Check connections are alive before using them.
+    _Setting("db_pool_pre_ping"),
+    # Replace connections older than this (in seconds).
+    _Setting("db_pool_recycle"),
+    # Cancel queries running for longer than this (in milliseconds).
+    _Setting("db_statement_timeout"),
+    # Connect through PgBouncer in transaction pooling mode.
+    _Setting("db_pgbouncer"),
+    # Optional read-only replica for dashboards and admin pages.
+    _Setting("database_replica_url"),
+    # Replication lag (in seconds) past which reads go to the primary instead.
+    _Setting("database_replica_max_lag"),
+    # Add the number and duration of each request's DB queries as response
+    # headers. Meant for development and QA, not production.
+    _Setting("db_query_profile_headers", value_mapper=asbool),
 )
 
 
@@ -11,8 +11,28 @@ from sqlalchemy.orm import Query, Session, declarative_base, sessionmaker
 from sqlalchemy.orm.properties import ColumnProperty
 
 from lms.db._columns import varchar_enum
+from lms.db._engine import create_engine, engine_options
 from lms.db._locks import CouldNotAcquireLock, LockType, try_advisory_transaction_lock
-from lms.db._text_search import full_text_match
+from lms.db._partitions import (
+    create_monthly_partition,
+    drop_monthly_partition,
+    monthly_partitions,
+    partitioned_by_month,
+)
+from lms.db._profiler import (
+    QueryProfile,
+    add_query_profile_headers,
+    log_query_profile,
+    profile_queries,
+    stop_profiling_queries,
+)
+from lms.db._replica import Replica, RoutingSession, replica_safe_view, use_replica
+from lms.db._text_search import (
+    escape_like,
+    full_text_match,
+    partial_match,
+    search_vector,
+)
 from lms.db._util import compile_query
 
 __all__ = ("Base", "compile_query", "create_engine", "varchar_enum")
@@ -37,17 +57,21 @@ Base = declarative_base(
 )
 
 
-def create_engine(database_url):
-    """Construct a sqlalchemy engine from the passed ``settings``."""
-    return sqlalchemy.create_engine(database_url)
+def pre_create(engine):
+    """Install the extensions the models need (called by `init_db`)."""
+    with engine.begin() as connection:
+        # Trigram indexes for partial matches. See `partial_match`.
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
 
-SESSION = sessionmaker()
+SESSION = sessionmaker(class_=RoutingSession)
 
 
 def _session(request):  # pragma: no cover
     engine = request.registry["sqlalchemy.engine"]
-    session = SESSION(bind=engine)
+    session = SESSION(
+        bind=engine, info={"replica": request.registry.get("sqlalchemy.replica")}
+    )
 
     # If the request has a transaction manager, associate the session with it.
     try:
@@ -57,6 +81,12 @@ def _session(request):  # pragma: no cover
     else:
         zope.sqlalchemy.register(session, transaction_manager=transaction_manager)
 
+    # Record how many queries the request makes and how long they take.
+    profile_queries(session)
+    request.add_finished_callback(log_query_profile)
+    if request.registry.settings.get("db_query_profile_headers"):
+        request.add_response_callback(add_query_profile_headers)
+
     # pyramid_tm doesn't always close the database session for us.
     #
     # If anything that executes later in the Pyramid request processing cycle
@@ -75,9 +105,21 @@ def _session(request):  # pragma: no cover
 
 def includeme(config):
     # Create the SQLAlchemy engine and save a reference in the app registry.
-    engine = create_engine(config.registry.settings["database_url"])
+    settings = config.registry.settings
+    options = engine_options(settings, settings.get("process_type", "web"))
+    engine = create_engine(settings["database_url"], **options)
     config.registry["sqlalchemy.engine"] = engine
 
+    # Optionally, a read-only replica for views and services that can read
+    # slightly outdated data. See `use_replica`.
+    if replica_url := settings.get("database_replica_url"):
+        config.registry["sqlalchemy.replica"] = Replica(
+            create_engine(replica_url, **options),
+            max_lag=float(settings.get("database_replica_max_lag") or 30),
+        )
+    replica_safe_view.options = ["replica_safe"]  # type: ignore  # noqa: PGH003
+    config.add_view_deriver(replica_safe_view)
+
     # Add a property to all requests for easy access to the session. This means
     # that view functions need only refer to ``request.db`` in order to
     # retrieve the current database session.
@@ -0,0 +1,101 @@
+from time import perf_counter
+
+import sqlalchemy as sa
+from newrelic.agent import record_custom_metric
+from pyramid.settings import asbool
+from sqlalchemy.pool import QueuePool
+
+from lms.config import aslist
+
+
+class TimedQueuePool(QueuePool):
+    """A `QueuePool` that records how long checking out a connection takes."""
+
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            # Waiting for a free connection (or opening a new one) before the
+            # request can even start talking to the DB. A high value means
+            # the pool is too small for the process' concurrency.
+            record_custom_metric("Custom/DB/PoolCheckoutWait", perf_counter() - start)
+
+
+def engine_options(settings, process_type: str) -> dict:
+    """
+    Get the `create_engine` keyword arguments for the `db_*` app settings.
+
+    Each setting is either a plain value for every process or a list of
+    `process_type=value` entries, with an optional plain value as the default
+    for the rest. For example, with `db_pool_size` set to:
+
+        10 celery=2
+
+    web processes get a pool of 10 connections and Celery workers one of 2.
+
+    With `db_pgbouncer` set the engine is compatible with PgBouncer's
+    transaction pooling: the server connection changes between transactions
+    so `statement_timeout` is set for each transaction instead of once for
+    the connection.
+
+    :param settings: The app settings
+    :param process_type: Type of the current process, e.g. "web" or "celery"
+    """
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_pre_ping": asbool(
+            _process_setting(settings, "db_pool_pre_ping", process_type)
+        ),
+    }
+    connect_args = {"application_name": f"lms-{process_type}"}
+
+    for name, option in (
+        ("db_pool_size", "pool_size"),
+        ("db_max_overflow", "max_overflow"),
+        ("db_pool_recycle", "pool_recycle"),
+    ):
+        if (value := _process_setting(settings, name, process_type)) is not None:
+            options[option] = int(value)
+
+    statement_timeout = _process_setting(settings, "db_statement_timeout", process_type)
+    if statement_timeout is not None:
+        if asbool(_process_setting(settings, "db_pgbouncer", process_type)):
+            options["statement_timeout"] = int(statement_timeout)
+        else:
+            connect_args["options"] = f"-c statement_timeout={int(statement_timeout)}"
+
+    options["connect_args"] = connect_args
+    return options
+
+
+def create_engine(database_url, **options):
+    """Construct a sqlalchemy engine with the given `engine_options`."""
+    statement_timeout = options.pop("statement_timeout", None)
+
+    engine = sa.create_engine(database_url, **options)
+
+    if statement_timeout is not None:
+
+        @sa.event.listens_for(engine, "begin")
+        def set_statement_timeout(connection):
+            # `SET LOCAL` only lasts until the end of the transaction, so
+            # nothing leaks into the next client of a PgBouncer connection.
+            connection.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {statement_timeout}"
+            )
+
+    return engine
+
+
+def _process_setting(settings, name: str, process_type: str) -> str | None:
+    default = None
+
+    for entry in aslist(settings.get(name)):
+        key, sep, value = entry.partition("=")
+        if not sep:
+            default = entry
+        elif key == process_type:
+            return value
+
+    return default
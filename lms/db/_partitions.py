@@ -0,0 +1,115 @@
+import re
+from datetime import date, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+
+def partitioned_by_month(table: sa.Table) -> sa.Table:
+    """
+    Set up `table` to be partitioned by month.
+
+    The table must be declared with a ``postgresql_partition_by`` of
+    ``RANGE (<timestamp column>)``. When it's created it gets a default
+    partition for rows that don't fall in any monthly partition. Create the
+    monthly partitions with `create_monthly_partition` before they are needed
+    as that fails once the default partition has rows for the month.
+    """
+    sa.event.listen(
+        table,
+        "after_create",
+        sa.DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+    )
+    return table
+
+
+def create_monthly_partition(db: Session, table: sa.Table, month: date) -> bool:
+    """
+    Create the partition of `table` for `month` if it doesn't exist.
+
+    Months covered, even partly, by another partition (e.g. one holding the
+    rows from before the table was partitioned) are skipped: Postgres doesn't
+    allow overlapping partitions.
+
+    :return: Whether the partition was created
+    """
+    month = month.replace(day=1)
+    next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    for start, end in _partition_bounds(db, table).values():
+        if (start is None or start < next_month) and (end is None or end > month):
+            return False
+
+    db.execute(
+        sa.text(
+            f"CREATE TABLE {_partition_name(table, month)}"
+            f" PARTITION OF {table.name}"
+            f" FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+    )
+    return True
+
+
+def monthly_partitions(db: Session, table: sa.Table) -> list[date]:
+    """Get the months `table` has a partition for, oldest first."""
+    pattern = re.compile(rf"{table.name}_y(\d{{4}})m(\d{{2}})")
+    return sorted(
+        date(int(match[1]), int(match[2]), 1)
+        for name in _partition_bounds(db, table)
+        if (match := pattern.fullmatch(name))
+    )
+
+
+def drop_monthly_partition(db: Session, table: sa.Table, month: date) -> None:
+    """
+    Detach and drop the partition of `table` for `month`.
+
+    Drop the partitions of tables referencing `table` first, Postgres checks
+    for referencing rows when detaching.
+    """
+    name = _partition_name(table, month)
+
+    db.execute(sa.text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+    db.execute(sa.text(f"DROP TABLE {name}"))
+
+
+_RANGE_BOUND = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+def _partition_bounds(
+    db: Session, table: sa.Table
+) -> dict[str, tuple[date | None, date | None]]:
+    """
+    Get the range each of `table`'s partitions covers, by name.
+
+    Unbounded ends (`MINVALUE`, `MAXVALUE` and the default partition) are
+    `None`.
+    """
+    rows = db.execute(
+        sa.text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table"
+        ),
+        {"table": table.name},
+    )
+
+    bounds = {}
+    for name, bound in rows:
+        if match := _RANGE_BOUND.fullmatch(bound):
+            bounds[name] = (_parse_bound(match[1]), _parse_bound(match[2]))
+    return bounds
+
+
+def _parse_bound(bound: str) -> date | None:
+    if bound in {"MINVALUE", "MAXVALUE"}:
+        return None
+
+    # A quoted timestamp, e.g. '2024-01-01 00:00:00'
+    return datetime.fromisoformat(bound.strip("'")).date()
+
+
+def _partition_name(table: sa.Table, month: date) -> str:
+    return f"{table.name}_y{month.year}m{month.month:02d}"
@@ -0,0 +1,129 @@
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from heapq import heappush, heappushpop
+from time import perf_counter
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(order=True, frozen=True)
+class Statement:
+    duration: float
+    """Time (in seconds) the statement took."""
+
+    sql: str = field(compare=False)
+
+    parameters_fingerprint: str = field(compare=False)
+    """
+    Short hash of the statement's parameters.
+
+    Tells apart repeats of the same statement with the same parameters (e.g.
+    the same row loaded twice) from ones with different parameters (e.g. an
+    N+1 query) without logging the parameters themselves.
+    """
+
+
+@dataclass
+class QueryProfile:
+    """The queries issued by a DB session."""
+
+    SLOWEST_STATEMENTS = 5
+
+    count: int = 0
+    duration: float = 0
+    """Total time (in seconds) spent running queries."""
+
+    _slowest: list[Statement] = field(default_factory=list)
+
+    @property
+    def slowest(self) -> list[Statement]:
+        """The slowest statements, slowest first."""
+        return sorted(self._slowest, reverse=True)
+
+    def record(self, sql: str, parameters, duration: float):
+        self.count += 1
+        self.duration += duration
+
+        fingerprint = hashlib.sha1(repr(parameters).encode(), usedforsecurity=False)
+        statement = Statement(duration, sql, fingerprint.hexdigest()[:8])
+        if len(self._slowest) < self.SLOWEST_STATEMENTS:
+            heappush(self._slowest, statement)
+        else:
+            heappushpop(self._slowest, statement)
+
+
+def profile_queries(session: Session) -> QueryProfile:
+    """Start recording the queries issued by `session`."""
+    profile = session.info["query_profile"] = QueryProfile()
+    if session.in_transaction():
+        # The connection the session already has won't begin again
+        session.connection().info["query_profile"] = profile
+    return profile
+
+
+def stop_profiling_queries(session: Session) -> None:
+    """Stop recording the queries issued by `session`."""
+    session.info.pop("query_profile", None)
+    if session.in_transaction():
+        session.connection().info.pop("query_profile", None)
+
+
+def log_query_profile(request):
+    """Log the queries of `request.db`."""
+    profile = request.db.info["query_profile"]
+    if not profile.count:
+        return
+
+    LOG.info(
+        "%s %s: %d queries in %.1fms. Slowest: %s",
+        request.method,
+        request.path,
+        profile.count,
+        profile.duration * 1000,
+        "; ".join(
+            f"{statement.duration * 1000:.1f}ms [{statement.parameters_fingerprint}]"
+            # Keep the whole summary on one line
+            f" {' '.join(statement.sql.split())[:200]}"
+            for statement in profile.slowest
+        ),
+    )
+
+
+def add_query_profile_headers(request, response):
+    """Add the number and duration of `request.db`'s queries to `response`."""
+    profile = request.db.info["query_profile"]
+
+    response.headers["X-DB-Query-Count"] = str(profile.count)
+    response.headers["X-DB-Query-Time"] = f"{profile.duration * 1000:.1f}ms"
+
+
+@sa.event.listens_for(Session, "after_begin")
+def _profile_connection(session, _transaction, connection):
+    if profile := session.info.get("query_profile"):
+        connection.info["query_profile"] = profile
+
+
+@sa.event.listens_for(Pool, "checkin")
+def _stop_profiling_connection(_dbapi_connection, connection_record):
+    # The connection might be used next by a session that isn't profiled
+    connection_record.info.pop("query_profile", None)
+
+
+@sa.event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, *_args):
+    if "query_profile" in conn.info:
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+
+@sa.event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, _cursor, statement, parameters, *_args):
+    if profile := conn.info.get("query_profile"):
+        profile.record(
+            statement, parameters, perf_counter() - conn.info["query_start"].pop()
+        )
@@ -0,0 +1,152 @@
+import logging
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+
+from sqlalchemy import Select, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+LOG = logging.getLogger(__name__)
+
+
+class Replica:
+    """A read-only replica of the database."""
+
+    CHECK_INTERVAL = 10
+    """How often (in seconds) to check the replication lag."""
+
+    def __init__(self, engine, max_lag: float):
+        """
+        Initialize the replica.
+
+        :param engine: Engine connected to the replica
+        :param max_lag: Lag (in seconds) past which the replica isn't used
+        """
+        self.engine = engine
+        self.max_lag = max_lag
+
+        self._lock = Lock()
+        self._available = False
+        self._checked_at: float | None = None
+
+    def is_available(self) -> bool:
+        """Get whether the replica is close enough to the primary to read from."""
+        with self._lock:
+            now = monotonic()
+            if (
+                self._checked_at is None
+                or now - self._checked_at >= self.CHECK_INTERVAL
+            ):
+                self._available = self._check()
+                self._checked_at = now
+
+            return self._available
+
+    def _check(self) -> bool:
+        try:
+            with self.engine.connect() as connection:
+                lag = connection.execute(
+                    # NULL when the server isn't replaying WAL, i.e. it's not
+                    # a replica
+                    text(
+                        "SELECT COALESCE(EXTRACT(EPOCH FROM"
+                        " now() - pg_last_xact_replay_timestamp()), 0)"
+                    )
+                ).scalar()
+        except SQLAlchemyError:
+            LOG.exception("Couldn't check the replication lag")
+            return False
+
+        if lag > self.max_lag:
+            LOG.warning("Replica lagging by %ss, using the primary", lag)
+            return False
+
+        return True
+
+
+class RoutingSession(Session):
+    """
+    A session that can send reads to a replica.
+
+    Inside `use_replica` plain `SELECT`s go to `info["replica"]` while it
+    isn't lagging. Everything else always goes to the primary.
+
+    Once the session has pending or flushed writes all its queries go to the
+    primary until the end of the transaction. The replica wouldn't see those
+    writes, and what's read next might be written back to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = self.info.get("replica")
+
+        if (
+            replica
+            and self.info.get("use_replica")
+            and isinstance(clause, Select)
+            and not self.has_writes()
+            and replica.is_available()
+        ):
+            return replica.engine
+
+        bind = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if clause is not None and clause.is_dml:
+            # e.g. an `insert()` executed directly, without the unit of work
+            self.info["has_writes"] = True
+
+        return bind
+
+    def has_writes(self) -> bool:
+        """Get whether this transaction has written, or is about to write."""
+        return bool(
+            self.info.get("has_writes") or self.new or self.dirty or self.deleted
+        )
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, _flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _after_transaction_end(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("has_writes", None)
+
+
+@contextmanager
+def use_replica(db: Session):
+    """
+    Read from the replica (if there is one) within this block.
+
+    Only use this for read-only code that can tolerate reading data a few
+    seconds old.
+    """
+    previous = db.info.get("use_replica", False)
+    db.info["use_replica"] = True
+    try:
+        yield db
+    finally:
+        db.info["use_replica"] = previous
+
+
+def replica_safe_view(view, info):
+    """
+    Run the view inside `use_replica`.
+
+    This is a Pyramid "view deriver" that a view can activate by having a
+    ``replica_safe=True`` argument in its view config.
+    """
+    if info.options.get("replica_safe"):
+
+        def wrapper_view(context, request):
+            # Get the LTI user's `User` from the primary. A user created by a
+            # recent launch might not have reached the replica yet, and
+            # getting it from there would raise `UserNotFound`.
+            _ = request.user
+
+            with use_replica(request.db):
+                return view(context, request)
+
+        return wrapper_view
+    return view
@@ -1,14 +1,44 @@
 import sqlalchemy as sa
 
 
+def search_vector(column):
+    """
+    Get the full text search vector of `column`.
+
+    Index it (``USING gin``) to avoid computing it for every row on each
+    search. Queries only use the index for this exact expression, which is
+    what `full_text_match` searches.
+    """
+    # A literal, as opposed to a bound parameter, so the expression always
+    # matches the index's
+    return sa.func.to_tsvector(sa.literal_column("'english'::regconfig"), column)
+
+
 def full_text_match(column, value):
     """
     Get an SQL comparator for full text matching.
 
     This uses a slightly janky kind of full text searching, but is more
     flexible than a direct comparison.
-    """
 
-    return sa.func.to_tsvector("english", column).op("@@")(
+    :param column: A text column, ideally with an index over its
+        `search_vector`
+    """
+    return search_vector(column).op("@@")(
         sa.func.websearch_to_tsquery("english", value)
     )
+
+
+def partial_match(column, value: str):
+    """
+    Get an SQL comparator for case insensitive substring matching.
+
+    Back `column` with a trigram index (``gin_trgm_ops``) to avoid scanning
+    the whole table.
+    """
+    return column.ilike(f"%{escape_like(value)}%", escape="\\")
+
+
+def escape_like(value: str) -> str:
+    """Escape the wildcards in `value` for use in a LIKE pattern."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
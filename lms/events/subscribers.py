@@ -1,11 +1,32 @@
 from pyramid.events import subscriber
 
-from lms.events.event import BaseEvent
+from lms.events.event import BaseEvent, LTIEvent
 from lms.services import EventService
+from lms.services.event import EVENT_BUFFER
 
 
 @subscriber(BaseEvent)
 def handle_event(event: BaseEvent):
-    """Record the event in the Event model's table."""
+    """
+    Record the event in the Event model's table.
+
+    With the event buffer enabled LTI events (e.g. launches) are buffered
+    instead of inserted by the request itself, see `EventBuffer`. Other
+    events, like the audit trail, are always inserted right away.
+    """
     assert event.request  # noqa: S101
+
+    if isinstance(event, LTIEvent) and EVENT_BUFFER.enabled:
+        # Events refer to rows the request might be creating, only buffer
+        # them once those are committed.
+        event.request.tm.get().addAfterCommitHook(
+            _buffer_event, args=(event.serialize(),)
+        )
+        return
+
     event.request.find_service(EventService).insert_event(event)
+
+
+def _buffer_event(committed: bool, event: dict) -> None:  # noqa: FBT001
+    if committed:
+        EVENT_BUFFER.add(event)
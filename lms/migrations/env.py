@@ -1,4 +1,5 @@
 import os
+import re
 from logging.config import fileConfig
 
 from alembic import context
@@ -19,6 +20,29 @@ fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
 
+# The partitions of partitioned tables (e.g. `event_y2024m01` or
+# `event_legacy`) are created as needed, not by the models.
+PARTITIONED_TABLES = [
+    table.name
+    for table in target_metadata.tables.values()
+    if table.dialect_options["postgresql"]["partition_by"]
+]
+PARTITION_NAME = re.compile(
+    rf"({'|'.join(PARTITIONED_TABLES)})_(legacy|default|y\d{{4}}m\d{{2}})"
+)
+
+
+def include_object(object_, _name, type_, _reflected, _compare_to):
+    """Leave partitions, and their indexes and constraints, out of autogenerate."""
+    if type_ == "table":
+        tables = [object_]
+    elif type_ == "foreign_key_constraint":
+        tables = [object_.table, object_.referred_table]
+    else:
+        tables = [object_.table]
+
+    return not any(PARTITION_NAME.fullmatch(table.name) for table in tables)
+
 
 def run_migrations_offline():
     """
@@ -36,6 +60,7 @@ def run_migrations_offline():
     context.configure(
         url=os.environ["DATABASE_URL"],
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
     )
 
@@ -59,7 +84,11 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,66 @@
+"""Add search vector and trigram indexes for the admin searches.
+
+Revision ID: 3c9e8b1d2f47
+Revises: 5f1c2d3e4a6b
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "3c9e8b1d2f47"
+down_revision = "5f1c2d3e4a6b"
+
+
+SEARCH_VECTORS = [
+    ("grouping", "lms_name"),
+    ("application_instances", "name"),
+    ("organization", "name"),
+]
+TRIGRAM_INDEXES = [
+    ("ix__grouping_lms_name_trgm", "grouping", "lms_name"),
+    (
+        "ix__application_instances_requesters_email_trgm",
+        "application_instances",
+        "requesters_email",
+    ),
+    (
+        "ix__application_instances_contact_email_trgm",
+        "application_instances",
+        "tool_consumer_instance_contact_email",
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY can't be used inside a transaction. Finish the current one.
+    op.execute("COMMIT")
+
+    for table, column in SEARCH_VECTORS:
+        op.create_index(
+            f"ix__{table}_{column}_search_vector",
+            table,
+            # The same expression as `lms.db.search_vector`
+            [sa.text(f"to_tsvector('english'::regconfig, {column})")],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, column in SEARCH_VECTORS:
+        op.drop_index(f"ix__{table}_{column}_search_vector", table_name=table)
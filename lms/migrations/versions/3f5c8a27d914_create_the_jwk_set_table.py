@@ -0,0 +1,35 @@
+"""Create the jwk_set table.
+
+Revision ID: 3f5c8a27d914
+Revises: 6a1d9e3b7c28
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "3f5c8a27d914"
+down_revision = "6a1d9e3b7c28"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jwk_set",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("url", sa.UnicodeText(), nullable=False),
+        sa.Column("keys", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "created", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__jwk_set")),
+        sa.UniqueConstraint("url", name=op.f("uq__jwk_set__url")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("jwk_set")
@@ -0,0 +1,64 @@
+"""Create organization_hierarchy closure table.
+
+Revision ID: 5f1c2d3e4a6b
+Revises: fa62e42cb531
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "5f1c2d3e4a6b"
+down_revision = "fa62e42cb531"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_hierarchy",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ancestor_id"],
+            ["organization.id"],
+            name=op.f("fk__organization_hierarchy__ancestor_id__organization"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["descendant_id"],
+            ["organization.id"],
+            name=op.f("fk__organization_hierarchy__descendant_id__organization"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint(
+            "ancestor_id", "descendant_id", name=op.f("pk__organization_hierarchy")
+        ),
+    )
+    op.create_index(
+        op.f("ix__organization_hierarchy_descendant_id"),
+        "organization_hierarchy",
+        ["descendant_id"],
+        unique=False,
+    )
+
+    # Fill the table from the existing parent_id links
+    op.execute(
+        """
+        INSERT INTO organization_hierarchy (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE hierarchy(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM organization
+            UNION ALL
+            SELECT hierarchy.ancestor_id, organization.id, hierarchy.depth + 1
+            FROM hierarchy
+            JOIN organization ON organization.parent_id = hierarchy.descendant_id
+        )
+        SELECT ancestor_id, descendant_id, depth FROM hierarchy
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix__organization_hierarchy_descendant_id"),
+        table_name="organization_hierarchy",
+    )
+    op.drop_table("organization_hierarchy")
@@ -0,0 +1,35 @@
+"""Create the backfill_checkpoint table.
+
+Revision ID: 6a1d9e3b7c28
+Revises: b2e7c4a91f05
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "6a1d9e3b7c28"
+down_revision = "b2e7c4a91f05"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_checkpoint",
+        sa.Column("name", sa.UnicodeText(), nullable=False),
+        sa.Column("last_key", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "rows_done", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk__backfill_checkpoint")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_checkpoint")
@@ -0,0 +1,232 @@
+"""Partition the event tables by month.
+
+The existing tables become a single "legacy" partition of the new partitioned
+tables, covering every event up to the end of the current month. Drop it by
+hand once those events are past their retention, `maintain_event_partitions`
+only looks after the monthly partitions.
+
+This is a one-off, heavy migration: it copies the event's timestamp into every
+`event_user` and `event_data` row and builds the new primary keys over the
+existing rows. Run it in a maintenance window.
+
+It can't be downgraded: going back to unpartitioned tables means copying every
+event, restore a backup taken before running it instead.
+
+Revision ID: 8d4f2a6c1e93
+Revises: 3c9e8b1d2f47
+"""
+
+from datetime import UTC, date, datetime
+from itertools import pairwise
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "8d4f2a6c1e93"
+down_revision = "3c9e8b1d2f47"
+
+
+TABLES = ["event", "event_user", "event_data"]
+"""The partitioned tables, referenced tables first."""
+
+FUTURE_MONTHS = 3
+
+
+def upgrade() -> None:
+    today = datetime.now(UTC).date()
+    months = [_add_months(today, offset) for offset in range(1, FUTURE_MONTHS + 2)]
+
+    # The partition key has to be part of the primary key and of foreign keys
+    # so the tables referencing events need a copy of the timestamp.
+    for table in ["event_user", "event_data"]:
+        op.add_column(table, sa.Column("event_timestamp", sa.DateTime()))
+        op.execute(
+            f"UPDATE {table} SET event_timestamp = event.timestamp"  # noqa: S608
+            f" FROM event WHERE event.id = {table}.event_id"
+        )
+        op.alter_column(table, "event_timestamp", nullable=False)
+        op.drop_constraint(f"fk__{table}__event_id__event", table)
+
+    # Move the existing tables, and their indexes, out of the way.
+    for table in TABLES:
+        op.rename_table(table, f"{table}_legacy")
+        op.execute(
+            f"""
+            DO $$
+            DECLARE index_name text;
+            BEGIN
+                FOR index_name IN
+                    SELECT indexname FROM pg_indexes WHERE tablename = '{table}_legacy'
+                LOOP
+                    EXECUTE format(
+                        'ALTER INDEX %I RENAME TO %I',
+                        index_name,
+                        left(index_name, 55) || '_legacy'
+                    );
+                END LOOP;
+            END $$
+            """  # noqa: S608
+        )
+        # Replaced by the partitioned table's, which include the partition key
+        op.drop_constraint(f"pk__{table}_legacy", f"{table}_legacy")
+    op.drop_constraint("uq__event_user__event_id_legacy", "event_user_legacy")
+
+    _create_event()
+    _create_event_user()
+    _create_event_data()
+
+    for table in TABLES:
+        op.execute(f"ALTER SEQUENCE IF EXISTS {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {table}_legacy"
+            f" FOR VALUES FROM (MINVALUE) TO ('{months[0].isoformat()}')"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        for start, end in pairwise(months):
+            op.execute(
+                f"CREATE TABLE {table}_y{start.year}m{start.month:02d}"
+                f" PARTITION OF {table}"
+                f" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+
+
+def _create_event():
+    op.create_table(
+        "event",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('event_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column(
+            "timestamp", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("type_id", sa.Integer(), nullable=True),
+        sa.Column("application_instance_id", sa.Integer(), nullable=True),
+        sa.Column("course_id", sa.Integer(), nullable=True),
+        sa.Column("assignment_id", sa.Integer(), nullable=True),
+        sa.Column("grouping_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["application_instance_id"],
+            ["application_instances.id"],
+            name=op.f("fk__event__application_instance_id__application_instances"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["assignment_id"],
+            ["assignment.id"],
+            name=op.f("fk__event__assignment_id__assignment"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["course_id"],
+            ["grouping.id"],
+            name=op.f("fk__event__course_id__grouping"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["grouping_id"],
+            ["grouping.id"],
+            name=op.f("fk__event__grouping_id__grouping"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["type_id"],
+            ["event_type.id"],
+            name=op.f("fk__event__type_id__event_type"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", "timestamp", name=op.f("pk__event")),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    for column in [
+        "application_instance_id",
+        "assignment_id",
+        "course_id",
+        "timestamp",
+        "type_id",
+    ]:
+        op.create_index(op.f(f"ix__event_{column}"), "event", [column])
+
+
+def _create_event_user():
+    op.create_table(
+        "event_user",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('event_user_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("event_timestamp", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("lti_role_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["event_id", "event_timestamp"],
+            ["event.id", "event.timestamp"],
+            name=op.f("fk__event_user__event_id__event"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["lti_role_id"],
+            ["lti_role.id"],
+            name=op.f("fk__event_user__lti_role_id__lti_role"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            name=op.f("fk__event_user__user_id__user"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint(
+            "id", "event_id", "event_timestamp", name=op.f("pk__event_user")
+        ),
+        sa.UniqueConstraint(
+            "event_id",
+            "user_id",
+            "lti_role_id",
+            "event_timestamp",
+            name=op.f("uq__event_user__event_id"),
+        ),
+        postgresql_partition_by="RANGE (event_timestamp)",
+    )
+    for column in ["lti_role_id", "user_id"]:
+        op.create_index(op.f(f"ix__event_user_{column}"), "event_user", [column])
+
+
+def _create_event_data():
+    op.create_table(
+        "event_data",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("event_timestamp", sa.DateTime(), nullable=False),
+        sa.Column(
+            "extra",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["event_id", "event_timestamp"],
+            ["event.id", "event.timestamp"],
+            name=op.f("fk__event_data__event_id__event"),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint(
+            "event_id", "event_timestamp", name=op.f("pk__event_data")
+        ),
+        postgresql_partition_by="RANGE (event_timestamp)",
+    )
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def downgrade() -> None:
+    # Not reversible, see the module's docstring.
+    pass
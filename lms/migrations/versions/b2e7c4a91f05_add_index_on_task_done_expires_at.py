@@ -0,0 +1,27 @@
+"""Add an index on task_done.expires_at.
+
+Revision ID: b2e7c4a91f05
+Revises: 8d4f2a6c1e93
+"""
+
+from alembic import op
+
+revision = "b2e7c4a91f05"
+down_revision = "8d4f2a6c1e93"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't be used inside a transaction. Finish the current one.
+    op.execute("COMMIT")
+
+    op.create_index(
+        op.f("ix__task_done_expires_at"),
+        "task_done",
+        ["expires_at"],
+        unique=False,
+        postgresql_concurrently=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix__task_done_expires_at"), table_name="task_done")
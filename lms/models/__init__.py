@@ -11,6 +11,7 @@ from lms.models.assignment_membership import (
     AssignmentMembership,
     LMSUserAssignmentMembership,
 )
+from lms.models.backfill_checkpoint import BackfillCheckpoint
 from lms.models.course_groups_exported_from_h import CourseGroupsExportedFromH
 from lms.models.dashboard_admin import DashboardAdmin
 from lms.models.event import Event, EventData, EventType, EventUser
@@ -32,6 +33,7 @@ from lms.models.grouping import (
 from lms.models.h_user import HUser
 from lms.models.hubspot import HubSpotCompany
 from lms.models.json_settings import JSONSettings
+from lms.models.jwk_set import JWKSet
 from lms.models.jwt_oauth2_token import JWTOAuth2Token
 from lms.models.legacy_course import LegacyCourse
 from lms.models.lms_course import (
@@ -49,6 +51,7 @@ from lms.models.lti_user import LTIUser, display_name
 from lms.models.notification import Notification
 from lms.models.oauth2_token import OAuth2Token
 from lms.models.organization import Organization
+from lms.models.organization_hierarchy import OrganizationHierarchy
 from lms.models.organization_usage import OrganizationUsageReport
 from lms.models.roster import AssignmentRoster, CourseRoster, LMSSegmentRoster
 from lms.models.rsa_key import RSAKey
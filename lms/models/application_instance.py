@@ -8,7 +8,7 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from lms.db import Base
+from lms.db import Base, search_vector
 from lms.models._mixins import CreatedUpdatedMixin
 from lms.models.exceptions import ReusedConsumerKey
 from lms.models.family import Family
@@ -209,6 +209,24 @@ class ApplicationInstance(CreatedUpdatedMixin, Base):
         # For LTI 1.3, registration and deployment_id uniquely identify the
         # instance.
         sa.UniqueConstraint("lti_registration_id", "deployment_id"),
+        # Indexes for searching by name and email in the admin pages.
+        sa.Index(
+            "ix__application_instances_name_search_vector",
+            search_vector(sa.column("name")),
+            postgresql_using="gin",
+        ),
+        sa.Index(
+            "ix__application_instances_requesters_email_trgm",
+            "requesters_email",
+            postgresql_using="gin",
+            postgresql_ops={"requesters_email": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix__application_instances_contact_email_trgm",
+            "tool_consumer_instance_contact_email",
+            postgresql_using="gin",
+            postgresql_ops={"tool_consumer_instance_contact_email": "gin_trgm_ops"},
+        ),
     )
 
     id = sa.Column(sa.Integer, autoincrement=True, primary_key=True)
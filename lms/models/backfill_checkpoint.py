@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from lms.db import Base
+from lms.models._mixins import CreatedUpdatedMixin
+
+
+class BackfillCheckpoint(CreatedUpdatedMixin, Base):
+    """The progress of a backfill, see `lms.backfills`."""
+
+    __tablename__ = "backfill_checkpoint"
+
+    name: Mapped[str] = mapped_column(sa.UnicodeText(), primary_key=True)
+    """The backfill's name."""
+
+    last_key = mapped_column(JSONB(), nullable=True)
+    """The key of the last row processed, None if none has been yet."""
+
+    rows_done: Mapped[int] = mapped_column(
+        sa.BigInteger(), server_default=sa.text("0"), default=0
+    )
+    """How many rows have been processed."""
+
+    finished_at: Mapped[datetime | None] = mapped_column()
+    """When the backfill ran out of rows, None if it's not finished."""
@@ -5,7 +5,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
 
-from lms.db import Base, varchar_enum
+from lms.db import Base, partitioned_by_month, varchar_enum
 
 
 class EventType(Base):
@@ -25,9 +25,15 @@ class EventType(Base):
 
 
 class Event(Base):
-    """Model to store any relevant events that occur within the application."""
+    """
+    Model to store any relevant events that occur within the application.
+
+    Events, and their `EventUser` and `EventData` rows, are partitioned by the
+    month of the event. See `lms.tasks.event.maintain_event_partitions`.
+    """
 
     __tablename__ = "event"
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}  # noqa: RUF012
 
     id = mapped_column(sa.Integer, autoincrement=True, primary_key=True)
 
@@ -36,6 +42,8 @@ class Event(Base):
         server_default=sa.func.now(),
         nullable=False,
         index=True,
+        # The partition key must be part of the primary key
+        primary_key=True,
     )
     """Time the event occurred, defaults to now() if not specified"""
 
@@ -84,16 +92,21 @@ class EventUser(Base):
 
     __tablename__ = "event_user"
 
-    __table_args__ = (sa.UniqueConstraint("event_id", "user_id", "lti_role_id"),)
+    __table_args__ = (
+        sa.UniqueConstraint("event_id", "user_id", "lti_role_id", "event_timestamp"),
+        sa.ForeignKeyConstraint(
+            ["event_id", "event_timestamp"],
+            ["event.id", "event.timestamp"],
+            ondelete="cascade",
+        ),
+        {"postgresql_partition_by": "RANGE (event_timestamp)"},
+    )
 
     id = sa.Column(sa.Integer, autoincrement=True, primary_key=True)
 
-    event_id = sa.Column(
-        sa.Integer(),
-        sa.ForeignKey("event.id", ondelete="cascade"),
-        nullable=False,
-        primary_key=True,
-    )
+    event_id = sa.Column(sa.Integer(), nullable=False, primary_key=True)
+    event_timestamp = sa.Column(sa.DateTime(), nullable=False, primary_key=True)
+    """Copy of `Event.timestamp`, the partition key."""
     event = sa.orm.relationship("Event")
 
     user_id = sa.Column(
@@ -119,13 +132,18 @@ class EventData(Base):
     """Keep potentially large blobs of data about an event in a separate table."""
 
     __tablename__ = "event_data"
-
-    event_id = sa.Column(
-        sa.Integer(),
-        sa.ForeignKey("event.id", ondelete="cascade"),
-        nullable=False,
-        primary_key=True,
+    __table_args__ = (
+        sa.ForeignKeyConstraint(
+            ["event_id", "event_timestamp"],
+            ["event.id", "event.timestamp"],
+            ondelete="cascade",
+        ),
+        {"postgresql_partition_by": "RANGE (event_timestamp)"},
     )
+
+    event_id = sa.Column(sa.Integer(), nullable=False, primary_key=True)
+    event_timestamp = sa.Column(sa.DateTime(), nullable=False, primary_key=True)
+    """Copy of `Event.timestamp`, the partition key."""
     event = sa.orm.relationship("Event")
 
     data: Mapped[MutableDict] = mapped_column(
@@ -134,3 +152,7 @@ class EventData(Base):
         server_default=sa.text("'{}'::jsonb"),
         nullable=False,
     )
+
+
+for _table in (Event.__table__, EventUser.__table__, EventData.__table__):
+    partitioned_by_month(_table)  # type: ignore[arg-type]
@@ -6,7 +6,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
 
-from lms.db import Base, varchar_enum
+from lms.db import Base, search_vector, varchar_enum
 from lms.models._mixins import CreatedUpdatedMixin
 from lms.models.json_settings import JSONSettings
 from lms.models.lms_course import LMSCourse
@@ -72,6 +72,18 @@ class Grouping(CreatedUpdatedMixin, Base):
             "(type='course' AND parent_id IS NULL) OR (type!='course' AND parent_id IS NOT NULL)",
             name="courses_must_NOT_have_parents_and_other_groupings_MUST_have_parents",
         ),
+        # Indexes for searching by name in the admin pages.
+        sa.Index(
+            "ix__grouping_lms_name_search_vector",
+            search_vector(sa.column("lms_name")),
+            postgresql_using="gin",
+        ),
+        sa.Index(
+            "ix__grouping_lms_name_trgm",
+            "lms_name",
+            postgresql_using="gin",
+            postgresql_ops={"lms_name": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True)
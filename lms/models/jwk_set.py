@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from lms.db import Base
+from lms.models._mixins import CreatedUpdatedMixin
+
+
+class JWKSet(CreatedUpdatedMixin, Base):
+    """
+    A copy of the JSON Web Key Set published by an LTI 1.3 platform.
+
+    Platforms sign their launches with the keys published in their
+    `LTIRegistration.key_set_url`. These are kept here so every process can
+    verify launches without downloading the keys first.
+    """
+
+    __tablename__ = "jwk_set"
+
+    id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True)
+
+    url: Mapped[str] = mapped_column(sa.UnicodeText(), unique=True)
+    """The URL the key set was downloaded from."""
+
+    keys: Mapped[dict] = mapped_column(JSONB())
+    """The key set document, as downloaded."""
+
+    fetched_at: Mapped[datetime] = mapped_column()
+    """When the key set was downloaded."""
+
+    expires_at: Mapped[datetime] = mapped_column()
+    """When the key set should be downloaded again, based on its Cache-Control."""
@@ -5,7 +5,7 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from lms.db import Base
+from lms.db import Base, search_vector
 from lms.models._mixins import CreatedUpdatedMixin
 from lms.models.json_settings import JSONSetting, JSONSettings
 
@@ -23,6 +23,14 @@ class Organization(CreatedUpdatedMixin, Base):
     """Model for Organizations comprised of application instances."""
 
     __tablename__ = "organization"
+    __table_args__ = (
+        # For searching by name in the admin pages.
+        sa.Index(
+            "ix__organization_name_search_vector",
+            search_vector(sa.column("name")),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True)
 
@@ -0,0 +1,95 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from lms.db import Base
+from lms.models.organization import Organization
+
+
+class OrganizationHierarchy(Base):
+    """
+    Closure table of the organization hierarchy.
+
+    There's a row for every (ancestor, descendant) pair of organizations,
+    including a row with depth 0 linking each organization to itself. That
+    makes "all the descendants of these organizations" a single indexed
+    lookup instead of a recursive query.
+
+    Rows are kept up to date by the ORM event listeners below whenever
+    organizations are created or their parent changes.
+    """
+
+    __tablename__ = "organization_hierarchy"
+
+    ancestor_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("organization.id", ondelete="cascade"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("organization.id", ondelete="cascade"),
+        primary_key=True,
+        index=True,
+    )
+    depth: Mapped[int] = mapped_column()
+    """How many levels below `ancestor` `descendant` is."""
+
+
+@sa.event.listens_for(Organization, "after_insert")
+def _insert_hierarchy(_mapper, connection, target: Organization):
+    hierarchy = OrganizationHierarchy.__table__
+
+    connection.execute(
+        sa.insert(hierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            sa.union_all(
+                # The organization itself
+                sa.select(sa.literal(target.id), sa.literal(target.id), sa.literal(0)),
+                # Everything above its parent (and the parent itself)
+                sa.select(
+                    hierarchy.c.ancestor_id,
+                    sa.literal(target.id),
+                    hierarchy.c.depth + 1,
+                ).where(hierarchy.c.descendant_id == target.parent_id),
+            ),
+        )
+    )
+
+
+@sa.event.listens_for(Organization, "after_update")
+def _move_hierarchy(_mapper, connection, target: Organization):
+    if not sa.inspect(target).attrs.parent_id.history.has_changes():
+        return
+
+    hierarchy = OrganizationHierarchy.__table__
+    subtree = sa.select(hierarchy.c.descendant_id).where(
+        hierarchy.c.ancestor_id == target.id
+    )
+
+    # Detach the organization and its descendants from their old ancestors
+    connection.execute(
+        sa.delete(hierarchy).where(
+            hierarchy.c.descendant_id.in_(subtree),
+            hierarchy.c.ancestor_id.not_in(subtree),
+        )
+    )
+
+    if target.parent_id is None:
+        return
+
+    # Link every node of the subtree to the new parent and its ancestors
+    above = hierarchy.alias("above")
+    below = hierarchy.alias("below")
+    connection.execute(
+        sa.insert(hierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            sa.select(
+                above.c.ancestor_id,
+                below.c.descendant_id,
+                above.c.depth + below.c.depth + 1,
+            )
+            # Every ancestor combined with every descendant
+            .join(below, sa.true())
+            .where(
+                above.c.descendant_id == target.parent_id,
+                below.c.ancestor_id == target.id,
+            ),
+        )
+    )
@@ -11,6 +11,10 @@ class TaskDone(CreatedUpdatedMixin, Base):
     id = Column(Integer, autoincrement=True, primary_key=True)
     key = Column(UnicodeText, nullable=False, unique=True)
     expires_at = Column(
-        DateTime, nullable=False, server_default=text("now() + interval '30 days'")
+        DateTime,
+        nullable=False,
+        server_default=text("now() + interval '30 days'"),
+        # For deleting expired rows in batches
+        index=True,
     )
     data = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=True)
@@ -2,13 +2,15 @@ from lms.services.aes import AESService
 from lms.services.annotation_activity_email import AnnotationActivityEmailService
 from lms.services.application_instance import ApplicationInstanceNotFound
 from lms.services.assignment import AssignmentService
+from lms.services.async_oauth_http import configure_async_runtime
 from lms.services.auto_grading import AutoGradingService
 from lms.services.canvas import CanvasService
 from lms.services.canvas_studio import CanvasStudioService
 from lms.services.d2l_api.client import D2LAPIClient
+from lms.services.dedupe import DedupeService
 from lms.services.digest import DigestService
 from lms.services.email_preferences import EmailPreferences, EmailPreferencesService
-from lms.services.event import EventService
+from lms.services.event import EventService, configure_event_buffer
 from lms.services.exceptions import (
     CanvasAPIError,
     CanvasAPIPermissionError,
@@ -19,11 +21,14 @@ from lms.services.exceptions import (
     SerializableError,
 )
 from lms.services.group_set import GroupSetService
-from lms.services.h_api import HAPI, HAPIError
+from lms.services.h_api import HAPI, HAPIError, configure_annotation_counts_cache
+from lms.services.http import configure_connection_pools
 from lms.services.hubspot import HubSpotService
 from lms.services.jstor import JSTORService
+from lms.services.jwk_set import JWKSetService
 from lms.services.jwt import JWTService
 from lms.services.jwt_oauth2_token import JWTOAuth2TokenService
+from lms.services.launch_persistence import LaunchPersistenceService
 from lms.services.launch_verifier import (
     ConsumerKeyLaunchVerificationError,
     LTILaunchVerificationError,
@@ -33,7 +38,7 @@ from lms.services.lms_term import LMSTermService
 from lms.services.lti_grading import LTIGradingService
 from lms.services.lti_names_roles import LTINamesRolesService
 from lms.services.lti_registration import LTIRegistrationService
-from lms.services.lti_role_service import LTIRoleService
+from lms.services.lti_role_service import LTIRoleService, configure_lti_role_cache
 from lms.services.lti_user import LTIUserService
 from lms.services.ltia_http import LTIAHTTPService
 from lms.services.moodle import MoodleAPIClient
@@ -42,6 +47,8 @@ from lms.services.organization_usage_report import OrganizationUsageReportServic
 from lms.services.roster import RosterService
 from lms.services.rsa_key import RSAKeyService
 from lms.services.segment import SegmentService
+from lms.services.tenant_cache import configure_tenant_cache
+from lms.services.touch import configure_touch_throttle
 from lms.services.user import UserService
 from lms.services.user_preferences import UserPreferencesService
 from lms.services.vitalsource import VitalSourceService
@@ -49,6 +56,13 @@ from lms.services.youtube import YouTubeService
 
 
 def includeme(config):  # noqa: PLR0915
+    configure_connection_pools(config.registry.settings)
+    configure_async_runtime(config.registry.settings)
+    configure_event_buffer(config.registry.settings)
+    configure_annotation_counts_cache(config.registry.settings)
+    configure_tenant_cache(config.registry.settings)
+    configure_lti_role_cache(config.registry.settings)
+    configure_touch_throttle(config.registry.settings)
     config.register_service_factory("lms.services.http.factory", name="http")
     config.register_service_factory(
         "lms.services.oauth_http.factory", name="oauth_http"
@@ -72,6 +86,9 @@ def includeme(config):  # noqa: PLR0915
         "lms.services.canvas_studio.factory", iface=CanvasStudioService
     )
     config.register_service_factory("lms.services.user.factory", iface=UserService)
+    config.register_service_factory(
+        "lms.services.launch_persistence.factory", iface=LaunchPersistenceService
+    )
     config.register_service_factory(
         "lms.services.user_preferences.factory", iface=UserPreferencesService
     )
@@ -129,6 +146,7 @@ def includeme(config):  # noqa: PLR0915
     )
     config.register_service_factory("lms.services.aes.factory", iface=AESService)
     config.register_service_factory("lms.services.jwt.factory", iface=JWTService)
+    config.register_service_factory("lms.services.jwk_set.factory", iface=JWKSetService)
     config.register_service_factory(
         "lms.services.jwt_oauth2_token.factory", iface=JWTOAuth2TokenService
     )
@@ -137,6 +155,7 @@ def includeme(config):  # noqa: PLR0915
     config.register_service_factory(
         "lms.services.ltia_http.factory", iface=LTIAHTTPService
     )
+    config.register_service_factory("lms.services.dedupe.factory", iface=DedupeService)
     config.register_service_factory("lms.services.mailchimp.factory", name="mailchimp")
     config.register_service_factory("lms.services.event.factory", iface=EventService)
     config.register_service_factory(
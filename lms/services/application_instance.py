@@ -4,13 +4,14 @@ from functools import lru_cache
 from logging import getLogger
 
 import sqlalchemy as sa
-from sqlalchemy.exc import NoResultFound
 
-from lms.db import full_text_match
+from lms.db import escape_like, full_text_match
 from lms.models import ApplicationInstance, JSONSettings, LTIParams, LTIRegistration
 from lms.services.aes import AESService
 from lms.services.exceptions import SerializableError
 from lms.services.organization import OrganizationService
+from lms.services.tenant_cache import TENANT_CACHE, TenantCache
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
 from lms.validation import ValidationError
 
 LOG = getLogger(__name__)
@@ -59,13 +60,11 @@ def _email_or_domain_match(columns, email: str):
     This will match the full email if it contains '@' or interpret the text
     as a domain if not. This will search over all the provided fields.
     """
+    # ILIKE rather than lower() so both can use the columns' trigram indexes
+    pattern = escape_like(email) if "@" in email else f"%@{escape_like(email)}"
+
     return sa.or_(  # type: ignore  # noqa: PGH003
-        (
-            sa.func.lower(column) == email.lower()
-            if "@" in email
-            else column.ilike(f"%@{email}")
-        )
-        for column in columns
+        column.ilike(pattern, escape="\\") for column in columns
     )
 
 
@@ -75,10 +74,14 @@ class ApplicationInstanceService:
         db,
         aes_service: AESService,
         organization_service: OrganizationService,
+        cache: TenantCache = TENANT_CACHE,
+        touch_throttle: TouchThrottle = TOUCH_THROTTLE,
     ):
         self._db = db
         self._aes_service = aes_service
         self._organization_service = organization_service
+        self._cache = cache
+        self._touch_throttle = touch_throttle
 
     @lru_cache(maxsize=1)  # noqa: B019
     def get_for_launch(self, id_) -> ApplicationInstance:
@@ -119,14 +122,9 @@ class ApplicationInstanceService:
 
         raise ApplicationInstanceNotFound
 
-    @lru_cache(maxsize=1)  # noqa: B019
     def get_by_id(self, id_) -> ApplicationInstance:
-        try:
-            return self._ai_search_query(id_=id_).one()
-        except NoResultFound as err:
-            raise ApplicationInstanceNotFound from err
+        return self._get_cached(("id", id_), self._ai_search_query(id_=id_))
 
-    @lru_cache(maxsize=128)  # noqa: B019
     def get_by_consumer_key(self, consumer_key) -> ApplicationInstance:
         """
         Return the `ApplicationInstance` with the given `consumer_key`.
@@ -138,25 +136,40 @@ class ApplicationInstanceService:
         if not consumer_key:
             raise ApplicationInstanceNotFound
 
-        try:
-            return self._ai_search_query(consumer_key=consumer_key).one()
-        except NoResultFound as err:
-            raise ApplicationInstanceNotFound from err
+        return self._get_cached(
+            ("consumer_key", consumer_key),
+            self._ai_search_query(consumer_key=consumer_key),
+        )
 
-    @lru_cache(maxsize=128)  # noqa: B019
     def get_by_deployment_id(
         self, issuer: str, client_id: str, deployment_id: str
     ) -> ApplicationInstance:
         if not all([issuer, client_id, deployment_id]):
             raise ApplicationInstanceNotFound
 
-        try:
-            return self._ai_search_query(
+        return self._get_cached(
+            ("deployment_id", issuer, client_id, deployment_id),
+            self._ai_search_query(
                 issuer=issuer, client_id=client_id, deployment_id=deployment_id
-            ).one()
+            ),
+        )
+
+    def invalidate_cache(self, application_instance: ApplicationInstance) -> None:
+        """
+        Make the `get_by_*` methods query `application_instance` again.
+
+        Takes effect once the current transaction is committed.
+        """
+        self._cache.invalidate_on_commit(self._db, application_instance)
 
-        except NoResultFound as err:
-            raise ApplicationInstanceNotFound from err
+    def _get_cached(self, key: tuple, query) -> ApplicationInstance:
+        application_instance = self._cache.get(
+            self._db, ("application_instance", *key), query.one_or_none
+        )
+        if not application_instance:
+            raise ApplicationInstanceNotFound
+
+        return application_instance
 
     def search(  # noqa: PLR0913
         self,
@@ -386,7 +399,14 @@ class ApplicationInstanceService:
 
         # This is a potentially misleading, as we can get here from deep-linked
         # "launches". Depending on whether you count that as a launch or not.
-        application_instance.last_launched = datetime.now()  # noqa: DTZ005
+        now = datetime.now()  # noqa: DTZ005
+        if self._touch_throttle.is_due(application_instance.last_launched, now):
+            application_instance.last_launched = now
+
+        if self._db.is_modified(application_instance):
+            # Otherwise launches would keep getting (and writing over) the
+            # values from before this change until the cached copy expires
+            self.invalidate_cache(application_instance)
 
 
 def factory(_context, request):
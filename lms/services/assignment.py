@@ -2,8 +2,9 @@ import logging
 from collections.abc import Sequence
 from datetime import UTC, datetime
 
-from sqlalchemy import Select, func, or_, select, text
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
 
 from lms.models import (
     Assignment,
@@ -12,10 +13,6 @@ from lms.models import (
     AutoGradingConfig,
     Course,
     Grouping,
-    LMSUser,
-    LMSUserAssignmentMembership,
-    LTIParams,
-    LTIRole,
     User,
 )
 from lms.services.course import CourseService
@@ -23,6 +20,7 @@ from lms.services.document_uri import (
     ensure_checkpoint_fingerprint,
     initial_document_uri,
 )
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
 from lms.services.upsert import bulk_upsert
 
 LOG = logging.getLogger(__name__)
@@ -31,9 +29,15 @@ LOG = logging.getLogger(__name__)
 class AssignmentService:
     """A service for getting and setting assignments."""
 
-    def __init__(self, db: Session, misc_plugin):
+    def __init__(
+        self,
+        db: Session,
+        misc_plugin,
+        touch_throttle: TouchThrottle = TOUCH_THROTTLE,
+    ):
         self._db = db
         self._misc_plugin = misc_plugin
+        self._touch_throttle = touch_throttle
 
     def get_assignment(self, tool_consumer_instance_guid, resource_link_id):
         """Get an assignment by resource_link_id."""
@@ -299,81 +303,6 @@ class AssignmentService:
             due_date=due_date,
         )
 
-    def upsert_assignment_membership(
-        self,
-        lti_params: LTIParams,
-        assignment: Assignment,
-        user: User,
-        lti_roles: list[LTIRole],
-    ) -> list[AssignmentMembership]:
-        """Store details of the roles a user plays in an assignment."""
-
-        # Commit any changes to ensure that our user and role objects have ids
-        self._db.flush()
-
-        values = [
-            {
-                "user_id": user.id,
-                "assignment_id": assignment.id,
-                "lti_role_id": lti_role.id,
-            }
-            for lti_role in lti_roles
-        ]
-
-        self._upsert_lms_user_assignment_memberships(
-            lti_params, user.lms_user, assignment, lti_roles
-        )
-
-        return list(
-            bulk_upsert(
-                self._db,
-                model_class=AssignmentMembership,
-                values=values,
-                index_elements=["user_id", "assignment_id", "lti_role_id"],
-                update_columns=["updated"],
-            )
-        )
-
-    def _upsert_lms_user_assignment_memberships(
-        self,
-        lti_params,
-        lms_user: LMSUser,
-        assignment: Assignment,
-        lti_roles: list[LTIRole],
-    ) -> list[LMSUserAssignmentMembership]:
-        values = [
-            {
-                "lms_user_id": lms_user.id,
-                "assignment_id": assignment.id,
-                "lti_role_id": lti_role.id,
-                "lti_v11_lis_result_sourcedid": None
-                if lti_params.v13
-                else lti_params.get("lis_result_sourcedid"),
-            }
-            for lti_role in lti_roles
-        ]
-
-        return list(
-            bulk_upsert(
-                self._db,
-                model_class=LMSUserAssignmentMembership,
-                values=values,
-                index_elements=["lms_user_id", "assignment_id", "lti_role_id"],
-                update_columns=[
-                    "updated",
-                    (
-                        "lti_v11_lis_result_sourcedid",
-                        func.coalesce(
-                            text('"excluded"."lti_v11_lis_result_sourcedid"'),
-                            text(
-                                '"lms_user_assignment_membership"."lti_v11_lis_result_sourcedid"'
-                            ),
-                        ),
-                    ),
-                ],
-            )
-        )
-
     def upsert_assignment_groupings(
         self, assignment: Assignment, groupings: list[Grouping]
     ) -> list[AssignmentGrouping]:
@@ -394,11 +323,21 @@ class AssignmentService:
                 values=values,
                 index_elements=["assignment_id", "grouping_id"],
                 update_columns=["updated"],
+                touch_after=self._touch_throttle.touch_after,
             )
         )
 
-    def get_by_id(self, id_: int) -> Assignment | None:
-        return self._db.query(Assignment).filter_by(id=id_).one_or_none()
+    def get_by_id(
+        self, id_: int, options: Sequence[ORMOption] = ()
+    ) -> Assignment | None:
+        """
+        Get an assignment by its ID.
+
+        :param options: Loader options, e.g. to eager load relationships
+        """
+        return (
+            self._db.query(Assignment).filter_by(id=id_).options(*options).one_or_none()
+        )
 
     def is_member(self, assignment: Assignment, h_userid: str) -> bool:
         """Check if a user is a member of an assignment."""
@@ -1,14 +1,117 @@
 import asyncio
+import atexit
 import json
+import os
+import threading
 
 import aiohttp
 
-from lms.services import ExternalAsyncRequestError
+from lms.services.exceptions import ExternalAsyncRequestError
+
+
+class AsyncRuntime:
+    """
+    A long-lived asyncio event loop and aiohttp session for this process.
+
+    The loop runs in a daemon thread and is started lazily on first use. Sync
+    code (views, Celery tasks) submits coroutines to it with `run()` and
+    blocks until they are done. This saves starting a new loop and opening a
+    new `ClientSession` (and with it new TCP+TLS connections) for every call.
+
+    The runtime notices when it's used from a forked child process (e.g. a
+    gunicorn or Celery worker forked after the app was loaded) and starts a
+    fresh loop there, as threads don't survive a fork.
+    """
+
+    def __init__(self, limit_per_host: int = 5, limit: int = 100):
+        """
+        Initialize the runtime.
+
+        :param limit_per_host: Maximum number of concurrent connections (and
+            so in-flight requests) to any single host
+        :param limit: Maximum number of concurrent connections in total
+        """
+        self.limit_per_host = limit_per_host
+        self.limit = limit
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+        self._thread = None
+        self._session = None
+
+    def run(self, coro_function, *args, **kwargs):
+        """
+        Run `coro_function(session, *args, **kwargs)` and return its result.
+
+        :param coro_function: A coroutine function which will get the shared
+            `aiohttp.ClientSession` as its first argument
+        """
+        loop = self._get_loop()
+
+        async def with_session():
+            return await coro_function(self._get_session(), *args, **kwargs)
+
+        return asyncio.run_coroutine_threadsafe(with_session(), loop).result()
+
+    def close(self):
+        """Close the shared session and stop the event loop."""
+        with self._lock:
+            if not self._loop or self._pid != os.getpid():
+                return
+
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._session = self._thread = self._pid = None
+
+    def _get_loop(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._session = None
+                self._pid = os.getpid()
+
+                self._thread = threading.Thread(
+                    target=_run_forever,
+                    args=(self._loop,),
+                    name="AsyncRuntime",
+                    daemon=True,
+                )
+                self._thread.start()
+
+            return self._loop
+
+    def _get_session(self):
+        # Only ever called from the loop's own thread, so there's no race here.
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                )
+            )
+
+        return self._session
+
+
+def _run_forever(loop):
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+ASYNC_RUNTIME = AsyncRuntime()
+"""The async runtime shared by every `AsyncOAuthHTTPService` in this process."""
+
+atexit.register(ASYNC_RUNTIME.close)
 
 
 class AsyncOAuthHTTPService:
-    def __init__(self, oauth2_token_service):
+    def __init__(self, oauth2_token_service, runtime: AsyncRuntime = ASYNC_RUNTIME):
         self._oauth2_token_service = oauth2_token_service
+        self._runtime = runtime
 
     def request(
         self, method, urls: list[str], timeout=10, headers=None, **kwargs
@@ -16,10 +119,15 @@ class AsyncOAuthHTTPService:
         r"""
         Send access token-authenticated async requests with aiohttp to all `urls`.
 
+        Requests are sent concurrently, but never more than the runtime's
+        `limit_per_host` at once to the same host.
+
         :param method: The HTTP method to use.
         :param urls:  All URLs to request
-        :param timeout: How long (in seconds) to wait before raising an error
-            for each of the requests.
+        :param timeout: How long (in seconds) to wait to connect to the host,
+            and then for each read, before raising an error. Time spent
+            waiting for a free connection (see `limit_per_host`) doesn't
+            count towards it.
         :param headers:  Headers to attach to all requests
         :param \**kwargs: Any other keyword arguments will be passed directly to
             aiohttp.ClientSession().request():
@@ -33,8 +141,16 @@ class AsyncOAuthHTTPService:
 
         access_token = self._oauth2_token_service.get().access_token
         headers["Authorization"] = f"Bearer {access_token}"
-        return asyncio.run(
-            _prepare_requests(method, urls, timeout=timeout, headers=headers, **kwargs)
+        return self._runtime.run(
+            _prepare_requests,
+            method,
+            urls,
+            # Not a `total` timeout: that includes waiting for the connector,
+            # which requests queued behind the first `limit_per_host` would
+            # spend most of their time doing.
+            timeout=aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout),
+            headers=headers,
+            **kwargs,
         )
 
 
@@ -49,26 +165,31 @@ async def _async_request(aio_session, method, url, **kwargs):
         return response
 
 
-async def _prepare_requests(method, urls, **kwargs):
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            task = asyncio.create_task(
-                _async_request(
-                    session,
-                    method,
-                    url,
-                    **kwargs,
-                )
+async def _prepare_requests(session, method, urls, **kwargs):
+    tasks = []
+    for url in urls:
+        task = asyncio.create_task(
+            _async_request(
+                session,
+                method,
+                url,
+                **kwargs,
             )
-            tasks.append(task)
-        try:
-            return await asyncio.gather(*tasks, return_exceptions=False)
-        except aiohttp.ClientError as err:
-            for task in tasks:
-                task.cancel()
-
-            raise ExternalAsyncRequestError() from err  # noqa: RSE102
+        )
+        tasks.append(task)
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=False)
+    except (aiohttp.ClientError, TimeoutError) as err:
+        for task in tasks:
+            task.cancel()
+
+        raise ExternalAsyncRequestError() from err  # noqa: RSE102
+
+
+def configure_async_runtime(settings, runtime=ASYNC_RUNTIME):
+    """Apply the `async_http_limit_per_host` app setting to the runtime."""
+    if limit_per_host := settings.get("async_http_limit_per_host"):
+        runtime.limit_per_host = int(limit_per_host)
 
 
 def factory(_context, request):
@@ -1,9 +1,11 @@
 import json
+from collections.abc import Sequence
 from copy import deepcopy
 
-from sqlalchemy import Select, select, union
+from sqlalchemy import Select, or_, select, union
+from sqlalchemy.orm.interfaces import ORMOption
 
-from lms.db import full_text_match
+from lms.db import full_text_match, partial_match
 from lms.models import (
     ApplicationInstance,
     AssignmentGrouping,
@@ -15,8 +17,6 @@ from lms.models import (
     GroupingMembership,
     LMSCourse,
     LMSCourseApplicationInstance,
-    LMSCourseMembership,
-    LMSUser,
     LTIParams,
     LTIRole,
     Organization,
@@ -26,6 +26,7 @@ from lms.models import (
 )
 from lms.services.grouping import GroupingService
 from lms.services.lms_term import LMSTermService
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
 from lms.services.upsert import bulk_upsert
 
 
@@ -36,11 +37,13 @@ class CourseService:
         application_instance,
         grouping_service: GroupingService,
         lms_term_service: LMSTermService,
+        touch_throttle: TouchThrottle = TOUCH_THROTTLE,
     ):
         self._db = db
         self._application_instance = application_instance
         self._grouping_service = grouping_service
         self._lms_term_service = lms_term_service
+        self._touch_throttle = touch_throttle
 
     def any_with_setting(self, group, key, value=True) -> bool:  # noqa: FBT002
         """
@@ -109,7 +112,12 @@ class CourseService:
             query = query.filter_by(authority_provided_id=h_id)
 
         if name:
-            query = query.filter(full_text_match(Course.lms_name, name))
+            query = query.filter(
+                or_(
+                    full_text_match(Course.lms_name, name),
+                    partial_match(Course.lms_name, name),
+                )
+            )
 
         if organization_ids:
             query = (
@@ -351,6 +359,7 @@ class CourseService:
                 "lms_api_course_id",
                 "lms_term_id",
             ],
+            skip_unchanged=True,
         ).one()
         bulk_upsert(
             self._db,
@@ -363,33 +372,17 @@ class CourseService:
             ],
             index_elements=["application_instance_id", "lms_course_id"],
             update_columns=["updated"],
+            touch_after=self._touch_throttle.touch_after,
         )
         return lms_course
 
-    def upsert_lms_course_membership(
-        self, lms_user: LMSUser, lms_course: LMSCourse, lti_roles: list[LTIRole]
-    ):
-        values = [
-            {
-                "lms_user_id": lms_user.id,
-                "lms_course_id": lms_course.id,
-                "lti_role_id": lti_role.id,
-            }
-            for lti_role in lti_roles
-        ]
-
-        return list(
-            bulk_upsert(
-                self._db,
-                model_class=LMSCourseMembership,
-                values=values,
-                index_elements=["lms_user_id", "lms_course_id", "lti_role_id"],
-                update_columns=["updated"],
-            )
-        )
+    def get_by_id(self, id_: int, options: Sequence[ORMOption] = ()) -> Course | None:
+        """
+        Get a course by its ID.
 
-    def get_by_id(self, id_: int) -> Course | None:
-        return self._search_query(id_=id_).one_or_none()
+        :param options: Loader options, e.g. to eager load relationships
+        """
+        return self._search_query(id_=id_).options(*options).one_or_none()
 
     def is_member(self, course: Course, h_userid: str) -> bool:
         """Check if an H user is a member of a course."""
@@ -0,0 +1,110 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.dialects.postgresql import insert
+
+from lms.models import TaskDone
+
+DEFAULT_TTL = timedelta(days=30)
+"""How long claims last unless told otherwise."""
+
+
+class DedupeService:
+    """
+    Record that something has been done so it isn't done again.
+
+    Keys are claimed for a period of time (their TTL), after which they can be
+    claimed again. Claims are stored in the `task_done` table.
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def claim(
+        self, key: str, ttl: timedelta = DEFAULT_TTL, data: dict | None = None
+    ) -> bool:
+        """
+        Claim `key` if nobody else has.
+
+        :param ttl: How long to hold the claim for
+        :param data: Arbitrary data to store with the claim
+        :return: Whether this call claimed the key
+        """
+        return bool(self.claim_many([key], ttl, data))
+
+    def claim_many(
+        self, keys: Iterable[str], ttl: timedelta = DEFAULT_TTL, data=None
+    ) -> set[str]:
+        """
+        Claim all of `keys` that nobody else has, with a single statement.
+
+        :return: The keys claimed by this call
+        """
+        now = datetime.utcnow()  # noqa: DTZ003
+        values = [{"key": key, "expires_at": now + ttl, "data": data} for key in keys]
+        if not values:
+            return set()
+
+        stmt = insert(TaskDone).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TaskDone.key],
+            set_={
+                "expires_at": stmt.excluded.expires_at,
+                "data": stmt.excluded.data,
+                "updated": now,
+            },
+            # Only take over claims that have expired
+            where=TaskDone.expires_at <= now,
+        ).returning(TaskDone.key)
+
+        return set(self._db.scalars(stmt))
+
+    def exists(self, keys: Iterable[str]) -> set[str]:
+        """Get which of `keys` are currently claimed."""
+        return set(
+            self._db.scalars(
+                select(TaskDone.key).where(
+                    TaskDone.key.in_(list(keys)),
+                    TaskDone.expires_at > datetime.utcnow(),  # noqa: DTZ003
+                )
+            )
+        )
+
+    @staticmethod
+    def is_claimed_clause(key):
+        """
+        Get an SQL clause for whether `key` is currently claimed.
+
+        `key` can be an SQL expression to check a key per row of a query, for
+        example ``func.concat("prefix::", Model.id)``.
+        """
+        return exists(
+            select(TaskDone.id).where(
+                TaskDone.key == key,
+                TaskDone.expires_at > datetime.utcnow(),  # noqa: DTZ003
+            )
+        )
+
+    def delete_expired(self, limit: int) -> int:
+        """
+        Delete up to `limit` expired claims.
+
+        Expired claims don't count as claimed so this is only housekeeping.
+
+        :return: How many claims were deleted
+        """
+        expired = (
+            select(TaskDone.id)
+            .where(TaskDone.expires_at < datetime.utcnow())  # noqa: DTZ003
+            .limit(limit)
+            # Leave rows that are being claimed right now alone
+            .with_for_update(skip_locked=True)
+        )
+        return self._db.execute(
+            delete(TaskDone).where(TaskDone.id.in_(expired.scalar_subquery()))
+        ).rowcount
+
+
+def factory(_context, request):
+    return DedupeService(db=request.db)
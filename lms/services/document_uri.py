@@ -36,8 +36,11 @@ bytes and is filled in lazily by `ensure_checkpoint_fingerprint`.
 import hashlib
 import logging
 import re
+from contextlib import closing
 from urllib.parse import quote_plus, urlparse
 
+from requests import Response
+
 from lms.document_url_regex import (
     BLACKBOARD_FILE,
     CANVAS_FILE,
@@ -215,7 +218,12 @@ def ensure_checkpoint_fingerprint(request, assignment: Assignment, course: Cours
         return
 
     try:
-        pdf = _download_file_content(request, assignment, course)
+        fingerprint = None
+        if file_request := _file_request(request, assignment, course):
+            url, kwargs = file_request
+            fingerprint = fetch_pdf_fingerprint(
+                request.find_service(name="http"), url, **kwargs
+            )
     except Exception:
         LOG.exception(
             "Couldn't compute the checkpoint PDF fingerprint for assignment %s",
@@ -223,13 +231,15 @@ def ensure_checkpoint_fingerprint(request, assignment: Assignment, course: Cours
         )
         return
 
-    if pdf is not None:
-        assignment.document_uri = f"urn:x-pdf:{pdf_fingerprint(pdf)}"
+    if fingerprint is not None:
+        assignment.document_uri = f"urn:x-pdf:{fingerprint}"
 
 
-def _download_file_content(request, assignment: Assignment, course: Course):  # noqa: PLR0911
+def _file_request(  # noqa: PLR0911
+    request, assignment: Assignment, course: Course
+) -> tuple[str, dict] | None:
     """
-    Download the assignment's file content, or return None.
+    Return the URL and request arguments to download the assignment's file.
 
     None means document_url isn't LMS file content. Each branch resolves the
     download URL the same way the LMS's files.py::via_url view does for the
@@ -237,28 +247,25 @@ def _download_file_content(request, assignment: Assignment, course: Course):  #
     mappings: this is best-effort and re-runs on every launch until it works).
     """
     document_url = assignment.document_url
-    http = request.find_service(name="http")
 
     if match := CANVAS_FILE.search(document_url):
         public_url = request.find_service(CanvasService).public_url_for_file(
             assignment, match["file_id"], _canvas_course_id(course, match)
         )
-        return http.get(public_url).content
+        return public_url, {}
 
     if match := BLACKBOARD_FILE.search(document_url):
         public_url = request.find_service(name="blackboard_api_client").public_url(
             course.lms_id, course.get_mapped_file_id(match["file_id"])
         )
-        return http.get(public_url).content
+        return public_url, {}
 
     if match := D2L_FILE.search(document_url):
         public_url = request.find_service(D2LAPIClient).public_url(
             course.lms_id, course.get_mapped_file_id(match["file_id"])
         )
         access_token = request.find_service(name="oauth2_token").get().access_token
-        return http.get(
-            public_url, headers={"Authorization": f"Bearer {access_token}"}
-        ).content
+        return public_url, {"headers": {"Authorization": f"Bearer {access_token}"}}
 
     if match := MOODLE_FILE.search(document_url):
         file_url = course.get_mapped_file_id(match["url"])
@@ -270,17 +277,141 @@ def _download_file_content(request, assignment: Assignment, course: Course):  #
             )
             return None
         token = request.find_service(MoodleAPIClient).token
-        return http.get(file_url, params={"token": token}).content
+        return file_url, {"params": {"token": token}}
 
     if document_url.startswith("jstor://"):
         jstor = request.find_service(iface=JSTORService)
         if not jstor.enabled:
             return None
-        return http.get(jstor.public_url(document_url)).content
+        return jstor.public_url(document_url), {}
 
     return None
 
 
+# Fetching only the parts of the file the fingerprint needs. PDF.js reads the
+# /ID from the trailer of the latest cross-reference section, which is found
+# through the `startxref` offset at the very end of the file. A classic
+# trailer sits right before `startxref`, a cross-reference stream's
+# dictionary (PDF 1.5+) is at that offset.
+
+_TAIL_BYTES = 64 * 1024
+"""How much of the end of the file to fetch looking for the trailer."""
+
+_XREF_BYTES = 4 * 1024
+"""How much to fetch from the `startxref` offset looking for the /ID."""
+
+_STREAM_CHUNK_BYTES = 64 * 1024
+_STREAM_OVERLAP_BYTES = 4 * 1024
+"""Bytes of the previous chunk to search again, for an /ID split across chunks."""
+
+MAX_STREAMED_BYTES = 100 * 1024 * 1024
+"""Give up on files larger than this from servers that don't support ranges."""
+
+_STARTXREF_REGEX = re.compile(rb"startxref\s+(\d+)")
+
+
+def fetch_pdf_fingerprint(http, url, headers=None, **kwargs) -> str | None:
+    """
+    Return the PDF.js fingerprint of the PDF at `url`, downloading as little as possible.
+
+    The end of the file (and if needed the cross-reference section it points
+    to, and the first 1024 bytes) are fetched with HTTP Range requests.
+
+    Servers that don't support ranges are read as a stream instead, keeping
+    only what the fingerprint needs in memory. None is returned for those if
+    the file is larger than `MAX_STREAMED_BYTES`.
+
+    :param http: HTTPService to make the requests with
+    :param url: URL of the PDF
+    :param headers: Headers to include in every request
+    :param kwargs: Other arguments for every request (e.g. `params`)
+    """
+
+    def get_range(range_: str) -> Response:
+        return http.get(
+            url,
+            headers={**(headers or {}), "Range": f"bytes={range_}"},
+            stream=True,
+            **kwargs,
+        )
+
+    with closing(get_range(f"-{_TAIL_BYTES}")) as response:
+        if response.status_code != 206:
+            return _streamed_fingerprint(response)
+
+        tail = _read(response, _TAIL_BYTES)
+        size = _content_range_size(response)
+
+    if size is not None and size <= len(tail):
+        # The whole file fits in the tail
+        return pdf_fingerprint(tail)
+
+    match = _last_id_match(tail)
+    if not match and (startxref := _last_startxref(tail)) is not None:
+        with closing(get_range(f"{startxref}-{startxref + _XREF_BYTES - 1}")) as xref:
+            match = _PDF_ID_REGEX.search(_read(xref, _XREF_BYTES))
+
+    if match and (original_id := _match_original_id(match)):
+        return original_id.hex()
+
+    with closing(get_range(f"0-{_FINGERPRINT_FIRST_BYTES - 1}")) as head:
+        return _md5_fingerprint(_read(head, _FINGERPRINT_FIRST_BYTES))
+
+
+def _streamed_fingerprint(response: Response) -> str | None:
+    """Compute the fingerprint reading `response` as a stream."""
+    if int(response.headers.get("Content-Length") or 0) > MAX_STREAMED_BYTES:
+        LOG.warning("Not fingerprinting PDF larger than %d bytes", MAX_STREAMED_BYTES)
+        return None
+
+    head = b""
+    last_match = None
+    window = b""
+    total = 0
+
+    for chunk in response.iter_content(_STREAM_CHUNK_BYTES):
+        total += len(chunk)
+        if total > MAX_STREAMED_BYTES:
+            LOG.warning(
+                "Not fingerprinting PDF larger than %d bytes", MAX_STREAMED_BYTES
+            )
+            return None
+
+        if len(head) < _FINGERPRINT_FIRST_BYTES:
+            head += chunk[: _FINGERPRINT_FIRST_BYTES - len(head)]
+
+        window = window[-_STREAM_OVERLAP_BYTES:] + chunk
+        if match := _last_id_match(window):
+            last_match = match
+
+    if last_match and (original_id := _match_original_id(last_match)):
+        return original_id.hex()
+
+    return _md5_fingerprint(head)
+
+
+def _read(response: Response, max_bytes: int) -> bytes:
+    """Read at most `max_bytes` of the response's body."""
+    content = b""
+    for chunk in response.iter_content(_STREAM_CHUNK_BYTES):
+        content += chunk
+        if len(content) >= max_bytes:
+            break
+
+    return content[:max_bytes]
+
+
+def _content_range_size(response: Response) -> int | None:
+    """Get the full size of the file from a `Content-Range: bytes a-b/size` header."""
+    size = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(size) if size.isdigit() else None
+
+
+def _last_startxref(tail: bytes) -> int | None:
+    matches = list(_STARTXREF_REGEX.finditer(tail))
+    return int(matches[-1][1]) if matches else None
+
+
 # The fingerprint algorithm below matches the `fingerprints` getter in the
 # PDF.js build bundled in Via (via/static/vendor/pdfjs-2/build/pdf.worker.js),
 # which is what the client reads to build its urn:x-pdf: claims.
@@ -305,20 +436,30 @@ def pdf_fingerprint(pdf: bytes) -> str:
     """
     if original_id := _pdf_original_id(pdf):
         return original_id.hex()
+    return _md5_fingerprint(pdf)
+
+
+def _md5_fingerprint(pdf: bytes) -> str:
     return hashlib.md5(pdf[:_FINGERPRINT_FIRST_BYTES]).hexdigest()  # noqa: S324
 
 
 def _pdf_original_id(pdf: bytes) -> bytes | None:
     """Return the original (first) /ID string of `pdf`'s latest trailer."""
-    matches = list(_PDF_ID_REGEX.finditer(pdf))
-    if not matches:
-        return None
+    if match := _last_id_match(pdf):
+        return _match_original_id(match)
+    return None
 
+
+def _last_id_match(pdf: bytes) -> re.Match | None:
     # Incremental updates append a new trailer at the end of the file, and
     # PDF.js reads the latest one — so take the last /ID in the file. (The
     # original ID is required by spec to be the same in every trailer anyway.)
-    match = matches[-1]
+    matches = list(_PDF_ID_REGEX.finditer(pdf))
+    return matches[-1] if matches else None
+
 
+def _match_original_id(match: re.Match) -> bytes | None:
+    """Return the decoded original ID from an /ID match, if it's a valid one."""
     if (hex_id := match["hex"]) is not None:
         # Whitespace is allowed anywhere inside a PDF hex string.
         hex_str = re.sub(r"\s", "", hex_id.decode("ascii"))
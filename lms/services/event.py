@@ -1,4 +1,6 @@
+import atexit
 import logging
+import threading
 from functools import lru_cache
 
 from celery.exceptions import OperationalError
@@ -6,11 +8,94 @@ from sqlalchemy.orm import Session
 
 from lms.events.event import BaseEvent
 from lms.models import Event, EventData, EventType, EventUser
-from lms.tasks.event import insert_event
+from lms.tasks.event import insert_event, insert_events
 
 log = logging.getLogger(__name__)
 
 
+class EventBuffer:
+    """
+    Per-process buffer of serialized events waiting to be queued in bulk.
+
+    Instead of one Celery task per event, buffered events are sent as a single
+    `insert_events` task once `max_size` of them have been collected or the
+    oldest of them is `max_age` seconds old, whichever comes first.
+
+    Buffering is disabled with a `max_size` of 1 or less (the default).
+    Events still in the buffer when the process exits are flushed then, but
+    they will be lost if the process is killed. That's in line with
+    `EventService.queue_event`'s best-effort approach.
+
+    When enabled LTI events, like launches, are buffered too instead of being
+    inserted by the request that caused them (see `lms.events.subscribers`).
+    """
+
+    def __init__(self, max_size: int = 1, max_age: float = 5):
+        self.max_size = max_size
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._events: list[dict] = []
+        self._timer: threading.Timer | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 1
+
+    def add(self, event: dict) -> None:
+        with self._lock:
+            self._events.append(event)
+
+            if len(self._events) < self.max_size:
+                if not self._timer:
+                    self._timer = threading.Timer(self.max_age, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+
+            events = self._drain()
+
+        _queue_events(events)
+
+    def flush(self) -> None:
+        """Queue all buffered events now."""
+        with self._lock:
+            events = self._drain()
+
+        if events:
+            _queue_events(events)
+
+    def _drain(self) -> list[dict]:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        events, self._events = self._events, []
+        return events
+
+
+def _queue_events(events: list[dict]) -> None:
+    try:
+        insert_events.apply_async((events,), retry=False)
+    except OperationalError:
+        log.exception("Error while queueing %d events", len(events))
+
+
+EVENT_BUFFER = EventBuffer()
+"""The event buffer shared by the whole process."""
+
+atexit.register(EVENT_BUFFER.flush)
+
+
+def configure_event_buffer(settings, event_buffer=EVENT_BUFFER):
+    """Apply the `event_buffer_*` app settings to the event buffer."""
+    if max_size := settings.get("event_buffer_size"):
+        event_buffer.max_size = int(max_size)
+
+    if max_age := settings.get("event_buffer_max_age"):
+        event_buffer.max_age = float(max_age)
+
+
 class EventService:
     def __init__(self, db: Session):
         self._db = db
@@ -43,6 +128,16 @@ class EventService:
 
         return event
 
+    def insert_events(self, events: list[BaseEvent]) -> None:
+        """
+        Insert many events into the DB at once.
+
+        Rows are only added to the session here, SQLAlchemy's unit of work
+        then writes each table with multi-row INSERTs on the next flush.
+        """
+        for event in events:
+            self.insert_event(event)
+
     @staticmethod
     def queue_event(event: BaseEvent) -> None:
         """
@@ -50,7 +145,14 @@ class EventService:
 
         This method hides errors while queuing the task and disables retries.
         If more guarantees are need about the event recording, call `insert_event` directly.
+
+        If the event buffer is enabled events are held in memory and queued
+        in bulk, see `EventBuffer`.
         """
+        if EVENT_BUFFER.enabled:
+            EVENT_BUFFER.add(event.serialize())
+            return
+
         try:
             insert_event.apply_async((event.serialize(),), retry=False)
         except OperationalError:
@@ -1,4 +1,6 @@
 from lms.models import GradingInfo, HUser
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
+from lms.services.upsert import bulk_upsert
 
 __all__ = ["GradingInfoService"]
 
@@ -6,9 +8,12 @@ __all__ = ["GradingInfoService"]
 class GradingInfoService:
     """Methods for interacting with GradingInfo records."""
 
-    def __init__(self, _context, request):
+    def __init__(
+        self, _context, request, touch_throttle: TouchThrottle = TOUCH_THROTTLE
+    ):
         self._db = request.db
         self._authority = request.registry.settings["h_authority"]
+        self._touch_throttle = touch_throttle
 
     def get_students_for_grading(
         self,
@@ -94,25 +99,33 @@ class GradingInfoService:
             # LIS data is not present on the request.
             return None
 
-        grading_info = self._find_or_create(
-            application_instance=lti_user.application_instance,
-            user_id=lti_user.user_id,
-            context_id=lti_user.lti.course_id,
-            resource_link_id=lti_user.lti.assignment_id,
-        )
-        grading_info.h_username = lti_user.h_user.username
-        grading_info.h_display_name = lti_user.h_user.display_name
-
-        grading_info.lis_outcome_service_url = lis_outcome_service_url
-        grading_info.lis_result_sourcedid = lis_result_sourcedid
-
-        return grading_info
-
-    def _find_or_create(self, **query):
-        result = self._db.query(GradingInfo).filter_by(**query).one_or_none()
-
-        if result is None:
-            result = GradingInfo(**query)
-            self._db.add(result)
-
-        return result
+        return bulk_upsert(
+            self._db,
+            GradingInfo,
+            [
+                {
+                    "application_instance_id": lti_user.application_instance_id,
+                    "user_id": lti_user.user_id,
+                    "context_id": lti_user.lti.course_id,
+                    "resource_link_id": lti_user.lti.assignment_id,
+                    "h_username": lti_user.h_user.username,
+                    "h_display_name": lti_user.h_user.display_name,
+                    "lis_outcome_service_url": lis_outcome_service_url,
+                    "lis_result_sourcedid": lis_result_sourcedid,
+                }
+            ],
+            index_elements=[
+                "application_instance_id",
+                "user_id",
+                "context_id",
+                "resource_link_id",
+            ],
+            update_columns=[
+                "updated",
+                "h_username",
+                "h_display_name",
+                "lis_outcome_service_url",
+                "lis_result_sourcedid",
+            ],
+            touch_after=self._touch_throttle.touch_after,
+        ).one()
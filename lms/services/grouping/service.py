@@ -5,6 +5,7 @@ from lms.models import Course, Grouping, GroupingMembership, LTIRole, LTIUser, U
 from lms.models._hashed_id import hashed_id
 from lms.product.plugin.grouping import GroupingPlugin
 from lms.services.segment import SegmentService
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
 from lms.services.upsert import bulk_upsert
 
 
@@ -15,11 +16,13 @@ class GroupingService:
         application_instance,
         plugin: GroupingPlugin,
         segment_service: SegmentService,
+        touch_throttle: TouchThrottle = TOUCH_THROTTLE,
     ):
         self._db = db
         self.application_instance = application_instance
         self.plugin = plugin
         self.segment_service = segment_service
+        self._touch_throttle = touch_throttle
 
     def get_authority_provided_id(
         self, lms_id, type_: Grouping.Type, parent: Grouping | None = None
@@ -91,6 +94,7 @@ class GroupingService:
             values,
             index_elements=["application_instance_id", "authority_provided_id"],
             update_columns=["lms_name", "extra", "updated"],
+            touch_after=self._touch_throttle.touch_after,
         ).all()
 
     def upsert_grouping_memberships(self, user: User, groups: list[Grouping]):
@@ -117,6 +121,7 @@ class GroupingService:
             ],
             index_elements=["grouping_id", "user_id"],
             update_columns=["updated"],
+            touch_after=self._touch_throttle.touch_after,
         )
 
     def get_course_groupings_for_user(
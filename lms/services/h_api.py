@@ -2,10 +2,12 @@
 
 import itertools
 import json
+import logging
 import random
 import re
+import threading
 import time
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TypedDict
@@ -16,6 +18,8 @@ from lms.models import HUser
 from lms.services.exceptions import ExternalRequestError
 from lms.services.http import HTTPService
 
+LOG = logging.getLogger(__name__)
+
 RETRYABLE_STATUSES = {429, 503}
 MAX_ATTEMPTS = 3
 
@@ -31,6 +35,105 @@ class AnnotationCounts(TypedDict):
     userid: str | None
 
 
+class AnnotationCountsCache:
+    """
+    Per-process cache of `HAPI.get_annotation_counts` results.
+
+    Results are fresh for `ttl` seconds. For `stale_ttl` seconds after that
+    they are still returned straight away while a background thread gets
+    new ones from h (stale-while-revalidate). Older results are discarded and
+    loaded again synchronously.
+
+    A `ttl` of 0 disables the cache.
+    """
+
+    @dataclass
+    class _Entry:
+        value: list
+        loaded_at: float
+
+    def __init__(self, ttl: float = 60, stale_ttl: float = 300, max_size: int = 1000):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, AnnotationCountsCache._Entry] = {}
+        self._refreshing: set[tuple] = set()
+
+    def get(self, key: tuple, load: Callable[[], list]) -> list:
+        """
+        Get the value for `key`, calling `load()` to get it if needed.
+
+        :param key: A hashable, normalized representation of the request
+        :param load: Function returning a fresh value. This might be called
+            from a background thread.
+        """
+        if not self.ttl:
+            return load()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry:
+            age = time.monotonic() - entry.loaded_at
+            if age < self.ttl:
+                return entry.value
+
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(key, load)
+                return entry.value
+
+        value = load()
+        self._set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _set(self, key: tuple, value: list):
+        with self._lock:
+            # Re-insert the key to keep entries in the order they were loaded
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = self._Entry(value=value, loaded_at=time.monotonic())
+
+    def _refresh_in_background(self, key: tuple, load: Callable[[], list]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._set(key, load())
+            except Exception:
+                LOG.exception("Error refreshing annotation counts")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=refresh, name="AnnotationCountsCache", daemon=True
+        ).start()
+
+
+ANNOTATION_COUNTS_CACHE = AnnotationCountsCache()
+"""The annotation counts cache shared by every `HAPI` in this process."""
+
+
+def configure_annotation_counts_cache(settings, cache=ANNOTATION_COUNTS_CACHE):
+    """Apply the `annotation_counts_cache_*` app settings to the cache."""
+    if (ttl := settings.get("annotation_counts_cache_ttl")) is not None:
+        cache.ttl = float(ttl)
+
+    if (stale_ttl := settings.get("annotation_counts_cache_stale_ttl")) is not None:
+        cache.stale_ttl = float(stale_ttl)
+
+
 class HAPIError(ExternalRequestError):
     """
     A problem with an h API request.
@@ -63,18 +166,20 @@ class HAPI:
     class HAPIGroup:
         authority_provided_id: str
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         authority,
         client_id,
         client_secret,
         h_private_url,
         http_service: HTTPService,
+        annotation_counts_cache: AnnotationCountsCache = ANNOTATION_COUNTS_CACHE,
     ):
         self._authority = authority
         self._http_auth = (client_id, client_secret)
         self._base_url = h_private_url
         self._http_service = http_service
+        self._annotation_counts_cache = annotation_counts_cache
 
     def execute_bulk(self, commands):
         """
@@ -201,9 +306,34 @@ class HAPI:
         h_userids: list[str] | None = None,
         resource_link_ids: list[str] | None = None,
     ) -> list[AnnotationCounts]:
+        """
+        Get annotation counts from h's bulk stats endpoint.
+
+        Results are cached, see `AnnotationCountsCache`.
+        """
         if not group_authority_ids:
             return []
 
+        cache_key = (
+            tuple(sorted(group_authority_ids)),
+            group_by,
+            tuple(sorted(h_userids)) if h_userids else None,
+            tuple(sorted(resource_link_ids)) if resource_link_ids is not None else None,
+        )
+        return self._annotation_counts_cache.get(
+            cache_key,
+            lambda: self._get_annotation_counts(
+                group_authority_ids, group_by, h_userids, resource_link_ids
+            ),
+        )
+
+    def _get_annotation_counts(
+        self,
+        group_authority_ids: list[str],
+        group_by: str,
+        h_userids: list[str] | None,
+        resource_link_ids: list[str] | None,
+    ) -> list[AnnotationCounts]:
         filters = {
             "groups": group_authority_ids,
             "assignment_ids": resource_link_ids,
@@ -1,8 +1,116 @@
+import socket
+import threading
+from dataclasses import dataclass
+
 from requests import RequestException, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
+from lms.config import aslist
 from lms.services.exceptions import ExternalRequestError
 
 
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for an upstream host."""
+
+    maxsize: int = 10
+    """Maximum number of connections kept open to a single host."""
+
+    block: bool = False
+    """Wait for a free connection instead of opening a throwaway one when full."""
+
+    keep_alive: bool = True
+    """Enable TCP keep-alive on pooled connections."""
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` that is shared between many `requests.Session`s."""
+
+    def __init__(self, config: PoolConfig):
+        self.pool_config = config
+        super().__init__(pool_maxsize=config.maxsize, pool_block=config.block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.pool_config.keep_alive:
+            kwargs["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+
+        super().init_poolmanager(*args, **kwargs)
+
+    def close(self):
+        # Sessions come and go (one per request) but the connections in this
+        # adapter are meant to outlive them, so closing a session must not
+        # close the process-wide pool.
+        pass
+
+
+class ConnectionPools:
+    """
+    Process-wide registry of urllib3 connection pools.
+
+    Every `HTTPService` mounts the adapters from here into its own
+    `requests.Session`. That keeps cookies and headers private to each
+    service while TCP/TLS connections are re-used across requests (and Celery
+    tasks) in the same process.
+
+    urllib3's pool manager is thread-safe so the adapters can be shared
+    between threads.
+    """
+
+    def __init__(self, default: PoolConfig | None = None):
+        self._default = default or PoolConfig()
+        self._host_configs: dict[str, PoolConfig] = {}
+        self._adapters: dict[str | None, _PooledHTTPAdapter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str | None = None, **kwargs):
+        """
+        Change the pool settings for `host`, or the default ones.
+
+        Connections opened with the previous settings are left to be garbage
+        collected along with the adapter that held them.
+
+        :param host: The hostname (e.g. "api.vitalsource.com") to tune or
+            `None` to change the settings used for all other hosts
+        :param kwargs: Any `PoolConfig` field
+        """
+        with self._lock:
+            if host is None:
+                self._default = PoolConfig(**kwargs)
+            else:
+                self._host_configs[host] = PoolConfig(**kwargs)
+
+            self._adapters.pop(host, None)
+
+    def mount(self, session: Session) -> Session:
+        """Make `session` send its requests over the shared pools."""
+        default_adapter = self._get_adapter(None)
+        session.mount("https://", default_adapter)
+        session.mount("http://", default_adapter)
+
+        for host in list(self._host_configs):
+            adapter = self._get_adapter(host)
+            session.mount(f"https://{host}/", adapter)
+            session.mount(f"http://{host}/", adapter)
+
+        return session
+
+    def _get_adapter(self, host: str | None) -> _PooledHTTPAdapter:
+        with self._lock:
+            if host not in self._adapters:
+                config = self._host_configs[host] if host else self._default
+                self._adapters[host] = _PooledHTTPAdapter(config)
+
+            return self._adapters[host]
+
+
+CONNECTION_POOLS = ConnectionPools()
+"""The connection pools shared by every `HTTPService` in this process."""
+
+
 class HTTPService:
     """Send HTTP requests with `requests` and receive the responses."""
 
@@ -10,14 +118,16 @@ class HTTPService:
     session: Session = None  # type: ignore  # noqa: PGH003
     """The underlying requests Session."""
 
-    def __init__(self):
-        # A session is used so that cookies are persisted across
-        # requests and urllib3 connection pooling is used (which means that
-        # underlying TCP connections are re-used when making multiple requests
-        # to the same host, e.g. pagination).
+    def __init__(self, connection_pools: ConnectionPools = CONNECTION_POOLS):
+        # A session is used so that cookies are persisted across requests.
+        #
+        # The session's transport adapters come from `connection_pools` which
+        # is shared by the whole process, so the underlying TCP connections
+        # are re-used not only when making multiple requests to the same host
+        # (e.g. pagination) but also across different web requests and tasks.
 
         # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects
-        self.session = Session()
+        self.session = connection_pools.mount(Session())
 
     def request(self, method, url, timeout=(10, 10), **kwargs) -> Response:
         """
@@ -57,5 +167,22 @@ class HTTPService:
         return self.request("DELETE", *args, **kwargs)
 
 
+def configure_connection_pools(settings, connection_pools=CONNECTION_POOLS):
+    """
+    Apply the `http_pool_*` app settings to the shared connection pools.
+
+    `http_pool_hosts` is a list of `host=maxsize` lines, for example:
+
+        api.vitalsource.com=20
+        hypothesis.instructure.com=50
+    """
+    if maxsize := settings.get("http_pool_maxsize"):
+        connection_pools.configure(maxsize=int(maxsize))
+
+    for line in aslist(settings.get("http_pool_hosts")):
+        host, maxsize = line.split("=", 1)
+        connection_pools.configure(host.strip(), maxsize=int(maxsize))
+
+
 def factory(_context, _request):
     return HTTPService()
@@ -0,0 +1,236 @@
+import logging
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+from jwt import PyJWK, PyJWKSet
+from jwt.exceptions import PyJWKClientError, PyJWKSetError
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from lms.models import JWKSet, LTIRegistration
+from lms.services.exceptions import ExternalRequestError
+from lms.services.http import HTTPService
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedJWKSet:
+    """A parsed key set kept in memory, detached from any DB session."""
+
+    key_set: PyJWKSet
+    refreshed_at: datetime
+    """When we last tried to download the key set."""
+
+    expires_at: datetime
+
+
+class JWKSetCache:
+    """Per-process store of parsed key sets keyed by URL."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_sets: dict[str, CachedJWKSet] = {}
+
+    def get(self, url: str) -> CachedJWKSet | None:
+        return self._key_sets.get(url)
+
+    def set(self, url: str, key_set: CachedJWKSet):
+        with self._lock:
+            self._key_sets[url] = key_set
+
+    def clear(self):
+        with self._lock:
+            self._key_sets.clear()
+
+
+JWK_SET_CACHE = JWKSetCache()
+
+
+class JWKSetService:
+    """
+    Get the public keys LTI 1.3 platforms sign their launches with.
+
+    Key sets are kept in the DB, shared by all processes, and in memory. The
+    `refresh_jwk_sets` task downloads them again before they expire so
+    launches rarely have to.
+    """
+
+    DEFAULT_MAX_AGE = timedelta(hours=1)
+    """How long to keep a key set for if its response doesn't say."""
+
+    MIN_MAX_AGE = timedelta(minutes=5)
+    MAX_MAX_AGE = timedelta(days=1)
+    """Limits to how long key sets are kept for, whatever their response says."""
+
+    REFETCH_INTERVAL = timedelta(minutes=5)
+    """
+    Minimum time between downloads of the same key set from a launch.
+
+    Launches signed with a key we don't know yet download the key set again,
+    this stops JWTs with made up key IDs from doing so for every request.
+    """
+
+    def __init__(
+        self, db, http_service: HTTPService, cache: JWKSetCache = JWK_SET_CACHE
+    ):
+        self._db = db
+        self._http_service = http_service
+        self._cache = cache
+
+    def get_signing_key(self, url: str, kid: str) -> PyJWK:
+        """
+        Get the key with ID `kid` from the key set published at `url`.
+
+        :raise PyJWKClientError: If the key set can't be downloaded or doesn't
+            contain the key
+        """
+        now = datetime.utcnow()  # noqa: DTZ003
+
+        cached = self._cache.get(url)
+        if not cached or cached.expires_at <= now or not self._find(cached, kid):
+            # Another process might have downloaded a newer copy already
+            cached = self._get_stored(url, newer_than=cached) or cached
+
+        if not cached:
+            cached = self._refresh(url, fallback=None)
+        elif cached.expires_at <= now or (
+            # The platform might have rotated its keys
+            not self._find(cached, kid)
+            and cached.refreshed_at + self.REFETCH_INTERVAL <= now
+        ):
+            cached = self._refresh(url, fallback=cached)
+
+        if key := self._find(cached, kid):
+            return key
+
+        raise PyJWKClientError(  # noqa: TRY003
+            f'Unable to find a signing key that matches: "{kid}"'  # noqa: EM102
+        )
+
+    def refresh(self, url: str) -> CachedJWKSet:
+        """
+        Download the key set at `url` and store it.
+
+        :raise ExternalRequestError: If the key set can't be downloaded or
+            isn't valid
+        """
+        # We found that some Moodle instances return 403s
+        # on request without an User-Agent.
+        response = self._http_service.get(url, headers={"User-Agent": "requests"})
+        try:
+            keys = response.json()
+            key_set = PyJWKSet.from_dict(keys)
+        # AttributeError is raised for JSON values other than objects
+        except (ValueError, AttributeError, PyJWKSetError) as err:
+            raise ExternalRequestError(
+                message="Invalid JWK set", response=response
+            ) from err
+
+        now = datetime.utcnow()  # noqa: DTZ003
+        values = {
+            "keys": keys,
+            "fetched_at": now,
+            "expires_at": now + self._max_age(response.headers.get("Cache-Control")),
+        }
+        self._db.execute(
+            insert(JWKSet)
+            .values(url=url, **values)
+            .on_conflict_do_update(
+                index_elements=[JWKSet.url], set_={**values, "updated": now}
+            )
+        )
+
+        cached = CachedJWKSet(
+            key_set=key_set, refreshed_at=now, expires_at=values["expires_at"]
+        )
+        self._cache.set(url, cached)
+        return cached
+
+    def get_stale_urls(self, within: timedelta) -> list[str]:
+        """Get the registrations' key set URLs that expire within `within`."""
+        return list(
+            self._db.scalars(
+                select(LTIRegistration.key_set_url)
+                .distinct()
+                .outerjoin(JWKSet, JWKSet.url == LTIRegistration.key_set_url)
+                .where(
+                    or_(
+                        JWKSet.id.is_(None),
+                        JWKSet.expires_at <= datetime.utcnow() + within,  # noqa: DTZ003
+                    )
+                )
+            )
+        )
+
+    def _refresh(self, url: str, fallback: CachedJWKSet | None) -> CachedJWKSet:
+        try:
+            return self.refresh(url)
+        except ExternalRequestError as err:
+            if not fallback:
+                raise PyJWKClientError(  # noqa: TRY003
+                    f"Fail to fetch data from the url, err: {err}"  # noqa: EM102
+                ) from err
+
+            LOG.warning("Couldn't refresh the key set at %s, using the old one", url)
+            now = datetime.utcnow()  # noqa: DTZ003
+            # Don't try again on every request while the platform is failing
+            fallback = replace(
+                fallback,
+                refreshed_at=now,
+                expires_at=max(fallback.expires_at, now + self.REFETCH_INTERVAL),
+            )
+            self._cache.set(url, fallback)
+            return fallback
+
+    def _get_stored(
+        self, url: str, newer_than: CachedJWKSet | None
+    ) -> CachedJWKSet | None:
+        """Get the key set in the DB if it was downloaded after `newer_than`."""
+        jwk_set = self._db.scalars(
+            select(JWKSet).where(JWKSet.url == url)
+        ).one_or_none()
+        if not jwk_set or (
+            newer_than and jwk_set.fetched_at <= newer_than.refreshed_at
+        ):
+            return None
+
+        cached = CachedJWKSet(
+            key_set=PyJWKSet.from_dict(jwk_set.keys),
+            refreshed_at=jwk_set.fetched_at,
+            expires_at=jwk_set.expires_at,
+        )
+        self._cache.set(url, cached)
+        return cached
+
+    @staticmethod
+    def _find(cached: CachedJWKSet, kid: str) -> PyJWK | None:
+        for key in cached.key_set.keys:
+            # Only consider signing keys, like PyJWKClient does
+            if key.key_id == kid and key.public_key_use in ("sig", None):
+                return key
+
+        return None
+
+    @classmethod
+    def _max_age(cls, cache_control: str | None) -> timedelta:
+        """Get how long to keep a key set for from its Cache-Control header."""
+        directives = {}
+        for directive in (cache_control or "").lower().split(","):
+            name, _, value = directive.strip().partition("=")
+            directives[name] = value.strip('"')
+
+        if "no-cache" in directives or "no-store" in directives:
+            max_age = timedelta(0)
+        elif directives.get("max-age", "").isdigit():
+            max_age = timedelta(seconds=int(directives["max-age"]))
+        else:
+            max_age = cls.DEFAULT_MAX_AGE
+
+        # Launches can't wait for a download every time, nor use keys forever
+        return min(max(max_age, cls.MIN_MAX_AGE), cls.MAX_MAX_AGE)
+
+
+def factory(_context, request):
+    return JWKSetService(db=request.db, http_service=request.find_service(name="http"))
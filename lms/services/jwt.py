@@ -1,13 +1,12 @@
 import copy
 import datetime
 import logging
-from functools import lru_cache
 
 import jwt
-import requests
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError, PyJWTError
 
 from lms.services.exceptions import ExpiredJWTError, InvalidJWTError
+from lms.services.jwk_set import JWKSetService
 from lms.services.lti_registration import LTIRegistrationService
 from lms.services.rsa_key import RSAKeyService
 from lms.validation import ValidationError
@@ -24,9 +23,10 @@ class JWTService:
     JWT and us.
     """
 
-    def __init__(self, registration_service, rsa_key_service):
+    def __init__(self, registration_service, rsa_key_service, jwk_set_service):
         self._registration_service = registration_service
         self._rsa_key_service = rsa_key_service
+        self._jwk_set_service = jwk_set_service
 
     @classmethod
     def decode_with_secret(cls, jwt_str, secret) -> dict:
@@ -110,9 +110,9 @@ class JWTService:
             )
 
         try:
-            signing_key = self._get_jwk_client(
-                registration.key_set_url
-            ).get_signing_key_from_jwt(id_token)
+            signing_key = self._jwk_set_service.get_signing_key(
+                registration.key_set_url, unverified_header["kid"]
+            )
 
             return jwt.decode(
                 id_token,
@@ -127,46 +127,20 @@ class JWTService:
             ) from err
 
     def encode_with_private_key(self, payload: dict):
-        key = self._rsa_key_service.get_random_key()
+        key = self._rsa_key_service.get_signing_key()
         return jwt.encode(
             payload,
-            self._rsa_key_service.private_key(key),
+            key.private_key,
             algorithm="RS256",
             headers={"kid": key.kid},
         )
 
-    @staticmethod
-    @lru_cache(maxsize=256)
-    def _get_jwk_client(jwk_url: str):
-        """
-        Get a PyJWKClient for the given key set URL.
-
-        PyJWKClient maintains a cache of keys it has seen.
-        We want to keep the clients around with `lru_cache` to reuse that internal cache.
-        """
-        return _RequestsPyJWKClient(jwk_url, cache_keys=True)
-
-
-class _RequestsPyJWKClient(jwt.PyJWKClient):
-    """
-    Version of PyJWKClient which uses requests to gather JWKs.
-
-    Having our own class and using request allows for easier customization.
-    """
-
-    def fetch_data(self):
-        # We found that some Moodle instances return 403s
-        # on request without an User-Agent.
-        with requests.get(
-            self.uri, headers={"User-Agent": "requests"}, timeout=(10, 10)
-        ) as response:
-            return response.json()
-
 
 def factory(_context, request):
     return JWTService(
         registration_service=request.find_service(LTIRegistrationService),
         rsa_key_service=request.find_service(RSAKeyService),
+        jwk_set_service=request.find_service(JWKSetService),
     )
 
 
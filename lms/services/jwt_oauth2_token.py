@@ -1,16 +1,71 @@
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from lms.models.jwt_oauth2_token import JWTOAuth2Token
 
 
+@dataclass(frozen=True)
+class CachedToken:
+    """An access token kept in memory, detached from any DB session."""
+
+    access_token: str
+    received_at: datetime
+    expires_at: datetime
+
+
+class AccessTokenCache:
+    """Per-process store of JWT access tokens keyed by registration and scopes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens: dict[tuple[int, str], CachedToken] = {}
+
+    def get(
+        self, lti_registration_id: int, scopes: str, min_ttl: timedelta
+    ) -> CachedToken | None:
+        """
+        Return the token if it's valid for at least `min_ttl`.
+
+        For tokens that live for less than twice `min_ttl` half their lifetime
+        is used instead. Otherwise they would never be returned.
+        """
+        token = self._tokens.get((lti_registration_id, scopes))
+        if not token:
+            return None
+
+        lifetime = token.expires_at - token.received_at
+        min_ttl = max(min(min_ttl, lifetime / 2), timedelta(0))
+        if token.expires_at - min_ttl > datetime.now():  # noqa: DTZ005
+            return token
+
+        return None
+
+    def set(self, lti_registration_id: int, scopes: str, token: CachedToken):
+        with self._lock:
+            now = datetime.now()  # noqa: DTZ005
+            # Evict expired tokens as we go to keep the cache bounded by the
+            # number of registrations/scopes in active use.
+            self._tokens = {
+                key: value
+                for key, value in self._tokens.items()
+                if value.expires_at > now
+            }
+            self._tokens[(lti_registration_id, scopes)] = token
+
+
+ACCESS_TOKEN_CACHE = AccessTokenCache()
+
+
 class JWTOAuth2TokenService:
-    """Save and retrieve JWTOAuth2Tokens from the DB."""
+    """Save and retrieve JWTOAuth2Tokens from memory and the DB."""
 
     EXPIRATION_LEEWAY = 60
     """Allowable wiggle room for expiry time to allow for request's delays."""
 
-    def __init__(self, db):
+    def __init__(self, db, cache: AccessTokenCache = ACCESS_TOKEN_CACHE):
         self._db = db
+        self._cache = cache
 
     def save_token(
         self, lti_registration, scopes: list[str], access_token: str, expires_in: int
@@ -32,8 +87,53 @@ class JWTOAuth2TokenService:
         token.received_at = datetime.now()  # noqa: DTZ005
         token.expires_at = datetime.now() + timedelta(seconds=expires_in)  # noqa: DTZ005
 
+        self._cache.set(
+            lti_registration.id,
+            token.scopes,
+            CachedToken(
+                access_token=access_token,
+                received_at=token.received_at,
+                expires_at=token.expires_at,
+            ),
+        )
         return token
 
+    def get_cached_token(
+        self, lti_registration, scopes: list[str], min_ttl: timedelta
+    ) -> CachedToken | None:
+        """
+        Get a token valid for at least `min_ttl` from memory or the DB.
+
+        Tokens found in the DB are kept in memory for subsequent calls, so a
+        burst of requests for the same registration and scopes only hits the
+        DB once.
+
+        :param lti_registration: Registration for the token we are looking for
+        :param scopes: Scopes of the desired token
+        :param min_ttl: Don't return tokens that expire sooner than this (or
+            than half their lifetime, for short lived tokens). Returning
+            `None` for those lets callers refresh tokens shortly before they
+            expire instead of after.
+        """
+        normalized_scopes = self._normalize_scopes(scopes)
+
+        if token := self._cache.get(lti_registration.id, normalized_scopes, min_ttl):
+            return token
+
+        db_token = self.get_token(lti_registration, scopes)
+        if not db_token:
+            return None
+
+        token = CachedToken(
+            access_token=db_token.access_token,
+            # `received_at` isn't stored, tokens are updated when received
+            received_at=db_token.updated,
+            expires_at=db_token.expires_at,
+        )
+        self._cache.set(lti_registration.id, normalized_scopes, token)
+
+        return self._cache.get(lti_registration.id, normalized_scopes, min_ttl)
+
     def get_token(
         self,
         lti_registration,
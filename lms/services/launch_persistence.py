@@ -0,0 +1,252 @@
+from datetime import timedelta
+
+from sqlalchemy import ColumnElement, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import CTE
+from zope.sqlalchemy import mark_changed
+
+from lms.models import (
+    Assignment,
+    AssignmentGrouping,
+    AssignmentMembership,
+    Grouping,
+    GroupingMembership,
+    LMSCourse,
+    LMSCourseMembership,
+    LMSUser,
+    LMSUserApplicationInstance,
+    LMSUserAssignmentMembership,
+    LTIParams,
+    LTIRole,
+    User,
+)
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
+from lms.services.upsert import on_conflict_update
+from lms.services.user import LMS_USER_UPDATE_COLUMNS, UserService
+
+
+class LaunchPersistenceService:
+    """
+    Record who launched what.
+
+    Every launch upserts the user's `LMSUser` and their memberships of the
+    course and assignment, a dozen rows across as many tables. Each method
+    here writes its part of that graph with a single statement, chaining the
+    upserts together with data-modifying CTEs, instead of a round trip (and
+    the queries to get the IDs of the related rows) per table.
+
+    Memberships that already exist are only touched (their `updated` bumped)
+    once per `touch_throttle` interval, so relaunches don't rewrite them.
+    """
+
+    def __init__(self, db: Session, touch_throttle: TouchThrottle = TOUCH_THROTTLE):
+        self._db = db
+        self._touch_throttle = touch_throttle
+
+    def record_course_launch(
+        self,
+        user: User,
+        lti_params: LTIParams,
+        course: Grouping,
+        lti_roles: list[LTIRole],
+    ) -> None:
+        """
+        Record `user` launching `course`.
+
+        This upserts the user's `LMSUser`, its link to the user's application
+        instance and the user's memberships of `course` (`GroupingMembership`)
+        and of its `LMSCourse` (one `LMSCourseMembership` per role).
+        """
+        # Make sure the user and course have IDs
+        self._db.flush()
+
+        lms_user = self._upsert(
+            LMSUser,
+            [UserService.get_lms_user_values(user, lti_params)],
+            index_elements=["h_userid"],
+            update_columns=LMS_USER_UPDATE_COLUMNS,
+            skip_unchanged=True,
+        )
+        lms_user_id = func.coalesce(
+            select(lms_user.c.id).scalar_subquery(),
+            # Unchanged rows aren't returned by the upsert, they already exist
+            self._lms_user_id(user),
+        )
+        lms_course_id = (
+            select(LMSCourse.id)
+            .where(LMSCourse.h_authority_provided_id == course.authority_provided_id)
+            .scalar_subquery()
+        )
+        touch_after = self._touch_throttle.touch_after
+
+        self._execute(
+            lms_user,
+            self._upsert(
+                LMSUserApplicationInstance,
+                [
+                    {
+                        "application_instance_id": user.application_instance_id,
+                        "lms_user_id": lms_user_id,
+                    }
+                ],
+                index_elements=["application_instance_id", "lms_user_id"],
+                update_columns=["updated"],
+                touch_after=touch_after,
+            ),
+            self._upsert(
+                GroupingMembership,
+                [{"grouping_id": course.id, "user_id": user.id}],
+                index_elements=["grouping_id", "user_id"],
+                update_columns=["updated"],
+                touch_after=touch_after,
+            ),
+            self._upsert(
+                LMSCourseMembership,
+                [
+                    {
+                        "lms_user_id": lms_user_id,
+                        "lms_course_id": lms_course_id,
+                        "lti_role_id": lti_role.id,
+                    }
+                    for lti_role in lti_roles
+                ],
+                index_elements=["lms_user_id", "lms_course_id", "lti_role_id"],
+                update_columns=["updated"],
+                touch_after=touch_after,
+            ),
+        )
+
+    def record_assignment_launch(
+        self,
+        user: User,
+        lti_params: LTIParams,
+        assignment: Assignment,
+        groupings: list[Grouping],
+        lti_roles: list[LTIRole],
+    ) -> None:
+        """
+        Record `user` launching `assignment`.
+
+        This upserts the roles the user plays in the assignment, as both
+        `AssignmentMembership` and `LMSUserAssignmentMembership` rows, and the
+        `groupings` (e.g. the course) the assignment is in.
+
+        The user's `LMSUser` must have been recorded already, see
+        `record_course_launch()`.
+        """
+        # Make sure the user, assignment and groupings have IDs
+        self._db.flush()
+
+        lms_user_id = self._lms_user_id(user)
+        lis_result_sourcedid = (
+            None if lti_params.v13 else lti_params.get("lis_result_sourcedid")
+        )
+        touch_after = self._touch_throttle.touch_after
+
+        self._execute(
+            self._upsert(
+                AssignmentMembership,
+                [
+                    {
+                        "user_id": user.id,
+                        "assignment_id": assignment.id,
+                        "lti_role_id": lti_role.id,
+                    }
+                    for lti_role in lti_roles
+                ],
+                index_elements=["user_id", "assignment_id", "lti_role_id"],
+                update_columns=["updated"],
+                touch_after=touch_after,
+            ),
+            self._upsert(
+                LMSUserAssignmentMembership,
+                [
+                    {
+                        "lms_user_id": lms_user_id,
+                        "assignment_id": assignment.id,
+                        "lti_role_id": lti_role.id,
+                        "lti_v11_lis_result_sourcedid": lis_result_sourcedid,
+                    }
+                    for lti_role in lti_roles
+                ],
+                index_elements=["lms_user_id", "assignment_id", "lti_role_id"],
+                update_columns=[
+                    "updated",
+                    (
+                        "lti_v11_lis_result_sourcedid",
+                        func.coalesce(
+                            text('"excluded"."lti_v11_lis_result_sourcedid"'),
+                            text(
+                                '"lms_user_assignment_membership"."lti_v11_lis_result_sourcedid"'
+                            ),
+                        ),
+                    ),
+                ],
+                touch_after=touch_after,
+            ),
+            self._upsert(
+                AssignmentGrouping,
+                [
+                    {"assignment_id": assignment.id, "grouping_id": grouping.id}
+                    for grouping in groupings
+                ],
+                index_elements=["assignment_id", "grouping_id"],
+                update_columns=["updated"],
+                touch_after=touch_after,
+            ),
+        )
+
+    @staticmethod
+    def _lms_user_id(user: User) -> ColumnElement[int]:
+        return (
+            select(LMSUser.id)
+            .where(LMSUser.h_userid == user.h_userid)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _upsert(  # noqa: PLR0913
+        model_class,
+        values: list[dict],
+        index_elements: list[str],
+        update_columns: list[str | tuple],
+        *,
+        skip_unchanged: bool = False,
+        touch_after: timedelta | None = None,
+    ) -> CTE | None:
+        """Get an upsert of `values` to run as part of a larger statement."""
+        if not values:
+            # Don't insert a row of defaults, see `bulk_upsert()`
+            return None
+
+        return (
+            on_conflict_update(
+                insert(model_class).values(values),
+                index_elements,
+                update_columns,
+                skip_unchanged=skip_unchanged,
+                touch_after=touch_after,
+            )
+            .returning(*model_class.__table__.primary_key)
+            .cte(f"upsert_{model_class.__tablename__}")
+        )
+
+    def _execute(self, *upserts: CTE | None) -> None:
+        """Run `upserts` in a single statement."""
+        # Postgres runs data-modifying CTEs even if the statement doesn't
+        # read them, and checks foreign keys once they have all run. Upserts
+        # can refer to rows created by the others.
+        self._db.execute(
+            select(literal(1)).add_cte(
+                *[upsert for upsert in upserts if upsert is not None]
+            )
+        )
+
+        # Let SQLAlchemy know that something has changed, otherwise it will
+        # never commit the transaction we are working on, see `bulk_upsert()`
+        mark_changed(self._db)
+
+
+def factory(_context, request):
+    return LaunchPersistenceService(db=request.db)
@@ -41,6 +41,7 @@ class LMSTermService:
             values=values,
             index_elements=["key"],
             update_columns=["updated", "name", "starts_at", "ends_at"],
+            skip_unchanged=True,
         ).first()
 
 
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
@@ -23,6 +24,9 @@ class LTI13GradingService(LTIGradingService):
         "https://purl.imsglobal.org/spec/lti-ags/scope/score",
     ]
 
+    SYNC_GRADES_MAX_WORKERS = 5
+    """Maximum number of concurrent requests while sending a batch of grades."""
+
     def __init__(  # noqa: PLR0913
         self,
         line_item_url,
@@ -91,19 +95,22 @@ class LTI13GradingService(LTIGradingService):
     def get_score_maximum(self, resource_link_id) -> float | None:
         return self._read_grading_configuration(resource_link_id).get("scoreMaximum")
 
-    def sync_grade(
+    def sync_grade(  # noqa: PLR0913
         self,
         application_instance: ApplicationInstance,
         assignment: Assignment,
         grade_timestamp: str,
         lms_user: LMSUser,
         score: float,
+        access_token: str | None = None,
     ):
         """
         Send a grade to the LMS.
 
         This is very similar to `record_result` but not scoped to the request context,
         taking all the necessary information as parameters.
+
+        :param access_token: LTIA access token to use instead of getting one
         """
         assert lms_user.lti_v13_user_id, (  # noqa: S101
             "Trying to grade a student without lti_v13_user_id"
@@ -126,8 +133,55 @@ class LTI13GradingService(LTIGradingService):
             scopes=self.LTIA_SCOPES,
             json=payload,
             headers={"Content-Type": "application/vnd.ims.lis.v1.score+json"},
+            access_token=access_token,
         )
 
+    def sync_grades(
+        self,
+        application_instance: ApplicationInstance,
+        assignment: Assignment,
+        grade_timestamp: str,
+        grades: list[tuple[LMSUser, float]],
+    ) -> list[Exception | None]:
+        """
+        Send a batch of grades to the LMS concurrently.
+
+        All requests share one access token and, through `LTIAHTTPService`,
+        the same connection pool. At most `SYNC_GRADES_MAX_WORKERS` requests
+        are in flight at once.
+
+        Everything the requests need from the DB must be loaded before
+        calling this as the worker threads can't use the DB session.
+
+        :return: The error sending each grade, or `None` if it was sent. If
+            we can't get an access token that's the error for all of them.
+        """
+        try:
+            access_token = self._ltia_service.get_access_token(
+                application_instance.lti_registration, self.LTIA_SCOPES
+            )
+        except Exception as err:  # noqa: BLE001
+            return [err] * len(grades)
+
+        def sync_grade(grade: tuple[LMSUser, float]) -> Exception | None:
+            lms_user, score = grade
+            try:
+                self.sync_grade(
+                    application_instance,
+                    assignment,
+                    grade_timestamp,
+                    lms_user,
+                    score,
+                    access_token=access_token,
+                )
+            except Exception as err:  # noqa: BLE001
+                return err
+
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.SYNC_GRADES_MAX_WORKERS) as executor:
+            return list(executor.map(sync_grade, grades))
+
     def record_result(self, grading_id, score=None, pre_record_hook=None, comment=None):
         payload = self._record_score_payload(
             score,
@@ -103,6 +103,35 @@ class LTIGradingService:  # pragma: no cover
         """
         raise NotImplementedError
 
+    def sync_grades(
+        self,
+        application_instance: ApplicationInstance,
+        assignment: Assignment,
+        grade_timestamp: str,
+        grades: list[tuple[LMSUser, float]],
+    ) -> list[Exception | None]:
+        """
+        Send a batch of grades to the LMS.
+
+        Errors sending one grade don't stop the rest of the batch.
+
+        :param grades: (lms_user, score) pairs to send
+        :return: For each grade, in the same order, the exception raised
+            while sending it or `None` if it was sent successfully
+        """
+        results: list[Exception | None] = []
+        for lms_user, score in grades:
+            try:
+                self.sync_grade(
+                    application_instance, assignment, grade_timestamp, lms_user, score
+                )
+            except Exception as err:  # noqa: BLE001
+                results.append(err)
+            else:
+                results.append(None)
+
+        return results
+
     def create_line_item(self, resource_link_id, label):
         """
         Create a new line item associated to one resource_link_id.
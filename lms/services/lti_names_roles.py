@@ -6,6 +6,9 @@ https://www.imsglobal.org/ltiadvantage
 """
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any, TypedDict
 from urllib.parse import parse_qs, urlparse
 
@@ -43,7 +46,7 @@ class LTINamesRolesService:
         lti_registration: LTIRegistration,
         service_url: str,
         resource_link_id: str | None = None,
-        max_pages: int = 10,
+        max_pages: int | None = None,
         limit: int = 100,
     ) -> list[Member]:
         """
@@ -54,34 +57,90 @@ class LTINamesRolesService:
 
         Optionally, using the  same service_url the API allows to get the roster of an assignment identified by `resource_link_id`.
 
-        max_pages and limit control the default pagination limits.
+        max_pages and limit control the pagination limits, see
+        `get_context_membership_pages`.
         """
+        return list(
+            chain.from_iterable(
+                self.get_context_membership_pages(
+                    lti_registration, service_url, resource_link_id, max_pages, limit
+                )
+            )
+        )
 
-        query: dict[str, Any] = {"limit": limit}
-        if resource_link_id:
-            query["rlid"] = resource_link_id
+    def get_context_membership_pages(
+        self,
+        lti_registration: LTIRegistration,
+        service_url: str,
+        resource_link_id: str | None = None,
+        max_pages: int | None = None,
+        limit: int = 100,
+    ) -> Iterator[list[Member]]:
+        """
+        Get the roster for a course or assignment one page at a time.
 
-        response = self._make_request(lti_registration, service_url, query)
+        The first page is requested straight away, so errors from the LMS
+        about the roster as a whole are raised by this method and not while
+        iterating.
 
-        members = response.json()["members"]
+        While the caller processes a page the next one is already being
+        fetched in the background.
 
-        while response.links.get("next") and max_pages:
-            LOG.info("Fetching next page of members %s", response.links["next"]["url"])
-            response = self._make_request(
-                lti_registration, response.links["next"]["url"], query
-            )
-            members.extend(response.json()["members"])
+        :param max_pages: Maximum number of pages to fetch after the first one
+            or `None` to fetch all of them.
+        :param limit: Number of members per page.
+        """
+        query: dict[str, Any] = {"limit": limit}
+        if resource_link_id:
+            query["rlid"] = resource_link_id
 
-            max_pages -= 1
+        # Get the token here, the background requests can't access the DB.
+        access_token = self._ltia_service.get_access_token(
+            lti_registration, self.LTIA_SCOPES
+        )
+        response = self._make_request(
+            lti_registration, service_url, query, access_token
+        )
 
-        return members
+        return self._iter_pages(
+            response, lti_registration, query, access_token, max_pages
+        )
 
-    def _make_request(self, lti_registration, service_url, query):
+    def _iter_pages(
+        self, response, lti_registration, query, access_token, max_pages
+    ) -> Iterator[list[Member]]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = None
+            pages = 0
+
+            while response:
+                if next_url := response.links.get("next", {}).get("url"):
+                    if max_pages is None or pages < max_pages:
+                        LOG.info("Fetching next page of members %s", next_url)
+                        next_page = executor.submit(
+                            self._make_request,
+                            lti_registration,
+                            next_url,
+                            query,
+                            access_token,
+                        )
+                    else:
+                        LOG.warning(
+                            "Stopped fetching members after %d pages", pages + 1
+                        )
+
+                yield response.json()["members"]
+
+                response = next_page.result() if next_page else None
+                next_page = None
+                pages += 1
+
+    def _make_request(self, lti_registration, service_url, query, access_token):
         existing_query_params = parse_qs(urlparse(service_url).query)
         if "rlid" in existing_query_params and "rlid" in query:
             # Some LMSes include the resource_link_id in the service_url
             # Avoid adding it again to the query params
-            del query["rlid"]
+            query = {key: value for key, value in query.items() if key != "rlid"}
 
         return self._ltia_service.request(
             lti_registration,
@@ -91,6 +150,7 @@ class LTINamesRolesService:
             headers={
                 "Accept": "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
             },
+            access_token=access_token,
             params=query,
         )
 
@@ -1,9 +1,11 @@
 from lms.models import LTIRegistration
+from lms.services.tenant_cache import TENANT_CACHE, TenantCache
 
 
 class LTIRegistrationService:
-    def __init__(self, db):
+    def __init__(self, db, cache: TenantCache = TENANT_CACHE):
         self._db = db
+        self._cache = cache
 
     def get(self, issuer: str, client_id: str | None = None):
         """
@@ -21,9 +23,21 @@ class LTIRegistrationService:
         if not issuer:
             return None
 
-        return self._registration_search_query(
-            issuer=issuer, client_id=client_id
-        ).one_or_none()
+        return self._cache.get(
+            self._db,
+            ("lti_registration", issuer, client_id),
+            self._registration_search_query(
+                issuer=issuer, client_id=client_id
+            ).one_or_none,
+        )
+
+    def invalidate_cache(self, lti_registration: LTIRegistration) -> None:
+        """
+        Make `get()` query `lti_registration` again after changing it.
+
+        Takes effect once the current transaction is committed.
+        """
+        self._cache.invalidate_on_commit(self._db, lti_registration)
 
     def get_by_id(self, id_) -> LTIRegistration | None:
         return self._registration_search_query(id_=id_).one_or_none()
@@ -1,15 +1,119 @@
-from sqlalchemy import func, or_, select
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from lms.models import ApplicationInstance
 from lms.models.lti_role import LTIRole, LTIRoleOverride, Role, RoleScope, RoleType
+from lms.services.tenant_cache import restore_row, snapshot_row
+
+
+class LTIRoleCache:
+    """
+    Per-process cache of LTI roles and role overrides.
+
+    Roles are kept by their raw value for the life of the process: a role's
+    type and scope only depend on its value. They are only cached once the
+    transaction that loaded them commits, roles created by a transaction
+    that is rolled back never make it here.
+
+    Each application instance's overrides are kept for `ttl` seconds, as they
+    are only invalidated right away in the process that changes them.
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._roles: dict[str, dict[str, Any]] = {}
+        self._overrides: dict[int, tuple[float, dict]] = {}
+
+    def get_roles(
+        self, values: list[str], db: Session | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the column values of the roles with `values` we have.
+
+        :param db: Also get the roles `db`'s transaction loaded, they are only
+            cached once it commits
+        """
+        roles = {value: self._roles[value] for value in values if value in self._roles}
+
+        if db is not None:
+            for value, (cache, row) in db.info.get(_UNCOMMITTED_ROLES, {}).items():
+                if cache is self and value in values:
+                    roles[value] = row
+
+        return roles
+
+    def set_role(self, role: LTIRole):
+        self.set_role_values(role.value, snapshot_row(role))
+
+    def set_role_values(self, value: str, values: dict[str, Any]):
+        with self._lock:
+            self._roles[value] = values
+
+    def set_role_on_commit(self, db: Session, role: LTIRole):
+        """Cache `role` when (and if) `db`'s transaction commits."""
+        db.info.setdefault(_UNCOMMITTED_ROLES, {})[role.value] = (
+            self,
+            snapshot_row(role),
+        )
+
+    def get_overrides(self, application_instance_id: int) -> dict | None:
+        """Get the overrides by role ID, None if they're not cached."""
+        loaded_at, overrides = self._overrides.get(application_instance_id, (0, None))
+        if overrides is None or time.monotonic() - loaded_at >= self.ttl:
+            return None
+
+        return overrides
+
+    def set_overrides(self, application_instance_id: int, overrides: dict):
+        with self._lock:
+            self._overrides[application_instance_id] = (time.monotonic(), overrides)
+
+    def invalidate_overrides(self, application_instance_id: int):
+        with self._lock:
+            self._overrides.pop(application_instance_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._roles.clear()
+            self._overrides.clear()
+
+
+LTI_ROLE_CACHE = LTIRoleCache()
+
+_UNCOMMITTED_ROLES = "lti_role_cache.uncommitted_roles"
+"""The `Session.info` key of the roles to cache once they are committed."""
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_roles(session):
+    if session.in_nested_transaction():
+        # Only a savepoint was released, the transaction can still roll back
+        return
+
+    uncommitted_roles = session.info.pop(_UNCOMMITTED_ROLES, {})
+    for value, (cache, values) in uncommitted_roles.items():
+        cache.set_role_values(value, values)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_uncommitted_roles(session):
+    # Including rolled back savepoints, roles loaded since might have been
+    # created in them
+    session.info.pop(_UNCOMMITTED_ROLES, None)
 
 
 class LTIRoleService:
     """A service for dealing with LTIRole objects."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, cache: LTIRoleCache = LTI_ROLE_CACHE):
         self._db = db_session
+        self._cache = cache
 
     def get_roles(self, role_description: str | list[str]) -> list[LTIRole]:
         """
@@ -22,14 +126,11 @@ class LTIRoleService:
         else:
             role_strings = role_description
 
-        roles = self._db.query(LTIRole).filter(LTIRole.value.in_(role_strings)).all()
+        cached = self._cache.get_roles(role_strings, self._db)
+        roles = [restore_row(self._db, LTIRole, values) for values in cached.values()]
 
-        for role in roles:
-            # Update scope and type.
-            # This is useful when the logic for those fields change, updating
-            # the values in the DB and also exposing the right values in the
-            # rest to the application.
-            role.update_from_value()
+        if not_cached := set(role_strings) - set(cached):
+            roles.extend(self._load_roles(not_cached))
 
         if missing := set(role_strings) - {role.value for role in roles}:
             new_roles = [LTIRole(value=value) for value in missing]
@@ -43,26 +144,20 @@ class LTIRoleService:
         self, ai: ApplicationInstance, roles: list[LTIRole]
     ) -> list[Role]:
         self._db.flush()  # Make sure roles have IDs
-        overrides = self._db.execute(
-            select(
-                LTIRole.value.label("value"),
-                func.coalesce(LTIRoleOverride.type, LTIRole.type).label("type"),
-                func.coalesce(LTIRoleOverride.scope, LTIRole.scope).label("scope"),
-            )
-            .outerjoin(LTIRoleOverride)
-            .filter(
-                LTIRole.id.in_([role.id for role in roles]),
-                or_(
-                    LTIRoleOverride.application_instance_id == ai.id,
-                    LTIRoleOverride.application_instance_id.is_(None),
-                ),
+        overrides = self._get_overrides(ai)
+
+        effective_roles = []
+        for role in sorted(roles, key=lambda r: r.value):
+            override_type, override_scope = overrides.get(role.id, (None, None))
+            effective_roles.append(
+                Role(
+                    scope=override_scope if override_scope is not None else role.scope,
+                    type=override_type if override_type is not None else role.type,
+                    value=role.value,
+                )
             )
-            .order_by("value")
-        )
-        return [
-            Role(scope=role.scope, type=role.type, value=role.value)
-            for role in overrides
-        ]
+
+        return effective_roles
 
     def search(self, id_=None):
         query = self._db.query(LTIRole).order_by(LTIRole.value)
@@ -80,6 +175,7 @@ class LTIRoleService:
             scope=scope,
         )
         self._db.add(override)
+        self._cache.invalidate_overrides(application_instance.id)
         return override
 
     def search_override(self, id_=None):
@@ -95,11 +191,49 @@ class LTIRoleService:
     ) -> LTIRoleOverride:
         override.scope = scope
         override.type = type_
+        self._cache.invalidate_overrides(override.application_instance_id)
 
         return override
 
     def delete_override(self, override: LTIRoleOverride):
         self._db.delete(override)
+        self._cache.invalidate_overrides(override.application_instance_id)
+
+    def _load_roles(self, values: set[str]) -> list[LTIRole]:
+        roles = self._db.query(LTIRole).filter(LTIRole.value.in_(values)).all()
+
+        for role in roles:
+            # Update scope and type.
+            # This is useful when the logic for those fields change, updating
+            # the values in the DB and also exposing the right values in the
+            # rest to the application.
+            role.update_from_value()
+
+            # The role might have been created (and autoflushed) by this
+            # transaction, only cache it once it's committed
+            self._cache.set_role_on_commit(self._db, role)
+
+        return roles
+
+    def _get_overrides(
+        self, ai: ApplicationInstance
+    ) -> dict[int, tuple[RoleType, RoleScope | None]]:
+        """Get `ai`'s role overrides' type and scope by role ID."""
+        if (overrides := self._cache.get_overrides(ai.id)) is not None:
+            return overrides
+
+        overrides = {
+            lti_role_id: (type_, scope)
+            for lti_role_id, type_, scope in self._db.execute(
+                select(
+                    LTIRoleOverride.lti_role_id,
+                    LTIRoleOverride.type,
+                    LTIRoleOverride.scope,
+                ).where(LTIRoleOverride.application_instance_id == ai.id)
+            )
+        }
+        self._cache.set_overrides(ai.id, overrides)
+        return overrides
 
     @staticmethod
     def is_admin(roles: list[LTIRole] | list[Role]) -> bool:
@@ -131,6 +265,12 @@ class LTIRoleService:
         )
 
 
+def configure_lti_role_cache(settings, cache=LTI_ROLE_CACHE):
+    """Apply the `tenant_cache_ttl` app setting to the role overrides' cache."""
+    if (ttl := settings.get("tenant_cache_ttl")) is not None:
+        cache.ttl = float(ttl)
+
+
 def service_factory(_context, request) -> LTIRoleService:
     """Create an LTIRoleService object."""
 
@@ -16,6 +16,9 @@ LOG = logging.getLogger(__name__)
 class LTIAHTTPService:
     """Send LTI Advantage requests and return the responses."""
 
+    TOKEN_REFRESH_BEFORE = timedelta(minutes=5)
+    """Get a new token when the current one is this close to expiring."""
+
     def __init__(
         self,
         plugin: MiscPlugin,
@@ -28,29 +31,39 @@ class LTIAHTTPService:
         self._plugin = plugin
         self._jwt_oauth2_token_service = jwt_oauth2_token_service
 
-    def request(
+    def request(  # noqa: PLR0913
         self,
         lti_registration: LTIRegistration,
         method,
         url,
         scopes,
         headers=None,
+        access_token: str | None = None,
         **kwargs,
     ):
+        """
+        Send an LTI Advantage request.
+
+        :param access_token: Use this access token instead of getting one from
+            the DB. This allows sending requests from a thread that mustn't
+            touch the DB session.
+        """
         headers = headers or {}
 
         assert "Authorization" not in headers  # noqa: S101
 
-        access_token = self._get_access_token(lti_registration, scopes)
+        access_token = access_token or self.get_access_token(lti_registration, scopes)
         headers["Authorization"] = f"Bearer {access_token}"
 
         return self._http.request(method, url, headers=headers, **kwargs)
 
-    def _get_access_token(
+    def get_access_token(
         self, lti_registration: LTIRegistration, scopes: list[str]
     ) -> str:
-        """Get a valid access token from the DB or get a new one from the LMS."""
-        token = self._jwt_oauth2_token_service.get_token(lti_registration, scopes)
+        """Get a valid access token from memory/the DB or get a new one from the LMS."""
+        token = self._jwt_oauth2_token_service.get_cached_token(
+            lti_registration, scopes, min_ttl=self.TOKEN_REFRESH_BEFORE
+        )
         if not token:
             LOG.debug("Requesting new LTIA JWT token")
             token = self._get_new_access_token(lti_registration, scopes)
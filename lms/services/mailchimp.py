@@ -5,9 +5,8 @@ from typing import Any
 
 import mailchimp_transactional
 from pyramid.renderers import render
-from sqlalchemy import select
 
-from lms.models import TaskDone
+from lms.services.dedupe import DedupeService
 
 LOG = logging.getLogger(__name__)
 
@@ -38,8 +37,8 @@ class MailchimpError(Exception):
 
 
 class MailchimpService:
-    def __init__(self, db, api_key):
-        self.db = db
+    def __init__(self, dedupe_service: DedupeService, api_key):
+        self._dedupe_service = dedupe_service
         self.mailchimp_client = mailchimp_transactional.Client(api_key)
 
     def send(  # noqa: PLR0913
@@ -59,12 +58,9 @@ class MailchimpService:
         https://mailchimp.com/developer/transactional/api/messages/send-new-message/
         """
 
-        if task_done_key:  # noqa: SIM102
-            if self.db.execute(
-                select(TaskDone).filter_by(key=task_done_key)
-            ).one_or_none():
-                LOG.info("Not sending duplicate email %s", task_done_key)
-                return
+        if task_done_key and self._dedupe_service.exists([task_done_key]):
+            LOG.info("Not sending duplicate email %s", task_done_key)
+            return
 
         headers = {}
 
@@ -105,8 +101,11 @@ class MailchimpService:
 
         if task_done_key:
             # Record the email send in the DB to avoid sending duplicates.
-            self.db.add(TaskDone(key=task_done_key, data=task_done_data))
+            self._dedupe_service.claim(task_done_key, data=task_done_data)
 
 
 def factory(_context, request):
-    return MailchimpService(request.db, request.registry.settings["mailchimp_api_key"])
+    return MailchimpService(
+        request.find_service(DedupeService),
+        request.registry.settings["mailchimp_api_key"],
+    )
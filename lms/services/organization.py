@@ -13,6 +13,7 @@ from lms.models import (
     GroupInfo,
     GroupingMembership,
     Organization,
+    OrganizationHierarchy,
     User,
 )
 
@@ -281,33 +282,42 @@ class OrganizationService:
         Get an organization and it's children's ids order not guaranteed.
 
         :param id_: Organization id to look for
-        :param include_parents: Include parents as well as children
+        :param include_parents: Include the whole hierarchy the organization
+            belongs to, that's its root and all the root's descendants
         """
+        if not include_parents:
+            return self.get_descendant_ids([id_])
 
-        # Find the relevant orgs in the hierarchy by id using a recursive CTE:
-        # https://www.postgresql.org/docs/current/queries-with.html#QUERIES-WITH-RECURSIVE
-        cols = [Organization.id, Organization.parent_id]
-        base_case = (
-            self._db_session.query(*cols)
-            .filter(Organization.id == id_)
-            # The name of the CTE is arbitrary, but must be present
-            .cte("organizations", recursive=True)
+        root_id = (
+            select(OrganizationHierarchy.ancestor_id)
+            .where(OrganizationHierarchy.descendant_id == id_)
+            .order_by(OrganizationHierarchy.depth.desc())
+            .limit(1)
+            .scalar_subquery()
         )
-
-        # We are going to self join onto the above with anything that is a
-        # child of the objects we've seen so far
-        join_condition = Organization.parent_id == base_case.c.id
-        if include_parents:
-            # Match anything that is a parent of what we've seen
-            join_condition = sa.or_(
-                join_condition, Organization.id == base_case.c.parent_id
+        return self._db_session.scalars(
+            select(OrganizationHierarchy.descendant_id).where(
+                OrganizationHierarchy.ancestor_id == root_id
             )
+        ).all()
+
+    def get_descendant_ids(self, ids: list[int]) -> list[int]:
+        """
+        Get the ids of the given organizations and all their descendants.
+
+        This is a single lookup on the organization hierarchy closure table,
+        no matter how deep or wide the hierarchy is. Order is not guaranteed.
 
-        recursive_case = self._db_session.query(*cols).join(base_case, join_condition)
+        :param ids: Ids of the organizations to look for
+        """
+        if not ids:
+            return []
 
-        # This will recurse until no new rows are added
-        rows = self._db_session.query(base_case.union(recursive_case)).all()  # type: ignore  # noqa: PGH003
-        return [row[0] for row in rows]
+        return self._db_session.scalars(
+            select(OrganizationHierarchy.descendant_id)
+            .where(OrganizationHierarchy.ancestor_id.in_(ids))
+            .distinct()
+        ).all()
 
     def is_member(self, organization: Organization, user: User) -> bool:
         """
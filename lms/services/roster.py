@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime
 from logging import getLogger
 
@@ -162,56 +163,17 @@ class RosterService:
         application_instance = self._get_application_instance(lms_course)
         lti_registration = self._get_lti_registration(lms_course)
 
-        roster = self._lti_names_roles_service.get_context_memberships(
+        roster_pages = self._lti_names_roles_service.get_context_membership_pages(
             lti_registration, lms_course.lti_context_memberships_url
         )
 
-        # Insert any users we might be missing in the DB
-        lms_users_by_lti_user_id = {
-            u.lti_user_id: u
-            for u in self._get_roster_users(
-                roster,
-                application_instance,
-                lms_course.tool_consumer_instance_guid,
-            )
-        }
-        # Also insert any roles we might be missing
-        lti_roles_by_value: dict[str, LTIRole] = {
-            r.value: r for r in self._get_roster_roles(roster)
-        }
-
-        # Make sure any new rows have IDs
-        self._db.flush()
-
-        roster_upsert_elements = []
-
-        for member in roster:
-            lti_user_id = member.get("lti11_legacy_user_id") or member["user_id"]
-            # Now, for every user + role, insert a row  in the roster table
-            for role in member["roles"]:
-                roster_upsert_elements.append(  # noqa: PERF401
-                    {
-                        "lms_course_id": lms_course.id,
-                        "lms_user_id": lms_users_by_lti_user_id[lti_user_id].id,
-                        "lti_role_id": lti_roles_by_value[role].id,
-                        "active": member["status"] == "Active",
-                    }
-                )
-        # We'll first mark everyone as non-Active.
-        # We keep a record of who belonged to a course even if they are no longer present.
-        self._db.execute(
-            update(CourseRoster)
-            .where(CourseRoster.lms_course_id == lms_course.id)
-            .values(active=False)
-        )
-
-        # Insert and update roster rows.
-        bulk_upsert(
-            self._db,
+        self._upsert_roster_pages(
+            roster_pages,
+            application_instance,
+            lms_course.tool_consumer_instance_guid,
             CourseRoster,
-            values=roster_upsert_elements,
-            index_elements=["lms_course_id", "lms_user_id", "lti_role_id"],
-            update_columns=["active", "updated"],
+            "lms_course_id",
+            lms_course.id,
         )
 
     def fetch_assignment_roster(self, assignment: Assignment) -> None:
@@ -237,11 +199,24 @@ class RosterService:
         lti_registration = self._get_lti_registration(lms_course)
 
         try:
-            roster = self._lti_names_roles_service.get_context_memberships(
-                lti_registration,
-                lms_course.lti_context_memberships_url,
-                resource_link_id=assignment.lti_v13_resource_link_id,
-            )
+            # Pages after the first are fetched while iterating, an error
+            # there rolls back the pages already upserted.
+            with self._db.begin_nested():
+                roster_pages = (
+                    self._lti_names_roles_service.get_context_membership_pages(
+                        lti_registration,
+                        lms_course.lti_context_memberships_url,
+                        resource_link_id=assignment.lti_v13_resource_link_id,
+                    )
+                )
+                self._upsert_roster_pages(
+                    roster_pages,
+                    application_instance,
+                    lms_course.tool_consumer_instance_guid,
+                    AssignmentRoster,
+                    "assignment_id",
+                    assignment.id,
+                )
         except ExternalRequestError as err:
             ignored_errors = [
                 # Canvas, unknown reason
@@ -261,54 +236,6 @@ class RosterService:
 
             raise
 
-        # Insert any users we might be missing in the DB
-        lms_users_by_lti_user_id = {
-            u.lti_user_id: u
-            for u in self._get_roster_users(
-                roster,
-                application_instance,
-                lms_course.tool_consumer_instance_guid,
-            )
-        }
-        # Also insert any roles we might be missing
-        lti_roles_by_value: dict[str, LTIRole] = {
-            r.value: r for r in self._get_roster_roles(roster)
-        }
-
-        # Make sure any new rows have IDs
-        self._db.flush()
-
-        roster_upsert_elements = []
-
-        for member in roster:
-            lti_user_id = member.get("lti11_legacy_user_id") or member["user_id"]
-            # Now, for every user + role, insert a row  in the roster table
-            for role in member["roles"]:
-                roster_upsert_elements.append(  # noqa: PERF401
-                    {
-                        "assignment_id": assignment.id,
-                        "lms_user_id": lms_users_by_lti_user_id[lti_user_id].id,
-                        "lti_role_id": lti_roles_by_value[role].id,
-                        "active": member["status"] == "Active",
-                    }
-                )
-        # We'll first mark everyone as non-Active.
-        # We keep a record of who belonged to a course even if they are no longer present.
-        self._db.execute(
-            update(AssignmentRoster)
-            .where(AssignmentRoster.assignment_id == assignment.id)
-            .values(active=False)
-        )
-
-        # Insert and update roster rows.
-        bulk_upsert(
-            self._db,
-            AssignmentRoster,
-            values=roster_upsert_elements,
-            index_elements=["assignment_id", "lms_user_id", "lti_role_id"],
-            update_columns=["active", "updated"],
-        )
-
     def fetch_canvas_group_roster(self, canvas_group: LMSSegment) -> None:
         """Fetch the roster information for a canvas group from the LMS."""
         assert canvas_group.type == "canvas_group"  # noqa: S101
@@ -320,13 +247,22 @@ class RosterService:
         application_instance = self._get_application_instance(lms_course)
 
         try:
-            roster = self._lti_names_roles_service.get_context_memberships(
-                application_instance.lti_registration,
-                # We won't use the names and roles endpoint for groups, we need to pass a URL from the Canvas extension to the API.
-                # https://canvas.instructure.com/doc/api/names_and_role.html#method.lti/ims/names_and_roles.group_index
-                f"https://{application_instance.lms_host()}/api/lti/groups/{canvas_group.lms_id}/names_and_roles",
-            )
-
+            # See `fetch_assignment_roster`
+            with self._db.begin_nested():
+                roster_pages = self._lti_names_roles_service.get_context_membership_pages(
+                    application_instance.lti_registration,
+                    # We won't use the names and roles endpoint for groups, we need to pass a URL from the Canvas extension to the API.
+                    # https://canvas.instructure.com/doc/api/names_and_role.html#method.lti/ims/names_and_roles.group_index
+                    f"https://{application_instance.lms_host()}/api/lti/groups/{canvas_group.lms_id}/names_and_roles",
+                )
+                self._upsert_roster_pages(
+                    roster_pages,
+                    application_instance,
+                    lms_course.tool_consumer_instance_guid,
+                    LMSSegmentRoster,
+                    "lms_segment_id",
+                    canvas_group.id,
+                )
         except ExternalRequestError as err:
             ignored_errors = [
                 # Canvas, group as been removed
@@ -342,54 +278,6 @@ class RosterService:
 
             raise
 
-        # Insert any users we might be missing in the DB
-        lms_users_by_lti_user_id = {
-            u.lti_user_id: u
-            for u in self._get_roster_users(
-                roster,
-                application_instance,
-                lms_course.tool_consumer_instance_guid,
-            )
-        }
-        # Also insert any roles we might be missing
-        lti_roles_by_value: dict[str, LTIRole] = {
-            r.value: r for r in self._get_roster_roles(roster)
-        }
-
-        # Make sure any new rows have IDs
-        self._db.flush()
-
-        roster_upsert_elements = []
-
-        for member in roster:
-            lti_user_id = member.get("lti11_legacy_user_id") or member["user_id"]
-            # Now, for every user + role, insert a row  in the roster table
-            for role in member["roles"]:
-                roster_upsert_elements.append(  # noqa: PERF401
-                    {
-                        "lms_segment_id": canvas_group.id,
-                        "lms_user_id": lms_users_by_lti_user_id[lti_user_id].id,
-                        "lti_role_id": lti_roles_by_value[role].id,
-                        "active": member["status"] == "Active",
-                    }
-                )
-        # We'll first mark everyone as non-Active.
-        # We keep a record of who belonged to a course even if they are no longer present.
-        self._db.execute(
-            update(LMSSegmentRoster)
-            .where(LMSSegmentRoster.lms_segment_id == canvas_group.id)
-            .values(active=False)
-        )
-
-        # Insert and update roster rows.
-        bulk_upsert(
-            self._db,
-            LMSSegmentRoster,
-            values=roster_upsert_elements,
-            index_elements=["lms_segment_id", "lms_user_id", "lti_role_id"],
-            update_columns=["active", "updated"],
-        )
-
     def fetch_canvas_sections_roster(self, lms_course: LMSCourse) -> None:
         """Fetch the roster information for all canvas sections for one particular course.
 
@@ -515,6 +403,69 @@ class RosterService:
             update_columns=["active", "updated"],
         )
 
+    def _upsert_roster_pages(  # noqa: PLR0913
+        self,
+        roster_pages: Iterable[list[Member]],
+        application_instance: ApplicationInstance,
+        tool_consumer_instance_guid: str,
+        roster_model: type[AssignmentRoster | CourseRoster | LMSSegmentRoster],
+        parent_column: str,
+        parent_id: int,
+    ) -> None:
+        """
+        Replace a roster with the members in `roster_pages`.
+
+        Each page is upserted as it arrives, keeping the number of members in
+        memory (and the size of each statement) bounded.
+        """
+        # We'll first mark everyone as non-Active.
+        # We keep a record of who belonged to a roster even if they are no longer present.
+        self._db.execute(
+            update(roster_model)
+            .where(getattr(roster_model, parent_column) == parent_id)
+            .values(active=False)
+        )
+
+        for roster in roster_pages:
+            # Insert any users we might be missing in the DB
+            lms_users_by_lti_user_id = {
+                u.lti_user_id: u
+                for u in self._get_roster_users(
+                    roster, application_instance, tool_consumer_instance_guid
+                )
+            }
+            # Also insert any roles we might be missing
+            lti_roles_by_value: dict[str, LTIRole] = {
+                r.value: r for r in self._get_roster_roles(roster)
+            }
+
+            # Make sure any new rows have IDs
+            self._db.flush()
+
+            roster_upsert_elements = []
+
+            for member in roster:
+                lti_user_id = member.get("lti11_legacy_user_id") or member["user_id"]
+                # Now, for every user + role, insert a row  in the roster table
+                for role in member["roles"]:
+                    roster_upsert_elements.append(  # noqa: PERF401
+                        {
+                            parent_column: parent_id,
+                            "lms_user_id": lms_users_by_lti_user_id[lti_user_id].id,
+                            "lti_role_id": lti_roles_by_value[role].id,
+                            "active": member["status"] == "Active",
+                        }
+                    )
+
+            # Insert and update roster rows.
+            bulk_upsert(
+                self._db,
+                roster_model,
+                values=roster_upsert_elements,
+                index_elements=[parent_column, "lms_user_id", "lti_role_id"],
+                update_columns=["active", "updated"],
+            )
+
     def _get_roster_users(
         self, roster: list[Member], application_instance, tool_consumer_instance_guid
     ):
@@ -598,6 +549,7 @@ class RosterService:
                     ),
                 ),
             ],
+            skip_unchanged=True,
         )
 
     def _get_roster_roles(self, roster) -> list[LTIRole]:
@@ -1,23 +1,76 @@
 import base64
 import json
+import random
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.utils import int_to_bytes
-from sqlalchemy import func
 
 from lms.models import RSAKey
 from lms.services.aes import AESService
 
 
+class NoSigningKeyError(Exception):
+    """There are no active RSA keys to sign with."""
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """A decrypted and parsed private key, ready to sign JWTs with."""
+
+    kid: str
+    private_key: rsa.RSAPrivateKey
+
+
+class SigningKeyCache:
+    """
+    Per-process cache of the active signing keys.
+
+    Decrypting and parsing the keys is comparatively expensive and they only
+    change when keys are rotated. Rotation invalidates the cache in the
+    process doing it, other processes pick up the new keys once `ttl` has
+    passed. That's fine as signatures made with a recently expired key are
+    still verifiable (see `RSAKeyService.get_all_public_jwks`).
+    """
+
+    def __init__(self, ttl: timedelta):
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._keys: list[SigningKey] = []
+        self._expires_at = 0.0
+
+    def get(self, load_keys) -> list[SigningKey]:
+        """Return the cached keys, calling `load_keys()` if they are stale."""
+        with self._lock:
+            if not self._keys or time.monotonic() >= self._expires_at:
+                self._keys = load_keys()
+                self._expires_at = time.monotonic() + self.ttl.total_seconds()
+
+            return self._keys
+
+    def clear(self):
+        with self._lock:
+            self._keys = []
+
+
+SIGNING_KEY_CACHE = SigningKeyCache(ttl=timedelta(minutes=5))
+
+
 class RSAKeyService:
     no_encryption = serialization.NoEncryption()
 
-    def __init__(self, db, aes_service):
+    def __init__(
+        self, db, aes_service, signing_key_cache: SigningKeyCache = SIGNING_KEY_CACHE
+    ):
         self._db = db
         self._aes_service = aes_service
+        self._signing_key_cache = signing_key_cache
 
     def rotate(
         self,
@@ -64,6 +117,8 @@ class RSAKeyService:
             "The number of active RSAKey doesn't match the target"
         )
 
+        self._signing_key_cache.clear()
+
     def generate(self) -> RSAKey:
         """Generate a new random RSA key pair."""
         rsa_key = rsa.generate_private_key(
@@ -96,14 +151,28 @@ class RSAKeyService:
             for key in self._db.query(RSAKey).filter_by().all()
         ]
 
-    def get_random_key(self) -> RSAKey:
-        """Get one random key from the valid ones to spread usage between them."""
-        return (
-            self._db.query(RSAKey)
-            .filter_by(expired=False)
-            .order_by(func.random())
-            .first()
-        )
+    def get_signing_key(self) -> SigningKey:
+        """
+        Get one random key from the valid ones to spread usage between them.
+
+        :raise NoSigningKeyError: if there are no active keys
+        """
+        keys = self._signing_key_cache.get(self._load_signing_keys)
+        if not keys:
+            raise NoSigningKeyError
+
+        return random.choice(keys)  # noqa: S311
+
+    def _load_signing_keys(self) -> list[SigningKey]:
+        return [
+            SigningKey(
+                kid=key.kid,
+                private_key=serialization.load_pem_private_key(
+                    self.private_key(key), password=None
+                ),
+            )
+            for key in self._db.query(RSAKey).filter_by(expired=False)
+        ]
 
     def _as_pem_private_key(self, rsa_key: rsa.RSAPrivateKey, aes_iv) -> bytes:
         """Encode a rsa key as an AES encrypted PEM private key."""
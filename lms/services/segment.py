@@ -1,4 +1,7 @@
+from collections.abc import Sequence
+
 from sqlalchemy import func
+from sqlalchemy.orm.interfaces import ORMOption
 
 from lms.models import (
     Grouping,
@@ -17,11 +20,18 @@ class SegmentService:
         self._db = db
         self._group_set_service = group_set_service
 
-    def get_segment(self, authority_provided_id: str) -> LMSSegment | None:
-        """Get a segment by its authority_provided_id."""
+    def get_segment(
+        self, authority_provided_id: str, options: Sequence[ORMOption] = ()
+    ) -> LMSSegment | None:
+        """
+        Get a segment by its authority_provided_id.
+
+        :param options: Loader options, e.g. to eager load relationships
+        """
         return (
             self._db.query(LMSSegment)
             .filter_by(h_authority_provided_id=authority_provided_id)
+            .options(*options)
             .one_or_none()
         )
 
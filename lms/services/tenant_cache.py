@@ -0,0 +1,178 @@
+import copy
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+ModelT = TypeVar("ModelT")
+
+
+class TenantCache:
+    """
+    Per-process cache of the rows a launch's tenant is resolved to.
+
+    Every launch looks up its `LTIRegistration` and `ApplicationInstance`
+    (by issuer, client ID, deployment ID or consumer key). This keeps a copy
+    of those rows' columns for `ttl` seconds and puts them back into the
+    request's session without querying the DB.
+
+    Only columns are cached, relationships are lazy loaded as usual. Changes
+    made in the DB are picked up once `ttl` has passed, call `invalidate()`
+    after changing a row to drop it from this process right away.
+
+    A `ttl` of 0 disables the cache.
+    """
+
+    @dataclass(frozen=True)
+    class _Entry:
+        model: type
+        identity_key: tuple
+        values: dict[str, Any]
+        loaded_at: float
+
+    def __init__(self, ttl: float = 60, max_size: int = 1000):
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, TenantCache._Entry] = {}
+
+    def get(
+        self, db: Session, key: Hashable, load: Callable[[], ModelT | None]
+    ) -> ModelT | None:
+        """
+        Get the row for `key`, calling `load()` to query it if needed.
+
+        :param db: The session to return the row in
+        :param key: A hashable description of the lookup, e.g. the model's
+            name and the values searched by
+        :param load: Function querying the row with `db`. Rows not found
+            (`None`) aren't cached.
+        """
+        if not self.ttl:
+            return load()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry and time.monotonic() - entry.loaded_at < self.ttl:
+            return self._restore(db, entry)
+
+        instance = load()
+        if instance is not None:
+            self._set(key, instance)
+        return instance
+
+    def invalidate(self, instance) -> None:
+        """Drop all entries of `instance`'s row."""
+        self._invalidate_key(sa.inspect(instance).key)
+
+    def invalidate_on_commit(self, db: Session, instance) -> None:
+        """
+        Drop all entries of `instance`'s row once `db`'s transaction ends.
+
+        Dropping them before the changes to the row are committed would let
+        another request in this process cache the row again, as it was.
+        """
+        db.info.setdefault(_INVALIDATE_ON_COMMIT, []).append(
+            (self, sa.inspect(instance).key)
+        )
+
+    def _invalidate_key(self, identity_key: tuple) -> None:
+        with self._lock:
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if entry.identity_key != identity_key
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _set(self, key: Hashable, instance) -> None:
+        state = sa.inspect(instance)
+        if state.modified:
+            # Don't cache changes that might never be committed
+            return
+
+        entry = self._Entry(
+            model=type(instance),
+            identity_key=state.key,
+            values=snapshot_row(instance),
+            loaded_at=time.monotonic(),
+        )
+
+        with self._lock:
+            # Re-insert the key to keep entries in the order they were loaded
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = entry
+
+    @staticmethod
+    def _restore(db: Session, entry: _Entry):
+        return restore_row(db, entry.model, entry.values)
+
+
+_INVALIDATE_ON_COMMIT = "tenant_cache.invalidate_on_commit"
+"""The `Session.info` key of the rows to invalidate when the transaction ends."""
+
+
+@sa.event.listens_for(Session, "after_transaction_end")
+def _invalidate_committed_rows(session, transaction):
+    # Savepoints aren't committed yet. After a rollback there's nothing new to
+    # load but invalidating the rows anyway does no harm.
+    if transaction.parent is not None:
+        return
+
+    for cache, identity_key in session.info.pop(_INVALIDATE_ON_COMMIT, []):
+        cache._invalidate_key(identity_key)  # noqa: SLF001
+
+
+def snapshot_row(instance) -> dict[str, Any]:
+    """Get a copy of the loaded column values of `instance`."""
+    state = sa.inspect(instance)
+
+    return {
+        attr.key: copy.deepcopy(state.dict[attr.key])
+        for attr in state.mapper.column_attrs
+        # Deferred columns aren't loaded and aren't copied
+        if attr.key in state.dict
+    }
+
+
+def restore_row(db: Session, model: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """
+    Add the row with column `values` to `db` without querying it.
+
+    :param values: A copy of the row's columns, see `snapshot_row()`
+    :return: The row, or `db`'s own copy if it has one already
+    """
+    instance = sa.inspect(model).class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(instance, key, copy.deepcopy(value))
+    make_transient_to_detached(instance)
+
+    # Merging would overwrite any changes made to the session's copy
+    if (existing := db.identity_map.get(sa.inspect(instance).key)) is not None:
+        return existing
+
+    # Add it to the session as if it had been loaded, without a query
+    return db.merge(instance, load=False)
+
+
+TENANT_CACHE = TenantCache()
+"""The tenant cache shared by every service in this process."""
+
+
+def configure_tenant_cache(settings, cache=TENANT_CACHE):
+    """Apply the `tenant_cache_ttl` app setting to the cache."""
+    if (ttl := settings.get("tenant_cache_ttl")) is not None:
+        cache.ttl = float(ttl)
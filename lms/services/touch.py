@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+
+class TouchThrottle:
+    """
+    Per-process setting for how often launches refresh unchanged rows.
+
+    Every launch "touches" the rows that link users, courses and assignments
+    together, bumping their `updated` timestamps even when nothing else about
+    them changed. Rows that were touched less than `interval` seconds ago are
+    left alone instead.
+
+    Upserts leave this check to the DB (see `bulk_upsert`'s `touch_after`)
+    while values we already have in memory can be checked with `is_due`.
+
+    An `interval` of 0 touches the rows on every launch.
+    """
+
+    def __init__(self, interval: float = 3600):
+        self.interval = interval
+
+    @property
+    def touch_after(self) -> timedelta | None:
+        """Get the age after which unchanged rows are touched, if throttled."""
+        if not self.interval:
+            return None
+
+        return timedelta(seconds=self.interval)
+
+    def is_due(self, touched_at: datetime | None, now: datetime) -> bool:
+        """Get whether a value last touched at `touched_at` should be now."""
+        if touched_at is None or not self.interval:
+            return True
+
+        return (now - touched_at).total_seconds() >= self.interval
+
+
+TOUCH_THROTTLE = TouchThrottle()
+"""The touch throttle shared by the whole process."""
+
+
+def configure_touch_throttle(settings, throttle=TOUCH_THROTTLE):
+    """Apply the `touch_interval` app setting to the touch throttle."""
+    if (interval := settings.get("touch_interval")) is not None:
+        throttle.interval = float(interval)
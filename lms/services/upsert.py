@@ -1,26 +1,67 @@
 """A helper for upserting into DB tables."""
 
-from sqlalchemy import tuple_
-from sqlalchemy.dialects.postgresql import insert
+import io
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from itertools import batched
+
+from newrelic.agent import record_custom_metric
+from sqlalchemy import column, false, func, or_, select, table, text, true, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.engine import ScalarResult
+from sqlalchemy.sql import ClauseElement
 from zope.sqlalchemy import mark_changed
 
+BULK_UPSERT_CHUNK_SIZE = 1000
+"""Upserts of more values than this are split into COPY-backed chunks."""
+
 
-def bulk_upsert(
+def bulk_upsert(  # noqa: PLR0913
     db,
     model_class,
     values: list[dict],
     index_elements: list[str],
     update_columns: list[str | tuple],
-):
+    chunk_size: int = BULK_UPSERT_CHUNK_SIZE,
+    *,
+    skip_unchanged: bool = False,
+    touch_after: timedelta | None = None,
+) -> ScalarResult:
     """
     Create or update the specified values in a table.
 
+    Up to `chunk_size` values are upserted with a single
+    `INSERT ... VALUES ... ON CONFLICT`.
+
+    Past that, values are streamed `chunk_size` at a time into a temporary
+    table with `COPY` and each chunk is merged into the model's table with a
+    single `INSERT ... SELECT ... ON CONFLICT`. This keeps memory use and
+    statement size bounded for upserts of tens of thousands of rows.
+
+    In both cases the affected rows are read from the `RETURNING` clause of
+    the upsert itself, without a second query to reload them.
+
+    With `skip_unchanged` existing rows are only updated if at least one of
+    `update_columns` (other than `updated`) has a different value. Rows that
+    are already up to date are left untouched, which avoids the dead tuples,
+    WAL and index updates of rewriting them, but are still returned. The
+    number of skipped updates is recorded as a custom metric per table.
+
+    With `touch_after` rows that are up to date are also skipped, unless their
+    `updated` timestamp is older than `touch_after`. This keeps the timestamp
+    roughly current, e.g. to tell when a membership was last seen in a
+    launch, without rewriting the row on every request.
+
     :param db: An SQLAlchemy session
     :param model_class: The model type to upsert
     :param values: Dicts of values to upsert
     :param index_elements: Columns to match when upserting. This must match an index.
     :param update_columns: Columns to update when a match is found.
-    :return: A lazy query of the affected `model_class` rows.
+    :param chunk_size: Maximum number of values to upsert in one statement
+    :param skip_unchanged: Don't update rows that wouldn't change
+    :param touch_after: Don't update rows that wouldn't change and were
+        updated more recently than this
+    :return: The affected `model_class` rows.
     """
     if not values:
         # Don't attempt to upsert an empty list of values into the DB.
@@ -41,34 +82,269 @@ def bulk_upsert(
         #
         # We do a wasteful query here to maintain
         # the same return type in all branches.
-        return db.query(model_class).filter(False)  # noqa: FBT003
+        return db.scalars(select(model_class).filter(False))  # noqa: FBT003
 
-    index_elements_columns = [getattr(model_class, c) for c in index_elements]
-
-    base = insert(model_class).values(values)
-    stmt = base.on_conflict_do_update(
-        # The columns to use to find matching rows.
+    upsert = partial(
+        _upsert,
+        db,
+        model_class,
         index_elements=index_elements,
-        # The columns to update.
-        set_={
-            # For tuples include the two elements as the key and value of the dict
-            # For strings use value: excluded.value by default
-            (element[0] if isinstance(element, tuple) else element): (
-                element[1]
-                if isinstance(element, tuple)
-                else getattr(base.excluded, element)
-            )
-            for element in update_columns
-        },
-    ).returning(*index_elements_columns)
+        update_columns=update_columns,
+        skip_unchanged=skip_unchanged,
+        touch_after=touch_after,
+    )
 
-    result = db.execute(stmt)
+    if len(values) <= chunk_size:
+        results = [
+            upsert(insert(model_class).values(values), _keys(values, index_elements))
+        ]
+    elif (columns := _copy_columns(values)) is not None:
+        results = _copy_upsert(
+            db, model_class, upsert, values, columns, index_elements, chunk_size
+        )
+    else:
+        # SQL expressions that differ from row to row can't be streamed with
+        # COPY, fall back to upserting chunks with plain VALUES.
+        results = [
+            upsert(insert(model_class).values(chunk), _keys(chunk, index_elements))
+            for chunk in batched(values, chunk_size)
+        ]
 
     # Let SQLAlchemy know that something has changed, otherwise it will
     # never commit the transaction we are working on and it will get rolled
     # back
     mark_changed(db)
 
-    return db.query(model_class).filter(
-        tuple_(*index_elements_columns).in_(result.all())
+    if skip_unchanged or touch_after is not None:
+        # Rows of these results are (row, skipped) pairs
+        frozen_results = [result.freeze() for result in results]
+        record_custom_metric(
+            f"Custom/BulkUpsert/{model_class.__tablename__}/SkippedUpdates",
+            sum(skipped for frozen in frozen_results for _, skipped in frozen.data),
+        )
+        results = [frozen() for frozen in frozen_results]
+
+    return results[0].merge(*results[1:]).scalars()
+
+
+def on_conflict_update(
+    base: Insert,
+    index_elements: list[str],
+    update_columns: list[str | tuple],
+    *,
+    skip_unchanged: bool = False,
+    touch_after: timedelta | None = None,
+) -> Insert:
+    """
+    Make the insert `base` update the rows it conflicts with.
+
+    This is the `ON CONFLICT` clause of `bulk_upsert()`, for building upserts
+    that are part of larger statements, e.g. in data-modifying CTEs.
+
+    :param base: An `INSERT` into the table to upsert into
+    :param index_elements: Columns to match when upserting. This must match an index.
+    :param update_columns: Columns to update when a match is found.
+    :param skip_unchanged: Don't update rows that wouldn't change. These rows
+        aren't returned by the `RETURNING` clause of the upsert.
+    :param touch_after: Like `skip_unchanged` but update rows anyway if their
+        `updated` timestamp is older than this
+    """
+    set_ = {
+        # For tuples include the two elements as the key and value of the dict
+        # For strings use value: excluded.value by default
+        (element[0] if isinstance(element, tuple) else element): (
+            element[1]
+            if isinstance(element, tuple)
+            else getattr(base.excluded, element)
+        )
+        for element in update_columns
+    }
+
+    where = None
+    if skip_unchanged or touch_after is not None:
+        # Only update rows if something other than the timestamp changes
+        where = or_(
+            false(),
+            *[
+                base.table.c[name].is_distinct_from(value)
+                for name, value in set_.items()
+                if name != "updated"
+            ],
+        )
+    if touch_after is not None:
+        # ...or if the timestamp is due a refresh
+        where = or_(where, base.table.c.updated < func.now() - touch_after)
+
+    return base.on_conflict_do_update(
+        # The columns to use to find matching rows.
+        index_elements=index_elements,
+        # The columns to update.
+        set_=set_,
+        where=where,
+    )
+
+
+def _upsert(  # noqa: PLR0913
+    db,
+    model_class,
+    base,
+    keys,
+    *,
+    index_elements,
+    update_columns,
+    skip_unchanged,
+    touch_after,
+):
+    upsert = on_conflict_update(
+        base,
+        index_elements,
+        update_columns,
+        skip_unchanged=skip_unchanged,
+        touch_after=touch_after,
+    )
+
+    if not skip_unchanged and touch_after is None:
+        return db.execute(
+            select(model_class)
+            .from_statement(upsert.returning(model_class))
+            # Refresh any instances of the affected rows already in the session
+            .execution_options(populate_existing=True)
+        )
+
+    target = model_class.__table__
+    upserted = upsert.returning(*target.c).cte("upserted")
+
+    # Rows the upsert skips updating aren't returned by it.
+    # Get them from the table in the same statement: it sees the table as it
+    # was before the upsert, which for these rows is also how it is after.
+    index_columns = tuple_(*[target.c[name] for name in index_elements])
+    skipped = select(*target.c, true().label("skipped")).where(
+        index_columns.in_(keys),
+        index_columns.not_in(select(*[upserted.c[name] for name in index_elements])),
+    )
+    stmt = select(*upserted.c, false().label("skipped")).union_all(skipped)
+
+    return db.execute(
+        select(model_class, column("skipped"))
+        .from_statement(stmt)
+        .execution_options(populate_existing=True)
+    )
+
+
+def _keys(values: list[dict], index_elements: list[str]) -> list[tuple]:
+    return [tuple(value[name] for name in index_elements) for value in values]
+
+
+def _copy_columns(values: list[dict]) -> dict[str, ClauseElement | None] | None:
+    """
+    Get the columns of `values` and how to send each of them with COPY.
+
+    Plain values map to `None`, they are copied as they are. SQL expressions
+    shared by every row (e.g. `func.now()`) map to that expression, which is
+    selected once from the temporary table instead of being copied.
+
+    :return: The columns or `None` if `values` can't be sent with COPY.
+    """
+    columns = {}
+
+    for name, first in values[0].items():
+        if not isinstance(first, ClauseElement):
+            if any(isinstance(row[name], ClauseElement) for row in values):
+                return None
+            columns[name] = None
+        elif all(
+            isinstance(row[name], ClauseElement) and row[name].compare(first)
+            for row in values
+        ):
+            columns[name] = first
+        else:
+            return None
+
+    return columns
+
+
+def _copy_upsert(  # noqa: PLR0913
+    db, model_class, upsert, values, columns, index_elements, chunk_size
+):
+    target = model_class.__table__
+    dialect = db.get_bind().dialect
+    quote = dialect.identifier_preparer.quote
+
+    copied = [name for name, expression in columns.items() if expression is None]
+    staging = table(f"_bulk_upsert_{target.name}", *[column(name) for name in copied])
+    staging_name = quote(staging.name)
+    copied_names = ", ".join(quote(name) for name in copied)
+
+    # A column-for-column copy of the table with none of its constraints.
+    db.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {staging_name} ON COMMIT DROP AS "  # noqa: S608
+            f"SELECT {copied_names} FROM {quote(target.name)} WITH NO DATA"
+        )
+    )
+
+    merge = insert(model_class).from_select(
+        list(columns),
+        select(
+            *[
+                staging.c[name] if expression is None else expression.label(name)
+                for name, expression in columns.items()
+            ]
+        ).select_from(staging),
+    )
+    processors = [
+        (name, target.c[name].type.bind_processor(dialect)) for name in copied
+    ]
+    copy_sql = f"COPY {staging_name} ({copied_names}) FROM STDIN"
+
+    results = []
+    for chunk in batched(values, chunk_size):
+        with db.connection().connection.cursor() as cursor:
+            cursor.copy_expert(copy_sql, _copy_file(chunk, processors))
+
+        results.append(
+            upsert(merge, select(*[staging.c[name] for name in index_elements]))
+        )
+        db.execute(text(f"TRUNCATE {staging_name}"))
+
+    # Don't wait for the end of the transaction, we might upsert into the same
+    # table again before then.
+    db.execute(text(f"DROP TABLE {staging_name}"))
+
+    return results
+
+
+def _copy_file(rows, processors) -> io.StringIO:
+    """Return `rows` in the text format of COPY."""
+    file = io.StringIO()
+
+    for row in rows:
+        file.write(
+            "\t".join(
+                _copy_value(processor(row[name]) if processor else row[name])
+                for name, processor in processors
+            )
+        )
+        file.write("\n")
+
+    file.seek(0)
+    return file
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return r"\N"
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+
+    if isinstance(value, date | datetime | time):
+        value = value.isoformat()
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
     )
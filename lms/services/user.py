@@ -1,4 +1,3 @@
-from functools import lru_cache
 from logging import getLogger
 
 from sqlalchemy import exists, func, select, text
@@ -23,11 +22,32 @@ from lms.models import (
 )
 from lms.models.lms_segment import LMSSegment
 from lms.services.course import CourseService
+from lms.services.touch import TOUCH_THROTTLE, TouchThrottle
 from lms.services.upsert import bulk_upsert
 
 LOG = getLogger(__name__)
 
 
+LMS_USER_UPDATE_COLUMNS = [
+    "updated",
+    "display_name",
+    "given_name",
+    "middle_name",
+    "family_name",
+    "name",
+    "email",
+    (
+        "lti_v13_user_id",
+        func.coalesce(
+            text('"excluded"."lti_v13_user_id"'),
+            text('"lms_user"."lti_v13_user_id"'),
+        ),
+    ),
+    "lms_api_user_id",
+]
+"""The columns of an existing `LMSUser` a launch updates."""
+
+
 class UserNotFound(Exception):  # noqa: N818
     """The requested User wasn't found in the database."""
 
@@ -39,9 +59,15 @@ class UserService:
     At the moment this is purely used for recording/reporting purposes.
     """
 
-    def __init__(self, db, h_authority: str):
+    def __init__(
+        self, db, h_authority: str, touch_throttle: TouchThrottle = TOUCH_THROTTLE
+    ):
         self._db = db
         self._h_authority = h_authority
+        self._touch_throttle = touch_throttle
+        # The users this request has looked up or upserted, by
+        # (application instance ID, user ID)
+        self._users: dict[tuple[int, str], User] = {}
 
     def upsert_user(self, lti_user: LTIUser) -> User:
         """Store a record of having seen a particular user."""
@@ -69,6 +95,7 @@ class UserService:
                 h_userid=lti_user.h_user.userid(self._h_authority),
             )
             self._db.add(user)
+        self._users[application_instance.id, lti_user.user_id] = user
 
         user.roles = lti_user.roles
         user.display_name = lti_user.display_name
@@ -90,44 +117,13 @@ class UserService:
         """Upsert LMSUser based on a User object."""
         self._db.flush()  # Make sure User has hit the DB on the current transaction
 
-        # API ID, only Canvas for now
-        lms_api_user_id = lti_params.get("custom_canvas_user_id")
         lms_user = bulk_upsert(
             self._db,
             LMSUser,
-            [
-                {
-                    "tool_consumer_instance_guid": user.application_instance.tool_consumer_instance_guid,
-                    "lti_user_id": user.user_id,
-                    "lti_v13_user_id": lti_params.v13.get("sub"),
-                    "h_userid": user.h_userid,
-                    "email": user.email,
-                    "display_name": user.display_name,
-                    "lms_api_user_id": lms_api_user_id,
-                    "given_name": lti_params.get("lis_person_name_given"),
-                    "middle_name": lti_params.get("middle_name"),
-                    "family_name": lti_params.get("lis_person_name_family"),
-                    "name": lti_params.get("lis_person_name_full"),
-                }
-            ],
+            [self.get_lms_user_values(user, lti_params)],
             index_elements=["h_userid"],
-            update_columns=[
-                "updated",
-                "display_name",
-                "given_name",
-                "middle_name",
-                "family_name",
-                "name",
-                "email",
-                (
-                    "lti_v13_user_id",
-                    func.coalesce(
-                        text('"excluded"."lti_v13_user_id"'),
-                        text('"lms_user"."lti_v13_user_id"'),
-                    ),
-                ),
-                "lms_api_user_id",
-            ],
+            update_columns=LMS_USER_UPDATE_COLUMNS,
+            skip_unchanged=True,
         ).one()
         bulk_upsert(
             self._db,
@@ -140,10 +136,28 @@ class UserService:
             ],
             index_elements=["application_instance_id", "lms_user_id"],
             update_columns=["updated"],
+            touch_after=self._touch_throttle.touch_after,
         )
         return lms_user
 
-    @lru_cache(maxsize=128)  # noqa: B019
+    @staticmethod
+    def get_lms_user_values(user: User, lti_params: LTIParams) -> dict:
+        """Get the column values of the `LMSUser` of `user` for a launch."""
+        return {
+            "tool_consumer_instance_guid": user.application_instance.tool_consumer_instance_guid,
+            "lti_user_id": user.user_id,
+            "lti_v13_user_id": lti_params.v13.get("sub"),
+            "h_userid": user.h_userid,
+            "email": user.email,
+            "display_name": user.display_name,
+            # API ID, only Canvas for now
+            "lms_api_user_id": lti_params.get("custom_canvas_user_id"),
+            "given_name": lti_params.get("lis_person_name_given"),
+            "middle_name": lti_params.get("middle_name"),
+            "family_name": lti_params.get("lis_person_name_family"),
+            "name": lti_params.get("lis_person_name_full"),
+        }
+
     def get(self, application_instance, user_id: str) -> User:
         """
         Get a User that belongs to `application_instance` with the given id.
@@ -153,6 +167,11 @@ class UserService:
         :raises UserNotFound: if the User is not present in the DB
         """
 
+        key = (application_instance.id, user_id)
+        if key in self._users:
+            # Most launches get the user they've just upserted
+            return self._users[key]
+
         try:
             existing_user = self._db.execute(
                 self._user_search_query(
@@ -163,6 +182,7 @@ class UserService:
         except NoResultFound as err:
             raise UserNotFound from err
 
+        self._users[key] = existing_user
         return existing_user
 
     def _user_search_query(self, application_instance_id, user_id) -> Select:
@@ -1,10 +1,11 @@
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import select, update
+from sqlalchemy import select, tuple_, update
 
+from lms.db import create_monthly_partition, drop_monthly_partition, monthly_partitions
 from lms.events.event import BaseEvent
-from lms.models import Event, EventData
+from lms.models import Event, EventData, EventUser
 from lms.tasks.celery import app
 
 LOG = logging.getLogger(__name__)
@@ -13,6 +14,9 @@ LOG = logging.getLogger(__name__)
 PURGE_LAUNCH_DATA_BATCH_SIZE = 1000
 "How many rows to remove per call to purge_launch_data"
 
+EVENT_TABLES = [Event.__table__, EventUser.__table__, EventData.__table__]
+"""The partitioned event tables, referenced tables first."""
+
 
 @app.task
 def insert_event(event: dict) -> None:
@@ -25,26 +29,83 @@ def insert_event(event: dict) -> None:
             )
 
 
+@app.task
+def insert_events(events: list[dict]) -> None:
+    """Insert a batch of events queued by `EventBuffer` in one transaction."""
+    with app.request_context() as request:  # noqa: SIM117
+        with request.tm:
+            from lms.services.event import EventService  # noqa: PLC0415
+
+            request.find_service(EventService).insert_events(
+                [BaseEvent(request=request, **event) for event in events]
+            )
+
+
 @app.task
 def purge_launch_data(*, max_age_days=30) -> None:
     with app.request_context() as request:  # noqa: SIM117
         with request.tm:
-            events_with_old_lti_params = (
-                select(Event.id)
-                .join(EventData)
+            now = datetime.now(UTC)
+            # EventData has a copy of the event's timestamp so this only needs
+            # to look at its partitions for this window.
+            old_lti_params = (
+                select(EventData.event_id, EventData.event_timestamp)
                 .where(
                     # Find data that's is at least max_age_days old
-                    Event.timestamp <= datetime.now(UTC) - timedelta(days=max_age_days),
+                    EventData.event_timestamp <= now - timedelta(days=max_age_days),
                     # Limit the search for only twice as old as we'd expect, limiting the data set significally
-                    Event.timestamp
-                    >= datetime.now(UTC) - timedelta(days=max_age_days * 2),
+                    EventData.event_timestamp >= now - timedelta(days=max_age_days * 2),
                     EventData.data["lti_params"].is_not(None),
                 )
                 .limit(PURGE_LAUNCH_DATA_BATCH_SIZE)
             )
             results = request.db.execute(
                 update(EventData)
-                .where(EventData.event_id.in_(events_with_old_lti_params))
+                .where(
+                    tuple_(EventData.event_id, EventData.event_timestamp).in_(
+                        old_lti_params
+                    )
+                )
                 .values(data=EventData.data - "lti_params")
             )
             LOG.info("Removed lti_params from events for %d rows", results.rowcount)
+
+
+@app.task
+def maintain_event_partitions(
+    *, future_months: int = 3, retention_months: int | None = None
+) -> None:
+    """
+    Create and drop the monthly partitions of the event tables.
+
+    :param future_months: How many months ahead of the current one to create
+        partitions for. Run this at least once a month so events never end up
+        in the default partitions.
+    :param retention_months: How many months, besides the current one, of
+        events to keep. Older partitions are dropped. Keep them all if `None`.
+    """
+    this_month = datetime.now(UTC).date().replace(day=1)
+
+    with app.request_context() as request:  # noqa: SIM117
+        with request.tm:
+            for table in EVENT_TABLES:
+                for offset in range(future_months + 1):
+                    create_monthly_partition(
+                        request.db, table, _add_months(this_month, offset)
+                    )
+
+            if retention_months is None:
+                return
+
+            oldest_month = _add_months(this_month, -retention_months)
+            # Referencing tables first, see drop_monthly_partition
+            for table in reversed(EVENT_TABLES):
+                for month in monthly_partitions(request.db, table):
+                    if month < oldest_month:
+                        LOG.info("Dropping the %s partition of %s", month, table.name)
+                        drop_monthly_partition(request.db, table, month)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
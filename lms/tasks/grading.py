@@ -1,7 +1,8 @@
 import logging
 from datetime import UTC
 
-from sqlalchemy import exists, select
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import selectinload
 
 from lms.models import GradingSync, GradingSyncGrade
 from lms.services.lti_grading.factory import service_factory
@@ -9,6 +10,9 @@ from lms.tasks.celery import app
 
 LOG = logging.getLogger(__name__)
 
+SYNC_GRADES_BATCH_MAX_RETRIES = 2
+"""How many times to retry the grades of a batch that failed to sync."""
+
 
 @app.task()
 def sync_grades():
@@ -24,19 +28,96 @@ def sync_grades():
             )
 
             for sync in scheduled_syncs:
-                for grade in sync.grades:
-                    sync_grade.delay(grading_sync_grade_id=grade.id)
+                sync_grades_batch.delay(grading_sync_id=sync.id)
 
                 sync.status = "in_progress"
 
 
+@app.task()
+def sync_grades_batch(*, grading_sync_id: int, retries: int = 0):
+    """
+    Send all pending grades of a GradingSync to the LMS.
+
+    Grades are sent concurrently by the grading service, results are saved
+    with a single UPDATE and the sync is completed at the end of the batch.
+
+    Grades that fail are retried (with a backoff) by re-scheduling this task,
+    which only picks grades that are still pending.
+    """
+    with app.request_context() as request:  # noqa: SIM117
+        with request.tm:
+            grading_sync = request.db.get(GradingSync, grading_sync_id)
+            assignment = grading_sync.assignment
+            application_instance = assignment.course.application_instance
+            grading_service = service_factory(None, request, application_instance)
+
+            pending_grades = request.db.scalars(
+                select(GradingSyncGrade)
+                .where(
+                    GradingSyncGrade.grading_sync_id == grading_sync_id,
+                    GradingSyncGrade.success.is_(None),
+                )
+                # Load the users now, the grading service might use them
+                # from other threads.
+                .options(selectinload(GradingSyncGrade.lms_user))
+                .order_by(GradingSyncGrade.id)
+            ).all()
+
+            if assignment.lis_outcome_service_url:
+                errors = grading_service.sync_grades(
+                    application_instance,
+                    assignment,
+                    # DB dates are not TZ aware but are always in UTC
+                    # Make them TZ aware so the LTI API calls have an explicit timezone
+                    grading_sync.created.replace(tzinfo=UTC).isoformat(),
+                    [(grade.lms_user, grade.grade) for grade in pending_grades],
+                )
+            else:
+                errors = [ValueError("Assignment without grading URL")] * len(
+                    pending_grades
+                )
+
+            is_last_retry = retries >= SYNC_GRADES_BATCH_MAX_RETRIES
+            results = []
+            for grade, error in zip(pending_grades, errors, strict=True):
+                if not error:
+                    results.append({"id": grade.id, "success": True})
+                elif is_last_retry:
+                    LOG.error("Syncing grade back to LMS failed: %r", error)
+                    results.append(
+                        {
+                            "id": grade.id,
+                            "success": False,
+                            "error_details": {"exception": str(error)},
+                        }
+                    )
+
+            if results:
+                request.db.execute(update(GradingSyncGrade), results)
+
+            if any(errors) and not is_last_retry:
+                sync_grades_batch.apply_async(
+                    (),
+                    {"grading_sync_id": grading_sync_id, "retries": retries + 1},
+                    countdown=10 * 2**retries,
+                )
+                return
+
+            _complete_grading_sync(request.db, grading_sync)
+
+
 @app.task(
     max_retries=2,
     retry_backoff=10,
     autoretry_for=(Exception,),
 )
 def sync_grade(*, grading_sync_grade_id: int):
-    """Send one particular grade to the LMS."""
+    """
+    Send one particular grade to the LMS.
+
+    New syncs are sent with `sync_grades_batch`, this is kept to process
+    tasks queued before that.
+    """
     with app.request_context() as request:  # noqa: SIM117
         with request.tm:
             grading_sync_grade = request.db.get(GradingSyncGrade, grading_sync_grade_id)
@@ -79,30 +160,35 @@ def sync_grades_complete(*, grading_sync_id):
     """Summarize a GradingSync status based on the state of its children GradingSyncGrade."""
     with app.request_context() as request:  # noqa: SIM117
         with request.tm:
-            grading_sync = request.db.get(GradingSync, grading_sync_id)
+            _complete_grading_sync(
+                request.db, request.db.get(GradingSync, grading_sync_id)
+            )
+
 
-            result = request.db.execute(
-                select(
-                    # Are all GradingSyncGrade completed?
-                    ~exists(
-                        select(GradingSyncGrade).where(
-                            GradingSyncGrade.grading_sync_id == grading_sync_id,
-                            GradingSyncGrade.success.is_(None),
-                        )
-                    ).label("completed"),
-                    # Are all GradingSyncGrade scucesfully?
-                    exists(
-                        select(GradingSyncGrade).where(
-                            GradingSyncGrade.grading_sync_id == grading_sync_id,
-                            GradingSyncGrade.success.is_(False),
-                        )
-                    ).label("failed"),
+def _complete_grading_sync(db, grading_sync: GradingSync) -> None:
+    grading_sync_id = grading_sync.id
+    result = db.execute(
+        select(
+            # Are all GradingSyncGrade completed?
+            ~exists(
+                select(GradingSyncGrade).where(
+                    GradingSyncGrade.grading_sync_id == grading_sync_id,
+                    GradingSyncGrade.success.is_(None),
+                )
+            ).label("completed"),
+            # Are all GradingSyncGrade scucesfully?
+            exists(
+                select(GradingSyncGrade).where(
+                    GradingSyncGrade.grading_sync_id == grading_sync_id,
+                    GradingSyncGrade.success.is_(False),
                 )
-            ).one()
-            is_completed, is_failed = result.completed, result.failed
+            ).label("failed"),
+        )
+    ).one()
+    is_completed, is_failed = result.completed, result.failed
 
-            if is_completed:
-                grading_sync.status = "failed" if is_failed else "finished"
+    if is_completed:
+        grading_sync.status = "failed" if is_failed else "finished"
 
 
 def _schedule_sync_grades_complete(grading_sync_id: int, countdown: int):
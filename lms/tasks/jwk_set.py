@@ -0,0 +1,36 @@
+"""Celery tasks for keeping the LTI 1.3 platforms' key sets up to date."""
+
+import logging
+from datetime import timedelta
+
+from lms.services import ExternalRequestError, JWKSetService
+from lms.tasks.celery import app
+
+LOG = logging.getLogger(__name__)
+
+REFRESH_AHEAD = timedelta(minutes=15)
+"""Refresh key sets that expire within this time, before launches need them."""
+
+
+@app.task
+def refresh_jwk_sets():
+    """
+    Download the key sets of all LTI 1.3 registrations that are about to expire.
+
+    This is intended to be called periodically (based on h-periodic), more
+    often than `REFRESH_AHEAD`, so launches find the platforms' keys in the DB
+    instead of downloading them.
+    """
+    with app.request_context() as request:
+        jwk_set_service = request.find_service(JWKSetService)
+
+        with request.tm:
+            urls = jwk_set_service.get_stale_urls(within=REFRESH_AHEAD)
+
+        for url in urls:
+            # Store each key set as soon as it's downloaded
+            with request.tm:
+                try:
+                    jwk_set_service.refresh(url)
+                except ExternalRequestError:
+                    LOG.exception("Couldn't refresh the key set at %s", url)
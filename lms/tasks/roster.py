@@ -13,8 +13,8 @@ from lms.models import (
     LMSCourse,
     LMSSegment,
     LMSSegmentRoster,
-    TaskDone,
 )
+from lms.services.dedupe import DedupeService
 from lms.services.roster import RosterService
 from lms.tasks.celery import app
 
@@ -43,10 +43,8 @@ def schedule_fetching_course_rosters() -> None:
     now = datetime.now()  # noqa: DTZ005
 
     # Only fetch roster for courses for which we haven't schedule a fetch recently
-    no_recent_scheduled_roster_fetch_clause = ~exists(
-        select(TaskDone).where(
-            TaskDone.key == func.concat("roster::course::scheduled::", LMSCourse.id),
-        )
+    no_recent_scheduled_roster_fetch_clause = ~DedupeService.is_claimed_clause(
+        func.concat("roster::course::scheduled::", LMSCourse.id)
     )
 
     # Only fetch roster for courses that don't have recent roster information
@@ -83,17 +81,10 @@ def schedule_fetching_course_rosters() -> None:
                 # Schedule only a few rosters per call to this method
                 .limit(ROSTER_LIMIT)
             )
-            for lms_course_id in request.db.scalars(query).all():
+            for lms_course_id in _claim_roster_fetches(
+                request, "course", request.db.scalars(query).all()
+            ):
                 fetch_course_roster.delay(lms_course_id=lms_course_id)
-                # Record that the roster fetching has been scheduled
-                # We set the expiration date to ROSTER_REFRESH_WINDOW so we'll try again after that period
-                request.db.add(
-                    TaskDone(
-                        key=f"roster::course::scheduled::{lms_course_id}",
-                        data=None,
-                        expires_at=datetime.now() + ROSTER_REFRESH_WINDOW,  # noqa: DTZ005
-                    )
-                )
 
 
 @app.task()
@@ -110,11 +101,8 @@ def schedule_fetching_assignment_rosters() -> None:
         )
     )
 
-    no_recent_scheduled_roster_fetch_clause = ~exists(
-        select(TaskDone).where(
-            TaskDone.key
-            == func.concat("roster::assignment::scheduled::", Assignment.id),
-        )
+    no_recent_scheduled_roster_fetch_clause = ~DedupeService.is_claimed_clause(
+        func.concat("roster::assignment::scheduled::", Assignment.id)
     )
 
     # Only fetch rosters for assignments that have been recently launched
@@ -148,17 +136,10 @@ def schedule_fetching_assignment_rosters() -> None:
                 # Schedule only a few roster per call to this method
                 .limit(ROSTER_LIMIT)
             )
-            for assignment_id in request.db.scalars(query).all():
+            for assignment_id in _claim_roster_fetches(
+                request, "assignment", request.db.scalars(query).all()
+            ):
                 fetch_assignment_roster.delay(assignment_id=assignment_id)
-                # Record that the roster fetching has been scheduled
-                # We set the expiration date to ROSTER_REFRESH_WINDOW so we'll try again after that period
-                request.db.add(
-                    TaskDone(
-                        key=f"roster::assignment::scheduled::{assignment_id}",
-                        data=None,
-                        expires_at=datetime.now() + ROSTER_REFRESH_WINDOW,  # noqa: DTZ005
-                    )
-                )
 
 
 @app.task()
@@ -169,10 +150,8 @@ def schedule_fetching_segment_rosters() -> None:
     now = datetime.now()  # noqa: DTZ005
 
     # Only fetch roster for segments for which we haven't schedule a fetch recently
-    no_recent_scheduled_roster_fetch_clause = ~exists(
-        select(TaskDone).where(
-            TaskDone.key == func.concat("roster::segment::scheduled::", LMSSegment.id),
-        )
+    no_recent_scheduled_roster_fetch_clause = ~DedupeService.is_claimed_clause(
+        func.concat("roster::segment::scheduled::", LMSSegment.id)
     )
 
     # Only fetch roster for segments that don't have recent roster information
@@ -212,17 +191,24 @@ def schedule_fetching_segment_rosters() -> None:
                 # Schedule only a few rosters per call to this method
                 .limit(ROSTER_LIMIT)
             )
-            for lms_segment_id in request.db.scalars(query).all():
+            for lms_segment_id in _claim_roster_fetches(
+                request, "segment", request.db.scalars(query).all()
+            ):
                 fetch_segment_roster.delay(lms_segment_id=lms_segment_id)
-                # Record that the roster fetching has been scheduled
-                # We set the expiration date to ROSTER_REFRESH_WINDOW so we'll try again after that period
-                request.db.add(
-                    TaskDone(
-                        key=f"roster::segment::scheduled::{lms_segment_id}",
-                        data=None,
-                        expires_at=datetime.now() + ROSTER_REFRESH_WINDOW,  # noqa: DTZ005
-                    )
-                )
+
+
+def _claim_roster_fetches(request, kind: str, ids: list[int]) -> list[int]:
+    """
+    Record that fetching the rosters of `ids` has been scheduled.
+
+    Claims expire after ROSTER_REFRESH_WINDOW so we'll try again after that
+    period. Returns the IDs that weren't already claimed, e.g. by a concurrent
+    run of the scheduler.
+    """
+    claimed = request.find_service(DedupeService).claim_many(
+        [f"roster::{kind}::scheduled::{id_}" for id_ in ids], ttl=ROSTER_REFRESH_WINDOW
+    )
+    return [id_ for id_ in ids if f"roster::{kind}::scheduled::{id_}" in claimed]
 
 
 @app.task(
@@ -1,24 +1,27 @@
 """Celery tasks for maintaining the task_done database table."""
 
-from datetime import datetime
-
-from sqlalchemy import delete
-
-from lms.models import TaskDone
+from lms.services.dedupe import DedupeService
 from lms.tasks.celery import app
 
+DELETE_BATCH_SIZE = 1000
+"""How many expired rows to delete per transaction."""
+
 
 @app.task
 def delete_expired_rows():
     """
     Delete any expired rows from the task_done table.
 
-    This is just so that the table doesn't grow forever.
+    This is just so that the table doesn't grow forever. Rows are deleted in
+    small batches, each in its own transaction, to avoid holding locks on a
+    large number of rows at once.
 
     This is intended to be called periodically.
     """
-    with app.request_context() as request:  # noqa: SIM117
-        with request.tm:
-            request.db.execute(
-                delete(TaskDone).where(TaskDone.expires_at < datetime.utcnow())  # noqa: DTZ003
-            )
+    with app.request_context() as request:
+        dedupe_service = request.find_service(DedupeService)
+
+        deleted = DELETE_BATCH_SIZE
+        while deleted == DELETE_BATCH_SIZE:
+            with request.tm:
+                deleted = dedupe_service.delete_expired(limit=DELETE_BATCH_SIZE)
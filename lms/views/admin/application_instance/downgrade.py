@@ -25,6 +25,7 @@ class DowngradeApplicationInstanceView(BaseApplicationInstanceView):
         else:
             ai.lti_registration_id = None
             ai.deployment_id = None
+            self.application_instance_service.invalidate_cache(ai)
 
             self.request.session.flash("Downgraded LTI 1.1 successful", "messages")
 
@@ -22,6 +22,7 @@ class MoveOrgApplicationInstanceView(BaseApplicationInstanceView):
                     "org_public_id", ""
                 ).strip(),
             )
+            self.application_instance_service.invalidate_cache(ai)
             self.request.session.flash(
                 f"Updated application instance {ai.id}", "messages"
             )
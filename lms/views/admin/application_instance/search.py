@@ -44,7 +44,7 @@ class SearchApplicationInstanceViews(BaseApplicationInstanceView):
     def search_start(self):
         return {"settings": SETTINGS_BY_FIELD}
 
-    @view_config(request_method="POST", require_csrf=True)
+    @view_config(request_method="POST", require_csrf=True, replica_safe=True)
     def search_callback(self):
         if flash_validation(self.request, SearchApplicationInstanceSchema):
             return {"settings": SETTINGS_BY_FIELD}
@@ -52,6 +52,7 @@ class UpdateApplicationInstanceView(BaseApplicationInstanceView):
         notes = self.request.params.get("hypothesis.notes")
         notes = notes.strip() if notes else None
         ai.settings.set("hypothesis", "notes", notes)
+        self.application_instance_service.invalidate_cache(ai)
 
         self.request.session.flash(f"Updated application instance {ai.id}", "messages")
         return self._redirect("admin.instance", id_=ai.id)
@@ -94,6 +95,7 @@ class UpdateApplicationInstanceView(BaseApplicationInstanceView):
                 assert field.format is SettingFormat.STRING  # noqa: S101
                 ai.settings.set(field.group, field.key, value)
 
+        self.application_instance_service.invalidate_cache(ai)
         self.request.session.flash(
             f"Updated application instance settings for {ai.id}", "messages"
         )
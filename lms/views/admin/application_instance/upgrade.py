@@ -94,4 +94,5 @@ class UpgradeApplicationInstanceViews(BaseApplicationInstanceView):
 
             return self._redirect("admin.instance.upgrade", _query=self.request.params)
 
+        self.application_instance_service.invalidate_cache(application_instance)
         return self._redirect("admin.instance", id_=application_instance.id)
@@ -94,6 +94,7 @@ class AdminCourseViews:
         request_method="POST",
         renderer="lms:templates/admin/course/search.html.jinja2",
         permission=Permissions.STAFF,
+        replica_safe=True,
     )
     def search(self):
         if flash_validation(self.request, SearchCourseSchema):
@@ -162,6 +162,7 @@ class AdminLTIRegistrationViews:
         request_method="POST",
         require_csrf=True,
         renderer="lms:templates/admin/registrations.html.jinja2",
+        replica_safe=True,
     )
     def search(self):
         if flash_validation(self.request, SearchLTIRegistrationSchema):
@@ -200,6 +201,7 @@ class AdminLTIRegistrationViews:
         lti_registration.auth_login_url = params["auth_login_url"].strip()
         lti_registration.key_set_url = params["key_set_url"].strip()
         lti_registration.token_url = params["token_url"].strip()
+        self.lti_registration_service.invalidate_cache(lti_registration)
 
         self.request.session.flash("Updated registration", "messages")
         return {"registration": lti_registration}
@@ -178,6 +178,7 @@ class AdminOrganizationViews:
         request_method="POST",
         renderer="lms:templates/admin/organization/search.html.jinja2",
         permission=Permissions.STAFF,
+        replica_safe=True,
     )
     def search(self):
         if flash_validation(self.request, SearchOrganizationSchema):
@@ -13,6 +13,7 @@ from lms.js_config_types import (
 from lms.models import Assignment, Grouping
 from lms.security import Permissions
 from lms.services import UserService
+from lms.services.dashboard import LoadingProfile
 from lms.services.h_api import HAPI
 from lms.validation import PyramidRequestSchema
 from lms.views.dashboard.pagination import PaginationParametersMixin, get_page
@@ -59,6 +60,7 @@ class AssignmentViews:
     @view_config(
         route_name="api.dashboard.assignments",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=ListAssignmentsSchema,
@@ -96,12 +98,15 @@ class AssignmentViews:
     @view_config(
         route_name="api.dashboard.assignment",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
     )
     def assignment(self) -> APIAssignment:
         assignment = self.dashboard_service.get_request_assignment(
-            self.request, self.request.matchdict["assignment_id"]
+            self.request,
+            self.request.matchdict["assignment_id"],
+            profile=LoadingProfile.ASSIGNMENT_DETAILS,
         )
         api_assignment = APIAssignment(
             id=assignment.id,
@@ -127,6 +132,7 @@ class AssignmentViews:
     @view_config(
         route_name="api.dashboard.course.assignments.metrics",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=AssignmentsMetricsSchema,
@@ -140,7 +146,9 @@ class AssignmentViews:
         )
 
         course = self.dashboard_service.get_request_course(
-            self.request, self.request.matchdict["course_id"]
+            self.request,
+            self.request.matchdict["course_id"],
+            profile=LoadingProfile.COURSE_DETAILS,
         )
         _, course_students_query = self.dashboard_service.get_course_roster(
             course.lms_course, h_userids=filter_by_h_userids
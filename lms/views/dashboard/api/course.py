@@ -49,6 +49,7 @@ class CourseViews:
     @view_config(
         route_name="api.dashboard.courses",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=ListCoursesSchema,
@@ -81,6 +82,7 @@ class CourseViews:
     @view_config(
         route_name="api.dashboard.courses.metrics",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=CoursesMetricsSchema,
@@ -133,6 +135,7 @@ class CourseViews:
     @view_config(
         route_name="api.dashboard.course",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
     )
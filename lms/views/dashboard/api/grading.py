@@ -83,6 +83,7 @@ class DashboardGradingViews:
     @view_config(
         route_name="api.dashboard.assignments.grading.sync",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.GRADE_ASSIGNMENT,
     )
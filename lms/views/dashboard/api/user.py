@@ -1,6 +1,5 @@
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING
 
 from marshmallow import fields, validate
 from pyramid.view import view_config
@@ -18,15 +17,13 @@ from lms.models import Assignment, LMSUser, RoleScope, RoleType
 from lms.security import Permissions
 from lms.services import UserService
 from lms.services.auto_grading import AutoGradingService
+from lms.services.dashboard import DashboardService, LoadingProfile
 from lms.services.h_api import HAPI
 from lms.validation._base import PyramidRequestSchema
 from lms.views.dashboard.pagination import PaginationParametersMixin, get_page
 
 LOG = logging.getLogger(__name__)
 
-if TYPE_CHECKING:
-    from lms.services.dashboard import DashboardService
-
 
 class ListUsersSchema(PaginationParametersMixin):
     """Query parameters to fetch a list of users."""
@@ -86,6 +83,7 @@ class UserViews:
     @view_config(
         route_name="api.dashboard.students",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=ListUsersSchema,
@@ -114,6 +112,7 @@ class UserViews:
     @view_config(
         route_name="api.dashboard.students.metrics",
         request_method="GET",
+        replica_safe=True,
         renderer="json_iso_utc",
         permission=Permissions.DASHBOARD_VIEW,
         schema=UsersMetricsSchema,
@@ -252,7 +251,9 @@ class UserViews:
         if course_ids and len(course_ids) == 1 and not segment_authority_provided_ids:
             # Fetch the course to be sure the current user has access to it.
             course = self.dashboard_service.get_request_course(
-                self.request, course_id=course_ids[0]
+                self.request,
+                course_id=course_ids[0],
+                profile=LoadingProfile.COURSE_DETAILS,
             )
             return self.dashboard_service.get_course_roster(
                 lms_course=course.lms_course, h_userids=h_userids
@@ -20,7 +20,11 @@ from lms.events import LTIEvent
 from lms.models import Assignment, Grouping
 from lms.product.plugin.misc import MiscPlugin  # noqa: TC001
 from lms.security import Permissions
-from lms.services import LTIGradingService, UserService, VitalSourceService
+from lms.services import (
+    LaunchPersistenceService,
+    LTIGradingService,
+    VitalSourceService,
+)
 from lms.services.assignment import AssignmentService  # noqa: TC001
 from lms.services.lti_h import checkpoint_sync_data
 from lms.validation import BasicLTILaunchSchema, ConfigureAssignmentSchema
@@ -52,10 +56,8 @@ class BasicLaunchViews:
         self.request.find_service(name="application_instance").update_from_lti_params(
             self.request.lti_user.application_instance, self.request.lti_params
         )
-        # Keep a record of every LMS user in the DB
-        # While request.user gets updated on every request we only need/want to update LMSUser on launches
-        request.find_service(UserService).upsert_lms_user(
-            request.user, request.lti_params
+        self._launch_persistence_service: LaunchPersistenceService = (
+            request.find_service(LaunchPersistenceService)
         )
         self.course = self._record_course()
 
@@ -223,17 +225,14 @@ class BasicLaunchViews:
             checkpoint_data=checkpoint_data,
         )
 
-        # Store the relationship between the assignment and the user
-        self.assignment_service.upsert_assignment_membership(
+        # Store the relationship between the assignment, the user and the course
+        self._launch_persistence_service.record_assignment_launch(
+            user=self.request.user,
             lti_params=self.request.lti_params,
             assignment=assignment,
-            user=self.request.user,
+            groupings=[self.course],
             lti_roles=self.request.lti_user.lti_roles,
         )
-        # Store the relationship between the assignment and the course
-        self.assignment_service.upsert_assignment_groupings(
-            assignment, groupings=[self.course]
-        )
 
         if (
             self.request.product.use_toolbar_editing
@@ -346,12 +345,13 @@ class BasicLaunchViews:
         course = self._course_service.get_from_launch(
             self.request.product.family, self.request.lti_params
         )
-        self.request.find_service(name="grouping").upsert_grouping_memberships(
-            user=self.request.user, groups=[course]
-        )
-        self._course_service.upsert_lms_course_membership(
-            lms_course=course.lms_course,
-            lms_user=self.request.user.lms_user,
+        # Keep a record of every LMS user in the DB and of their courses.
+        # While request.user gets updated on every request we only need/want
+        # to update LMSUser on launches
+        self._launch_persistence_service.record_course_launch(
+            user=self.request.user,
+            lti_params=self.request.lti_params,
+            course=course,
             lti_roles=self.request.lti_user.lti_roles,
         )
         return course
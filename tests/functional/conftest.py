@@ -16,10 +16,14 @@ from webtest import TestApp
 
 from lms import db
 from lms.app import create_app
+from lms.services.jwk_set import JWK_SET_CACHE
+from lms.services.lti_role_service import LTI_ROLE_CACHE
+from lms.services.tenant_cache import TENANT_CACHE
 from tests import factories
 from tests.conftest import TEST_SETTINGS
 
 TEST_SETTINGS["database_url"] = os.environ["DATABASE_URL"]
+TEST_SETTINGS["db_query_profile_headers"] = True
 
 TEST_ENVIRONMENT = {
     key.upper(): value for key, value in TEST_SETTINGS.items() if isinstance(value, str)
@@ -48,6 +52,14 @@ def clean_database(db_engine):
         transaction.commit()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Forget the rows cached by the previous test, they've been deleted."""
+    TENANT_CACHE.clear()
+    JWK_SET_CACHE.clear()
+    LTI_ROLE_CACHE.clear()
+
+
 @pytest.fixture(scope="session")
 def monkeysession():
     # It's planned to include this on pytest directly
@@ -108,6 +120,20 @@ def do_deep_link_launch(app):
     return functools.partial(_lti_v11_launch, app, "/content_item_selection")
 
 
+@pytest.fixture
+def assert_query_budget():
+    """Assert a response's request made at most `max_queries` DB queries."""
+
+    def _assert_query_budget(response, max_queries):
+        queries = int(response.headers["X-DB-Query-Count"])
+
+        assert queries <= max_queries, (
+            f"{queries} DB queries, over the budget of {max_queries}"
+        )
+
+    return _assert_query_budget
+
+
 @pytest.fixture
 def get_client_config():
     def _get_client_config(response):
@@ -41,6 +41,27 @@ class TestBasicLTILaunch:
         assert js_config["mode"] == JSConfig.Mode.BASIC_LTI_LAUNCH
         assert urlencode({"url": assignment.document_url}) in js_config["viaUrl"]
 
+    @pytest.mark.usefixtures("assignment")
+    def test_db_configured_basic_lti_launch_query_budget(
+        self, lti_params, do_lti_launch, assert_query_budget
+    ):
+        response = do_lti_launch(post_params=lti_params, status=200)
+
+        assert_query_budget(response, 30)
+
+    @pytest.mark.usefixtures("assignment")
+    def test_db_configured_basic_lti_relaunch_query_budget(
+        self, lti_params, do_lti_launch, assert_query_budget
+    ):
+        # The first launch fills in the application instance's LMS details,
+        # which drops it from the cache until the next launch gets it again
+        for _ in range(2):
+            do_lti_launch(post_params=lti_params, status=200)
+
+        response = do_lti_launch(post_params=lti_params, status=200)
+
+        assert_query_budget(response, 19)
+
     def test_basic_lti_launch_canvas_deep_linking_url(
         self, do_lti_launch, url_launch_params, db_session, get_client_config
     ):
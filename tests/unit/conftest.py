@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from dataclasses import asdict
 from os import environ
 from unittest import mock
@@ -7,6 +8,7 @@ import pytest
 from pyramid import testing
 from pyramid.request import apply_request_extensions
 
+from lms.db import profile_queries, stop_profiling_queries
 from lms.models import ApplicationSettings, LTIParams
 from lms.models.lti_role import Role, RoleScope, RoleType
 from lms.product import Product
@@ -331,3 +333,28 @@ def oauth_token(lti_user, application_instance):
         user_id=lti_user.user_id,
         application_instance=application_instance,
     )
+
+
+@pytest.fixture
+def query_profile(db_session):
+    """
+    Profile the queries `db_session` sends in a `with` block.
+
+    The relationships of objects already in the session don't need queries,
+    expunge them first to count what loading them from scratch takes:
+
+        db_session.expunge_all()
+        with query_profile() as profile:
+            ...
+        assert profile.count == 2
+    """
+
+    @contextmanager
+    def _query_profile():
+        profile = profile_queries(db_session)
+        try:
+            yield profile
+        finally:
+            stop_profiling_queries(db_session)
+
+    return _query_profile
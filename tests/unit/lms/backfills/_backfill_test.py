@@ -0,0 +1,138 @@
+from unittest.mock import call, create_autospec
+
+import pytest
+from sqlalchemy import select, update
+
+from lms.backfills import Backfill, BackfillRunner
+from lms.db import Replica
+from lms.models import BackfillCheckpoint, TaskDone
+from tests import factories
+
+DONE = {"done": True}
+BEFORE = {"done": "before"}
+
+
+class MarkAsDone(Backfill):
+    @property
+    def key(self):
+        return TaskDone.id
+
+    def where(self):
+        return ~TaskDone.data.has_key("done")
+
+    def run_batch(self, db, keys):
+        db.execute(
+            update(TaskDone).where(TaskDone.id.in_(keys)).values(data={"done": True})
+        )
+
+
+class TestBackfill:
+    def test_name(self):
+        assert MarkAsDone().name == f"{__name__}.MarkAsDone"
+
+    def test_key(self):
+        with pytest.raises(NotImplementedError):
+            _ = Backfill().key
+
+    def test_where(self, db_session):
+        assert db_session.scalar(select(Backfill().where()))
+
+    def test_run_batch(self, db_session):
+        with pytest.raises(NotImplementedError):
+            Backfill().run_batch(db_session, [])
+
+
+class TestBackfillRunner:
+    def test_run(self, runner, task_dones, db_session, backfill):
+        checkpoint = runner.run(backfill)
+
+        assert self.data(db_session) == [DONE, DONE, BEFORE, DONE]
+        assert checkpoint.rows_done == 3
+        assert checkpoint.last_key == task_dones[3].id
+        assert checkpoint.finished_at
+
+    def test_run_with_max_batches(self, runner, task_dones, db_session, backfill):
+        checkpoint = runner.run(backfill, max_batches=1)
+
+        assert self.data(db_session) == [DONE, DONE, BEFORE, {}]
+        assert checkpoint.last_key == task_dones[1].id
+        assert not checkpoint.finished_at
+
+    @pytest.mark.usefixtures("task_dones")
+    def test_run_resumes(self, runner, db_session, backfill):
+        runner.run(backfill, max_batches=1)
+        # Rows before the checkpoint aren't looked at again
+        db_session.execute(update(TaskDone).values(data={}))
+
+        checkpoint = runner.run(backfill)
+
+        assert self.data(db_session) == [{}, {}, DONE, DONE]
+        assert checkpoint.rows_done == 4
+
+    @pytest.mark.usefixtures("task_dones")
+    def test_run_with_restart(self, runner, db_session, backfill):
+        runner.run(backfill)
+        db_session.execute(update(TaskDone).values(data={}))
+
+        checkpoint = runner.run(backfill, restart=True)
+
+        assert self.data(db_session) == [DONE] * 4
+        assert checkpoint.rows_done == 4
+
+    @pytest.mark.usefixtures("task_dones")
+    def test_run_rolls_back_failed_batches(self, runner, db_session, backfill):
+        runner.run(backfill, max_batches=1)
+        backfill.run_batch = create_autospec(backfill.run_batch, side_effect=ValueError)
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            runner.run(backfill)
+
+        checkpoint = db_session.get(BackfillCheckpoint, backfill.name)
+        assert checkpoint.rows_done == 2
+        assert not checkpoint.finished_at
+
+    @pytest.mark.usefixtures("task_dones")
+    def test_run_with_max_rows_per_second(self, db_session, backfill, sleep, monotonic):
+        monotonic.side_effect = [0, 0.5, 10, 10, 20, 20]
+        runner = BackfillRunner(db_session, batch_size=2, max_rows_per_second=1)
+
+        runner.run(backfill)
+
+        # 2 rows took 0.5s: wait the rest of the 2s, 1 row took no time at all
+        assert sleep.call_args_list == [call(1.5), call(1), call(0)]
+
+    @pytest.mark.usefixtures("task_dones")
+    def test_run_waits_for_the_replica(self, db_session, backfill, sleep):
+        replica = create_autospec(Replica, instance=True)
+        replica.is_available.side_effect = [False, True, True, True]
+        runner = BackfillRunner(db_session, batch_size=2, replica=replica)
+
+        runner.run(backfill)
+
+        sleep.assert_called_once_with(BackfillRunner.REPLICA_WAIT)
+
+    def data(self, db_session):
+        return db_session.scalars(select(TaskDone.data).order_by(TaskDone.id)).all()
+
+    @pytest.fixture
+    def task_dones(self, db_session):
+        task_dones = factories.TaskDone.create_batch(4, data={})
+        task_dones[2].data = BEFORE
+        db_session.flush()
+        return task_dones
+
+    @pytest.fixture
+    def backfill(self):
+        return MarkAsDone()
+
+    @pytest.fixture
+    def runner(self, db_session):
+        return BackfillRunner(db_session, batch_size=2)
+
+    @pytest.fixture
+    def sleep(self, patch):
+        return patch("lms.backfills._backfill.sleep")
+
+    @pytest.fixture
+    def monotonic(self, patch):
+        return patch("lms.backfills._backfill.monotonic")
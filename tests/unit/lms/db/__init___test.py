@@ -0,0 +1,29 @@
+import os
+
+from sqlalchemy import text
+
+from lms.db import Replica, includeme, pre_create
+
+
+def test_includeme_with_a_replica(pyramid_config):
+    pyramid_config.registry.settings.update(
+        {
+            "database_replica_url": os.environ["DATABASE_URL"],
+            "database_replica_max_lag": "5",
+        }
+    )
+
+    includeme(pyramid_config)
+
+    replica = pyramid_config.registry["sqlalchemy.replica"]
+    assert isinstance(replica, Replica)
+    assert replica.max_lag == 5
+
+
+def test_pre_create(db_engine):
+    pre_create(db_engine)
+
+    with db_engine.connect() as connection:
+        assert connection.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).scalar()
@@ -0,0 +1,114 @@
+import os
+
+import pytest
+from h_matchers import Any
+from sqlalchemy import text
+
+from lms.db._engine import TimedQueuePool, create_engine, engine_options
+
+
+class TestTimedQueuePool:
+    def test_connect_records_the_checkout_wait(self, record_custom_metric):
+        engine = create_engine(os.environ["DATABASE_URL"], poolclass=TimedQueuePool)
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+        record_custom_metric.assert_called_once_with(
+            "Custom/DB/PoolCheckoutWait", Any.instance_of(float)
+        )
+        engine.dispose()
+
+    @pytest.fixture
+    def record_custom_metric(self, patch):
+        return patch("lms.db._engine.record_custom_metric")
+
+
+class TestEngineOptions:
+    def test_defaults(self):
+        assert engine_options({}, "web") == {
+            "poolclass": TimedQueuePool,
+            "pool_pre_ping": False,
+            "connect_args": {"application_name": "lms-web"},
+        }
+
+    def test_it(self):
+        options = engine_options(
+            {
+                "db_pool_size": "5",
+                "db_max_overflow": "10",
+                "db_pool_pre_ping": "true",
+                "db_pool_recycle": "3600",
+                "db_statement_timeout": "30000",
+            },
+            "celery",
+        )
+
+        assert options == {
+            "poolclass": TimedQueuePool,
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            "connect_args": {
+                "application_name": "lms-celery",
+                "options": "-c statement_timeout=30000",
+            },
+        }
+
+    @pytest.mark.parametrize(
+        "value,process_type,expected",
+        [
+            ("celery=2 10", "celery", 2),
+            ("celery=2 10", "web", 10),
+            ("10\ncelery=2", "celery", 2),
+            ("celery=2", "celery", 2),
+            ("other=2 10", "celery", 10),
+        ],
+    )
+    def test_per_process_type_values(self, value, process_type, expected):
+        assert (
+            engine_options({"db_pool_size": value}, process_type)["pool_size"]
+            == expected
+        )
+
+    def test_per_process_type_values_without_default(self):
+        assert "pool_size" not in engine_options({"db_pool_size": "celery=2"}, "web")
+
+    def test_pgbouncer(self):
+        options = engine_options(
+            {"db_pgbouncer": "true", "db_statement_timeout": "30000"}, "web"
+        )
+
+        assert options["statement_timeout"] == 30000
+        assert options["connect_args"] == {"application_name": "lms-web"}
+
+
+class TestCreateEngine:
+    def test_it(self):
+        engine = create_engine(os.environ["DATABASE_URL"])
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SHOW statement_timeout")).scalar() == "0"
+
+        engine.dispose()
+
+    def test_it_sets_the_statement_timeout_for_each_transaction(self):
+        engine = create_engine(os.environ["DATABASE_URL"], statement_timeout=1234)
+
+        with engine.connect() as connection:
+            for _ in range(2):
+                with connection.begin():
+                    assert (
+                        connection.execute(text("SHOW statement_timeout")).scalar()
+                        == "1234ms"
+                    )
+
+        # The timeout doesn't outlive the transactions
+        connection = engine.raw_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW statement_timeout")
+            assert cursor.fetchone() == ("0",)
+        connection.close()
+
+        engine.dispose()
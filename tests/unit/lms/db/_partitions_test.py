@@ -0,0 +1,98 @@
+from datetime import date, datetime
+
+import pytest
+import sqlalchemy as sa
+
+from lms.db import (
+    create_monthly_partition,
+    drop_monthly_partition,
+    monthly_partitions,
+    partitioned_by_month,
+)
+
+
+def test_partitioned_by_month_creates_a_default_partition(db_session, table):
+    partitioned_by_month(table)
+
+    table.create(db_session.connection())
+
+    db_session.execute(table.insert().values(timestamp=datetime(2024, 1, 1)))  # noqa: DTZ001
+    assert (
+        db_session.execute(sa.text("SELECT count(*) FROM test_events_default")).scalar()
+        == 1
+    )
+
+
+@pytest.mark.usefixtures("partitioned_table")
+class TestMonthlyPartitions:
+    @pytest.mark.parametrize("month", [date(2024, 1, 1), date(2024, 12, 31)])
+    def test_create_monthly_partition(self, db_session, table, month):
+        assert create_monthly_partition(db_session, table, month)
+        assert not create_monthly_partition(db_session, table, month)
+
+        db_session.execute(table.insert().values(timestamp=month))
+        assert self.partition_rows(db_session, month) == 1
+        assert monthly_partitions(db_session, table) == [month.replace(day=1)]
+
+    @pytest.mark.parametrize(
+        "bounds,month,created",
+        [
+            # Like the partition of the rows from before partitioning
+            ("FROM (MINVALUE) TO ('2024-02-01')", date(2024, 1, 1), False),
+            ("FROM (MINVALUE) TO ('2024-02-01')", date(2024, 2, 1), True),
+            ("FROM ('2024-01-15') TO (MAXVALUE)", date(2024, 1, 1), False),
+            ("FROM ('2024-01-15') TO (MAXVALUE)", date(2023, 12, 1), True),
+        ],
+    )
+    def test_create_monthly_partition_skips_months_covered_by_other_partitions(
+        self, db_session, table, bounds, month, created
+    ):
+        db_session.execute(
+            sa.text(
+                f"CREATE TABLE test_events_other PARTITION OF test_events FOR VALUES {bounds}"
+            )
+        )
+
+        assert create_monthly_partition(db_session, table, month) == created
+
+        assert monthly_partitions(db_session, table) == ([month] if created else [])
+
+    def test_monthly_partitions(self, db_session, table):
+        for month in [date(2024, 3, 1), date(2023, 12, 1), date(2024, 1, 1)]:
+            create_monthly_partition(db_session, table, month)
+
+        assert monthly_partitions(db_session, table) == [
+            date(2023, 12, 1),
+            date(2024, 1, 1),
+            date(2024, 3, 1),
+        ]
+
+    def test_drop_monthly_partition(self, db_session, table):
+        for month in [date(2024, 1, 1), date(2024, 2, 1)]:
+            create_monthly_partition(db_session, table, month)
+
+        drop_monthly_partition(db_session, table, date(2024, 1, 1))
+
+        assert monthly_partitions(db_session, table) == [date(2024, 2, 1)]
+
+    def partition_rows(self, db_session, month):
+        return db_session.execute(
+            sa.text(
+                f"SELECT count(*) FROM test_events_y{month.year}m{month.month:02d}"  # noqa: S608
+            )
+        ).scalar()
+
+    @pytest.fixture
+    def partitioned_table(self, db_session, table):
+        table.create(db_session.connection())
+        return table
+
+
+@pytest.fixture
+def table():
+    return sa.Table(
+        "test_events",
+        sa.MetaData(),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
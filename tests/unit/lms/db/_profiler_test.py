@@ -0,0 +1,144 @@
+import logging
+
+import pytest
+from pyramid.response import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from lms.db._profiler import (
+    QueryProfile,
+    Statement,
+    add_query_profile_headers,
+    log_query_profile,
+    profile_queries,
+    stop_profiling_queries,
+)
+
+
+class TestQueryProfile:
+    def test_record(self):
+        profile = QueryProfile()
+
+        profile.record("SELECT 1", {"id": 1}, 0.5)
+        profile.record("SELECT 2", {"id": 1}, 0.25)
+
+        assert profile.count == 2
+        assert profile.duration == 0.75
+
+    def test_slowest(self):
+        profile = QueryProfile()
+
+        for duration in [3, 1, 6, 4, 2, 5]:
+            profile.record(f"SELECT {duration}", {}, duration)
+
+        assert [statement.sql for statement in profile.slowest] == [
+            "SELECT 6",
+            "SELECT 5",
+            "SELECT 4",
+            "SELECT 3",
+            "SELECT 2",
+        ]
+
+    def test_it_fingerprints_parameters(self):
+        profile = QueryProfile()
+
+        profile.record("SELECT", {"id": 1}, 1)
+        profile.record("SELECT", {"id": 1}, 2)
+        profile.record("SELECT", {"id": 2}, 3)
+
+        fingerprints = [s.parameters_fingerprint for s in profile.slowest]
+        assert fingerprints[1] == fingerprints[2]
+        assert fingerprints[0] != fingerprints[1]
+
+
+class TestProfileQueries:
+    def test_it(self, db_engine):
+        session = Session(bind=db_engine)
+
+        profile = profile_queries(session)
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+        session.close()
+
+        assert profile.count == 2
+        assert profile.duration > 0
+        assert {s.sql for s in profile.slowest} == {"SELECT 1", "SELECT 2"}
+
+    def test_it_stops_when_the_connection_is_returned_to_the_pool(self, db_engine):
+        session = Session(bind=db_engine)
+        profile = profile_queries(session)
+        session.execute(text("SELECT 1"))
+        session.close()
+
+        with Session(bind=db_engine) as other_session:
+            other_session.execute(text("SELECT 2"))
+
+        assert profile.count == 1
+
+    def test_it_profiles_sessions_already_in_a_transaction(self, db_engine):
+        with Session(bind=db_engine) as session:
+            session.execute(text("SELECT 1"))
+
+            profile = profile_queries(session)
+            session.execute(text("SELECT 2"))
+
+        assert [s.sql for s in profile.slowest] == ["SELECT 2"]
+
+    @pytest.mark.parametrize("in_transaction", [True, False])
+    def test_stop_profiling_queries(self, db_engine, in_transaction):
+        with Session(bind=db_engine) as session:
+            if in_transaction:
+                session.execute(text("SELECT 1"))
+            profile = profile_queries(session)
+
+            stop_profiling_queries(session)
+            session.execute(text("SELECT 2"))
+
+        assert not profile.count
+
+
+class TestLogQueryProfile:
+    def test_it(self, pyramid_request, profile, caplog):
+        caplog.set_level(logging.INFO)
+        profile.record("SELECT 1", {}, 0.002)
+
+        log_query_profile(pyramid_request)
+
+        assert caplog.messages == [
+            "GET /: 1 queries in 2.0ms. Slowest: 2.0ms [bf21a9e8] SELECT 1"
+        ]
+
+    def test_it_logs_statements_on_one_line(self, pyramid_request, profile, caplog):
+        caplog.set_level(logging.INFO)
+        profile.record("SELECT 1\nFROM  table", {}, 0.002)
+
+        log_query_profile(pyramid_request)
+
+        assert caplog.messages[0].endswith("SELECT 1 FROM table")
+
+    @pytest.mark.usefixtures("profile")
+    def test_it_doesnt_log_requests_without_queries(self, pyramid_request, caplog):
+        caplog.set_level(logging.INFO)
+
+        log_query_profile(pyramid_request)
+
+        assert not caplog.messages
+
+
+def test_add_query_profile_headers(pyramid_request, profile):
+    profile.record("SELECT 1", {}, 0.0025)
+    response = Response()
+
+    add_query_profile_headers(pyramid_request, response)
+
+    assert response.headers["X-DB-Query-Count"] == "1"
+    assert response.headers["X-DB-Query-Time"] == "2.5ms"
+
+
+def test_statement_ordering():
+    assert Statement(2, "B", "") > Statement(1, "A", "")
+
+
+@pytest.fixture
+def profile(pyramid_request):
+    return profile_queries(pyramid_request.db)
@@ -0,0 +1,168 @@
+import os
+from unittest.mock import create_autospec, sentinel
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from lms.db import create_engine
+from lms.db._replica import Replica, RoutingSession, replica_safe_view, use_replica
+from lms.models import Event, Organization
+
+
+class TestReplica:
+    def test_is_available(self, replica):
+        assert replica.is_available()
+
+    def test_is_available_when_lagging(self, replica, caplog):
+        replica.max_lag = -1
+
+        assert not replica.is_available()
+        assert "Replica lagging" in caplog.text
+
+    def test_is_available_when_the_check_fails(self):
+        replica = Replica(
+            create_engine("postgresql://postgres@localhost:1/missing"), max_lag=30
+        )
+
+        assert not replica.is_available()
+
+    def test_is_available_checks_periodically(self, replica, monotonic):
+        monotonic.return_value = 100
+        assert replica.is_available()
+        replica.max_lag = -1
+
+        monotonic.return_value = 100 + Replica.CHECK_INTERVAL - 1
+        assert replica.is_available()
+
+        monotonic.return_value = 100 + Replica.CHECK_INTERVAL
+        assert not replica.is_available()
+
+    @pytest.fixture
+    def replica(self):
+        engine = create_engine(os.environ["DATABASE_URL"])
+        yield Replica(engine, max_lag=30)
+        engine.dispose()
+
+    @pytest.fixture
+    def monotonic(self, patch):
+        return patch("lms.db._replica.monotonic")
+
+
+class TestRoutingSession:
+    def test_it_reads_from_the_replica(self, session, replica):
+        with use_replica(session):
+            assert session.get_bind(clause=select(Event)) == replica.engine
+
+    @pytest.mark.parametrize(
+        "clause", [insert(Event), text("SELECT 1"), None], ids=["insert", "text", None]
+    )
+    def test_it_writes_to_the_primary(self, session, clause):
+        with use_replica(session):
+            assert session.get_bind(clause=clause) == sentinel.primary
+
+    def test_it_reads_from_the_primary_outside_use_replica(self, session):
+        assert session.get_bind(clause=select(Event)) == sentinel.primary
+
+    def test_it_reads_from_the_primary_when_the_replica_is_lagging(
+        self, session, replica
+    ):
+        replica.is_available.return_value = False
+
+        with use_replica(session):
+            assert session.get_bind(clause=select(Event)) == sentinel.primary
+
+    def test_it_reads_from_the_primary_without_a_replica(self, session):
+        session.info["replica"] = None
+
+        with use_replica(session):
+            assert session.get_bind(clause=select(Event)) == sentinel.primary
+
+    def test_it_reads_from_the_primary_after_executing_writes(self, session):
+        session.get_bind(clause=insert(Event))
+
+        with use_replica(session):
+            assert session.get_bind(clause=select(Event)) == sentinel.primary
+
+    def test_it_reads_from_the_primary_with_pending_writes(self, session):
+        session.add(Organization())
+
+        with use_replica(session):
+            assert session.get_bind(clause=select(Event)) == sentinel.primary
+
+    def test_it_reads_from_the_primary_after_flushing_writes(self, db_engine, replica):
+        with db_engine.connect() as connection:
+            session = RoutingSession(bind=connection, info={"replica": replica})
+            session.add(Organization(public_id="PUBLIC_ID"))
+            session.flush()
+
+            with use_replica(session):
+                assert session.get_bind(clause=select(Event)) == connection
+
+                # Until the end of the transaction
+                session.rollback()
+                assert session.get_bind(clause=select(Event)) == replica.engine
+
+    @pytest.fixture
+    def replica(self):
+        replica = create_autospec(Replica, instance=True)
+        replica.engine = sentinel.replica
+        replica.is_available.return_value = True
+        return replica
+
+    @pytest.fixture
+    def session(self, replica, patch):
+        patch("lms.db._replica.Session.get_bind", return_value=sentinel.primary)
+        return RoutingSession(info={"replica": replica})
+
+
+def test_use_replica_restores_the_previous_value():
+    session = Session()
+
+    with use_replica(session):
+        with use_replica(session):
+            assert session.info["use_replica"]
+        assert session.info["use_replica"]
+
+    assert not session.info["use_replica"]
+
+
+class TestReplicaSafeView:
+    def test_it(self, pyramid_request, info):
+        info.options = {"replica_safe": True}
+
+        def view(_context, request):
+            return request.db.info["use_replica"]
+
+        assert replica_safe_view(view, info)(sentinel.context, pyramid_request)
+        assert not pyramid_request.db.info["use_replica"]
+
+    def test_it_gets_the_user_before_using_the_replica(self, pyramid_request, info):
+        info.options = {"replica_safe": True}
+        got_user_with_replica = []
+
+        class Request:
+            db = pyramid_request.db
+
+            @property
+            def user(self):
+                got_user_with_replica.append(self.db.info.get("use_replica"))
+
+        replica_safe_view(lambda _context, _request: None, info)(
+            sentinel.context, Request()
+        )
+
+        assert got_user_with_replica == [None]
+
+    @pytest.mark.parametrize("options", [{}, {"replica_safe": False}])
+    def test_it_does_nothing_if_the_view_isnt_replica_safe(self, info, options):
+        info.options = options
+
+        assert replica_safe_view(sentinel.view, info) == sentinel.view
+
+    @pytest.fixture
+    def info(self):
+        class Info:
+            options: dict
+
+        return Info()
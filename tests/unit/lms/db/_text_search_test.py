@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import literal, select
+
+from lms.db import escape_like, full_text_match, partial_match
+from lms.models import Organization
+from tests import factories
+
+
+class TestFullTextMatch:
+    @pytest.mark.parametrize(
+        "query,matches",
+        [("school", True), ("schools", True), ("university", False)],
+    )
+    def test_it(self, db_session, query, matches):
+        organization = factories.Organization(name="Springfield Schools")
+        db_session.flush()
+
+        result = db_session.scalars(
+            select(Organization).where(full_text_match(Organization.name, query))
+        ).all()
+
+        assert result == ([organization] if matches else [])
+
+    def test_it_with_a_text_column(self, db_session):
+        assert db_session.scalar(
+            select(full_text_match(literal("Springfield Schools"), "school"))
+        )
+
+
+@pytest.mark.parametrize(
+    "value,query,matches",
+    [
+        ("Biology 101", "LOGY 1", True),
+        ("Biology 101", "Chemistry", False),
+        ("100% Biology", "100%", True),
+        ("1000 Biology", "100%", False),
+        ("a_b", "a_b", True),
+        ("axb", "a_b", False),
+    ],
+)
+def test_partial_match(db_session, value, query, matches):
+    assert db_session.scalar(select(partial_match(literal(value), query))) == matches
+
+
+def test_escape_like():
+    assert escape_like("\\a%b_c") == "\\\\a\\%b\\_c"
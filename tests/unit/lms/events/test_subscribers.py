@@ -1,12 +1,58 @@
 from unittest.mock import sentinel
 
-from lms.events.event import BaseEvent
+import pytest
+import transaction
+
+from lms.events.event import BaseEvent, LTIEvent
 from lms.events.subscribers import handle_event
 
 
-def test_handle_event(event_service, pyramid_request):
+@pytest.mark.parametrize("buffer_enabled", [True, False])
+def test_handle_event(event_service, pyramid_request, EVENT_BUFFER, buffer_enabled):
+    EVENT_BUFFER.enabled = buffer_enabled
     event = BaseEvent(request=pyramid_request, type=sentinel.type)
 
     handle_event(event)
 
     event_service.insert_event.assert_called_once_with(event)
+
+
+def test_handle_event_with_an_lti_event(event_service, pyramid_request, EVENT_BUFFER):
+    EVENT_BUFFER.enabled = False
+    event = LTIEvent(request=pyramid_request, type=sentinel.type)
+
+    handle_event(event)
+
+    event_service.insert_event.assert_called_once_with(event)
+
+
+@pytest.mark.parametrize("committed", [True, False])
+def test_handle_event_buffers_lti_events_after_commit(
+    event_service, pyramid_request, EVENT_BUFFER, transaction_manager, committed
+):
+    EVENT_BUFFER.enabled = True
+    event = LTIEvent(request=pyramid_request, type=sentinel.type, user_id=1)
+
+    handle_event(event)
+
+    event_service.insert_event.assert_not_called()
+    EVENT_BUFFER.add.assert_not_called()
+    hook, args, _ = next(iter(transaction_manager.get().getAfterCommitHooks()))
+    hook(committed, *args)
+    if committed:
+        EVENT_BUFFER.add.assert_called_once_with(event.serialize())
+    else:
+        EVENT_BUFFER.add.assert_not_called()
+
+
+@pytest.fixture
+def transaction_manager(pyramid_request):
+    pyramid_request.tm = transaction.TransactionManager(explicit=True)
+    pyramid_request.tm.begin()
+    yield pyramid_request.tm
+    pyramid_request.tm.abort()
+
+
+@pytest.fixture
+def EVENT_BUFFER(patch):
+    return patch("lms.events.subscribers.EVENT_BUFFER")
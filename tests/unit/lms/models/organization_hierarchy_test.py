@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import select
+
+from lms.models import OrganizationHierarchy
+from tests import factories
+
+
+class TestOrganizationHierarchy:
+    def test_it_is_filled_on_insert(self, hierarchy, closure):
+        root, child, grandchild, sibling = hierarchy
+
+        assert closure() == {
+            (root.id, root.id, 0),
+            (root.id, child.id, 1),
+            (root.id, grandchild.id, 2),
+            (root.id, sibling.id, 1),
+            (child.id, child.id, 0),
+            (child.id, grandchild.id, 1),
+            (grandchild.id, grandchild.id, 0),
+            (sibling.id, sibling.id, 0),
+        }
+
+    def test_moving_an_organization_moves_its_descendants(
+        self, hierarchy, closure, db_session
+    ):
+        root, child, grandchild, sibling = hierarchy
+
+        child.parent = sibling
+        db_session.flush()
+
+        assert closure() == {
+            (root.id, root.id, 0),
+            (root.id, sibling.id, 1),
+            (root.id, child.id, 2),
+            (root.id, grandchild.id, 3),
+            (sibling.id, sibling.id, 0),
+            (sibling.id, child.id, 1),
+            (sibling.id, grandchild.id, 2),
+            (child.id, child.id, 0),
+            (child.id, grandchild.id, 1),
+            (grandchild.id, grandchild.id, 0),
+        }
+
+    def test_removing_the_parent(self, hierarchy, closure, db_session):
+        root, child, grandchild, sibling = hierarchy
+
+        child.parent = None
+        db_session.flush()
+
+        assert closure() == {
+            (root.id, root.id, 0),
+            (root.id, sibling.id, 1),
+            (child.id, child.id, 0),
+            (child.id, grandchild.id, 1),
+            (grandchild.id, grandchild.id, 0),
+            (sibling.id, sibling.id, 0),
+        }
+
+    def test_other_updates_dont_change_it(self, hierarchy, closure, db_session):
+        before = closure()
+
+        hierarchy[1].name = "NEW NAME"
+        db_session.flush()
+
+        assert closure() == before
+
+    @pytest.fixture
+    def hierarchy(self, db_session):
+        root = factories.Organization()
+        child = factories.Organization(parent=root)
+        grandchild = factories.Organization(parent=child)
+        sibling = factories.Organization(parent=root)
+        db_session.flush()
+
+        return root, child, grandchild, sibling
+
+    @pytest.fixture
+    def closure(self, db_session, hierarchy):
+        def closure():
+            return set(
+                db_session.execute(
+                    select(
+                        OrganizationHierarchy.ancestor_id,
+                        OrganizationHierarchy.descendant_id,
+                        OrganizationHierarchy.depth,
+                    ).where(
+                        OrganizationHierarchy.descendant_id.in_(
+                            [org.id for org in hierarchy]
+                        )
+                    )
+                ).all()
+            )
+
+        return closure
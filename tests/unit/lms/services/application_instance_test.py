@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from operator import attrgetter
 from unittest import mock
 
 import pytest
@@ -14,6 +15,8 @@ from lms.services.application_instance import (
     ProvisioningDisabled,
     factory,
 )
+from lms.services.tenant_cache import TenantCache
+from lms.services.touch import TouchThrottle
 from lms.validation import ValidationError
 from tests import factories
 
@@ -99,6 +102,54 @@ class TestApplicationInstanceService:
         with pytest.raises(ApplicationInstanceNotFound):
             service.get_by_deployment_id(issuer, client_id, deployment_id)
 
+    @pytest.mark.parametrize(
+        "method,args",
+        (
+            ("get_by_id", ["id"]),
+            ("get_by_consumer_key", ["consumer_key"]),
+            (
+                "get_by_deployment_id",
+                [
+                    "lti_registration.issuer",
+                    "lti_registration.client_id",
+                    "deployment_id",
+                ],
+            ),
+        ),
+    )
+    def test_lookups_are_cached(
+        self,
+        service,
+        lti_v13_application_instance,
+        db_session,
+        query_profile,
+        method,
+        args,
+    ):
+        args = [attrgetter(arg)(lti_v13_application_instance) for arg in args]
+        id_ = lti_v13_application_instance.id
+        getattr(service, method)(*args)
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            assert getattr(service, method)(*args).id == id_
+
+        assert not profile.count
+
+    def test_invalidate_cache(
+        self, service, application_instance, db_session, query_profile
+    ):
+        id_ = application_instance.id
+        service.get_by_id(id_)
+
+        service.invalidate_cache(application_instance)
+        db_session.commit()
+
+        db_session.expunge_all()
+        with query_profile() as profile:
+            service.get_by_id(id_)
+        assert profile.count == 1
+
     def test_update_application_instance(
         self, service, application_instance, aes_service, organization_service
     ):
@@ -230,6 +281,7 @@ class TestApplicationInstanceService:
             ("marcos@one.example.com", ["marcos"]),
             ("other.example.com", ["sean"]),
             ("one.example.com", ["marcos", "ian"]),
+            ("marcos_one.example.com", []),
         ),
     )
     def test_search_by_email(self, service, query, expected_names):
@@ -314,6 +366,62 @@ class TestApplicationInstanceService:
         assert application_instance == Any.object.with_attrs(lms_data)
         assert application_instance.last_launched == datetime(year=2022, month=4, day=4)  # noqa: DTZ001
 
+    @freeze_time("2022-04-04 12:00")
+    @pytest.mark.parametrize(
+        "last_launched,expected",
+        (
+            # Launched recently, not worth writing again
+            (datetime(2022, 4, 4, 11, 30), datetime(2022, 4, 4, 11, 30)),  # noqa: DTZ001
+            (datetime(2022, 4, 3), datetime(2022, 4, 4, 12)),  # noqa: DTZ001
+        ),
+    )
+    def test_update_from_lti_params_throttles_last_launched(
+        self, service, application_instance, last_launched, expected
+    ):
+        application_instance.last_launched = last_launched
+
+        service.update_from_lti_params(
+            application_instance,
+            LTIParams(
+                {
+                    "tool_consumer_instance_guid": application_instance.tool_consumer_instance_guid
+                }
+            ),
+        )
+
+        assert application_instance.last_launched == expected
+
+    @freeze_time("2022-04-04 12:00")
+    @pytest.mark.parametrize(
+        "last_launched,invalidated",
+        (
+            (datetime(2022, 4, 4, 11, 30), False),  # noqa: DTZ001
+            (datetime(2022, 4, 3), True),  # noqa: DTZ001
+        ),
+    )
+    def test_update_from_lti_params_invalidates_the_cache_after_changes(
+        self, service, application_instance, db_session, last_launched, invalidated
+    ):
+        application_instance.last_launched = last_launched
+        db_session.flush()
+        id_ = application_instance.id
+        service.get_by_id(id_)
+
+        service.update_from_lti_params(
+            application_instance,
+            LTIParams(
+                {
+                    "tool_consumer_instance_guid": application_instance.tool_consumer_instance_guid
+                }
+            ),
+        )
+        db_session.commit()
+
+        db_session.expunge_all()
+        assert service.get_by_id(id_).last_launched == (
+            datetime(2022, 4, 4, 12) if invalidated else last_launched  # noqa: DTZ001
+        )
+
     def test_update_from_lti_params_no_guid_doesnt_change_values(
         self, service, organization_service, application_instance
     ):
@@ -365,6 +473,8 @@ class TestApplicationInstanceService:
             db=db_session,
             aes_service=aes_service,
             organization_service=organization_service,
+            cache=TenantCache(),
+            touch_throttle=TouchThrottle(interval=3600),
         )
 
     @pytest.fixture
@@ -3,13 +3,12 @@ from unittest.mock import patch, sentinel
 
 import pytest
 from h_matchers import Any
-from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 from lms.models import (
+    Assignment,
     AssignmentGrouping,
-    AssignmentMembership,
     AutoGradingConfig,
-    LMSUserAssignmentMembership,
     RoleScope,
     RoleType,
 )
@@ -504,83 +503,6 @@ class TestAssignmentService:
         assert assignment.copied_from == original_assignment
         assert assignment.document_url == sentinel.document_url
 
-    @pytest.mark.parametrize("with_lti11_grading_id", [True, False])
-    def test_upsert_assignment_membership(
-        self, svc, assignment, pyramid_request, db_session, with_lti11_grading_id
-    ):
-        lms_user = factories.LMSUser()
-        user = factories.User(lms_user=lms_user)
-        lti_roles = factories.LTIRole.create_batch(3)
-        # One existing row
-        factories.AssignmentMembership.create(
-            assignment=assignment, user=user, lti_role=lti_roles[0]
-        )
-        if with_lti11_grading_id:
-            pyramid_request.lti_params["lis_result_sourcedid"] = "SOURCEDID"
-
-        membership = svc.upsert_assignment_membership(
-            pyramid_request.lti_params,
-            assignment=assignment,
-            user=user,
-            lti_roles=lti_roles,
-        )
-        assert (
-            membership
-            == Any.list.containing(
-                [
-                    Any.instance_of(AssignmentMembership).with_attrs(
-                        {"user": user, "assignment": assignment, "lti_role": lti_role}
-                    )
-                    for lti_role in lti_roles
-                ]
-            ).only()
-        )
-        assert (
-            db_session.scalars(select(LMSUserAssignmentMembership)).all()
-            == Any.list.containing(
-                [
-                    Any.instance_of(LMSUserAssignmentMembership).with_attrs(
-                        {
-                            "lms_user": lms_user,
-                            "assignment": assignment,
-                            "lti_role": lti_role,
-                            "lti_v11_lis_result_sourcedid": "SOURCEDID"
-                            if with_lti11_grading_id
-                            else None,
-                        }
-                    )
-                    for lti_role in lti_roles
-                ]
-            ).only()
-        )
-
-    def test_upsert_assignment_membership_doesnt_clear_sourcedid(
-        self, svc, pyramid_request, db_session, assignment
-    ):
-        lms_user = factories.LMSUser()
-        user = factories.User(lms_user=lms_user)
-        lti_roles = factories.LTIRole.create_batch(3)
-
-        for role in lti_roles:
-            factories.LMSUserAssignmentMembership.create(
-                assignment=assignment,
-                lms_user=lms_user,
-                lti_role=role,
-                lti_v11_lis_result_sourcedid="EXISTING",
-            )
-        db_session.commit()
-        pyramid_request.lti_params["lis_result_sourcedid"] = None
-
-        svc.upsert_assignment_membership(
-            pyramid_request.lti_params,
-            assignment=assignment,
-            user=user,
-            lti_roles=lti_roles,
-        )
-
-        for membership in db_session.scalars(select(LMSUserAssignmentMembership)).all():
-            assert membership.lti_v11_lis_result_sourcedid == "EXISTING"
-
     def test_upsert_assignment_grouping(self, svc, assignment, db_session):
         groupings = factories.CanvasGroup.create_batch(3)
         # One existing row
@@ -606,6 +528,19 @@ class TestAssignmentService:
 
         assert assignment == svc.get_by_id(assignment.id)
 
+    def test_get_by_id_with_options(self, svc, db_session, query_profile):
+        assignment = factories.Assignment(course=factories.Course())
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            assignment = svc.get_by_id(
+                assignment.id, options=[joinedload(Assignment.course)]
+            )
+            assert assignment.course
+
+        assert profile.count == 1
+
     def test_is_member(self, svc, db_session):
         assignment = factories.Assignment()
         user = factories.User()
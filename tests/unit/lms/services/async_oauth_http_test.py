@@ -1,10 +1,17 @@
+import asyncio
+import os
 from unittest.mock import sentinel
 
 import pytest
-from aiohttp import TooManyRedirects
+from aiohttp import ClientTimeout, TooManyRedirects
 from aioresponses import aioresponses
 
-from lms.services.async_oauth_http import AsyncOAuthHTTPService, factory
+from lms.services.async_oauth_http import (
+    AsyncOAuthHTTPService,
+    AsyncRuntime,
+    configure_async_runtime,
+    factory,
+)
 from lms.services.exceptions import ExternalAsyncRequestError
 
 
@@ -26,7 +33,9 @@ class TestAsyncOAuthHTTPService:
         for request in with_successful_responses.requests.values():
             request_kwargs = request[0].kwargs
 
-            assert request_kwargs["timeout"] == 10
+            assert request_kwargs["timeout"] == ClientTimeout(
+                sock_connect=10, sock_read=10
+            )
             assert (
                 request_kwargs["headers"]["Authorization"]
                 == f"Bearer {oauth2_token_service.get().access_token}"
@@ -37,6 +46,27 @@ class TestAsyncOAuthHTTPService:
         with pytest.raises(ExternalAsyncRequestError):
             svc.request("GET", urls)
 
+    def test_request_with_timeout(self, svc, urls):
+        with aioresponses() as m:
+            for url in urls:
+                m.get(url, exception=TimeoutError())
+
+            with pytest.raises(ExternalAsyncRequestError):
+                svc.request("GET", urls)
+
+    def test_requests_reuse_the_runtimes_session(self, svc, urls, runtime):
+        with aioresponses() as m:
+            for url in urls:
+                m.get(url, repeat=True)
+
+            svc.request("GET", urls)
+            session = runtime._session  # noqa: SLF001
+
+            svc.request("GET", urls)
+
+        assert runtime._session is session  # noqa: SLF001
+        assert session.connector.limit_per_host == runtime.limit_per_host
+
     @pytest.fixture
     def with_successful_responses(self, urls):
         with aioresponses() as m:
@@ -60,8 +90,80 @@ class TestAsyncOAuthHTTPService:
         return ["https://example.com/example", "https://example.com/another"]
 
     @pytest.fixture
-    def svc(self, oauth2_token_service):
-        return AsyncOAuthHTTPService(oauth2_token_service)
+    def svc(self, oauth2_token_service, runtime):
+        return AsyncOAuthHTTPService(oauth2_token_service, runtime)
+
+
+class TestAsyncRuntime:
+    def test_run(self, runtime):
+        async def coro_function(session, *args, **kwargs):
+            return session, args, kwargs
+
+        session, args, kwargs = runtime.run(
+            coro_function, sentinel.arg, kwarg=sentinel.kwarg
+        )
+
+        assert session.connector.limit_per_host == 3
+        assert args == (sentinel.arg,)
+        assert kwargs == {"kwarg": sentinel.kwarg}
+
+    def test_run_reuses_the_loop(self, runtime):
+        async def get_loop(_session):
+            return asyncio.get_running_loop()
+
+        assert runtime.run(get_loop) is runtime.run(get_loop)
+
+    def test_run_starts_a_new_loop_after_a_fork(self, runtime, patch):
+        async def get_session_and_loop(session):
+            return session, asyncio.get_running_loop()
+
+        parent_session, parent_loop = runtime.run(get_session_and_loop)
+        parent_thread = runtime._thread  # noqa: SLF001
+        getpid = patch("lms.services.async_oauth_http.os.getpid")
+        getpid.return_value = os.getpid() + 1
+
+        session, loop = runtime.run(get_session_and_loop)
+
+        assert session is not parent_session
+        assert loop is not parent_loop
+        # In a real fork the parent's loop would be gone, here we have to
+        # clean it up ourselves.
+        asyncio.run_coroutine_threadsafe(parent_session.close(), parent_loop).result()
+        parent_loop.call_soon_threadsafe(parent_loop.stop)
+        parent_thread.join()
+        runtime.close()
+
+    def test_run_propagates_exceptions(self, runtime):
+        async def fail(_session):
+            raise ValueError
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            runtime.run(fail)
+
+    def test_close(self, runtime):
+        async def get_session(session):
+            return session
+
+        session = runtime.run(get_session)
+
+        runtime.close()
+
+        assert session.closed
+
+    def test_close_without_a_loop(self):
+        AsyncRuntime().close()
+
+
+class TestConfigureAsyncRuntime:
+    def test_it(self, runtime):
+        configure_async_runtime({"async_http_limit_per_host": "10"}, runtime)
+
+        assert runtime.limit_per_host == 10
+
+    def test_it_does_nothing_without_settings(self, runtime):
+        configure_async_runtime({"async_http_limit_per_host": None}, runtime)
+
+        assert runtime.limit_per_host == 3
 
 
 class TestFactory:
@@ -70,3 +172,10 @@ class TestFactory:
         assert isinstance(
             factory(sentinel.context, pyramid_request), AsyncOAuthHTTPService
         )
+
+
+@pytest.fixture
+def runtime():
+    runtime = AsyncRuntime(limit_per_host=3)
+    yield runtime
+    runtime.close()
@@ -4,20 +4,22 @@ from unittest.mock import call, patch, sentinel
 import pytest
 from h_matchers import Any
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import joinedload
 
 from lms.models import (
     ApplicationSettings,
+    Course,
     CourseGroupsExportedFromH,
     Grouping,
     LMSCourse,
     LMSCourseApplicationInstance,
-    LMSCourseMembership,
     LTIParams,
     RoleScope,
     RoleType,
 )
 from lms.product.product import Product
 from lms.services.course import CourseService, course_service_factory
+from lms.services.touch import TouchThrottle
 from tests import factories
 
 
@@ -194,6 +196,7 @@ class TestCourseService:
         course_ends_at,
         custom_canvas_api_id,
         lms_term_service,
+        touch_throttle,
     ):
         lti_params["custom_course_starts"] = custom_course_starts
         lti_params["custom_course_ends"] = custom_course_ends
@@ -247,6 +250,7 @@ class TestCourseService:
                         "lms_api_course_id",
                         "lms_term_id",
                     ],
+                    skip_unchanged=True,
                 ),
                 call().one(),
                 call(
@@ -260,6 +264,7 @@ class TestCourseService:
                     ],
                     index_elements=["application_instance_id", "lms_course_id"],
                     update_columns=["updated"],
+                    touch_after=touch_throttle.touch_after,
                 ),
             ]
         )
@@ -299,34 +304,6 @@ class TestCourseService:
         )
         bulk_upsert.assert_called()
 
-    def test_upsert_lms_course_membership(
-        self,
-        db_session,
-        svc,
-        bulk_upsert,
-    ):
-        lti_roles = factories.LTIRole.create_batch(3)
-        lms_user = factories.LMSUser()
-        lms_course = factories.LMSCourse()
-        db_session.flush()
-
-        svc.upsert_lms_course_membership(lms_user, lms_course, lti_roles)
-
-        bulk_upsert.assert_called_once_with(
-            db_session,
-            LMSCourseMembership,
-            values=[
-                {
-                    "lms_user_id": lms_user.id,
-                    "lms_course_id": lms_course.id,
-                    "lti_role_id": role.id,
-                }
-                for role in lti_roles
-            ],
-            index_elements=["lms_user_id", "lms_course_id", "lti_role_id"],
-            update_columns=["updated"],
-        )
-
     @pytest.mark.parametrize(
         "param,field",
         (
@@ -344,6 +321,14 @@ class TestCourseService:
 
         assert svc.search(**{param: getattr(course, field)}) == [course]
 
+    @pytest.mark.parametrize("name", ["biology", "LOGY 10", "101"])
+    def test_search_by_partial_name(self, svc, db_session, name):
+        course = factories.Course(lms_name="Biology 101")
+        factories.Course(lms_name="Chemistry 200")
+        db_session.flush()
+
+        assert svc.search(name=name) == [course]
+
     def test_search_by_organization(self, svc, db_session):
         org = factories.Organization()
         ai = factories.ApplicationInstance(organization=org)
@@ -370,6 +355,19 @@ class TestCourseService:
         assert course == svc.get_by_id(course.id)
         assert not svc.get_by_id(100_00)
 
+    def test_get_by_id_with_options(self, svc, db_session, query_profile):
+        course = factories.Course()
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            course = svc.get_by_id(
+                course.id, options=[joinedload(Course.application_instance)]
+            )
+            assert course.application_instance
+
+        assert profile.count == 1
+
     def test_is_member(self, svc, db_session):
         course = factories.Course()
         user = factories.User()
@@ -503,14 +501,26 @@ class TestCourseService:
         return grouping_service
 
     @pytest.fixture
-    def svc(self, db_session, application_instance, grouping_service, lms_term_service):
+    def svc(
+        self,
+        db_session,
+        application_instance,
+        grouping_service,
+        lms_term_service,
+        touch_throttle,
+    ):
         return CourseService(
             db=db_session,
             application_instance=application_instance,
             grouping_service=grouping_service,
             lms_term_service=lms_term_service,
+            touch_throttle=touch_throttle,
         )
 
+    @pytest.fixture
+    def touch_throttle(self):
+        return TouchThrottle()
+
     @pytest.fixture
     def get_by_context_id(self, svc):
         with patch.object(svc, "get_by_context_id") as get_by_context_id:
@@ -1,10 +1,21 @@
 from unittest.mock import patch, sentinel
 
 import pytest
+from h_matchers import Any
 from pyramid.httpexceptions import HTTPNotFound, HTTPUnauthorized
-
-from lms.models import DashboardAdmin, RoleScope, RoleType
-from lms.services.dashboard import DashboardService, factory
+from sqlalchemy import select
+
+from lms.models import (
+    Assignment,
+    AutoGradingCalculation,
+    AutoGradingType,
+    Course,
+    DashboardAdmin,
+    LMSSegment,
+    RoleScope,
+    RoleType,
+)
+from lms.services.dashboard import DashboardService, LoadingProfile, factory
 from tests import factories
 
 pytestmark = pytest.mark.usefixtures("h_api", "assignment_service")
@@ -38,6 +49,9 @@ class TestDashboardService:
 
         assert svc.get_request_assignment(pyramid_request, sentinel.id)
 
+        assignment_service.get_by_id.assert_called_once_with(
+            sentinel.id, options=Any.list.of_size(1)
+        )
         course_service.is_member.assert_called_once_with(
             assignment_service.get_by_id.return_value.course,
             pyramid_request.user.h_userid,
@@ -102,7 +116,13 @@ class TestDashboardService:
     def test_get_request_course(self, pyramid_request, course_service, svc):
         course_service.is_member.return_value = True
 
-        assert svc.get_request_course(pyramid_request, sentinel.id)
+        assert svc.get_request_course(
+            pyramid_request, sentinel.id, profile=LoadingProfile.COURSE_DETAILS
+        )
+
+        course_service.get_by_id.assert_called_once_with(
+            sentinel.id, options=Any.list.of_size(3)
+        )
 
     def test_get_request_segment_404(
         self,
@@ -209,17 +229,18 @@ class TestDashboardService:
             organization=organization, email="testing@example.com", created_by="creator"
         )
         db_session.flush()
-        organization_service.get_hierarchy_ids.side_effect = (
-            [
-                organization.id,
-                child_organization.id,
-            ],
-            [organization_lti_admin.id],
-        )
+        organization_service.get_descendant_ids.return_value = [
+            organization.id,
+            child_organization.id,
+            organization_lti_admin.id,
+        ]
 
         assert set(
             svc.get_organizations_where_admin(lms_admin.h_userid, email_admin.email)
         ) == {organization, child_organization, organization_lti_admin}
+        organization_service.get_descendant_ids.assert_called_once_with(
+            Any.list.containing([organization.id, organization_lti_admin.id]).only()
+        )
 
     def test_get_request_admin_organizations_for_non_staff(self, pyramid_request, svc):
         pyramid_request.params = {"org_public_id": sentinel.public_id}
@@ -440,6 +461,97 @@ class TestDashboardService:
         return pyramid_config
 
 
+class TestLoadingProfile:
+    @pytest.mark.parametrize(
+        "loading_profile,expected_queries",
+        [
+            (LoadingProfile.AUTHORIZATION, 2),
+            (LoadingProfile.ASSIGNMENT_DETAILS, 1),
+        ],
+    )
+    def test_assignment_options(
+        self, db_session, query_profile, course, loading_profile, expected_queries
+    ):
+        assignment = factories.Assignment(
+            course=course,
+            auto_grading_config=factories.AutoGradingConfig(
+                activity_calculation=AutoGradingCalculation.CUMULATIVE,
+                grading_type=AutoGradingType.SCALED,
+            ),
+        )
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            assignment = db_session.scalars(
+                select(Assignment)
+                .where(Assignment.id == assignment.id)
+                .options(*loading_profile.assignment_options())
+            ).one()
+            assert assignment.course.application_instance.organization
+            assert assignment.auto_grading_config
+
+        assert profile.count == expected_queries
+
+    @pytest.mark.parametrize(
+        "loading_profile,expected_queries",
+        [
+            (LoadingProfile.AUTHORIZATION, 3),
+            # One query for the course and one for all its children
+            (LoadingProfile.COURSE_DETAILS, 2),
+        ],
+    )
+    def test_course_options(
+        self, db_session, query_profile, course, loading_profile, expected_queries
+    ):
+        factories.CanvasSection.create_batch(
+            3, parent=course, application_instance=course.application_instance
+        )
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            course = db_session.scalars(
+                select(Course)
+                .where(Course.id == course.id)
+                .options(*loading_profile.course_options())
+            ).one()
+            assert course.application_instance.organization
+            assert course.lms_course
+            assert len(course.children) == 3
+
+        assert profile.count == expected_queries
+
+    def test_segment_options(self, db_session, query_profile, course):
+        segment = factories.LMSSegment(lms_course=course.lms_course)
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            segment = db_session.scalars(
+                select(LMSSegment)
+                .where(LMSSegment.id == segment.id)
+                .options(*LoadingProfile.segment_options())
+            ).one()
+            assert segment.lms_course.course.application_instance.organization
+
+        assert profile.count == 1
+
+    def test_segment_options_are_only_built_once(self):
+        assert LoadingProfile.segment_options() is LoadingProfile.segment_options()
+
+    @pytest.fixture
+    def course(self, db_session):
+        course = factories.Course(
+            application_instance=factories.ApplicationInstance(
+                organization=factories.Organization()
+            )
+        )
+        course.lms_course = factories.LMSCourse(course=course)
+        db_session.flush()
+        return course
+
+
 class TestFactory:
     def test_it(
         self,
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from unittest.mock import sentinel
+
+import pytest
+from freezegun import freeze_time
+from sqlalchemy import func, select
+
+from lms.models import TaskDone
+from lms.services.dedupe import DedupeService, factory
+from tests import factories
+
+NOW = datetime(2024, 5, 4, 12)  # noqa: DTZ001
+
+
+@freeze_time(NOW)
+class TestDedupeService:
+    def test_claim(self, svc, db_session):
+        assert svc.claim("key", ttl=timedelta(days=1), data={"foo": "bar"})
+
+        task_done = db_session.scalars(select(TaskDone)).one()
+        assert task_done.key == "key"
+        assert task_done.expires_at == NOW + timedelta(days=1)
+        assert task_done.data == {"foo": "bar"}
+
+    def test_claim_when_already_claimed(self, svc):
+        factories.TaskDone(key="key", expires_at=NOW + timedelta(seconds=1))
+
+        assert not svc.claim("key")
+
+    def test_claim_takes_over_expired_claims(self, svc, db_session):
+        factories.TaskDone(key="key", expires_at=NOW, data={"old": True})
+        db_session.flush()
+
+        assert svc.claim("key", ttl=timedelta(days=1), data={"new": True})
+
+        db_session.expire_all()
+        task_done = db_session.scalars(select(TaskDone)).one()
+        assert task_done.expires_at == NOW + timedelta(days=1)
+        assert task_done.data == {"new": True}
+
+    def test_claim_many(self, svc):
+        factories.TaskDone(key="claimed", expires_at=NOW + timedelta(seconds=1))
+
+        assert svc.claim_many(["claimed", "new_1", "new_2"]) == {"new_1", "new_2"}
+
+    def test_claim_many_with_no_keys(self, svc):
+        assert svc.claim_many([]) == set()
+
+    def test_exists(self, svc):
+        factories.TaskDone(key="claimed", expires_at=NOW + timedelta(seconds=1))
+        factories.TaskDone(key="expired", expires_at=NOW - timedelta(seconds=1))
+
+        assert svc.exists(["claimed", "expired", "missing"]) == {"claimed"}
+
+    def test_is_claimed_clause(self, svc, db_session):
+        factories.TaskDone(key="prefix::1", expires_at=NOW + timedelta(seconds=1))
+        factories.TaskDone(key="prefix::2", expires_at=NOW - timedelta(seconds=1))
+        db_session.flush()
+
+        keys = db_session.scalars(
+            select(func.concat("prefix::", func.generate_series(1, 3)).label("key"))
+        ).all()
+
+        assert [
+            key for key in keys if db_session.scalar(select(svc.is_claimed_clause(key)))
+        ] == ["prefix::1"]
+
+    def test_delete_expired(self, svc, db_session):
+        for i in range(3):
+            factories.TaskDone(key=f"expired_{i}", expires_at=NOW - timedelta(1))
+        factories.TaskDone(key="fresh", expires_at=NOW + timedelta(seconds=1))
+        db_session.flush()
+
+        assert svc.delete_expired(limit=2) == 2
+        assert svc.delete_expired(limit=2) == 1
+        assert svc.delete_expired(limit=2) == 0
+        assert db_session.scalars(select(TaskDone.key)).all() == ["fresh"]
+
+    @pytest.fixture
+    def svc(self, db_session):
+        return DedupeService(db_session)
+
+
+class TestFactory:
+    def test_it(self, pyramid_request, DedupeService):
+        svc = factory(sentinel.context, pyramid_request)
+
+        DedupeService.assert_called_once_with(db=pyramid_request.db)
+        assert svc == DedupeService.return_value
+
+    @pytest.fixture
+    def DedupeService(self, patch):
+        return patch("lms.services.dedupe.DedupeService")
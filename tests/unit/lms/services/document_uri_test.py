@@ -1,10 +1,13 @@
 import hashlib
+from io import BytesIO
 
 import pytest
+from requests import Response
 
 from lms.services.document_uri import (
     _decode_pdf_literal,
     ensure_checkpoint_fingerprint,
+    fetch_pdf_fingerprint,
     initial_document_uri,
     pdf_fingerprint,
 )
@@ -230,21 +233,23 @@ class TestInitialDocumentURI:
 @pytest.mark.usefixtures("canvas_service", "http_service")
 class TestEnsureCheckpointFingerprint:
     def test_it_computes_and_stores_the_fingerprint(
-        self, pyramid_request, assignment, course, canvas_service, http_service
+        self,
+        pyramid_request,
+        assignment,
+        course,
+        canvas_service,
+        http_service,
+        fetch_pdf_fingerprint,
     ):
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
-
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         canvas_service.public_url_for_file.assert_called_once_with(
             assignment, "99", "CANVAS_COURSE_ID"
         )
-        http_service.get.assert_called_once_with(
-            canvas_service.public_url_for_file.return_value
-        )
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
+        fetch_pdf_fingerprint.assert_called_once_with(
+            http_service, canvas_service.public_url_for_file.return_value
         )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     def test_it_does_nothing_if_document_uri_is_already_set(
         self, pyramid_request, assignment, course, canvas_service
@@ -258,32 +263,26 @@ class TestEnsureCheckpointFingerprint:
 
     @pytest.mark.usefixtures("user_is_learner")
     def test_it_computes_the_fingerprint_for_students_too(
-        self, pyramid_request, assignment, course, http_service
+        self, pyramid_request, assignment, course
     ):
         # Students launch first most of the time, so this must not need an
         # instructor.
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
-        )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     def test_it_computes_the_fingerprint_for_blackboard_files(
-        self, pyramid_request, assignment, course, blackboard_api_client, http_service
+        self, pyramid_request, assignment, course, blackboard_api_client
     ):
         assignment.document_url = "blackboard://content-resource/FILE_ID/"
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         blackboard_api_client.public_url.assert_called_once_with(
             course.lms_id, "FILE_ID"
         )
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
-        )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     @pytest.mark.usefixtures("oauth2_token_service")
     def test_it_computes_the_fingerprint_for_d2l_files(
@@ -294,42 +293,46 @@ class TestEnsureCheckpointFingerprint:
         d2l_api_client,
         http_service,
         oauth_token,
+        fetch_pdf_fingerprint,
     ):
         assignment.document_url = "d2l://file/course/42/file_id/99/"
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         d2l_api_client.public_url.assert_called_once_with(course.lms_id, "99")
-        http_service.get.assert_called_once_with(
+        fetch_pdf_fingerprint.assert_called_once_with(
+            http_service,
             d2l_api_client.public_url.return_value,
             headers={"Authorization": f"Bearer {oauth_token.access_token}"},
         )
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
-        )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     def test_it_computes_the_fingerprint_for_moodle_files(
-        self, pyramid_request, assignment, course, moodle_api_client, http_service
+        self,
+        pyramid_request,
+        assignment,
+        course,
+        moodle_api_client,
+        http_service,
+        fetch_pdf_fingerprint,
     ):
         course.application_instance.lms_url = "https://moodle.com"
         assignment.document_url = (
             "moodle://file/course/42/url/https://moodle.com/file.pdf"
         )
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
-        http_service.get.assert_called_once_with(
-            "https://moodle.com/file.pdf", params={"token": moodle_api_client.token}
-        )
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
+        fetch_pdf_fingerprint.assert_called_once_with(
+            http_service,
+            "https://moodle.com/file.pdf",
+            params={"token": moodle_api_client.token},
         )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     @pytest.mark.usefixtures("moodle_api_client")
     def test_it_refuses_moodle_urls_on_other_hosts(
-        self, pyramid_request, assignment, course, http_service
+        self, pyramid_request, assignment, course, fetch_pdf_fingerprint
     ):
         course.application_instance.lms_url = "https://moodle.com"
         assignment.document_url = (
@@ -338,62 +341,74 @@ class TestEnsureCheckpointFingerprint:
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
-        http_service.get.assert_not_called()
+        fetch_pdf_fingerprint.assert_not_called()
         assert assignment.document_uri is None
 
     def test_it_computes_the_fingerprint_for_jstor(
-        self, pyramid_request, assignment, course, jstor_service, http_service
+        self,
+        pyramid_request,
+        assignment,
+        course,
+        jstor_service,
+        http_service,
+        fetch_pdf_fingerprint,
     ):
         assignment.document_url = "jstor://10.2307/1234"
         jstor_service.enabled = True
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         jstor_service.public_url.assert_called_once_with("jstor://10.2307/1234")
-        http_service.get.assert_called_once_with(jstor_service.public_url.return_value)
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
+        fetch_pdf_fingerprint.assert_called_once_with(
+            http_service, jstor_service.public_url.return_value
         )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     def test_it_does_nothing_for_jstor_when_disabled(
-        self, pyramid_request, assignment, course, jstor_service, http_service
+        self,
+        pyramid_request,
+        assignment,
+        course,
+        jstor_service,
+        fetch_pdf_fingerprint,
     ):
         assignment.document_url = "jstor://10.2307/1234"
         jstor_service.enabled = False
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
-        http_service.get.assert_not_called()
+        fetch_pdf_fingerprint.assert_not_called()
         assert assignment.document_uri is None
 
     def test_it_does_nothing_for_non_file_urls(
-        self, pyramid_request, assignment, course, canvas_service, http_service
+        self,
+        pyramid_request,
+        assignment,
+        course,
+        canvas_service,
+        fetch_pdf_fingerprint,
     ):
         assignment.document_url = "moodle://page/course/42/page_id/314"
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         canvas_service.public_url_for_file.assert_not_called()
-        http_service.get.assert_not_called()
+        fetch_pdf_fingerprint.assert_not_called()
         assert assignment.document_uri is None
 
     def test_canvas_courses_without_extra_use_the_document_urls_course(
-        self, pyramid_request, assignment, course, canvas_service, http_service
+        self, pyramid_request, assignment, course, canvas_service
     ):
         # Courses that predate extra["canvas"] don't have it: fall back to
         # the course id in document_url rather than raising on every launch.
         course.extra = {}
-        http_service.get.return_value.content = PDF_WITH_HEX_ID
 
         ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
 
         canvas_service.public_url_for_file.assert_called_once_with(
             assignment, "99", "42"
         )
-        assert (
-            assignment.document_uri == f"urn:x-pdf:{pdf_fingerprint(PDF_WITH_HEX_ID)}"
-        )
+        assert assignment.document_uri == "urn:x-pdf:FINGERPRINT"
 
     def test_it_swallows_errors(
         self, pyramid_request, assignment, course, canvas_service
@@ -404,6 +419,22 @@ class TestEnsureCheckpointFingerprint:
 
         assert assignment.document_uri is None
 
+    def test_it_does_nothing_without_a_fingerprint(
+        self, pyramid_request, assignment, course, fetch_pdf_fingerprint
+    ):
+        fetch_pdf_fingerprint.return_value = None
+
+        ensure_checkpoint_fingerprint(pyramid_request, assignment, course)
+
+        assert assignment.document_uri is None
+
+    @pytest.fixture(autouse=True)
+    def fetch_pdf_fingerprint(self, patch):
+        return patch(
+            "lms.services.document_uri.fetch_pdf_fingerprint",
+            return_value="FINGERPRINT",
+        )
+
     @pytest.fixture
     def assignment(self):
         return factories.Assignment(
@@ -424,6 +455,138 @@ PDF_WITH_HEX_ID = (
     b"<CAFEBABECAFEBABECAFEBABECAFEBABE>] >>\nstartxref\n123\n%%EOF\n"
 )
 
+PDF_WITHOUT_ID = b"%PDF-1.4\nsome pdf content here\n%%EOF\n"
+
+# Enough content to push the start of the file out of the fetched tail.
+LARGE_PDF_HEAD = b"%PDF-1.7\n" + b"x" * 100_000 + b"\n"
+
+
+class TestFetchPDFFingerprint:
+    def test_it_fetches_the_end_of_the_file(self, http_service, serve):
+        serve(LARGE_PDF_HEAD + PDF_WITH_HEX_ID)
+
+        fingerprint = fetch_pdf_fingerprint(
+            http_service,
+            "https://example.com/file.pdf",
+            headers={"Authorization": "Bearer TOKEN"},
+            params={"token": "TOKEN"},
+        )
+
+        assert fingerprint == "deadbeefdeadbeefdeadbeefdeadbeef"
+        http_service.get.assert_called_once_with(
+            "https://example.com/file.pdf",
+            headers={"Authorization": "Bearer TOKEN", "Range": "bytes=-65536"},
+            stream=True,
+            params={"token": "TOKEN"},
+        )
+
+    def test_it_fingerprints_small_files_from_the_tail(self, http_service, serve):
+        serve(PDF_WITHOUT_ID)
+
+        assert fetch_pdf_fingerprint(http_service, "URL") == pdf_fingerprint(
+            PDF_WITHOUT_ID
+        )
+        http_service.get.assert_called_once()
+
+    def test_it_reads_the_cross_reference_stream_at_startxref(
+        self, http_service, serve
+    ):
+        xref_stream = b"1 0 obj\n<< /Type /XRef /ID [<0102030405060708>] >>\n"
+        tail = b"stream\n" + b"x" * 70_000 + b"\nendstream\n"
+        offset = len(LARGE_PDF_HEAD)
+        serve(
+            LARGE_PDF_HEAD
+            + xref_stream
+            + tail
+            + f"startxref\n{offset}\n%%EOF\n".encode()
+        )
+
+        assert fetch_pdf_fingerprint(http_service, "URL") == "0102030405060708"
+        assert http_service.get.call_args.kwargs["headers"]["Range"] == (
+            f"bytes={offset}-{offset + 4095}"
+        )
+
+    @pytest.mark.parametrize(
+        "tail",
+        (
+            # No /ID and no startxref
+            b"%%EOF\n",
+            # No /ID in the cross-reference section either
+            b"startxref\n10\n%%EOF\n",
+            # All-zero /ID
+            b"trailer\n<< /ID [<00000000000000000000000000000000>] >>\n",
+        ),
+    )
+    def test_it_falls_back_to_the_md5_of_the_head(self, http_service, serve, tail):
+        pdf = LARGE_PDF_HEAD + tail
+        serve(pdf)
+
+        assert fetch_pdf_fingerprint(http_service, "URL") == pdf_fingerprint(pdf)
+        assert http_service.get.call_args.kwargs["headers"]["Range"] == "bytes=0-1023"
+
+    def test_it_handles_unknown_sizes(self, http_service, serve):
+        serve(PDF_WITH_HEX_ID, size="*")
+
+        assert (
+            fetch_pdf_fingerprint(http_service, "URL")
+            == "deadbeefdeadbeefdeadbeefdeadbeef"
+        )
+
+    @pytest.mark.parametrize(
+        "pdf",
+        (
+            LARGE_PDF_HEAD + PDF_WITH_HEX_ID,
+            # An /ID split between two chunks
+            b"x" * (65536 - 20) + PDF_WITH_HEX_ID.partition(b"trailer")[2],
+            PDF_WITHOUT_ID,
+        ),
+    )
+    def test_it_streams_the_file_when_ranges_are_not_supported(
+        self, http_service, serve, pdf
+    ):
+        serve(pdf, ranges=False)
+
+        assert fetch_pdf_fingerprint(http_service, "URL") == pdf_fingerprint(pdf)
+        http_service.get.assert_called_once()
+
+    @pytest.mark.parametrize("content_length", (True, False))
+    def test_it_gives_up_streaming_large_files(
+        self, http_service, serve, content_length, patch
+    ):
+        patch("lms.services.document_uri.MAX_STREAMED_BYTES", new=1000, autospec=False)
+        serve(LARGE_PDF_HEAD + PDF_WITH_HEX_ID, ranges=False, length=content_length)
+
+        assert fetch_pdf_fingerprint(http_service, "URL") is None
+
+    @pytest.fixture
+    def serve(self, http_service):
+        def serve(pdf, *, ranges=True, size=None, length=True):
+            def get(_url, headers, **_kwargs):
+                response = Response()
+                if not ranges:
+                    response.status_code = 200
+                    response.raw = BytesIO(pdf)
+                    if length:
+                        response.headers["Content-Length"] = str(len(pdf))
+                    return response
+
+                start, end = headers["Range"].removeprefix("bytes=").split("-")
+                if start:
+                    start, end = int(start), min(int(end), len(pdf) - 1)
+                else:
+                    start, end = max(len(pdf) - int(end), 0), len(pdf) - 1
+
+                response.status_code = 206
+                response.raw = BytesIO(pdf[start : end + 1])
+                response.headers["Content-Range"] = (
+                    f"bytes {start}-{end}/{size or len(pdf)}"
+                )
+                return response
+
+            http_service.get.side_effect = get
+
+        return serve
+
 
 class TestPDFFingerprint:
     def test_it_uses_the_original_id_when_present(self):
@@ -1,11 +1,16 @@
-from unittest.mock import sentinel
+from unittest.mock import call, sentinel
 
 import pytest
 from celery.exceptions import OperationalError
 
 from lms.events import BaseEvent
 from lms.models import Event, EventData, EventType, EventUser
-from lms.services.event import EventService, factory
+from lms.services.event import (
+    EventBuffer,
+    EventService,
+    configure_event_buffer,
+    factory,
+)
 from tests import factories
 
 
@@ -78,6 +83,21 @@ class TestEventService:
         # The type is the same as the first insert
         assert event_type == type_query.one()
 
+    def test_insert_events(self, svc, db_session):
+        svc.insert_events(
+            [
+                BaseEvent(request=sentinel.request, type=EventType.Type.AUDIT_TRAIL),
+                BaseEvent(
+                    request=sentinel.request, type=EventType.Type.CONFIGURED_LAUNCH
+                ),
+            ]
+        )
+
+        assert {event.type.type for event in db_session.query(Event)} == {
+            EventType.Type.AUDIT_TRAIL,
+            EventType.Type.CONFIGURED_LAUNCH,
+        }
+
     def test_queue_event(self, svc, insert_event, base_event):
         svc.queue_event(base_event)
 
@@ -92,6 +112,15 @@ class TestEventService:
 
         assert not svc.queue_event(base_event)
 
+    def test_queue_event_with_buffer(self, svc, insert_event, base_event, patch):
+        EVENT_BUFFER = patch("lms.services.event.EVENT_BUFFER")
+        EVENT_BUFFER.enabled = True
+
+        svc.queue_event(base_event)
+
+        EVENT_BUFFER.add.assert_called_once_with(base_event.serialize())
+        insert_event.apply_async.assert_not_called()
+
     @pytest.fixture
     def svc(self, db_session):
         return EventService(db_session)
@@ -107,6 +136,80 @@ class TestEventService:
         return patch("lms.services.event.insert_event")
 
 
+class TestEventBuffer:
+    def test_it_is_disabled_by_default(self):
+        assert not EventBuffer().enabled
+
+    def test_add_queues_events_when_full(self, buffer, insert_events, Timer):
+        buffer.add({"event": 1})
+        buffer.add({"event": 2})
+        insert_events.apply_async.assert_not_called()
+
+        buffer.add({"event": 3})
+
+        insert_events.apply_async.assert_called_once_with(
+            ([{"event": 1}, {"event": 2}, {"event": 3}],), retry=False
+        )
+        Timer.assert_called_once_with(buffer.max_age, buffer.flush)
+        Timer.return_value.start.assert_called_once_with()
+        Timer.return_value.cancel.assert_called_once_with()
+
+    def test_flush(self, buffer, insert_events):
+        buffer.add({"event": 1})
+
+        buffer.flush()
+
+        insert_events.apply_async.assert_called_once_with(
+            ([{"event": 1}],), retry=False
+        )
+        # Nothing left to flush
+        buffer.flush()
+        insert_events.apply_async.assert_called_once()
+
+    def test_flush_starts_a_new_timer_afterwards(self, buffer, Timer):
+        buffer.add({"event": 1})
+        buffer.flush()
+        buffer.add({"event": 2})
+
+        assert Timer.call_args_list == [
+            call(buffer.max_age, buffer.flush),
+            call(buffer.max_age, buffer.flush),
+        ]
+
+    def test_flush_with_OperationalError_doest_raise(self, buffer, insert_events):
+        insert_events.apply_async.side_effect = OperationalError
+        buffer.add({"event": 1})
+
+        buffer.flush()
+
+    @pytest.mark.parametrize(
+        "settings,max_size,max_age",
+        (
+            ({}, 1, 5),
+            ({"event_buffer_size": "100", "event_buffer_max_age": "2.5"}, 100, 2.5),
+        ),
+    )
+    def test_configure_event_buffer(self, settings, max_size, max_age):
+        buffer = EventBuffer()
+
+        configure_event_buffer(settings, buffer)
+
+        assert buffer.max_size == max_size
+        assert buffer.max_age == max_age
+
+    @pytest.fixture
+    def buffer(self):
+        return EventBuffer(max_size=3)
+
+    @pytest.fixture(autouse=True)
+    def Timer(self, patch):
+        return patch("lms.services.event.threading.Timer")
+
+    @pytest.fixture(autouse=True)
+    def insert_events(self, patch):
+        return patch("lms.services.event.insert_events")
+
+
 class TestFactory:
     def test_it(self, pyramid_request, EventService):
         svc = factory(sentinel.context, pyramid_request)
@@ -1,6 +1,6 @@
 import json
 from datetime import UTC, datetime
-from unittest.mock import call, patch, sentinel
+from unittest.mock import Mock, call, patch, sentinel
 
 import pytest
 from h_api.bulk_api.model.command import ConfigCommand
@@ -8,7 +8,12 @@ from h_matchers import Any
 
 from lms.models import HUser
 from lms.services import HAPIError
-from lms.services.h_api import HAPI, service_factory
+from lms.services.h_api import (
+    HAPI,
+    AnnotationCountsCache,
+    configure_annotation_counts_cache,
+    service_factory,
+)
 from lms.services.http import ExternalRequestError
 from tests import factories
 
@@ -184,6 +189,21 @@ class TestHAPI:
             stream=False,
         )
 
+    def test_get_annotation_counts_is_cached(self, h_api, http_service):
+        http_service.request.return_value = factories.requests.Response(
+            raw='[{"annotations": 1}]'
+        )
+
+        first = h_api.get_annotation_counts(
+            ["group_1", "group_2"], group_by="user", h_userids=["user_1", "user_2"]
+        )
+        second = h_api.get_annotation_counts(
+            ["group_2", "group_1"], group_by="user", h_userids=["user_2", "user_1"]
+        )
+
+        http_service.request.assert_called_once()
+        assert first == second == [{"annotations": 1}]
+
     def test_get_annotation_counts_with_no_groups(self, h_api, http_service):
         assert not h_api.get_annotation_counts(
             group_authority_ids=[], group_by=sentinel.group_by
@@ -498,6 +518,7 @@ class TestHAPI:
             client_secret="TEST_CLIENT_SECRET",  # noqa: S106
             h_private_url="https://h.example.com/private/api/",
             http_service=http_service,
+            annotation_counts_cache=AnnotationCountsCache(),
         )
 
     @pytest.fixture
@@ -506,6 +527,130 @@ class TestHAPI:
             yield h_api._api_request  # noqa: SLF001
 
 
+class TestAnnotationCountsCache:
+    def test_it_loads_missing_values(self, cache, load):
+        assert cache.get("key", load) == load.return_value
+        load.assert_called_once_with()
+
+    def test_it_returns_fresh_values(self, cache, load, time):
+        cache.get("key", load)
+        time.monotonic.return_value = 59
+
+        assert cache.get("key", load) == load.return_value
+        load.assert_called_once_with()
+
+    def test_it_returns_stale_values_and_refreshes_them(
+        self, cache, load, time, Thread
+    ):
+        cache.get("key", load)
+        load.return_value = sentinel.new_value
+        time.monotonic.return_value = 61
+
+        assert cache.get("key", load) == sentinel.value
+        # Only one refresh at a time for the same key
+        assert cache.get("key", load) == sentinel.value
+        Thread.assert_called_once_with(
+            target=Any.function(), name="AnnotationCountsCache", daemon=True
+        )
+        Thread.return_value.start.assert_called_once_with()
+
+        Thread.call_args.kwargs["target"]()
+
+        assert cache.get("key", load) == sentinel.new_value
+        assert load.call_count == 2
+
+    def test_it_logs_errors_refreshing_values(self, cache, load, time, Thread, caplog):
+        cache.get("key", load)
+        load.side_effect = ValueError
+        time.monotonic.return_value = 61
+        cache.get("key", load)
+
+        Thread.call_args.kwargs["target"]()
+
+        assert "Error refreshing annotation counts" in caplog.text
+        # The next call can try again
+        cache.get("key", load)
+        assert (
+            Thread.call_args_list.count(
+                call(target=Any.function(), name="AnnotationCountsCache", daemon=True)
+            )
+            == 2
+        )
+
+    def test_it_reloads_expired_values(self, cache, load, time):
+        cache.get("key", load)
+        load.return_value = sentinel.new_value
+        time.monotonic.return_value = 361
+
+        assert cache.get("key", load) == sentinel.new_value
+
+    def test_it_evicts_the_oldest_values(self, load):
+        cache = AnnotationCountsCache(max_size=2)
+        cache.get("key_1", load)
+        cache.get("key_2", load)
+        cache.get("key_3", load)
+
+        cache.get("key_1", load)
+
+        assert load.call_count == 4
+
+    def test_it_can_be_disabled(self, load):
+        cache = AnnotationCountsCache(ttl=0)
+
+        cache.get("key", load)
+        cache.get("key", load)
+
+        assert load.call_count == 2
+
+    def test_clear(self, cache, load):
+        cache.get("key", load)
+
+        cache.clear()
+
+        cache.get("key", load)
+        assert load.call_count == 2
+
+    @pytest.mark.parametrize(
+        "settings,ttl,stale_ttl",
+        (
+            ({}, 60, 300),
+            (
+                {
+                    "annotation_counts_cache_ttl": "0",
+                    "annotation_counts_cache_stale_ttl": "30",
+                },
+                0,
+                30,
+            ),
+        ),
+    )
+    def test_configure_annotation_counts_cache(self, settings, ttl, stale_ttl):
+        cache = AnnotationCountsCache()
+
+        configure_annotation_counts_cache(settings, cache)
+
+        assert cache.ttl == ttl
+        assert cache.stale_ttl == stale_ttl
+
+    @pytest.fixture
+    def cache(self):
+        return AnnotationCountsCache(ttl=60, stale_ttl=300)
+
+    @pytest.fixture
+    def load(self):
+        return Mock(return_value=sentinel.value)
+
+    @pytest.fixture(autouse=True)
+    def time(self, patch):
+        time = patch("lms.services.h_api.time")
+        time.monotonic.return_value = 0
+        return time
+
+    @pytest.fixture
+    def Thread(self, patch):
+        return patch("lms.services.h_api.threading.Thread")
+
+
 class TestServiceFactory:
     def test_it(self, HAPI, pyramid_request, http_service):
         pyramid_request.registry.settings = {
@@ -1,14 +1,39 @@
-from unittest.mock import create_autospec, sentinel
+import socket
+from unittest.mock import call, create_autospec, sentinel
 
 import pytest
 import requests
-from requests import RequestException
+from h_matchers import Any
+from requests import RequestException, Session
 
 from lms.services.exceptions import ExternalRequestError
-from lms.services.http import HTTPService, factory
+from lms.services.http import (
+    ConnectionPools,
+    HTTPService,
+    PoolConfig,
+    configure_connection_pools,
+    factory,
+)
 
 
 class TestHTTPService:
+    def test_it_uses_the_shared_connection_pools(self, connection_pools):
+        svc = HTTPService(connection_pools)
+
+        connection_pools.mount.assert_called_once_with(Any.instance_of(Session))
+        assert svc.session == connection_pools.mount.return_value
+
+    def test_sessions_share_adapters_but_not_cookies(self):
+        connection_pools = ConnectionPools()
+
+        svc_1 = HTTPService(connection_pools)
+        svc_2 = HTTPService(connection_pools)
+
+        assert svc_1.session.get_adapter("https://example.com/") is (
+            svc_2.session.get_adapter("https://example.com/")
+        )
+        assert svc_1.session.cookies is not svc_2.session.cookies
+
     def test_request(self, svc, passed_args):
         response = svc.request(sentinel.method, sentinel.url, **passed_args)
 
@@ -74,6 +99,111 @@ class TestHTTPService:
         return svc
 
 
+class TestConnectionPools:
+    def test_mount_uses_the_default_adapter(self, session):
+        ConnectionPools().mount(session)
+
+        adapter = session.get_adapter("https://example.com/path")
+        assert adapter.pool_config == PoolConfig()
+        assert session.get_adapter("http://example.com/path") is adapter
+
+    def test_mount_uses_per_host_adapters(self, session):
+        connection_pools = ConnectionPools()
+        connection_pools.configure("api.example.com", maxsize=50)
+
+        connection_pools.mount(session)
+
+        assert session.get_adapter("https://api.example.com/path").pool_config == (
+            PoolConfig(maxsize=50)
+        )
+        assert session.get_adapter("https://api.example.com.evil/").pool_config == (
+            PoolConfig()
+        )
+
+    def test_mount_reuses_adapters(self):
+        connection_pools = ConnectionPools()
+
+        session_1 = connection_pools.mount(Session())
+        session_2 = connection_pools.mount(Session())
+
+        assert session_1.get_adapter("https://example.com/") is (
+            session_2.get_adapter("https://example.com/")
+        )
+
+    def test_configure_replaces_the_adapter(self):
+        connection_pools = ConnectionPools()
+        old_adapter = connection_pools.mount(Session()).get_adapter(
+            "https://example.com/"
+        )
+
+        connection_pools.configure(maxsize=2, block=True)
+
+        new_adapter = connection_pools.mount(Session()).get_adapter(
+            "https://example.com/"
+        )
+        assert new_adapter is not old_adapter
+        assert new_adapter.pool_config == PoolConfig(maxsize=2, block=True)
+
+    def test_closing_a_session_doesnt_close_the_pool(self, session):
+        ConnectionPools().mount(session)
+        adapter = session.get_adapter("https://example.com/")
+        pool = adapter.get_connection_with_tls_context(
+            requests.Request("GET", "https://example.com/").prepare(), verify=True
+        )
+
+        session.close()
+
+        assert (
+            adapter.get_connection_with_tls_context(
+                requests.Request("GET", "https://example.com/").prepare(), verify=True
+            )
+            is pool
+        )
+
+    @pytest.mark.parametrize("keep_alive", (True, False))
+    def test_keep_alive(self, session, keep_alive):
+        connection_pools = ConnectionPools(PoolConfig(keep_alive=keep_alive))
+        connection_pools.mount(session)
+
+        socket_options = session.get_adapter(
+            "https://example.com/"
+        ).poolmanager.connection_pool_kw.get("socket_options", [])
+
+        assert (
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+        ) == keep_alive
+
+    @pytest.fixture
+    def session(self):
+        return Session()
+
+
+class TestConfigureConnectionPools:
+    def test_it(self, connection_pools):
+        configure_connection_pools(
+            {
+                "http_pool_maxsize": "20",
+                "http_pool_hosts": "example.com=5\nother.example.com=10",
+            },
+            connection_pools,
+        )
+
+        connection_pools.configure.assert_has_calls(
+            [
+                call(maxsize=20),
+                call("example.com", maxsize=5),
+                call("other.example.com", maxsize=10),
+            ]
+        )
+
+    def test_it_does_nothing_without_settings(self, connection_pools):
+        configure_connection_pools(
+            {"http_pool_maxsize": None, "http_pool_hosts": None}, connection_pools
+        )
+
+        connection_pools.configure.assert_not_called()
+
+
 class TestFactory:
     def test_it(self, pyramid_request, HTTPService):
         svc = factory(sentinel.context, pyramid_request)
@@ -84,3 +214,8 @@ class TestFactory:
     @pytest.fixture
     def HTTPService(self, patch):
         return patch("lms.services.http.HTTPService")
+
+
+@pytest.fixture
+def connection_pools():
+    return create_autospec(ConnectionPools, instance=True, spec_set=True)
@@ -0,0 +1,265 @@
+from datetime import datetime, timedelta
+from unittest.mock import sentinel
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from freezegun import freeze_time
+from jwt.algorithms import RSAAlgorithm
+from jwt.exceptions import PyJWKClientError
+from sqlalchemy import select
+
+from lms.models import JWKSet
+from lms.services.exceptions import ExternalRequestError
+from lms.services.jwk_set import JWKSetCache, JWKSetService, factory
+from tests import factories
+
+URL = "https://platform.example.com/jwks"
+NOW = datetime(2024, 1, 1, 12)  # noqa: DTZ001
+
+
+class TestJWKSetService:
+    def test_get_signing_key_downloads_new_key_sets(
+        self, svc, http_service, db_session
+    ):
+        key = svc.get_signing_key(URL, "KID")
+
+        assert key.key_id == "KID"
+        http_service.get.assert_called_once_with(
+            URL, headers={"User-Agent": "requests"}
+        )
+        assert db_session.scalars(select(JWKSet.url)).all() == [URL]
+
+    def test_get_signing_key_uses_the_key_set_in_memory(
+        self, svc, http_service, query_profile
+    ):
+        svc.get_signing_key(URL, "KID")
+
+        with query_profile() as profile:
+            key = svc.get_signing_key(URL, "KID")
+
+        assert key.key_id == "KID"
+        assert not profile.count
+        http_service.get.assert_called_once()
+
+    def test_get_signing_key_uses_the_key_set_in_the_db(
+        self, svc, http_service, jwk_set
+    ):
+        jwk_set.keys["keys"][0]["kid"] = "STORED_KID"
+
+        assert svc.get_signing_key(URL, "STORED_KID").key_id == "STORED_KID"
+        http_service.get.assert_not_called()
+
+    def test_get_signing_key_downloads_expired_key_sets(
+        self, svc, http_service, jwk_set, db_session
+    ):
+        jwk_set.expires_at = NOW
+
+        assert svc.get_signing_key(URL, "KID").key_id == "KID"
+        http_service.get.assert_called_once()
+        db_session.refresh(jwk_set)
+        assert jwk_set.expires_at == NOW + timedelta(minutes=10)
+
+    def test_get_signing_key_downloads_key_sets_with_unknown_keys(
+        self, svc, http_service, frozen_time
+    ):
+        svc.get_signing_key(URL, "KID")
+        # The platform rotates its keys
+        http_service.get.return_value = self.response(self.key_set("NEW_KID"))
+        frozen_time.tick(JWKSetService.REFETCH_INTERVAL)
+
+        assert svc.get_signing_key(URL, "NEW_KID").key_id == "NEW_KID"
+        assert http_service.get.call_count == 2
+
+    def test_get_signing_key_limits_downloads_for_unknown_keys(self, svc, http_service):
+        svc.get_signing_key(URL, "KID")
+
+        with pytest.raises(PyJWKClientError):
+            svc.get_signing_key(URL, "UNKNOWN_KID")
+
+        http_service.get.assert_called_once()
+
+    def test_get_signing_key_picks_up_key_sets_downloaded_by_other_processes(
+        self, svc, http_service, jwk_set, frozen_time
+    ):
+        svc.get_signing_key(URL, "KID")
+        frozen_time.tick(timedelta(minutes=1))
+        jwk_set.keys = self.key_set("NEW_KID")
+        jwk_set.fetched_at = NOW + timedelta(minutes=1)
+
+        assert svc.get_signing_key(URL, "NEW_KID").key_id == "NEW_KID"
+        http_service.get.assert_not_called()
+
+    def test_get_signing_key_ignores_older_key_sets_in_the_db(
+        self, svc, http_service, jwk_set
+    ):
+        jwk_set.fetched_at = NOW - timedelta(days=1)
+        http_service.get.return_value = self.response(self.key_set("NEW_KID"))
+        svc.refresh(URL)
+        # The DB row is rolled back to its old value, e.g. by a failed request
+        jwk_set.keys = self.key_set("KID")
+        jwk_set.fetched_at = NOW - timedelta(days=1)
+
+        with pytest.raises(PyJWKClientError):
+            svc.get_signing_key(URL, "KID")
+
+    def test_get_signing_key_only_returns_signing_keys(self, svc, http_service):
+        key_set = self.key_set("KID")
+        key_set["keys"][0]["use"] = "enc"
+        http_service.get.return_value = self.response(key_set)
+
+        with pytest.raises(PyJWKClientError):
+            svc.get_signing_key(URL, "KID")
+
+    def test_get_signing_key_raises_if_the_key_set_cant_be_downloaded(
+        self, svc, http_service
+    ):
+        http_service.get.side_effect = ExternalRequestError
+
+        with pytest.raises(PyJWKClientError):
+            svc.get_signing_key(URL, "KID")
+
+    def test_get_signing_key_uses_expired_key_sets_if_they_cant_be_downloaded(
+        self, svc, http_service, jwk_set, frozen_time
+    ):
+        jwk_set.expires_at = NOW
+        http_service.get.side_effect = ExternalRequestError
+
+        assert svc.get_signing_key(URL, "KID").key_id == "KID"
+        # It doesn't try again straight away
+        frozen_time.tick(JWKSetService.REFETCH_INTERVAL - timedelta(seconds=1))
+        assert svc.get_signing_key(URL, "KID").key_id == "KID"
+        http_service.get.assert_called_once()
+
+    def test_refresh_updates_the_stored_key_set(
+        self, svc, http_service, jwk_set, db_session
+    ):
+        http_service.get.return_value = self.response(self.key_set("NEW_KID"))
+
+        svc.refresh(URL)
+
+        db_session.refresh(jwk_set)
+        assert jwk_set.keys == self.key_set("NEW_KID")
+        assert jwk_set.fetched_at == NOW
+
+    @pytest.mark.parametrize(
+        "cache_control,max_age",
+        (
+            (None, JWKSetService.DEFAULT_MAX_AGE),
+            ("max-age=abc", JWKSetService.DEFAULT_MAX_AGE),
+            ("public, max-age=600", timedelta(minutes=10)),
+            ('max-age="900"', timedelta(minutes=15)),
+            ("max-age=1", JWKSetService.MIN_MAX_AGE),
+            ("max-age=999999", JWKSetService.MAX_MAX_AGE),
+            ("no-cache, max-age=600", JWKSetService.MIN_MAX_AGE),
+            ("No-Store", JWKSetService.MIN_MAX_AGE),
+        ),
+    )
+    def test_refresh_honors_cache_control(
+        self, svc, http_service, cache_control, max_age
+    ):
+        headers = {"Cache-Control": cache_control} if cache_control else {}
+        http_service.get.return_value = self.response(self.key_set("KID"), headers)
+
+        assert svc.refresh(URL).expires_at == NOW + max_age
+
+    @pytest.mark.parametrize(
+        "json_data", ("NOT AN OBJECT", {}, {"keys": ["NOT AN OBJECT"]})
+    )
+    def test_refresh_raises_for_invalid_key_sets(self, svc, http_service, json_data):
+        http_service.get.return_value = self.response(json_data)
+
+        with pytest.raises(ExternalRequestError):
+            svc.refresh(URL)
+
+    def test_refresh_raises_for_non_json_responses(self, svc, http_service):
+        http_service.get.return_value = factories.requests.Response(
+            status_code=200, raw="NOT JSON"
+        )
+
+        with pytest.raises(ExternalRequestError):
+            svc.refresh(URL)
+
+    def test_get_stale_urls(self, svc, db_session):
+        for key_set_url in ["MISSING", "STALE", "STALE", "FRESH"]:
+            factories.LTIRegistration(key_set_url=key_set_url)
+        for key_set_url, expires_at in [
+            ("STALE", NOW + timedelta(minutes=5)),
+            ("FRESH", NOW + timedelta(minutes=20)),
+            ("NO_REGISTRATION", NOW),
+        ]:
+            db_session.add(
+                JWKSet(url=key_set_url, keys={}, fetched_at=NOW, expires_at=expires_at)
+            )
+        db_session.flush()
+
+        urls = svc.get_stale_urls(within=timedelta(minutes=10))
+
+        assert sorted(urls) == ["MISSING", "STALE"]
+
+    @classmethod
+    def key_set(cls, *kids):
+        return {"keys": [dict(PUBLIC_JWK, kid=kid) for kid in kids]}
+
+    @classmethod
+    def response(cls, json_data, headers=None):
+        return factories.requests.Response(
+            status_code=200,
+            json_data=json_data,
+            headers={"Cache-Control": "max-age=600"} if headers is None else headers,
+        )
+
+    @pytest.fixture(autouse=True)
+    def frozen_time(self):
+        with freeze_time(NOW) as frozen_time:
+            yield frozen_time
+
+    @pytest.fixture
+    def jwk_set(self, db_session):
+        jwk_set = JWKSet(
+            url=URL,
+            keys=self.key_set("KID"),
+            fetched_at=NOW - timedelta(minutes=10),
+            expires_at=NOW + timedelta(hours=1),
+        )
+        db_session.add(jwk_set)
+        db_session.flush()
+        return jwk_set
+
+    @pytest.fixture
+    def http_service(self, http_service):
+        http_service.get.return_value = self.response(self.key_set("KID"))
+        return http_service
+
+    @pytest.fixture
+    def svc(self, db_session, http_service):
+        return JWKSetService(db_session, http_service, cache=JWKSetCache())
+
+
+class TestJWKSetCache:
+    def test_clear(self):
+        cache = JWKSetCache()
+        cache.set(URL, sentinel.key_set)
+
+        cache.clear()
+
+        assert not cache.get(URL)
+
+
+class TestFactory:
+    def test_it(self, pyramid_request, http_service, JWKSetService):
+        svc = factory(sentinel.context, pyramid_request)
+
+        JWKSetService.assert_called_once_with(
+            db=pyramid_request.db, http_service=http_service
+        )
+        assert svc == JWKSetService.return_value
+
+    @pytest.fixture
+    def JWKSetService(self, patch):
+        return patch("lms.services.jwk_set.JWKSetService")
+
+
+PUBLIC_JWK = RSAAlgorithm.to_jwk(
+    rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key(),
+    as_dict=True,
+)
@@ -1,10 +1,15 @@
 from datetime import datetime, timedelta
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 import pytest
 from freezegun import freeze_time
 
-from lms.services.jwt_oauth2_token import JWTOAuth2TokenService, factory
+from lms.services.jwt_oauth2_token import (
+    AccessTokenCache,
+    CachedToken,
+    JWTOAuth2TokenService,
+    factory,
+)
 from tests import factories
 
 
@@ -80,6 +85,70 @@ class TestJWTOAuth2TokenServiceTest:
 
         assert token == expired_token
 
+    @freeze_time("2022-04-04")
+    def test_get_cached_token_after_save(self, svc, lti_registration, scopes):
+        svc.save_token(lti_registration, scopes, "ACCESS_TOKEN", 3600)
+
+        with patch.object(svc, "get_token") as get_token:
+            token = svc.get_cached_token(
+                lti_registration, list(reversed(scopes)), timedelta(minutes=5)
+            )
+
+        get_token.assert_not_called()
+        assert token == CachedToken(
+            access_token="ACCESS_TOKEN",  # noqa: S106
+            received_at=datetime(2022, 4, 4),  # noqa: DTZ001
+            expires_at=datetime(2022, 4, 4, 1),  # noqa: DTZ001
+        )
+
+    @freeze_time("2022-04-04")
+    def test_get_cached_token_from_db(
+        self, svc, lti_registration, db_session, scopes, cache
+    ):
+        existing_token = factories.JWTOAuth2Token(
+            lti_registration=lti_registration,
+            scopes=" ".join(scopes),
+            expires_at=datetime.now() + timedelta(hours=1),  # noqa: DTZ005
+        )
+        db_session.flush()
+
+        token = svc.get_cached_token(lti_registration, scopes, timedelta(minutes=5))
+
+        assert token.access_token == existing_token.access_token
+        assert cache.get(lti_registration.id, "SCOPE_1 SCOPE_2", timedelta(0)) == token
+
+    @freeze_time("2022-04-04")
+    def test_get_cached_token_none_in_db(self, svc, lti_registration, scopes):
+        assert not svc.get_cached_token(lti_registration, scopes, timedelta(0))
+
+    def test_get_cached_token_about_to_expire(self, svc, lti_registration, scopes):
+        # Tokens from the DB are timed with the DB's clock, use the real time
+        now = datetime.now()  # noqa: DTZ005
+        with freeze_time(now) as frozen_time:
+            svc.save_token(lti_registration, scopes, "ACCESS_TOKEN", 3600)
+            frozen_time.move_to(now + timedelta(minutes=56))
+
+            assert not svc.get_cached_token(
+                lti_registration, scopes, timedelta(minutes=5)
+            )
+
+    @pytest.mark.parametrize(
+        "seconds_later,returned",
+        # Short lived tokens are returned for half their lifetime
+        ((50, True), (70, False)),
+    )
+    def test_get_cached_token_short_lived(
+        self, svc, lti_registration, scopes, seconds_later, returned
+    ):
+        now = datetime.now()  # noqa: DTZ005
+        with freeze_time(now) as frozen_time:
+            svc.save_token(lti_registration, scopes, "ACCESS_TOKEN", 120)
+            frozen_time.move_to(now + timedelta(seconds=seconds_later))
+
+            token = svc.get_cached_token(lti_registration, scopes, timedelta(minutes=5))
+
+        assert bool(token) == returned
+
     @pytest.fixture
     def scopes(self):
         return ["SCOPE_1", "SCOPE_2"]
@@ -90,8 +159,33 @@ class TestJWTOAuth2TokenServiceTest:
         factories.JWTOAuth2Token.build_batch(3)
 
     @pytest.fixture
-    def svc(self, db_session):
-        return JWTOAuth2TokenService(db_session)
+    def cache(self):
+        return AccessTokenCache()
+
+    @pytest.fixture
+    def svc(self, db_session, cache):
+        return JWTOAuth2TokenService(db_session, cache=cache)
+
+
+class TestAccessTokenCache:
+    def test_get_missing(self, cache):
+        assert not cache.get(1, "SCOPE", timedelta(0))
+
+    @freeze_time("2022-04-04")
+    def test_set_evicts_expired_tokens(self, cache):
+        now = datetime.now()  # noqa: DTZ005
+        expired = CachedToken("EXPIRED", now, now - timedelta(seconds=1))
+        valid = CachedToken("VALID", now, now + timedelta(hours=1))
+        cache.set(1, "SCOPE", expired)
+        cache.set(2, "SCOPE", valid)
+
+        cache.set(3, "SCOPE", valid)
+
+        assert cache._tokens == {(2, "SCOPE"): valid, (3, "SCOPE"): valid}  # noqa: SLF001
+
+    @pytest.fixture
+    def cache(self):
+        return AccessTokenCache()
 
 
 class TestFactory:
@@ -10,13 +10,7 @@ from pyramid.config import Configurator
 from pytest import param  # noqa: PT013
 
 from lms.services.exceptions import ExpiredJWTError, InvalidJWTError
-from lms.services.jwt import (
-    JWTService,
-    _get_lti_jwt,
-    _RequestsPyJWKClient,
-    factory,
-    includeme,
-)
+from lms.services.jwt import JWTService, _get_lti_jwt, factory, includeme
 from lms.validation import ValidationError
 from tests import factories
 
@@ -73,36 +67,33 @@ class TestJWTService:
 
         encoded_jwt = svc.encode_with_private_key(payload)
 
-        rsa_key_service.get_random_key.assert_called_once_with()
+        rsa_key_service.get_signing_key.assert_called_once_with()
         jwt.encode.assert_called_once_with(
             payload,
-            rsa_key_service.private_key.return_value,
+            rsa_key_service.get_signing_key.return_value.private_key,
             algorithm="RS256",
-            headers={"kid": rsa_key_service.get_random_key.return_value.kid},
+            headers={"kid": rsa_key_service.get_signing_key.return_value.kid},
         )
         assert encoded_jwt == jwt.encode.return_value
 
     def test_decode_lti_token(
-        self,
-        svc,
-        jwt,
-        _RequestsPyJWKClient,  # noqa: PT019
-        lti_registration_service,
+        self, svc, jwt, jwk_set_service, lti_registration_service
     ):
         registration = factories.LTIRegistration(key_set_url="http://jwk.com")
         lti_registration_service.get.return_value = registration
+        jwt.get_unverified_header.return_value = {"kid": "KID"}
         jwt.decode.return_value = {"aud": "AUD", "iss": "ISS"}
 
         payload = svc.decode_lti_token(sentinel.id_token)
 
         jwt.get_unverified_header.assert_called_once_with(sentinel.id_token)
         lti_registration_service.get.assert_called_once_with("ISS", "AUD")
-        _RequestsPyJWKClient.assert_called_once_with(
-            lti_registration_service.get.return_value.key_set_url, cache_keys=True
+        jwk_set_service.get_signing_key.assert_called_once_with(
+            registration.key_set_url, "KID"
         )
         jwt.decode.assert_called_with(
             sentinel.id_token,
-            key=_RequestsPyJWKClient.return_value.get_signing_key_from_jwt.return_value.key,
+            key=jwk_set_service.get_signing_key.return_value.key,
             audience="AUD",
             algorithms=["RS256"],
             leeway=JWTService.LEEWAY,
@@ -168,40 +159,26 @@ class TestJWTService:
         return patch("lms.services.jwt.jwt")
 
     @pytest.fixture
-    def _RequestsPyJWKClient(self, patch):
-        return patch("lms.services.jwt._RequestsPyJWKClient")
-
-    @pytest.fixture
-    def svc(self, lti_registration_service, rsa_key_service):
-        svc = JWTService(lti_registration_service, rsa_key_service)
-        # Clear the lru_cache to make tests independent
-        svc._get_jwk_client.cache_clear()  # noqa: SLF001
-        return svc
-
-
-class Test_RequestsPyJWKClient:
-    def test_fetch_data(self, requests):
-        keys = _RequestsPyJWKClient(sentinel.url).fetch_data()
-
-        requests.get.assert_called_once_with(
-            sentinel.url, headers={"User-Agent": "requests"}, timeout=(10, 10)
-        )
-        assert (
-            keys == requests.get.return_value.__enter__.return_value.json.return_value
-        )
-
-    @pytest.fixture
-    def requests(self, patch):
-        return patch("lms.services.jwt.requests")
+    def svc(self, lti_registration_service, rsa_key_service, jwk_set_service):
+        return JWTService(lti_registration_service, rsa_key_service, jwk_set_service)
 
 
 class TestFactory:
     def test_it(
-        self, pyramid_request, JWTService, lti_registration_service, rsa_key_service
+        self,
+        pyramid_request,
+        JWTService,
+        lti_registration_service,
+        rsa_key_service,
+        jwk_set_service,
     ):
         jwt_service = factory(sentinel.context, pyramid_request)
 
-        JWTService.assert_called_once_with(lti_registration_service, rsa_key_service)
+        JWTService.assert_called_once_with(
+            registration_service=lti_registration_service,
+            rsa_key_service=rsa_key_service,
+            jwk_set_service=jwk_set_service,
+        )
         assert jwt_service == JWTService.return_value
 
     @pytest.fixture
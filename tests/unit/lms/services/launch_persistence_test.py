@@ -0,0 +1,308 @@
+from datetime import timedelta
+from unittest.mock import sentinel
+
+import pytest
+from h_matchers import Any
+from sqlalchemy import func, select
+
+from lms.models import (
+    AssignmentGrouping,
+    AssignmentMembership,
+    GroupingMembership,
+    LMSCourseMembership,
+    LMSUser,
+    LMSUserApplicationInstance,
+    LMSUserAssignmentMembership,
+    LTIParams,
+)
+from lms.services.launch_persistence import LaunchPersistenceService, factory
+from lms.services.touch import TouchThrottle
+from tests import factories
+
+
+class TestLaunchPersistenceService:
+    def test_record_course_launch(
+        self,
+        svc,
+        user,
+        course,
+        lms_course,
+        lti_roles,
+        lti_params,
+        query_profile,
+        rows,
+        get_lms_user,
+    ):
+        lti_params.v13 = {"sub": "LTI_V13_USER_ID"}
+
+        with query_profile() as profile:
+            svc.record_course_launch(user, lti_params, course, lti_roles)
+
+        assert profile.count == 1
+        lms_user = get_lms_user(user)
+        assert lms_user.lti_v13_user_id == "LTI_V13_USER_ID"
+        assert lms_user.given_name == "GIVEN_NAME"
+        assert rows(LMSUserApplicationInstance) == [
+            Any.object.with_attrs(
+                {
+                    "application_instance_id": user.application_instance_id,
+                    "lms_user_id": lms_user.id,
+                }
+            )
+        ]
+        assert rows(GroupingMembership) == [
+            Any.object.with_attrs({"grouping_id": course.id, "user_id": user.id})
+        ]
+        assert (
+            rows(LMSCourseMembership)
+            == Any.list.containing(
+                [
+                    Any.object.with_attrs(
+                        {
+                            "lms_course_id": lms_course.id,
+                            "lms_user_id": lms_user.id,
+                            "lti_role_id": lti_role.id,
+                        }
+                    )
+                    for lti_role in lti_roles
+                ]
+            ).only()
+        )
+
+    @pytest.mark.usefixtures("lms_course")
+    def test_record_course_launch_updates_the_lms_user(
+        self, svc, user, course, lti_roles, lti_params, db_session
+    ):
+        lms_user = factories.LMSUser(
+            h_userid=user.h_userid, lti_v13_user_id="OLD_LTI_V13_USER_ID"
+        )
+        db_session.flush()
+
+        svc.record_course_launch(user, lti_params, course, lti_roles)
+
+        db_session.refresh(lms_user)
+        assert lms_user.given_name == "GIVEN_NAME"
+        # Values the launch doesn't have are kept
+        assert lms_user.lti_v13_user_id == "OLD_LTI_V13_USER_ID"
+
+    @pytest.mark.usefixtures("lms_course")
+    def test_record_course_launch_with_an_unchanged_lms_user(
+        self, svc, user, course, lti_roles, lti_params, rows, get_lms_user
+    ):
+        svc.record_course_launch(user, lti_params, course, lti_roles)
+        lms_user = get_lms_user(user)
+        svc.record_course_launch(user, lti_params, course, [lti_roles[0]])
+
+        # The existing LMSUser is linked, even though it isn't updated
+        assert {row.lms_user_id for row in rows(LMSCourseMembership)} == {lms_user.id}
+
+    @pytest.mark.usefixtures("lms_course")
+    @pytest.mark.parametrize(
+        "interval,age,touched",
+        (
+            (3600, timedelta(minutes=5), False),
+            (3600, timedelta(hours=2), True),
+            # Without throttling memberships are touched on every launch
+            (0, timedelta(minutes=5), True),
+        ),
+    )
+    def test_record_course_launch_throttles_touching_memberships(
+        self, user, course, lti_roles, lti_params, db_session, interval, age, touched
+    ):
+        now = db_session.scalar(select(func.now())).replace(tzinfo=None)
+        membership = factories.GroupingMembership(
+            grouping=course, user=user, updated=now - age
+        )
+        db_session.flush()
+        svc = LaunchPersistenceService(db_session, TouchThrottle(interval))
+
+        svc.record_course_launch(user, lti_params, course, lti_roles)
+
+        db_session.refresh(membership)
+        assert membership.updated == (now if touched else now - age)
+
+    def test_record_course_launch_without_roles(
+        self, svc, user, course, lti_params, rows, get_lms_user
+    ):
+        svc.record_course_launch(user, lti_params, course, [])
+
+        assert get_lms_user(user)
+        assert not rows(LMSCourseMembership)
+
+    @pytest.mark.parametrize("with_lti11_grading_id", [True, False])
+    def test_record_assignment_launch(
+        self,
+        svc,
+        user,
+        lms_user,
+        assignment,
+        course,
+        lti_roles,
+        lti_params,
+        with_lti11_grading_id,
+        query_profile,
+        rows,
+        db_session,
+    ):
+        # One existing row
+        factories.AssignmentMembership(
+            assignment=assignment, user=user, lti_role=lti_roles[0]
+        )
+        if with_lti11_grading_id:
+            lti_params["lis_result_sourcedid"] = "SOURCEDID"
+        groupings = [course, factories.CanvasSection(parent=course)]
+        db_session.flush()
+
+        with query_profile() as profile:
+            svc.record_assignment_launch(
+                user, lti_params, assignment, groupings, lti_roles
+            )
+
+        assert profile.count == 1
+        assert (
+            rows(AssignmentMembership)
+            == Any.list.containing(
+                [
+                    Any.object.with_attrs(
+                        {"user": user, "assignment": assignment, "lti_role": lti_role}
+                    )
+                    for lti_role in lti_roles
+                ]
+            ).only()
+        )
+        assert (
+            rows(LMSUserAssignmentMembership)
+            == Any.list.containing(
+                [
+                    Any.object.with_attrs(
+                        {
+                            "lms_user": lms_user,
+                            "assignment": assignment,
+                            "lti_role": lti_role,
+                            "lti_v11_lis_result_sourcedid": "SOURCEDID"
+                            if with_lti11_grading_id
+                            else None,
+                        }
+                    )
+                    for lti_role in lti_roles
+                ]
+            ).only()
+        )
+        assert (
+            rows(AssignmentGrouping)
+            == Any.list.containing(
+                [
+                    Any.object.with_attrs(
+                        {"assignment": assignment, "grouping": grouping}
+                    )
+                    for grouping in groupings
+                ]
+            ).only()
+        )
+
+    def test_record_assignment_launch_doesnt_clear_sourcedid(
+        self, svc, user, lms_user, assignment, lti_roles, lti_params, rows
+    ):
+        for lti_role in lti_roles:
+            factories.LMSUserAssignmentMembership(
+                assignment=assignment,
+                lms_user=lms_user,
+                lti_role=lti_role,
+                lti_v11_lis_result_sourcedid="EXISTING",
+            )
+
+        svc.record_assignment_launch(user, lti_params, assignment, [], lti_roles)
+
+        for membership in rows(LMSUserAssignmentMembership):
+            assert membership.lti_v11_lis_result_sourcedid == "EXISTING"
+
+    def test_record_assignment_launch_ignores_the_sourcedid_in_lti_13(
+        self, svc, user, lms_user, assignment, lti_roles, lti_params, rows
+    ):
+        lti_params["lis_result_sourcedid"] = "SOURCEDID"
+        lti_params.v13 = {"sub": "LTI_V13_USER_ID"}
+
+        svc.record_assignment_launch(user, lti_params, assignment, [], lti_roles)
+
+        assert rows(LMSUserAssignmentMembership) == Any.list.containing(
+            [
+                Any.object.with_attrs(
+                    {"lms_user": lms_user, "lti_v11_lis_result_sourcedid": None}
+                )
+            ]
+        )
+
+    @pytest.fixture
+    def rows(self, db_session):
+        def rows(model_class):
+            db_session.expire_all()
+            return db_session.scalars(select(model_class)).all()
+
+        return rows
+
+    @pytest.fixture
+    def get_lms_user(self, db_session):
+        def get_lms_user(user):
+            return db_session.scalars(
+                select(LMSUser).where(LMSUser.h_userid == user.h_userid)
+            ).one()
+
+        return get_lms_user
+
+    @pytest.fixture
+    def user(self, db_session):
+        user = factories.User(display_name="DISPLAY_NAME")
+        db_session.flush()
+        return user
+
+    @pytest.fixture
+    def lms_user(self, user, db_session):
+        lms_user = factories.LMSUser(h_userid=user.h_userid)
+        db_session.flush()
+        return lms_user
+
+    @pytest.fixture
+    def course(self, db_session):
+        course = factories.Course()
+        db_session.flush()
+        return course
+
+    @pytest.fixture
+    def lms_course(self, course, db_session):
+        lms_course = factories.LMSCourse(
+            h_authority_provided_id=course.authority_provided_id
+        )
+        db_session.flush()
+        return lms_course
+
+    @pytest.fixture
+    def assignment(self, db_session):
+        assignment = factories.Assignment()
+        db_session.flush()
+        return assignment
+
+    @pytest.fixture
+    def lti_roles(self, db_session):
+        lti_roles = factories.LTIRole.create_batch(3)
+        db_session.flush()
+        return lti_roles
+
+    @pytest.fixture
+    def lti_params(self):
+        return LTIParams(v11={"lis_person_name_given": "GIVEN_NAME"})
+
+    @pytest.fixture
+    def svc(self, db_session):
+        return LaunchPersistenceService(db_session, TouchThrottle())
+
+
+class TestFactory:
+    def test_it(self, pyramid_request, LaunchPersistenceService):
+        svc = factory(sentinel.context, pyramid_request)
+
+        LaunchPersistenceService.assert_called_once_with(db=pyramid_request.db)
+        assert svc == LaunchPersistenceService.return_value
+
+    @pytest.fixture
+    def LaunchPersistenceService(self, patch):
+        return patch("lms.services.launch_persistence.LaunchPersistenceService")
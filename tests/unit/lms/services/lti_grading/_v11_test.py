@@ -1,4 +1,4 @@
-from unittest.mock import Mock, sentinel
+from unittest.mock import Mock, call, patch, sentinel
 
 import pytest
 import xmltodict
@@ -107,6 +107,39 @@ class TestLTI11GradingService:
             }
         }
 
+    def test_sync_grades(self, svc, application_instance):
+        error = ValueError()
+        assignment = factories.Assignment()
+        lms_users = factories.LMSUser.create_batch(2)
+
+        with patch.object(svc, "sync_grade", side_effect=[None, error]) as sync_grade:
+            results = svc.sync_grades(
+                application_instance,
+                assignment,
+                sentinel.timestamp,
+                [(lms_users[0], 0.5), (lms_users[1], 1)],
+            )
+
+        sync_grade.assert_has_calls(
+            [
+                call(
+                    application_instance,
+                    assignment,
+                    sentinel.timestamp,
+                    lms_users[0],
+                    0.5,
+                ),
+                call(
+                    application_instance,
+                    assignment,
+                    sentinel.timestamp,
+                    lms_users[1],
+                    1,
+                ),
+            ]
+        )
+        assert results == [None, error]
+
     @pytest.mark.usefixtures("with_response")
     def test_record_result_calls_hook(self, svc, http_service):
         my_hook = Mock(return_value={"my_dict": 1})
@@ -193,9 +193,55 @@ class TestLTI13GradingService:
             scopes=svc.LTIA_SCOPES,
             json=payload,
             headers={"Content-Type": "application/vnd.ims.lis.v1.score+json"},
+            access_token=None,
         )
         assert response == ltia_http_service.request.return_value
 
+    def test_sync_grades(
+        self, svc, ltia_http_service, lti_v13_application_instance, assignment
+    ):
+        lms_users = [factories.LMSUser(lti_v13_user_id=f"USER_{i}") for i in range(3)]
+        error = ExternalRequestError()
+        ltia_http_service.request.side_effect = [None, error, None]
+        svc.SYNC_GRADES_MAX_WORKERS = 1
+
+        results = svc.sync_grades(
+            lti_v13_application_instance,
+            assignment,
+            datetime(2022, 4, 4).isoformat(),  # noqa: DTZ001
+            [(lms_user, 0.5) for lms_user in lms_users],
+        )
+
+        ltia_http_service.get_access_token.assert_called_once_with(
+            lti_v13_application_instance.lti_registration, svc.LTIA_SCOPES
+        )
+        assert results == [None, error, None]
+        for request_call, lms_user in zip(
+            ltia_http_service.request.call_args_list, lms_users, strict=True
+        ):
+            assert request_call.kwargs["json"]["userId"] == lms_user.lti_v13_user_id
+            assert (
+                request_call.kwargs["access_token"]
+                == ltia_http_service.get_access_token.return_value
+            )
+
+    def test_sync_grades_without_an_access_token(
+        self, svc, ltia_http_service, lti_v13_application_instance, assignment
+    ):
+        lms_users = [factories.LMSUser(lti_v13_user_id=f"USER_{i}") for i in range(2)]
+        error = ExternalRequestError()
+        ltia_http_service.get_access_token.side_effect = error
+
+        results = svc.sync_grades(
+            lti_v13_application_instance,
+            assignment,
+            datetime(2022, 4, 4).isoformat(),  # noqa: DTZ001
+            [(lms_user, 0.5) for lms_user in lms_users],
+        )
+
+        assert results == [error, error]
+        ltia_http_service.request.assert_not_called()
+
     @freeze_time("2022-04-04")
     @pytest.mark.parametrize("comment", [sentinel.comment, None])
     def test_record_result(
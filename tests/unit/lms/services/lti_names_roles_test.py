@@ -8,6 +8,9 @@ from lms.services.lti_names_roles import LTINamesRolesService, factory
 class TestLTINameRolesServices:
     def test_get_context_memberships(self, svc, ltia_http_service, lti_registration):
         ltia_http_service.request.return_value.links = {}
+        ltia_http_service.request.return_value.json.return_value = {
+            "members": [sentinel.member]
+        }
         service_url = "http://example.com"
 
         memberships = svc.get_context_memberships(lti_registration, service_url)
@@ -20,12 +23,10 @@ class TestLTINameRolesServices:
             headers={
                 "Accept": "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
             },
+            access_token=ltia_http_service.get_access_token.return_value,
             params={"limit": 100},
         )
-        assert (
-            memberships
-            == ltia_http_service.request.return_value.json.return_value["members"]
-        )
+        assert memberships == [sentinel.member]
 
     def test_get_context_memberships_multiple_pages(
         self, svc, ltia_http_service, lti_registration
@@ -55,6 +56,7 @@ class TestLTINameRolesServices:
                     headers={
                         "Accept": "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
                     },
+                    access_token=ltia_http_service.get_access_token.return_value,
                     params={"limit": 100},
                 ),
                 call(
@@ -65,11 +67,81 @@ class TestLTINameRolesServices:
                     headers={
                         "Accept": "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
                     },
+                    access_token=ltia_http_service.get_access_token.return_value,
                     params={"limit": 100},
                 ),
             ]
         )
         assert memberships == [sentinel.member_1, sentinel.member_2]
+        ltia_http_service.get_access_token.assert_called_once_with(
+            lti_registration, LTINamesRolesService.LTIA_SCOPES
+        )
+
+    @pytest.mark.parametrize("max_pages,expected_pages", [(None, 3), (1, 2), (0, 1)])
+    def test_get_context_membership_pages(
+        self,
+        svc,
+        ltia_http_service,
+        lti_registration,
+        max_pages,
+        expected_pages,
+        caplog,
+    ):
+        ltia_http_service.request.side_effect = [
+            Mock(
+                links={"next": {"url": "http://example.com?page=2"}},
+                json=Mock(return_value={"members": [sentinel.member_1]}),
+            ),
+            Mock(
+                links={"next": {"url": "http://example.com?page=3"}},
+                json=Mock(return_value={"members": [sentinel.member_2]}),
+            ),
+            Mock(links={}, json=Mock(return_value={"members": [sentinel.member_3]})),
+        ]
+
+        pages = svc.get_context_membership_pages(
+            lti_registration, "http://example.com", max_pages=max_pages
+        )
+
+        assert (
+            list(pages)
+            == [
+                [sentinel.member_1],
+                [sentinel.member_2],
+                [sentinel.member_3],
+            ][:expected_pages]
+        )
+        assert ltia_http_service.request.call_count == expected_pages
+        if expected_pages < 3:
+            assert "Stopped fetching members" in caplog.text
+
+    def test_get_context_membership_pages_requests_the_first_page_eagerly(
+        self, svc, ltia_http_service, lti_registration
+    ):
+        ltia_http_service.request.return_value.links = {}
+
+        svc.get_context_membership_pages(lti_registration, "http://example.com")
+
+        ltia_http_service.request.assert_called_once()
+
+    def test_get_context_membership_pages_prefetches_the_next_page(
+        self, svc, ltia_http_service, lti_registration
+    ):
+        ltia_http_service.request.side_effect = [
+            Mock(
+                links={"next": {"url": "http://example.com?page=2"}},
+                json=Mock(return_value={"members": [sentinel.member_1]}),
+            ),
+            Mock(links={}, json=Mock(return_value={"members": [sentinel.member_2]})),
+        ]
+        pages = svc.get_context_membership_pages(lti_registration, "http://example.com")
+
+        first_page = next(pages)
+
+        # The second request is sent before the first page is processed.
+        assert ltia_http_service.request.call_count == 2
+        assert first_page == [sentinel.member_1]
+        assert list(pages) == [[sentinel.member_2]]
 
     @pytest.mark.parametrize(
         "service_url", ["http://example.com", "http://example.com?rlid=123"]
@@ -78,6 +150,9 @@ class TestLTINameRolesServices:
         self, svc, ltia_http_service, lti_registration, service_url
     ):
         ltia_http_service.request.return_value.links = {}
+        ltia_http_service.request.return_value.json.return_value = {
+            "members": [sentinel.member]
+        }
         query_params = {"limit": 100}
         if "rlid" not in service_url:
             query_params["rlid"] = "123"
@@ -92,12 +167,10 @@ class TestLTINameRolesServices:
             headers={
                 "Accept": "application/vnd.ims.lti-nrps.v2.membershipcontainer+json"
             },
+            access_token=ltia_http_service.get_access_token.return_value,
             params=query_params,
         )
-        assert (
-            memberships
-            == ltia_http_service.request.return_value.json.return_value["members"]
-        )
+        assert memberships == [sentinel.member]
 
     @pytest.fixture
     def svc(self, ltia_http_service):
@@ -4,6 +4,7 @@ import pytest
 
 from lms.models import LTIRegistration
 from lms.services.lti_registration import LTIRegistrationService, factory
+from lms.services.tenant_cache import TenantCache
 from tests import factories
 
 
@@ -18,6 +19,28 @@ class TestLTIRegistrationService:
     def test_get_without_client_id(self, svc, registration):
         assert svc.get(registration.issuer) == registration
 
+    def test_get_is_cached(self, svc, registration, db_session, query_profile):
+        issuer, client_id = registration.issuer, registration.client_id
+        svc.get(issuer, client_id)
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            assert svc.get(issuer, client_id).issuer == issuer
+
+        assert not profile.count
+
+    def test_invalidate_cache(self, svc, registration, db_session, query_profile):
+        svc.get(registration.issuer, registration.client_id)
+
+        issuer, client_id = registration.issuer, registration.client_id
+        svc.invalidate_cache(registration)
+        db_session.commit()
+
+        db_session.expunge_all()
+        with query_profile() as profile:
+            svc.get(issuer, client_id)
+        assert profile.count == 1
+
     def test_create(self, svc, db_session):
         registration = svc.create_registration(
             "ISSUER", "CLIENT_ID", "AUTH_LOGIN_URL", "KEY_SET_URL", "TOKEN_URL"
@@ -66,7 +89,7 @@ class TestLTIRegistrationService:
 
     @pytest.fixture
     def svc(self, db_session):
-        return LTIRegistrationService(db_session)
+        return LTIRegistrationService(db_session, cache=TenantCache())
 
 
 class TestFactory:
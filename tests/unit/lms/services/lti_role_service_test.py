@@ -5,7 +5,13 @@ import pytest
 from h_matchers import Any
 
 from lms.models.lti_role import LTIRole, LTIRoleOverride, RoleScope, RoleType
-from lms.services.lti_role_service import LTIRoleService, Role, service_factory
+from lms.services.lti_role_service import (
+    LTIRoleCache,
+    LTIRoleService,
+    Role,
+    configure_lti_role_cache,
+    service_factory,
+)
 from tests import factories
 
 
@@ -52,6 +58,98 @@ class TestLTIRoleService:
         assert roles[0].type == RoleType.INSTRUCTOR
         assert roles[0].scope == RoleScope.COURSE
 
+    def test_get_roles_is_cached(self, svc, existing_roles, db_session, query_profile):
+        values = [role.value for role in existing_roles]
+        db_session.flush()
+        expected = [
+            (role.id, role.value, role.type, role.scope) for role in existing_roles
+        ]
+        svc.get_roles(values)
+        db_session.commit()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            roles = svc.get_roles(values)
+
+            assert [
+                (role.id, role.value, role.type, role.scope) for role in roles
+            ] == expected
+            assert all(role in db_session for role in roles)
+
+        assert not profile.count
+
+    def test_get_roles_doesnt_cache_new_roles(self, svc, cache, db_session):
+        svc.get_roles("Instructor")
+        db_session.commit()
+
+        assert not cache.get_roles(["Instructor"])
+
+    def test_get_roles_doesnt_cache_roles_before_commit(self, svc, cache, db_session):
+        factories.LTIRole(_value="Instructor")
+        db_session.flush()
+
+        svc.get_roles("Instructor")
+
+        assert not cache.get_roles(["Instructor"])
+        # The transaction that loaded them can still use them
+        assert cache.get_roles(["Instructor"], db_session)
+        assert not LTIRoleCache().get_roles(["Instructor"], db_session)
+
+    def test_get_roles_reuses_the_roles_loaded_by_the_transaction(
+        self, svc, query_profile
+    ):
+        svc.get_roles("Instructor")
+        svc.get_roles("Instructor")
+
+        with query_profile() as profile:
+            roles = svc.get_roles("Instructor")
+
+        assert [role.value for role in roles] == ["Instructor"]
+        assert not profile.count
+
+    def test_get_roles_caches_updated_roles_once_committed(
+        self, svc, cache, db_session
+    ):
+        factories.LTIRole(
+            _value="Instructor", type=RoleType.ADMIN, scope=RoleScope.SYSTEM
+        )
+
+        svc.get_roles("Instructor")
+        db_session.commit()
+
+        assert cache.get_roles(["Instructor"]) == {
+            "Instructor": Any.dict.containing(
+                {"type": RoleType.INSTRUCTOR, "scope": RoleScope.COURSE}
+            )
+        }
+
+    def test_get_roles_doesnt_cache_roles_when_releasing_a_savepoint(
+        self, svc, cache, db_session
+    ):
+        with db_session.begin_nested():
+            # A role created in the savepoint is autoflushed and loaded
+            svc.get_roles("Instructor")
+            svc.get_roles("Instructor")
+
+        assert not cache.get_roles(["Instructor"])
+        db_session.rollback()
+        db_session.commit()
+        assert not cache.get_roles(["Instructor"])
+
+    @pytest.mark.parametrize("savepoint", [True, False])
+    def test_get_roles_doesnt_cache_rolled_back_roles(
+        self, svc, cache, db_session, savepoint
+    ):
+        transaction = db_session.begin_nested() if savepoint else db_session
+        # A role created in this transaction is autoflushed and loaded
+        svc.get_roles("Instructor")
+        svc.get_roles("Instructor")
+
+        transaction.rollback()
+        db_session.commit()
+
+        assert not cache.get_roles(["Instructor"])
+
     def test_get_roles_for_application_instance_no_overrides(
         self, svc, existing_roles, application_instance
     ):
@@ -87,6 +185,86 @@ class TestLTIRoleService:
             for role in existing_roles[1:]
         ]
 
+    def test_get_roles_for_application_instance_with_overrides_elsewhere(
+        self, svc, existing_roles, application_instance
+    ):
+        factories.LTIRoleOverride(
+            lti_role=existing_roles[0],
+            application_instance=factories.ApplicationInstance(),
+            type=RoleType.ADMIN,
+        )
+
+        roles = svc.get_roles_for_application_instance(
+            application_instance, existing_roles
+        )
+
+        assert roles == [
+            Role(scope=role.scope, type=role.type, value=role.value)
+            for role in existing_roles
+        ]
+
+    def test_get_roles_for_application_instance_with_overrides_without_scope(
+        self, svc, existing_roles, application_instance
+    ):
+        factories.LTIRoleOverride(
+            lti_role=existing_roles[0],
+            application_instance=application_instance,
+            type=RoleType.ADMIN,
+            scope=None,
+        )
+
+        roles = svc.get_roles_for_application_instance(
+            application_instance, existing_roles
+        )
+
+        assert roles[0].type == RoleType.ADMIN
+        assert roles[0].scope == existing_roles[0].scope
+
+    def test_get_roles_for_application_instance_caches_the_overrides(
+        self,
+        svc,
+        existing_overrides,
+        existing_roles,
+        application_instance,
+        query_profile,
+    ):
+        expected = svc.get_roles_for_application_instance(
+            application_instance, existing_roles
+        )
+
+        with query_profile() as profile:
+            roles = svc.get_roles_for_application_instance(
+                application_instance, existing_roles
+            )
+
+        assert roles == expected
+        assert [role.type for role in roles] == [
+            override.type for override in existing_overrides
+        ]
+        assert not profile.count
+
+    @pytest.mark.parametrize("change", ["new", "update", "delete"])
+    def test_changing_overrides_invalidates_the_cache(
+        self, svc, existing_overrides, application_instance, change
+    ):
+        role = existing_overrides[0].lti_role
+        svc.get_roles_for_application_instance(application_instance, [role])
+
+        if change == "new":
+            svc.delete_override(existing_overrides[0])
+            svc.get_roles_for_application_instance(application_instance, [role])
+            svc.new_role_override(
+                application_instance, role, type_=RoleType.ADMIN, scope=None
+            )
+        elif change == "update":
+            svc.update_override(existing_overrides[0], scope=None, type_=RoleType.ADMIN)
+        else:
+            svc.delete_override(existing_overrides[0])
+
+        roles = svc.get_roles_for_application_instance(application_instance, [role])
+
+        assert roles[0].type == (RoleType.ADMIN if change != "delete" else role.type)
+
     def test_search(self, existing_roles, svc):
         results = svc.search()
 
@@ -145,8 +323,12 @@ class TestLTIRoleService:
         assert override.type == RoleType.INSTRUCTOR
 
     @pytest.fixture
-    def svc(self, db_session):
-        return LTIRoleService(db_session=db_session)
+    def cache(self):
+        return LTIRoleCache()
+
+    @pytest.fixture
+    def svc(self, db_session, cache):
+        return LTIRoleService(db_session=db_session, cache=cache)
 
     @pytest.fixture
     def existing_roles(self):
@@ -166,6 +348,41 @@ class TestLTIRoleService:
         return random.choice(list(set(enum_) - {excluding}))  # noqa: S311
 
 
+class TestLTIRoleCache:
+    def test_overrides_expire(self, monotonic):
+        cache = LTIRoleCache(ttl=60)
+        monotonic.return_value = 0
+        cache.set_overrides(1, sentinel.overrides)
+
+        assert cache.get_overrides(1) == sentinel.overrides
+        monotonic.return_value = 60
+        assert cache.get_overrides(1) is None
+
+    def test_clear(self, db_session):
+        cache = LTIRoleCache()
+        role = factories.LTIRole()
+        db_session.flush()
+        cache.set_role(role)
+        cache.set_overrides(1, {})
+
+        cache.clear()
+
+        assert not cache.get_roles([role.value])
+        assert cache.get_overrides(1) is None
+
+    @pytest.mark.parametrize("settings,ttl", (({}, 60), ({"tenant_cache_ttl": "0"}, 0)))
+    def test_configure_lti_role_cache(self, settings, ttl):
+        cache = LTIRoleCache()
+
+        configure_lti_role_cache(settings, cache)
+
+        assert cache.ttl == ttl
+
+    @pytest.fixture
+    def monotonic(self, patch):
+        return patch("lms.services.lti_role_service.time.monotonic")
+
+
 class TestServiceFactory:
     def test_it(self, pyramid_request, LTIRoleService):
         svc = service_factory(sentinel.context, pyramid_request)
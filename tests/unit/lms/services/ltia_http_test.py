@@ -21,7 +21,7 @@ class TestLTIAHTTPService:
         jwt_oauth2_token_service,
         scopes,
     ):
-        jwt_oauth2_token_service.get_token.return_value = None
+        jwt_oauth2_token_service.get_cached_token.return_value = None
 
         response = svc.request(lti_registration, "POST", "https://example.com", scopes)
 
@@ -66,10 +66,13 @@ class TestLTIAHTTPService:
         self, svc, http_service, jwt_oauth2_token_service, scopes, lti_registration
     ):
         token = factories.JWTOAuth2Token()
-        jwt_oauth2_token_service.get_token.return_value = token
+        jwt_oauth2_token_service.get_cached_token.return_value = token
 
         response = svc.request(lti_registration, "POST", "https://example.com", scopes)
 
+        jwt_oauth2_token_service.get_cached_token.assert_called_once_with(
+            lti_registration, scopes, min_ttl=svc.TOKEN_REFRESH_BEFORE
+        )
         http_service.request.assert_called_once_with(
             "POST",
             "https://example.com",
@@ -78,6 +81,25 @@ class TestLTIAHTTPService:
         assert response == http_service.request.return_value
         jwt_oauth2_token_service.save_token.assert_not_called()
 
+    def test_request_with_explicit_access_token(
+        self, svc, http_service, jwt_oauth2_token_service, scopes, lti_registration
+    ):
+        response = svc.request(
+            lti_registration,
+            "POST",
+            "https://example.com",
+            scopes,
+            access_token=sentinel.access_token,
+        )
+
+        jwt_oauth2_token_service.get_cached_token.assert_not_called()
+        http_service.request.assert_called_once_with(
+            "POST",
+            "https://example.com",
+            headers={"Authorization": f"Bearer {sentinel.access_token}"},
+        )
+        assert response == http_service.request.return_value
+
     @pytest.fixture
     def svc(self, jwt_service, http_service, misc_plugin, jwt_oauth2_token_service):
         return LTIAHTTPService(
@@ -7,6 +7,7 @@ from h_matchers import Any
 from sqlalchemy import select
 
 from lms.models import TaskDone
+from lms.services.dedupe import DedupeService
 from lms.services.mailchimp import (
     EmailRecipient,
     EmailSender,
@@ -197,16 +198,16 @@ class TestSend:
 
     @pytest.fixture
     def svc(self, db_session):
-        return MailchimpService(db_session, sentinel.api_key)
+        return MailchimpService(DedupeService(db_session), sentinel.api_key)
 
 
 class TestFactory:
-    def test_it(self, pyramid_request, MailchimpService):
+    def test_it(self, pyramid_request, MailchimpService, dedupe_service):
         pyramid_request.registry.settings["mailchimp_api_key"] = sentinel.api_key
 
         svc = factory(sentinel.context, pyramid_request)
 
-        MailchimpService.assert_called_once_with(pyramid_request.db, sentinel.api_key)
+        MailchimpService.assert_called_once_with(dedupe_service, sentinel.api_key)
         assert svc == MailchimpService.return_value
 
     @pytest.fixture
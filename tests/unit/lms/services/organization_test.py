@@ -39,6 +39,35 @@ class TestOrganizationService:
 
         assert root == org_with_parent.parent
 
+    def test_get_hierarchy_ids(self, svc, hierarchy):
+        _, child, grandchild, _ = hierarchy
+
+        assert (
+            svc.get_hierarchy_ids(child.id)
+            == Any.list.containing([child.id, grandchild.id]).only()
+        )
+
+    def test_get_hierarchy_ids_including_parents(self, svc, hierarchy):
+        assert (
+            svc.get_hierarchy_ids(hierarchy[2].id, include_parents=True)
+            == Any.list.containing([org.id for org in hierarchy]).only()
+        )
+
+    def test_get_descendant_ids(self, svc, hierarchy, db_session):
+        _, child, grandchild, sibling = hierarchy
+        other = factories.Organization()
+        db_session.flush()
+
+        assert (
+            svc.get_descendant_ids([child.id, sibling.id, other.id])
+            == Any.list.containing(
+                [child.id, grandchild.id, sibling.id, other.id]
+            ).only()
+        )
+
+    def test_get_descendant_ids_with_no_ids(self, svc):
+        assert svc.get_descendant_ids([]) == []
+
     @pytest.mark.usefixtures("with_matching_noise")
     @pytest.mark.parametrize(
         "param,field", (("name", "name"), ("public_id", "public_id"), ("id_", "id"))
@@ -231,6 +260,18 @@ class TestOrganizationService:
         assert svc.is_member(org, user)
         assert not svc.is_member(org, other_user)
 
+    @pytest.fixture
+    def hierarchy(self, db_session):
+        root = factories.Organization()
+        child = factories.Organization(parent=root)
+        grandchild = factories.Organization(parent=child)
+        sibling = factories.Organization(parent=root)
+        # Some unrelated organizations
+        factories.Organization(parent=factories.Organization())
+        db_session.flush()
+
+        return root, child, grandchild, sibling
+
     @pytest.fixture
     def org_with_parent(self, db_session):
         org_with_parent = factories.Organization.create(
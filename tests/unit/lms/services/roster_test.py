@@ -261,9 +261,9 @@ class TestRosterService:
             active=True,
         )
         db_session.flush()
-        lti_names_roles_service.get_context_memberships.return_value = (
+        lti_names_roles_service.get_context_membership_pages.return_value = [
             names_and_roles_roster_response
-        )
+        ]
         lti_role_service.get_roles.return_value = [
             factories.LTIRole(value="ROLE1"),
             factories.LTIRole(value="ROLE2"),
@@ -271,7 +271,7 @@ class TestRosterService:
 
         svc.fetch_course_roster(lms_course)
 
-        lti_names_roles_service.get_context_memberships.assert_called_once_with(
+        lti_names_roles_service.get_context_membership_pages.assert_called_once_with(
             lti_v13_application_instance.lti_registration, "SERVICE_URL"
         )
         lti_role_service.get_roles.assert_has_calls(
@@ -305,6 +305,37 @@ class TestRosterService:
         assert roster[3].lms_user.lti_user_id == "USER_ID_INACTIVE"
         assert not roster[3].active
 
+    def test_fetch_course_roster_with_multiple_pages(
+        self,
+        svc,
+        lti_names_roles_service,
+        db_session,
+        names_and_roles_roster_response,
+        lti_role_service,
+        lms_course,
+    ):
+        db_session.flush()
+        lti_names_roles_service.get_context_membership_pages.return_value = [
+            [member] for member in names_and_roles_roster_response
+        ]
+        lti_role_service.get_roles.return_value = [
+            factories.LTIRole(value="ROLE1"),
+            factories.LTIRole(value="ROLE2"),
+        ]
+
+        svc.fetch_course_roster(lms_course)
+
+        roster = db_session.scalars(
+            select(CourseRoster)
+            .where(CourseRoster.lms_course_id == lms_course.id)
+            .order_by(CourseRoster.lms_user_id)
+        ).all()
+        assert [(r.lms_user.lti_user_id, r.active) for r in roster] == [
+            ("USER_ID", True),
+            ("USER_ID", True),
+            ("USER_ID_INACTIVE", False),
+        ]
+
     def test_fetch_assignment_roster(
         self,
         svc,
@@ -323,9 +354,9 @@ class TestRosterService:
             active=True,
         )
         db_session.flush()
-        lti_names_roles_service.get_context_memberships.return_value = (
+        lti_names_roles_service.get_context_membership_pages.return_value = [
             names_and_roles_roster_response
-        )
+        ]
         lti_role_service.get_roles.return_value = [
             factories.LTIRole(value="ROLE1"),
             factories.LTIRole(value="ROLE2"),
@@ -333,7 +364,7 @@ class TestRosterService:
 
         svc.fetch_assignment_roster(assignment)
 
-        lti_names_roles_service.get_context_memberships.assert_called_once_with(
+        lti_names_roles_service.get_context_membership_pages.assert_called_once_with(
             lti_v13_application_instance.lti_registration, "SERVICE_URL", "LTI1.3_ID"
         )
         lti_role_service.get_roles.assert_has_calls(
@@ -403,7 +434,7 @@ class TestRosterService:
         application_instance.settings.set(
             "hypothesis", "collect_student_emails", collect_student_emails
         )
-        lti_names_roles_service.get_context_memberships.return_value = [response]
+        lti_names_roles_service.get_context_membership_pages.return_value = [[response]]
         lti_role_service.get_roles.return_value = [
             factories.LTIRole(
                 value="ROLE1",
@@ -473,7 +504,7 @@ class TestRosterService:
         application_instance,
     ):
         application_instance.tool_consumer_info_product_family_code = family
-        lti_names_roles_service.get_context_memberships.return_value = [response]
+        lti_names_roles_service.get_context_membership_pages.return_value = [[response]]
         lti_role_service.get_roles.return_value = [
             factories.LTIRole(value="ROLE1"),
         ]
@@ -500,17 +531,53 @@ class TestRosterService:
     def test_fetch_assignment_roster_ignores_known_errors(
         self, svc, lti_names_roles_service, assignment, known_error
     ):
-        lti_names_roles_service.get_context_memberships.side_effect = (
+        lti_names_roles_service.get_context_membership_pages.side_effect = (
             ExternalRequestError(response=Mock(text=known_error))
         )
 
         # Method finishes without re-raising the exception
         assert not svc.fetch_assignment_roster(assignment)
 
+    def test_fetch_assignment_roster_ignores_known_errors_in_later_pages(
+        self,
+        svc,
+        lti_names_roles_service,
+        lti_role_service,
+        assignment,
+        names_and_roles_roster_response,
+        db_session,
+    ):
+        existing = factories.AssignmentRoster(
+            assignment=assignment,
+            lms_user=factories.LMSUser(lti_user_id="EXISTING USER"),
+            lti_role=factories.LTIRole(),
+            active=True,
+        )
+        db_session.flush()
+        lti_names_roles_service.get_context_membership_pages.return_value = (
+            self.failing_pages(
+                names_and_roles_roster_response,
+                ExternalRequestError(
+                    response=Mock(text="Requested ResourceLink was not found")
+                ),
+            )
+        )
+        lti_role_service.get_roles.return_value = [
+            factories.LTIRole(value="ROLE1"),
+            factories.LTIRole(value="ROLE2"),
+        ]
+
+        assert not svc.fetch_assignment_roster(assignment)
+
+        # The roster is left as it was
+        db_session.refresh(existing)
+        assert existing.active
+        assert db_session.scalars(select(AssignmentRoster)).all() == [existing]
+
     def test_fetch_assignment_roster_raises_external_request_error(
         self, svc, lti_names_roles_service, assignment
     ):
-        lti_names_roles_service.get_context_memberships.side_effect = (
+        lti_names_roles_service.get_context_membership_pages.side_effect = (
             ExternalRequestError()
         )
 
@@ -528,19 +595,47 @@ class TestRosterService:
         canvas_group = factories.LMSSegment(type="canvas_group", lms_course=lms_course)
         db_session.flush()
 
-        lti_names_roles_service.get_context_memberships.side_effect = (
+        lti_names_roles_service.get_context_membership_pages.side_effect = (
             ExternalRequestError(response=Mock(text=known_error))
         )
 
         # Method finishes without re-raising the exception
         assert not svc.fetch_canvas_group_roster(canvas_group)
 
+    def test_fetch_canvas_group_roster_ignores_known_errors_in_later_pages(
+        self,
+        svc,
+        lti_names_roles_service,
+        lti_role_service,
+        lms_course,
+        names_and_roles_roster_response,
+        db_session,
+    ):
+        canvas_group = factories.LMSSegment(type="canvas_group", lms_course=lms_course)
+        db_session.flush()
+        lti_names_roles_service.get_context_membership_pages.return_value = (
+            self.failing_pages(
+                names_and_roles_roster_response,
+                ExternalRequestError(
+                    response=Mock(text="The specified resource does not exist.")
+                ),
+            )
+        )
+        lti_role_service.get_roles.return_value = [
+            factories.LTIRole(value="ROLE1"),
+            factories.LTIRole(value="ROLE2"),
+        ]
+
+        assert not svc.fetch_canvas_group_roster(canvas_group)
+
+        assert not db_session.scalars(select(LMSSegmentRoster)).all()
+
     def test_fetch_canvas_group_roster_raises_external_request_error(
         self, svc, lti_names_roles_service, lms_course, db_session
     ):
         canvas_group = factories.LMSSegment(type="canvas_group", lms_course=lms_course)
         db_session.flush()
-        lti_names_roles_service.get_context_memberships.side_effect = (
+        lti_names_roles_service.get_context_membership_pages.side_effect = (
             ExternalRequestError()
         )
 
@@ -566,9 +661,9 @@ class TestRosterService:
             active=True,
         )
         db_session.flush()
-        lti_names_roles_service.get_context_memberships.return_value = (
+        lti_names_roles_service.get_context_membership_pages.return_value = [
             names_and_roles_roster_response
-        )
+        ]
         lti_role_service.get_roles.return_value = [
             factories.LTIRole(value="ROLE1"),
             factories.LTIRole(value="ROLE2"),
@@ -576,7 +671,7 @@ class TestRosterService:
 
         svc.fetch_canvas_group_roster(canvas_group)
 
-        lti_names_roles_service.get_context_memberships.assert_called_once_with(
+        lti_names_roles_service.get_context_membership_pages.assert_called_once_with(
             lti_v13_application_instance.lti_registration,
             f"https://{lti_v13_application_instance.lms_host()}/api/lti/groups/{canvas_group.lms_id}/names_and_roles",
         )
@@ -830,6 +925,12 @@ class TestRosterService:
     def lms_segment(self, lms_course):
         return factories.LMSSegment(lms_course=lms_course)
 
+    @staticmethod
+    def failing_pages(first_page, error):
+        """Yield `first_page` and then fail, as fetching the next page would."""
+        yield first_page
+        raise error
+
     @pytest.fixture
     def names_and_roles_roster_response(self):
         return [
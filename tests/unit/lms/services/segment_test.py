@@ -1,7 +1,9 @@
 from unittest.mock import sentinel
 
 import pytest
+from sqlalchemy.orm import joinedload
 
+from lms.models import LMSSegment
 from lms.services.segment import SegmentService, factory
 from tests import factories
 
@@ -61,6 +63,20 @@ class TestSegmentService:
 
         assert svc.get_segment(segment.h_authority_provided_id) == segment
 
+    def test_get_segment_with_options(self, svc, db_session, query_profile):
+        segment = factories.LMSSegment(lms_course=factories.LMSCourse())
+        db_session.flush()
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            segment = svc.get_segment(
+                segment.h_authority_provided_id,
+                options=[joinedload(LMSSegment.lms_course)],
+            )
+            assert segment.lms_course
+
+        assert profile.count == 1
+
     @pytest.fixture
     def svc(self, db_session, group_set_service):
         return SegmentService(db=db_session, group_set_service=group_set_service)
@@ -0,0 +1,154 @@
+from unittest.mock import Mock
+
+import pytest
+
+from lms.models import LTIRegistration
+from lms.services.tenant_cache import TenantCache, configure_tenant_cache
+from tests import factories
+
+
+class TestTenantCache:
+    def test_get_loads_the_row(self, cache, db_session, load, registration):
+        assert cache.get(db_session, "key", load) == registration
+        load.assert_called_once_with()
+
+    def test_get_caches_the_row(
+        self, cache, db_session, load, registration, query_profile
+    ):
+        cache.get(db_session, "key", load)
+        db_session.expunge_all()
+
+        with query_profile() as profile:
+            cached = cache.get(db_session, "key", load)
+
+            assert cached.id == registration.id
+            assert cached.issuer == registration.issuer
+            assert cached in db_session
+
+        assert not profile.count
+        load.assert_called_once_with()
+
+    def test_cached_rows_can_be_changed(self, cache, db_session, load, registration):
+        cache.get(db_session, "key", load)
+        db_session.expunge_all()
+
+        cache.get(db_session, "key", load).issuer = "NEW_ISSUER"
+        db_session.flush()
+        db_session.expunge_all()
+
+        assert db_session.get(LTIRegistration, registration.id).issuer == "NEW_ISSUER"
+
+    def test_get_returns_the_sessions_copy(self, cache, db_session, load):
+        cached = cache.get(db_session, "key", load)
+        cached.issuer = "CHANGED"
+
+        assert cache.get(db_session, "key", load).issuer == "CHANGED"
+
+    def test_get_doesnt_cache_changed_rows(self, cache, db_session, registration):
+        registration.issuer = "CHANGED"
+
+        cache.get(db_session, "key", lambda: registration)
+
+        db_session.rollback()
+        assert not cache.get(db_session, "key", lambda: None)
+
+    def test_get_doesnt_cache_missing_rows(self, cache, db_session, load):
+        load.return_value = None
+
+        assert not cache.get(db_session, "key", load)
+        assert not cache.get(db_session, "key", load)
+        assert load.call_count == 2
+
+    def test_get_loads_expired_rows_again(
+        self, cache, db_session, load, registration, monotonic
+    ):
+        monotonic.return_value = 0
+        cache.get(db_session, "key", load)
+
+        monotonic.return_value = 61
+        assert cache.get(db_session, "key", load) == registration
+
+        assert load.call_count == 2
+
+    def test_it_can_be_disabled(self, db_session, load):
+        cache = TenantCache(ttl=0)
+
+        cache.get(db_session, "key", load)
+        cache.get(db_session, "key", load)
+
+        assert load.call_count == 2
+
+    def test_it_evicts_the_oldest_rows(self, db_session, load):
+        cache = TenantCache(max_size=2)
+        for key in ["first", "second", "third"]:
+            cache.get(db_session, key, load)
+
+        load.reset_mock()
+        cache.get(db_session, "first", load)
+        cache.get(db_session, "third", load)
+
+        load.assert_called_once_with()
+
+    def test_invalidate(self, cache, db_session, load, registration):
+        cache.get(db_session, "key", load)
+        cache.get(db_session, "other_key", load)
+        other_load = Mock(return_value=factories.LTIRegistration())
+        db_session.flush()
+        cache.get(db_session, "other_registration", other_load)
+
+        cache.invalidate(registration)
+
+        cache.get(db_session, "key", load)
+        cache.get(db_session, "other_key", load)
+        cache.get(db_session, "other_registration", other_load)
+        assert load.call_count == 4
+        other_load.assert_called_once_with()
+
+    def test_invalidate_on_commit(self, cache, db_session, load, registration):
+        cache.get(db_session, "key", load)
+
+        cache.invalidate_on_commit(db_session, registration)
+
+        # Not while the change can still be rolled back
+        with db_session.begin_nested():
+            pass
+        cache.get(db_session, "key", load)
+        assert load.call_count == 1
+
+        db_session.commit()
+        cache.get(db_session, "key", load)
+        assert load.call_count == 2
+
+    def test_clear(self, cache, db_session, load):
+        cache.get(db_session, "key", load)
+
+        cache.clear()
+
+        cache.get(db_session, "key", load)
+        assert load.call_count == 2
+
+    @pytest.mark.parametrize("settings,ttl", (({}, 60), ({"tenant_cache_ttl": "0"}, 0)))
+    def test_configure_tenant_cache(self, settings, ttl):
+        cache = TenantCache()
+
+        configure_tenant_cache(settings, cache)
+
+        assert cache.ttl == ttl
+
+    @pytest.fixture
+    def cache(self):
+        return TenantCache(ttl=60)
+
+    @pytest.fixture
+    def registration(self, db_session):
+        registration = factories.LTIRegistration()
+        db_session.flush()
+        return registration
+
+    @pytest.fixture
+    def load(self, registration):
+        return Mock(return_value=registration)
+
+    @pytest.fixture
+    def monotonic(self, patch):
+        return patch("lms.services.tenant_cache.time.monotonic")
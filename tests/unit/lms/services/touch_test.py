@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from lms.services.touch import TouchThrottle, configure_touch_throttle
+
+NOW = datetime(2024, 1, 2, 12)  # noqa: DTZ001
+
+
+class TestTouchThrottle:
+    @pytest.mark.parametrize(
+        "interval,touch_after", ((3600, timedelta(hours=1)), (0, None))
+    )
+    def test_touch_after(self, interval, touch_after):
+        assert TouchThrottle(interval).touch_after == touch_after
+
+    @pytest.mark.parametrize(
+        "interval,touched_at,is_due",
+        (
+            (3600, None, True),
+            (3600, NOW - timedelta(minutes=5), False),
+            (3600, NOW - timedelta(hours=1), True),
+            (0, NOW, True),
+        ),
+    )
+    def test_is_due(self, interval, touched_at, is_due):
+        assert TouchThrottle(interval).is_due(touched_at, NOW) == is_due
+
+    @pytest.mark.parametrize(
+        "settings,interval", (({}, 3600), ({"touch_interval": "0"}, 0))
+    )
+    def test_configure_touch_throttle(self, settings, interval):
+        throttle = TouchThrottle()
+
+        configure_touch_throttle(settings, throttle)
+
+        assert throttle.interval == interval
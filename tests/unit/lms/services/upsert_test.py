@@ -1,6 +1,9 @@
+from datetime import date, datetime, timedelta
+
 import pytest
 import sqlalchemy as sa
 from h_matchers import Any
+from sqlalchemy.dialects.postgresql import JSONB
 
 from lms.db import Base
 from lms.services.upsert import bulk_upsert
@@ -17,8 +20,21 @@ class TestBulkAction:
         id = sa.Column(sa.Integer, primary_key=True)
         name = sa.Column(sa.String, nullable=False)
         other = sa.Column(sa.String)
+        flag = sa.Column(sa.Boolean)
+        day = sa.Column(sa.Date)
+        data = sa.Column(JSONB)
+        updated = sa.Column(sa.DateTime)
 
-    def test_upsert(self, db_session):
+    @pytest.mark.parametrize(
+        "chunk_size",
+        [
+            1000,
+            # Past the chunk size values are upserted with COPY
+            2,
+            1,
+        ],
+    )
+    def test_upsert(self, db_session, chunk_size):
         db_session.add_all(
             [
                 self.TableWithBulkUpsert(id=1, name="pre_existing_1", other="pre_1"),
@@ -37,6 +53,7 @@ class TestBulkAction:
             ],
             self.INDEX_ELEMENTS,
             self.UPDATE_COLUMNS,
+            chunk_size=chunk_size,
         )
 
         expected_rows = [
@@ -57,6 +74,207 @@ class TestBulkAction:
                 "other": model.other,
             } in expected_rows
 
+    def test_upsert_refreshes_instances_in_the_session(self, db_session):
+        row = self.TableWithBulkUpsert(id=1, name="pre_existing")
+        db_session.add(row)
+        db_session.flush()
+
+        result = bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            [{"id": 1, "name": "updated"}],
+            self.INDEX_ELEMENTS,
+            self.UPDATE_COLUMNS,
+        ).one()
+
+        assert result is row
+        assert row.name == "updated"
+
+    @pytest.mark.parametrize("chunk_size", [1000, 1])
+    def test_upsert_column_types(self, db_session, chunk_size):
+        values = [
+            {
+                "id": 1,
+                "name": "tab\t newline\n return\r backslash\\N",
+                "other": None,
+                "flag": True,
+                "day": date(2024, 1, 2),
+                "data": {"key": ["value"]},
+            },
+            {
+                "id": 2,
+                "name": "",
+                "other": "other",
+                "flag": False,
+                "day": None,
+                "data": None,
+            },
+        ]
+
+        bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            values,
+            self.INDEX_ELEMENTS,
+            self.UPDATE_COLUMNS,
+            chunk_size=chunk_size,
+        )
+
+        self.assert_has_rows(db_session, *values)
+
+    @pytest.mark.parametrize(
+        "names,expected_names",
+        [
+            # The same expression for every row is selected once
+            (
+                [sa.func.concat("same"), sa.func.concat("same")],
+                ["same", "same"],
+            ),
+            # Expressions that change from row to row fall back to VALUES
+            (
+                [sa.func.concat("first"), sa.func.concat("second")],
+                ["first", "second"],
+            ),
+            ([sa.func.concat("first"), "second"], ["first", "second"]),
+            (["first", sa.func.concat("second")], ["first", "second"]),
+        ],
+    )
+    def test_upsert_sql_expressions_past_the_chunk_size(
+        self, db_session, names, expected_names
+    ):
+        result = bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            [{"id": id_, "name": name} for id_, name in enumerate(names)],
+            self.INDEX_ELEMENTS,
+            self.UPDATE_COLUMNS,
+            chunk_size=1,
+        )
+
+        assert sorted(row.name for row in result) == expected_names
+
+    def test_upsert_past_the_chunk_size_twice_in_the_same_transaction(self, db_session):
+        for name in ["first", "second"]:
+            bulk_upsert(
+                db_session,
+                self.TableWithBulkUpsert,
+                [{"id": 1, "name": name}, {"id": 2, "name": name}],
+                self.INDEX_ELEMENTS,
+                self.UPDATE_COLUMNS,
+                chunk_size=1,
+            )
+
+        self.assert_has_rows(
+            db_session, {"id": 1, "name": "second"}, {"id": 2, "name": "second"}
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1000, 1])
+    @pytest.mark.parametrize("updated", [datetime(2024, 1, 2), sa.func.now()])  # noqa: DTZ001
+    def test_upsert_skip_unchanged(
+        self, db_session, chunk_size, updated, record_custom_metric
+    ):
+        before = datetime(2024, 1, 1)  # noqa: DTZ001
+        db_session.add_all(
+            [
+                self.TableWithBulkUpsert(id=1, name="unchanged", updated=before),
+                self.TableWithBulkUpsert(id=2, name="pre_existing", updated=before),
+            ]
+        )
+        db_session.flush()
+
+        result = bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            [
+                {"id": 1, "name": "unchanged", "updated": updated},
+                {"id": 2, "name": "changed", "updated": updated},
+                {"id": 3, "name": "new", "updated": updated},
+            ],
+            self.INDEX_ELEMENTS,
+            ["name", "updated"],
+            chunk_size=chunk_size,
+            skip_unchanged=True,
+        )
+
+        # All the rows are returned, including the ones that didn't change
+        assert sorted(row.id for row in result) == [1, 2, 3]
+        # Only the rows with changes were updated
+        self.assert_has_rows(
+            db_session,
+            {"id": 1, "name": "unchanged", "updated": before},
+            {"id": 2, "name": "changed", "updated": Any.instance_of(datetime)},
+            {"id": 3, "name": "new", "updated": Any.instance_of(datetime)},
+        )
+        assert db_session.get(self.TableWithBulkUpsert, 2).updated != before
+        record_custom_metric.assert_called_once_with(
+            "Custom/BulkUpsert/test_table_with_bulk_upsert/SkippedUpdates", 1
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1000, 1])
+    def test_upsert_touch_after(self, db_session, chunk_size, record_custom_metric):
+        now = db_session.scalar(sa.select(sa.func.now())).replace(tzinfo=None)
+        recent = now - timedelta(minutes=5)
+        stale = now - timedelta(hours=2)
+        db_session.add_all(
+            [
+                self.TableWithBulkUpsert(id=1, name="recent", updated=recent),
+                self.TableWithBulkUpsert(id=2, name="stale", updated=stale),
+                self.TableWithBulkUpsert(id=3, name="recent", updated=recent),
+            ]
+        )
+        db_session.flush()
+
+        result = bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            [
+                {"id": 1, "name": "recent", "updated": sa.func.now()},
+                {"id": 2, "name": "stale", "updated": sa.func.now()},
+                {"id": 3, "name": "changed", "updated": sa.func.now()},
+            ],
+            self.INDEX_ELEMENTS,
+            ["name", "updated"],
+            chunk_size=chunk_size,
+            touch_after=timedelta(hours=1),
+        )
+
+        assert sorted(row.id for row in result) == [1, 2, 3]
+        # Unchanged rows are only touched if they haven't been for a while
+        self.assert_has_rows(
+            db_session,
+            {"id": 1, "name": "recent", "updated": recent},
+            {"id": 2, "name": "stale", "updated": now},
+            {"id": 3, "name": "changed", "updated": now},
+        )
+        record_custom_metric.assert_called_once_with(
+            "Custom/BulkUpsert/test_table_with_bulk_upsert/SkippedUpdates", 1
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1000, 1])
+    def test_upsert_skip_unchanged_with_per_row_expressions(
+        self, db_session, chunk_size, record_custom_metric
+    ):
+        db_session.add(self.TableWithBulkUpsert(id=1, name="unchanged"))
+        db_session.flush()
+
+        result = bulk_upsert(
+            db_session,
+            self.TableWithBulkUpsert,
+            [
+                {"id": 1, "name": sa.func.concat("unchanged")},
+                {"id": 2, "name": sa.func.concat("new")},
+            ],
+            self.INDEX_ELEMENTS,
+            self.UPDATE_COLUMNS,
+            chunk_size=chunk_size,
+            skip_unchanged=True,
+        )
+
+        assert sorted(row.name for row in result) == ["new", "unchanged"]
+        record_custom_metric.assert_called_once_with(
+            "Custom/BulkUpsert/test_table_with_bulk_upsert/SkippedUpdates", 1
+        )
+
     def test_upsert_return_empty_query_if_given_an_empty_list_of_values(
         self, db_session
     ):
@@ -84,6 +302,10 @@ class TestBulkAction:
             ).only()
         )
 
+    @pytest.fixture
+    def record_custom_metric(self, patch):
+        return patch("lms.services.upsert.record_custom_metric")
+
     @pytest.fixture(autouse=True, scope="class")
     def create_test_table_with_bulk_upsert_table(self, db_engine):
         self.TableWithBulkUpsert.__table__.drop(db_engine, checkfirst=True)
@@ -117,6 +117,22 @@ class TestUserService:
 
         assert db_user == user
 
+    def test_get_returns_upserted_users(self, service, lti_user, query_profile):
+        user = service.upsert_user(lti_user)
+
+        with query_profile() as profile:
+            assert service.get(lti_user.application_instance, lti_user.user_id) == user
+
+        assert not profile.count
+
+    def test_get_caches_users(self, user, service, query_profile):
+        service.get(user.application_instance, user.user_id)
+
+        with query_profile() as profile:
+            assert service.get(user.application_instance, user.user_id) == user
+
+        assert not profile.count
+
     def test_get_not_found(self, user, service):
         with pytest.raises(UserNotFound):
             service.get(user.application_instance, "some-other-id")
@@ -1,10 +1,22 @@
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import date, datetime
+from unittest.mock import call
 
 import pytest
+import sqlalchemy as sa
 from freezegun import freeze_time
 
-from lms.tasks.event import insert_event, purge_launch_data
+from lms.db import (
+    create_monthly_partition,
+    monthly_partitions,
+    partitioned_by_month,
+)
+from lms.tasks.event import (
+    insert_event,
+    insert_events,
+    maintain_event_partitions,
+    purge_launch_data,
+)
 from tests import factories
 
 
@@ -15,6 +27,20 @@ def test_insert_event(event_service, BaseEvent, pyramid_request):
     event_service.insert_event.assert_called_once_with(BaseEvent.return_value)
 
 
+def test_insert_events(event_service, BaseEvent, pyramid_request):
+    insert_events([{"type": "value"}, {"type": "other"}])
+
+    BaseEvent.assert_has_calls(
+        [
+            call(request=pyramid_request, type="value"),
+            call(request=pyramid_request, type="other"),
+        ]
+    )
+    event_service.insert_events.assert_called_once_with(
+        [BaseEvent.return_value, BaseEvent.return_value]
+    )
+
+
 @freeze_time("2024-1-25")
 def test_purge_launch_data():
     recent_data = factories.EventData(
@@ -40,6 +66,92 @@ def test_purge_launch_data():
     assert "some_other_data" in old_data_no_launch.data
 
 
+@freeze_time("2024-11-25")
+class TestMaintainEventPartitions:
+    def test_it_creates_partitions(self, db_session, event_tables):
+        maintain_event_partitions(future_months=2)
+
+        for table in event_tables:
+            assert monthly_partitions(db_session, table) == [
+                date(2024, 11, 1),
+                date(2024, 12, 1),
+                date(2025, 1, 1),
+            ]
+
+    def test_it_skips_months_with_a_legacy_partition(self, db_session, event_tables):
+        for table in event_tables:
+            db_session.execute(
+                sa.text(
+                    f"CREATE TABLE {table.name}_legacy PARTITION OF {table.name}"
+                    " FOR VALUES FROM (MINVALUE) TO ('2024-12-01')"
+                )
+            )
+
+        maintain_event_partitions(future_months=2)
+
+        for table in event_tables:
+            assert monthly_partitions(db_session, table) == [
+                date(2024, 12, 1),
+                date(2025, 1, 1),
+            ]
+
+    def test_it_drops_old_partitions(self, db_session, event_tables):
+        events, event_data = event_tables
+        for table in event_tables:
+            for month in [date(2024, 8, 1), date(2024, 9, 1), date(2024, 10, 1)]:
+                create_monthly_partition(db_session, table, month)
+        old, kept = datetime(2024, 8, 10), datetime(2024, 9, 10)  # noqa: DTZ001
+        for id_, timestamp in enumerate([old, kept]):
+            db_session.execute(events.insert().values(id=id_, timestamp=timestamp))
+            db_session.execute(
+                event_data.insert().values(event_id=id_, event_timestamp=timestamp)
+            )
+
+        maintain_event_partitions(future_months=0, retention_months=2)
+
+        for table in event_tables:
+            assert monthly_partitions(db_session, table) == [
+                date(2024, 9, 1),
+                date(2024, 10, 1),
+                date(2024, 11, 1),
+            ]
+        assert db_session.scalars(sa.select(events.c.timestamp)).all() == [kept]
+
+    @pytest.fixture
+    def event_tables(self, db_session, monkeypatch):
+        # Stand-ins for the event tables. Changing the partitions of the real
+        # ones locks them, deadlocking with other tests inserting events.
+        metadata = sa.MetaData()
+        events = partitioned_by_month(
+            sa.Table(
+                "test_events",
+                metadata,
+                sa.Column("id", sa.Integer, primary_key=True),
+                sa.Column("timestamp", sa.DateTime(), primary_key=True),
+                postgresql_partition_by="RANGE (timestamp)",
+            )
+        )
+        event_data = partitioned_by_month(
+            sa.Table(
+                "test_event_data",
+                metadata,
+                sa.Column("event_id", sa.Integer, primary_key=True),
+                sa.Column("event_timestamp", sa.DateTime(), primary_key=True),
+                sa.ForeignKeyConstraint(
+                    ["event_id", "event_timestamp"],
+                    ["test_events.id", "test_events.timestamp"],
+                    ondelete="cascade",
+                ),
+                postgresql_partition_by="RANGE (event_timestamp)",
+            )
+        )
+        metadata.create_all(db_session.connection())
+
+        tables = [events, event_data]
+        monkeypatch.setattr("lms.tasks.event.EVENT_TABLES", tables)
+        return tables
+
+
 @pytest.fixture(autouse=True)
 def BaseEvent(patch):
     return patch("lms.tasks.event.BaseEvent")
@@ -1,23 +1,132 @@
 from contextlib import contextmanager
 from datetime import UTC
-from unittest.mock import call
 
 import pytest
-
-from lms.tasks.grading import sync_grade, sync_grades, sync_grades_complete
+from h_matchers import Any
+
+from lms.tasks.grading import (
+    sync_grade,
+    sync_grades,
+    sync_grades_batch,
+    sync_grades_complete,
+)
 from tests import factories
 
 
 class TestGradingTasks:
-    def test_sync_grades(self, sync_grade, grading_sync):
+    def test_sync_grades(self, sync_grades_batch_task, grading_sync):
         sync_grades()
 
-        sync_grade.delay.assert_has_calls(
-            [call(grading_sync_grade_id=grade.id) for grade in grading_sync.grades],
-            any_order=True,
+        sync_grades_batch_task.delay.assert_called_once_with(
+            grading_sync_id=grading_sync.id
         )
         assert grading_sync.status == "in_progress"
 
+    def test_sync_grades_batch(
+        self,
+        grading_sync,
+        lti_v13_application_instance,
+        service_factory,
+        pyramid_request,
+        sync_grades_batch_task,
+        db_session,
+    ):
+        grading_service = service_factory.return_value
+        grading_service.sync_grades.return_value = [None, None]
+
+        sync_grades_batch(grading_sync_id=grading_sync.id)
+
+        service_factory.assert_called_once_with(
+            None, pyramid_request, lti_v13_application_instance
+        )
+        grading_service.sync_grades.assert_called_once_with(
+            lti_v13_application_instance,
+            grading_sync.assignment,
+            grading_sync.created.replace(tzinfo=UTC).isoformat(),
+            Any.list.containing(
+                [(grade.lms_user, grade.grade) for grade in grading_sync.grades]
+            ).only(),
+        )
+        sync_grades_batch_task.apply_async.assert_not_called()
+        db_session.refresh(grading_sync)
+        assert [grade.success for grade in grading_sync.grades] == [True, True]
+        assert grading_sync.status == "finished"
+
+    def test_sync_grades_batch_only_sends_pending_grades(
+        self, grading_sync, service_factory, db_session
+    ):
+        grading_sync.grades[0].success = True
+        db_session.flush()
+        grading_service = service_factory.return_value
+        grading_service.sync_grades.return_value = [None]
+
+        sync_grades_batch(grading_sync_id=grading_sync.id)
+
+        assert grading_service.sync_grades.call_args.args[3] == [
+            (grading_sync.grades[1].lms_user, grading_sync.grades[1].grade)
+        ]
+
+    def test_sync_grades_batch_retries_failed_grades(
+        self, grading_sync, service_factory, sync_grades_batch_task, db_session
+    ):
+        grading_service = service_factory.return_value
+        grades = sorted(grading_sync.grades, key=lambda grade: grade.id)
+        grading_service.sync_grades.return_value = [None, Exception("Error")]
+
+        sync_grades_batch(grading_sync_id=grading_sync.id, retries=1)
+
+        sync_grades_batch_task.apply_async.assert_called_once_with(
+            (), {"grading_sync_id": grading_sync.id, "retries": 2}, countdown=20
+        )
+        db_session.refresh(grades[0])
+        db_session.refresh(grades[1])
+        assert grades[0].success is True
+        assert grades[1].success is None
+        assert grading_sync.status == "scheduled"
+
+    def test_sync_grades_batch_all_failed(
+        self, grading_sync, service_factory, sync_grades_batch_task
+    ):
+        service_factory.return_value.sync_grades.return_value = [
+            Exception("Error"),
+            Exception("Error"),
+        ]
+
+        sync_grades_batch(grading_sync_id=grading_sync.id)
+
+        sync_grades_batch_task.apply_async.assert_called_once_with(
+            (), {"grading_sync_id": grading_sync.id, "retries": 1}, countdown=10
+        )
+
+    def test_sync_grades_batch_last_retry(
+        self, grading_sync, service_factory, sync_grades_batch_task, db_session
+    ):
+        grading_service = service_factory.return_value
+        grades = sorted(grading_sync.grades, key=lambda grade: grade.id)
+        grading_service.sync_grades.return_value = [None, Exception("Error")]
+
+        sync_grades_batch(grading_sync_id=grading_sync.id, retries=2)
+
+        sync_grades_batch_task.apply_async.assert_not_called()
+        db_session.refresh(grades[1])
+        assert grades[1].success is False
+        assert grades[1].error_details == {"exception": "Error"}
+        assert grading_sync.status == "failed"
+
+    def test_sync_grades_batch_without_grading_url(
+        self, grading_sync, service_factory, db_session
+    ):
+        grading_sync.assignment.lis_outcome_service_url = None
+
+        sync_grades_batch(grading_sync_id=grading_sync.id, retries=2)
+
+        service_factory.return_value.sync_grades.assert_not_called()
+        db_session.refresh(grading_sync.grades[0])
+        assert grading_sync.grades[0].error_details == {
+            "exception": "Assignment without grading URL"
+        }
+        assert grading_sync.status == "failed"
+
     def test_sync_grade(
         self,
         grading_sync,
@@ -120,6 +229,10 @@ class TestGradingTasks:
     def sync_grade(self, patch):
         return patch("lms.tasks.grading.sync_grade")
 
+    @pytest.fixture
+    def sync_grades_batch_task(self, patch):
+        return patch("lms.tasks.grading.sync_grades_batch")
+
     @pytest.fixture
     def sync_grades_complete(self, patch):
         return patch("lms.tasks.grading.sync_grades_complete")
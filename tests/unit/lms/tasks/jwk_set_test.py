@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from unittest.mock import call
+
+import pytest
+
+from lms.services.exceptions import ExternalRequestError
+from lms.tasks.jwk_set import REFRESH_AHEAD, refresh_jwk_sets
+
+
+def test_refresh_jwk_sets(jwk_set_service):
+    jwk_set_service.get_stale_urls.return_value = ["URL_1", "URL_2"]
+
+    refresh_jwk_sets()
+
+    jwk_set_service.get_stale_urls.assert_called_once_with(within=REFRESH_AHEAD)
+    assert jwk_set_service.refresh.call_args_list == [call("URL_1"), call("URL_2")]
+
+
+def test_refresh_jwk_sets_carries_on_after_errors(jwk_set_service, caplog):
+    jwk_set_service.get_stale_urls.return_value = ["URL_1", "URL_2"]
+    jwk_set_service.refresh.side_effect = [ExternalRequestError, None]
+
+    refresh_jwk_sets()
+
+    assert jwk_set_service.refresh.call_args_list == [call("URL_1"), call("URL_2")]
+    assert "Couldn't refresh the key set at URL_1" in caplog.text
+
+
+@pytest.fixture(autouse=True)
+def app(patch, pyramid_request):
+    app = patch("lms.tasks.jwk_set.app")
+
+    @contextmanager
+    def request_context():
+        yield pyramid_request
+
+    app.request_context = request_context
+
+    return app
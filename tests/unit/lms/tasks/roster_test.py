@@ -1,9 +1,11 @@
 from contextlib import contextmanager
 from datetime import datetime
+from unittest.mock import create_autospec
 
 import pytest
 from freezegun import freeze_time
 
+from lms.services.dedupe import DedupeService
 from lms.tasks.roster import (
     fetch_assignment_roster,
     fetch_canvas_sections_roster,
@@ -85,7 +87,11 @@ class TestRosterTasks:
         "lms_course_with_recent_launch_and_task_done_row",
     )
     def test_schedule_fetching_course_rosters(
-        self, lms_course_with_recent_launch, db_session, fetch_course_roster
+        self,
+        lms_course_with_recent_launch,
+        db_session,
+        fetch_course_roster,
+        dedupe_service,
     ):
         db_session.flush()
 
@@ -94,6 +100,24 @@ class TestRosterTasks:
         fetch_course_roster.delay.assert_called_once_with(
             lms_course_id=lms_course_with_recent_launch.id
         )
+        assert dedupe_service.exists(
+            [f"roster::course::scheduled::{lms_course_with_recent_launch.id}"]
+        )
+
+    @freeze_time("2024-08-28")
+    @pytest.mark.usefixtures("lms_course_with_recent_launch")
+    def test_schedule_fetching_course_rosters_when_claimed_concurrently(
+        self, db_session, fetch_course_roster, dedupe_service
+    ):
+        db_session.flush()
+        # Another run of the scheduler claimed the course in the meantime
+        dedupe_service.claim_many = create_autospec(
+            dedupe_service.claim_many, return_value=set()
+        )
+
+        schedule_fetching_course_rosters()
+
+        fetch_course_roster.delay.assert_not_called()
 
     @freeze_time("2024-08-28")
     @pytest.mark.usefixtures(
@@ -342,6 +366,13 @@ class TestRosterTasks:
         return patch("lms.tasks.roster.schedule_fetching_course_rosters")
 
 
+@pytest.fixture(autouse=True)
+def dedupe_service(pyramid_config, db_session):
+    dedupe_service = DedupeService(db_session)
+    pyramid_config.register_service(dedupe_service, iface=DedupeService)
+    return dedupe_service
+
+
 @pytest.fixture(autouse=True)
 def app(patch, pyramid_request):
     app = patch("lms.tasks.roster.app")
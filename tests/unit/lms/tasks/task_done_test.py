@@ -6,11 +6,14 @@ from freezegun import freeze_time
 from sqlalchemy import select
 
 from lms.models import TaskDone
+from lms.services.dedupe import DedupeService
 from lms.tasks.task_done import delete_expired_rows
 
 
 @freeze_time("2023-05-04 12:12:01")
-def test_delete_expired_rows(db_session):
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_delete_expired_rows(db_session, monkeypatch, batch_size):
+    monkeypatch.setattr("lms.tasks.task_done.DELETE_BATCH_SIZE", batch_size)
     frozen_time = datetime.fromisoformat("2023-05-04 12:12:01")
     expired_task_dones = [
         TaskDone(key="expired_1", expires_at=frozen_time - timedelta(seconds=1)),
@@ -28,6 +31,13 @@ def test_delete_expired_rows(db_session):
     assert db_session.scalars(select(TaskDone.id)).all() == [fresh_task_done.id]
 
 
+@pytest.fixture(autouse=True)
+def dedupe_service(pyramid_config, db_session):
+    dedupe_service = DedupeService(db_session)
+    pyramid_config.register_service(dedupe_service, iface=DedupeService)
+    return dedupe_service
+
+
 @pytest.fixture(autouse=True)
 def app(patch, pyramid_request):
     app = patch("lms.tasks.task_done.app")
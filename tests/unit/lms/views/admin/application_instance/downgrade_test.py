@@ -9,11 +9,16 @@ from tests.matchers import temporary_redirect_to
 @pytest.mark.usefixtures("application_instance_service")
 class TestDowngradeApplicationInstanceView:
     @pytest.mark.usefixtures("lti_v13_application_instance")
-    def test_downgrade_instance(self, view, pyramid_request, ai_from_matchdict):
+    def test_downgrade_instance(
+        self, view, pyramid_request, ai_from_matchdict, application_instance_service
+    ):
         response = view.downgrade_instance()
 
         assert not ai_from_matchdict.lti_registration_id
         assert not ai_from_matchdict.deployment_id
+        application_instance_service.invalidate_cache.assert_called_once_with(
+            ai_from_matchdict
+        )
         assert response == temporary_redirect_to(
             pyramid_request.route_url("admin.instance", id_=ai_from_matchdict.id)
         )
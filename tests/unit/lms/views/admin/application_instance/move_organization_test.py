@@ -21,6 +21,9 @@ class TestAdminApplicationInstanceViews:
         application_instance_service.update_application_instance.assert_called_once_with(
             ai_from_matchdict, organization_public_id="PUBLIC_ID"
         )
+        application_instance_service.invalidate_cache.assert_called_once_with(
+            ai_from_matchdict
+        )
         assert response == temporary_redirect_to(
             pyramid_request.route_url("admin.instance", id_=ai_from_matchdict.id)
         )
@@ -55,6 +55,9 @@ class TestUpdateApplicationInstanceView:
             developer_secret="DEVELOPER SECRET",  # noqa: S106
         )
         assert ai_from_matchdict.settings.get(setting, sub_setting) == expected
+        application_instance_service.invalidate_cache.assert_called_once_with(
+            ai_from_matchdict
+        )
 
     @pytest.mark.usefixtures("with_minimal_fields_for_update")
     def test_update_application_instance_with_minimal_arguments(
@@ -116,6 +119,7 @@ class TestUpdateApplicationInstanceView:
         views,
         pyramid_request,
         ai_from_matchdict,
+        application_instance_service,
         setting,
         sub_setting,
         value,
@@ -126,6 +130,9 @@ class TestUpdateApplicationInstanceView:
         views.update_instance_settings()
 
         assert ai_from_matchdict.settings.get(setting, sub_setting) == expected
+        application_instance_service.invalidate_cache.assert_called_once_with(
+            ai_from_matchdict
+        )
 
     @pytest.mark.parametrize(
         "setting,sub_setting", (("desire2learn", "client_secret"),)
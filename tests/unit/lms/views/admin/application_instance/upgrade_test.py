@@ -64,6 +64,9 @@ class TestUpgradeApplicationInstanceViews:
             application_instance.deployment_id
             == pyramid_request.params["deployment_id"]
         )
+        application_instance_service.invalidate_cache.assert_called_once_with(
+            application_instance
+        )
         assert response == temporary_redirect_to(
             pyramid_request.route_url("admin.instance", id_=application_instance.id)
         )
@@ -184,6 +184,9 @@ class TestAdminApplicationInstanceViews:
         assert (
             response["registration"] == lti_registration_service.get_by_id.return_value
         )
+        lti_registration_service.invalidate_cache.assert_called_once_with(
+            lti_registration_service.get_by_id.return_value
+        )
         assert pyramid_request.session.peek_flash("messages")
 
     @pytest.mark.usefixtures("with_form_submission")
@@ -5,6 +5,7 @@ import pytest
 from sqlalchemy import select
 
 from lms.models import Assignment, AutoGradingConfig, User
+from lms.services.dashboard import LoadingProfile
 from lms.views.dashboard.api.assignment import AssignmentViews
 from tests import factories
 
@@ -69,7 +70,7 @@ class TestAssignmentViews:
         response = views.assignment()
 
         dashboard_service.get_request_assignment.assert_called_once_with(
-            pyramid_request, sentinel.id
+            pyramid_request, sentinel.id, profile=LoadingProfile.ASSIGNMENT_DETAILS
         )
 
         assert response == {
@@ -97,7 +98,7 @@ class TestAssignmentViews:
         response = views.assignment()
 
         dashboard_service.get_request_assignment.assert_called_once_with(
-            pyramid_request, sentinel.id
+            pyramid_request, sentinel.id, profile=LoadingProfile.ASSIGNMENT_DETAILS
         )
 
         assert response == {
@@ -126,7 +127,7 @@ class TestAssignmentViews:
         response = views.assignment()
 
         dashboard_service.get_request_assignment.assert_called_once_with(
-            pyramid_request, sentinel.id
+            pyramid_request, sentinel.id, profile=LoadingProfile.ASSIGNMENT_DETAILS
         )
         assignment_service.get_assignment_groups.assert_called_once_with(assignment)
 
@@ -154,7 +155,7 @@ class TestAssignmentViews:
         response = views.assignment()
 
         dashboard_service.get_request_assignment.assert_called_once_with(
-            pyramid_request, sentinel.id
+            pyramid_request, sentinel.id, profile=LoadingProfile.ASSIGNMENT_DETAILS
         )
         assignment_service.get_assignment_sections.assert_called_once_with(assignment)
 
@@ -202,6 +203,9 @@ class TestAssignmentViews:
 
         response = views.course_assignments_metrics()
 
+        dashboard_service.get_request_course.assert_called_once_with(
+            pyramid_request, sentinel.id, profile=LoadingProfile.COURSE_DETAILS
+        )
         dashboard_service.get_course_roster.assert_called_once_with(
             course.lms_course, h_userids=sentinel.h_userids
         )
@@ -6,6 +6,7 @@ from sqlalchemy import select
 
 from lms.js_config_types import APIStudent
 from lms.models import AutoGradingConfig, LMSUser, RoleScope, RoleType, User
+from lms.services.dashboard import LoadingProfile
 from lms.views.dashboard.api.user import UserViews
 from tests import factories
 
@@ -318,7 +319,7 @@ class TestUserViews:
         views._students_query(assignment_ids=None, segment_authority_provided_ids=None)  # noqa: SLF001
 
         dashboard_service.get_request_course.assert_called_once_with(
-            pyramid_request, sentinel.course_id
+            pyramid_request, sentinel.course_id, profile=LoadingProfile.COURSE_DETAILS
         )
         dashboard_service.get_course_roster.assert_called_once_with(
             lms_course=dashboard_service.get_request_course.return_value.lms_course,
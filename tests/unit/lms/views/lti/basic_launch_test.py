@@ -19,16 +19,16 @@ from tests import factories
     "lti_h_service",
     "lti_role_service",
     "grouping_service",
+    "launch_persistence_service",
     "misc_plugin",
-    "user_service",
 )
 class TestBasicLaunchViews:
     def test___init___(
         self,
         context,
         pyramid_request,
-        grouping_service,
         course_service,
+        launch_persistence_service,
         application_instance_service,
         lti_user,
     ):
@@ -37,13 +37,10 @@ class TestBasicLaunchViews:
         course_service.get_from_launch.assert_called_once_with(
             pyramid_request.product.family, pyramid_request.lti_params
         )
-        grouping_service.upsert_grouping_memberships.assert_called_once_with(
+        launch_persistence_service.record_course_launch.assert_called_once_with(
             user=pyramid_request.user,
-            groups=[course_service.get_from_launch.return_value],
-        )
-        course_service.upsert_lms_course_membership.assert_called_once_with(
-            lms_course=course_service.get_from_launch.return_value.lms_course,
-            lms_user=pyramid_request.user.lms_user,
+            lti_params=pyramid_request.lti_params,
+            course=course_service.get_from_launch.return_value,
             lti_roles=lti_user.lti_roles,
         )
         pyramid_request.lti_user.application_instance.check_guid_aligns.assert_called_once_with(
@@ -267,7 +264,7 @@ class TestBasicLaunchViews:
         pyramid_request,
         context,
         lti_h_service,
-        assignment_service,
+        launch_persistence_service,
         lti_user,
         course_service,
         misc_plugin,
@@ -290,15 +287,13 @@ class TestBasicLaunchViews:
             checkpoint_data=None,
         )
 
-        assignment_service.upsert_assignment_membership.assert_called_once_with(
-            pyramid_request.lti_params,
-            assignment=assignment,
+        launch_persistence_service.record_assignment_launch.assert_called_once_with(
             user=pyramid_request.user,
+            lti_params=pyramid_request.lti_params,
+            assignment=assignment,
+            groupings=[course_service.get_from_launch.return_value],
             lti_roles=lti_user.lti_roles,
         )
-        assignment_service.upsert_assignment_groupings.assert_called_once_with(
-            assignment, groupings=[course_service.get_from_launch.return_value]
-        )
 
         context.js_config.enable_lti_launch_mode.assert_called_once_with(
             course_service.get_from_launch.return_value, assignment
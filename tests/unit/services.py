@@ -22,6 +22,7 @@ from lms.services.canvas_studio import CanvasStudioService
 from lms.services.course import CourseService
 from lms.services.d2l_api import D2LAPIClient
 from lms.services.dashboard import DashboardService
+from lms.services.dedupe import DedupeService
 from lms.services.digest import DigestService
 from lms.services.email_preferences import EmailPreferencesService
 from lms.services.event import EventService
@@ -35,8 +36,10 @@ from lms.services.h_api import HAPI
 from lms.services.http import HTTPService
 from lms.services.hubspot import HubSpotService
 from lms.services.jstor import JSTORService
+from lms.services.jwk_set import JWKSetService
 from lms.services.jwt import JWTService
 from lms.services.jwt_oauth2_token import JWTOAuth2TokenService
+from lms.services.launch_persistence import LaunchPersistenceService
 from lms.services.launch_verifier import LaunchVerifier
 from lms.services.lms_term import LMSTermService
 from lms.services.lti_grading import LTIGradingService
@@ -77,6 +80,7 @@ __all__ = (  # noqa: RUF022
     "course_service",
     "d2l_api_client",
     "dashboard_service",
+    "dedupe_service",
     "digest_service",
     "event_service",
     "file_service",
@@ -89,8 +93,10 @@ __all__ = (  # noqa: RUF022
     "http_service",
     "hubspot_service",
     "jstor_service",
+    "jwk_set_service",
     "jwt_service",
     "jwt_oauth2_token_service",
+    "launch_persistence_service",
     "launch_verifier",
     "lms_term_service",
     "lti_grading_service",
@@ -234,6 +240,11 @@ def moodle_api_client(mock_service):
     return mock_service(MoodleAPIClient)
 
 
+@pytest.fixture
+def dedupe_service(mock_service):
+    return mock_service(DedupeService)
+
+
 @pytest.fixture
 def digest_service(mock_service):
     return mock_service(DigestService)
@@ -300,6 +311,16 @@ def youtube_service(mock_service):
     return mock_service(YouTubeService)
 
 
+@pytest.fixture
+def jwk_set_service(mock_service):
+    return mock_service(JWKSetService)
+
+
+@pytest.fixture
+def launch_persistence_service(mock_service):
+    return mock_service(LaunchPersistenceService)
+
+
 @pytest.fixture
 def jwt_service(mock_service):
     return mock_service(JWTService)